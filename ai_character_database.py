@@ -4,7 +4,6 @@ AI 캐릭터 데이터베이스 관리 시스템
 각 AI 캐릭터별로 독립적인 SQLite 데이터베이스를 관리
 """
 
-import sqlite3
 import json
 import os
 import datetime
@@ -13,6 +12,8 @@ from dataclasses import dataclass, asdict
 import threading
 import time
 
+from game.sqlite_store import get_sqlite_store
+
 # 데이터베이스 디렉토리 (새로운 폴더 구조)
 DB_DIR = "ai_character_data/memories"
 PRESETS_DIR = "character_presets"
@@ -71,293 +72,272 @@ class EmotionalState:
     trigger_event: str
     duration: int  # 분 단위
 
+# =====================================
+# 📜 스키마 / SQL (연결별 문장 캐시로 재사용)
+# =====================================
+
+_SCHEMA_SQL = '''
+    -- 학습 이벤트 테이블
+    CREATE TABLE IF NOT EXISTS learning_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        context TEXT,
+        action_taken TEXT,
+        outcome TEXT,
+        feedback_score REAL,
+        emotional_weight REAL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    -- 관계 데이터 테이블
+    CREATE TABLE IF NOT EXISTS relationships (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        target_name TEXT UNIQUE NOT NULL,
+        relationship_type TEXT NOT NULL,
+        trust_level REAL DEFAULT 0.5,
+        friendship_points INTEGER DEFAULT 0,
+        last_interaction TEXT,
+        memorable_events TEXT,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    -- 게임 지식 테이블
+    CREATE TABLE IF NOT EXISTS game_knowledge (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category TEXT NOT NULL,
+        subject TEXT NOT NULL,
+        knowledge TEXT,
+        confidence_level REAL DEFAULT 0.5,
+        last_updated TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    -- 행동 패턴 테이블
+    CREATE TABLE IF NOT EXISTS behavioral_patterns (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        situation_type TEXT NOT NULL,
+        action_pattern TEXT NOT NULL,
+        success_rate REAL DEFAULT 0.5,
+        usage_count INTEGER DEFAULT 0,
+        last_used TEXT,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    -- 감정 상태 테이블
+    CREATE TABLE IF NOT EXISTS emotional_states (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        emotion_type TEXT NOT NULL,
+        intensity REAL NOT NULL,
+        trigger_event TEXT,
+        duration INTEGER DEFAULT 60,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    -- 인덱스
+    CREATE INDEX IF NOT EXISTS idx_events_type ON learning_events(event_type);
+    CREATE INDEX IF NOT EXISTS idx_events_created ON learning_events(created_at);
+    CREATE INDEX IF NOT EXISTS idx_emotions_created ON emotional_states(created_at);
+    CREATE INDEX IF NOT EXISTS idx_emotions_type ON emotional_states(emotion_type);
+    DROP INDEX IF EXISTS idx_events_timestamp;
+    DROP INDEX IF EXISTS idx_relationships_target;
+    DROP INDEX IF EXISTS idx_knowledge_category;
+    DROP INDEX IF EXISTS idx_patterns_situation;
+'''
+
+# (테이블, 고유 키 컬럼, 인덱스 이름) - 고유 인덱스가 앞쪽 컬럼 조회 인덱스 역할도 함
+_UNIQUE_KEYS = (
+    ('game_knowledge', 'category, subject', 'uq_knowledge_subject'),
+    ('behavioral_patterns', 'situation_type, action_pattern', 'uq_patterns_action'),
+)
+
+_INSERT_EVENT_SQL = '''
+    INSERT INTO learning_events 
+    (timestamp, event_type, context, action_taken, outcome, feedback_score, emotional_weight)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+_UPSERT_RELATIONSHIP_SQL = '''
+    INSERT INTO relationships 
+    (target_name, relationship_type, trust_level, friendship_points, 
+     last_interaction, memorable_events, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(target_name) DO UPDATE SET
+        relationship_type = excluded.relationship_type,
+        trust_level = excluded.trust_level,
+        friendship_points = excluded.friendship_points,
+        last_interaction = excluded.last_interaction,
+        memorable_events = excluded.memorable_events,
+        updated_at = excluded.updated_at
+'''
+
+_UPSERT_KNOWLEDGE_SQL = '''
+    INSERT INTO game_knowledge 
+    (category, subject, knowledge, confidence_level, last_updated)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(category, subject) DO UPDATE SET
+        knowledge = excluded.knowledge,
+        confidence_level = excluded.confidence_level,
+        last_updated = excluded.last_updated
+'''
+
+_UPSERT_PATTERN_SQL = '''
+    INSERT INTO behavioral_patterns 
+    (situation_type, action_pattern, success_rate, usage_count, last_used, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(situation_type, action_pattern) DO UPDATE SET
+        success_rate = excluded.success_rate,
+        usage_count = excluded.usage_count,
+        last_used = excluded.last_used,
+        updated_at = excluded.updated_at
+'''
+
+_INSERT_EMOTION_SQL = '''
+    INSERT INTO emotional_states 
+    (timestamp, emotion_type, intensity, trigger_event, duration)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
 class AICharacterDatabase:
-    """AI 캐릭터별 데이터베이스 관리"""
+    """AI 캐릭터별 데이터베이스 관리 (공용 SQLite 저장소 - 연결 재사용 + 쓰기 일괄 처리)"""
     
     def __init__(self, character_name: str):
         self.character_name = character_name
         self.db_path = os.path.join(DB_DIR, f"ai_memory_{character_name}.db")
         self.lock = threading.Lock()
+        self.store = get_sqlite_store(self.db_path)
         self._initialize_database()
     
     def _initialize_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # 학습 이벤트 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS learning_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    context TEXT,
-                    action_taken TEXT,
-                    outcome TEXT,
-                    feedback_score REAL,
-                    emotional_weight REAL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # 관계 데이터 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS relationships (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    target_name TEXT UNIQUE NOT NULL,
-                    relationship_type TEXT NOT NULL,
-                    trust_level REAL DEFAULT 0.5,
-                    friendship_points INTEGER DEFAULT 0,
-                    last_interaction TEXT,
-                    memorable_events TEXT,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # 게임 지식 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS game_knowledge (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    category TEXT NOT NULL,
-                    subject TEXT NOT NULL,
-                    knowledge TEXT,
-                    confidence_level REAL DEFAULT 0.5,
-                    last_updated TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # 행동 패턴 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS behavioral_patterns (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    situation_type TEXT NOT NULL,
-                    action_pattern TEXT NOT NULL,
-                    success_rate REAL DEFAULT 0.5,
-                    usage_count INTEGER DEFAULT 0,
-                    last_used TEXT,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # 감정 상태 테이블
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS emotional_states (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    emotion_type TEXT NOT NULL,
-                    intensity REAL NOT NULL,
-                    trigger_event TEXT,
-                    duration INTEGER DEFAULT 60,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # 인덱스 생성
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_type ON learning_events(event_type)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_timestamp ON learning_events(timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_relationships_target ON relationships(target_name)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_knowledge_category ON game_knowledge(category)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_patterns_situation ON behavioral_patterns(situation_type)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_emotions_type ON emotional_states(emotion_type)')
-            
-            conn.commit()
+        with self.lock:
+            self.store.executescript(_SCHEMA_SQL)
+            # 이전 버전 DB: 중복 행 정리 후 고유 인덱스 (UPSERT 대상)
+            with self.store.transaction() as conn:
+                for table, key_columns, index_name in _UNIQUE_KEYS:
+                    conn.execute(f'''
+                        DELETE FROM {table} WHERE id NOT IN (
+                            SELECT MAX(id) FROM {table} GROUP BY {key_columns}
+                        )
+                    ''')
+                    conn.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table}({key_columns})')
+    
+    def flush(self, timeout: float = None) -> bool:
+        """예약된 쓰기를 모두 반영 (조회 메서드는 자동으로 호출)"""
+        return self.store.flush(timeout)
     
     def add_learning_event(self, event: LearningEvent):
         """학습 이벤트 추가"""
-        with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO learning_events 
-                    (timestamp, event_type, context, action_taken, outcome, feedback_score, emotional_weight)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    event.timestamp, event.event_type, event.context,
-                    event.action_taken, event.outcome, event.feedback_score, event.emotional_weight
-                ))
-                conn.commit()
+        self.store.submit(_INSERT_EVENT_SQL, (
+            event.timestamp, event.event_type, event.context,
+            event.action_taken, event.outcome, event.feedback_score, event.emotional_weight
+        ))
     
     def update_relationship(self, relationship: RelationshipData):
         """관계 데이터 업데이트"""
-        with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                memorable_events_json = json.dumps(relationship.memorable_events, ensure_ascii=False)
-                
-                cursor.execute('''
-                    INSERT OR REPLACE INTO relationships 
-                    (target_name, relationship_type, trust_level, friendship_points, 
-                     last_interaction, memorable_events, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    relationship.target_name, relationship.relationship_type,
-                    relationship.trust_level, relationship.friendship_points,
-                    relationship.last_interaction, memorable_events_json,
-                    datetime.datetime.now().isoformat()
-                ))
-                conn.commit()
+        memorable_events_json = json.dumps(relationship.memorable_events, ensure_ascii=False)
+        self.store.submit(_UPSERT_RELATIONSHIP_SQL, (
+            relationship.target_name, relationship.relationship_type,
+            relationship.trust_level, relationship.friendship_points,
+            relationship.last_interaction, memorable_events_json,
+            datetime.datetime.now().isoformat()
+        ))
     
     def add_game_knowledge(self, knowledge: GameKnowledge):
         """게임 지식 추가"""
-        with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO game_knowledge 
-                    (category, subject, knowledge, confidence_level, last_updated)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    knowledge.category, knowledge.subject, knowledge.knowledge,
-                    knowledge.confidence_level, knowledge.last_updated
-                ))
-                conn.commit()
+        self.store.submit(_UPSERT_KNOWLEDGE_SQL, (
+            knowledge.category, knowledge.subject, knowledge.knowledge,
+            knowledge.confidence_level, knowledge.last_updated
+        ))
     
     def update_behavioral_pattern(self, pattern: BehavioralPattern):
         """행동 패턴 업데이트"""
-        with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO behavioral_patterns 
-                    (situation_type, action_pattern, success_rate, usage_count, last_used, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    pattern.situation_type, pattern.action_pattern,
-                    pattern.success_rate, pattern.usage_count, pattern.last_used,
-                    datetime.datetime.now().isoformat()
-                ))
-                conn.commit()
+        self.store.submit(_UPSERT_PATTERN_SQL, (
+            pattern.situation_type, pattern.action_pattern,
+            pattern.success_rate, pattern.usage_count, pattern.last_used,
+            datetime.datetime.now().isoformat()
+        ))
     
     def add_emotional_state(self, emotion: EmotionalState):
         """감정 상태 추가"""
-        with self.lock:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO emotional_states 
-                    (timestamp, emotion_type, intensity, trigger_event, duration)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    emotion.timestamp, emotion.emotion_type, emotion.intensity,
-                    emotion.trigger_event, emotion.duration
-                ))
-                conn.commit()
+        self.store.submit(_INSERT_EMOTION_SQL, (
+            emotion.timestamp, emotion.emotion_type, emotion.intensity,
+            emotion.trigger_event, emotion.duration
+        ))
     
     def get_recent_learning_events(self, limit: int = 20) -> List[Dict]:
         """최근 학습 이벤트 조회"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM learning_events 
-                ORDER BY created_at DESC 
-                LIMIT ?
-            ''', (limit,))
-            
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return self.store.query_dicts('''
+            SELECT * FROM learning_events 
+            ORDER BY created_at DESC 
+            LIMIT ?
+        ''', (limit,))
     
     def get_relationship(self, target_name: str) -> Optional[Dict]:
         """특정 대상과의 관계 조회"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM relationships WHERE target_name = ?
-            ''', (target_name,))
-            
-            row = cursor.fetchone()
-            if row:
-                columns = [description[0] for description in cursor.description]
-                relationship = dict(zip(columns, row))
-                # JSON 문자열을 리스트로 변환
-                if relationship['memorable_events']:
-                    relationship['memorable_events'] = json.loads(relationship['memorable_events'])
-                else:
-                    relationship['memorable_events'] = []
-                return relationship
+        rows = self.store.query_dicts('''
+            SELECT * FROM relationships WHERE target_name = ?
+        ''', (target_name,))
+        if not rows:
             return None
+        relationship = rows[0]
+        # JSON 문자열을 리스트로 변환
+        if relationship['memorable_events']:
+            relationship['memorable_events'] = json.loads(relationship['memorable_events'])
+        else:
+            relationship['memorable_events'] = []
+        return relationship
     
     def get_knowledge_by_category(self, category: str) -> List[Dict]:
         """카테고리별 지식 조회"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM game_knowledge 
-                WHERE category = ? 
-                ORDER BY confidence_level DESC
-            ''', (category,))
-            
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return self.store.query_dicts('''
+            SELECT * FROM game_knowledge 
+            WHERE category = ? 
+            ORDER BY confidence_level DESC
+        ''', (category,))
     
     def get_behavioral_patterns(self, situation_type: str = None) -> List[Dict]:
         """행동 패턴 조회"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            if situation_type:
-                cursor.execute('''
-                    SELECT * FROM behavioral_patterns 
-                    WHERE situation_type = ? 
-                    ORDER BY success_rate DESC
-                ''', (situation_type,))
-            else:
-                cursor.execute('''
-                    SELECT * FROM behavioral_patterns 
-                    ORDER BY success_rate DESC
-                ''')
-            
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        if situation_type:
+            return self.store.query_dicts('''
+                SELECT * FROM behavioral_patterns 
+                WHERE situation_type = ? 
+                ORDER BY success_rate DESC
+            ''', (situation_type,))
+        return self.store.query_dicts('''
+            SELECT * FROM behavioral_patterns 
+            ORDER BY success_rate DESC
+        ''')
     
     def get_current_emotional_state(self) -> Optional[Dict]:
         """현재 감정 상태 조회 (가장 최근)"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM emotional_states 
-                ORDER BY created_at DESC 
-                LIMIT 1
-            ''')
-            
-            row = cursor.fetchone()
-            if row:
-                columns = [description[0] for description in cursor.description]
-                return dict(zip(columns, row))
-            return None
+        rows = self.store.query_dicts('''
+            SELECT * FROM emotional_states 
+            ORDER BY created_at DESC 
+            LIMIT 1
+        ''')
+        return rows[0] if rows else None
     
     def get_statistics(self) -> Dict[str, Any]:
         """데이터베이스 통계 조회"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            stats = {}
-            
-            # 학습 이벤트 수
-            cursor.execute('SELECT COUNT(*) FROM learning_events')
-            stats['total_learning_events'] = cursor.fetchone()[0]
-            
-            # 관계 수
-            cursor.execute('SELECT COUNT(*) FROM relationships')
-            stats['total_relationships'] = cursor.fetchone()[0]
-            
-            # 지식 수
-            cursor.execute('SELECT COUNT(*) FROM game_knowledge')
-            stats['total_knowledge_items'] = cursor.fetchone()[0]
-            
-            # 행동 패턴 수
-            cursor.execute('SELECT COUNT(*) FROM behavioral_patterns')
-            stats['total_behavioral_patterns'] = cursor.fetchone()[0]
-            
-            # 감정 기록 수
-            cursor.execute('SELECT COUNT(*) FROM emotional_states')
-            stats['total_emotional_records'] = cursor.fetchone()[0]
-            
-            # 평균 신뢰도
-            cursor.execute('SELECT AVG(trust_level) FROM relationships')
-            avg_trust = cursor.fetchone()[0]
-            stats['average_trust_level'] = avg_trust if avg_trust else 0.0
-            
-            return stats
+        row = self.store.query_one('''
+            SELECT
+                (SELECT COUNT(*) FROM learning_events),
+                (SELECT COUNT(*) FROM relationships),
+                (SELECT COUNT(*) FROM game_knowledge),
+                (SELECT COUNT(*) FROM behavioral_patterns),
+                (SELECT COUNT(*) FROM emotional_states),
+                (SELECT AVG(trust_level) FROM relationships)
+        ''')
+        return {
+            'total_learning_events': row[0],      # 학습 이벤트 수
+            'total_relationships': row[1],        # 관계 수
+            'total_knowledge_items': row[2],      # 지식 수
+            'total_behavioral_patterns': row[3],  # 행동 패턴 수
+            'total_emotional_records': row[4],    # 감정 기록 수
+            'average_trust_level': row[5] if row[5] else 0.0,  # 평균 신뢰도
+        }
 
 class AICharacterPresetManager:
     """AI 캐릭터 프리셋 관리"""
@@ -14,6 +14,8 @@ from enum import Enum
 import threading
 import queue
 
+from game.sqlite_store import get_sqlite_store
+
 # 기존 시스템 import
 try:
     from ai_character_database import AICharacterDatabase
@@ -98,11 +100,44 @@ class GroupDynamics:
     shared_goals: List[str]           # 공동 목표들
     group_achievements: List[str]     # 그룹 성과들
 
+_INSERT_INTERACTION_SQL = '''
+    INSERT INTO interactions (
+        timestamp, initiator, target, interaction_type, context,
+        emotion_before, emotion_after, success, outcome, relationship_change
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_UPSERT_RELATIONSHIP_SQL = '''
+    INSERT INTO relationships (ai1, ai2, relationship_score, last_updated)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(ai1, ai2) DO UPDATE SET
+        relationship_score = excluded.relationship_score,
+        last_updated = excluded.last_updated
+'''
+
+_UPSERT_GROUP_SQL = '''
+    INSERT INTO group_dynamics (
+        group_id, members, group_mood, leadership_scores,
+        cooperation_level, conflict_level, formed_time, last_activity,
+        shared_goals, group_achievements
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(group_id) DO UPDATE SET
+        members = excluded.members,
+        group_mood = excluded.group_mood,
+        leadership_scores = excluded.leadership_scores,
+        cooperation_level = excluded.cooperation_level,
+        conflict_level = excluded.conflict_level,
+        last_activity = excluded.last_activity,
+        shared_goals = excluded.shared_goals,
+        group_achievements = excluded.group_achievements
+'''
+
 class AIInteractionSystem:
     """AI 간 상호작용 시스템 매니저"""
     
     def __init__(self, database_path: str = "ai_interactions.db"):
         self.database_path = database_path
+        self.store = get_sqlite_store(database_path)  # 연결 재사용 + 쓰기 일괄 처리
         self.ai_engine = None
         self.active_groups: Dict[str, GroupDynamics] = {}
         self.relationship_matrix: Dict[Tuple[str, str], float] = {}
@@ -133,7 +168,7 @@ class AIInteractionSystem:
     def _init_database(self):
         """상호작용 데이터베이스 초기화"""
         try:
-            with sqlite3.connect(self.database_path) as conn:
+            with self.store.transaction() as conn:
                 cursor = conn.cursor()
                 
                 # 상호작용 히스토리 테이블
@@ -180,7 +215,6 @@ class AIInteractionSystem:
                     )
                 ''')
                 
-                conn.commit()
                 print("✅ AI 상호작용 데이터베이스 초기화 완료")
                 
         except Exception as e:
@@ -501,57 +535,34 @@ class AIInteractionSystem:
     def _save_interaction_to_db(self, interaction: AIInteraction):
         """상호작용을 데이터베이스에 저장"""
         try:
-            with sqlite3.connect(self.database_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO interactions (
-                        timestamp, initiator, target, interaction_type, context,
-                        emotion_before, emotion_after, success, outcome, relationship_change
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    interaction.timestamp, interaction.initiator, interaction.target,
-                    interaction.interaction_type.value, interaction.context,
-                    interaction.emotion_before.value, interaction.emotion_after.value,
-                    interaction.success, interaction.outcome, interaction.relationship_change
-                ))
-                conn.commit()
-                
+            self.store.submit(_INSERT_INTERACTION_SQL, (
+                interaction.timestamp, interaction.initiator, interaction.target,
+                interaction.interaction_type.value, interaction.context,
+                interaction.emotion_before.value, interaction.emotion_after.value,
+                interaction.success, interaction.outcome, interaction.relationship_change
+            ))
+            
         except Exception as e:
             print(f"❌ 상호작용 저장 실패: {e}")
     
     def _save_relationship_to_db(self, ai1: str, ai2: str, score: float):
         """관계도를 데이터베이스에 저장"""
         try:
-            with sqlite3.connect(self.database_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO relationships (ai1, ai2, relationship_score, last_updated)
-                    VALUES (?, ?, ?, ?)
-                ''', (ai1, ai2, score, time.time()))
-                conn.commit()
-                
+            self.store.submit(_UPSERT_RELATIONSHIP_SQL, (ai1, ai2, score, time.time()))
+            
         except Exception as e:
             print(f"❌ 관계도 저장 실패: {e}")
     
     def _save_group_to_db(self, group: GroupDynamics):
         """그룹 정보를 데이터베이스에 저장"""
         try:
-            with sqlite3.connect(self.database_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO group_dynamics (
-                        group_id, members, group_mood, leadership_scores,
-                        cooperation_level, conflict_level, formed_time, last_activity,
-                        shared_goals, group_achievements
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    group.group_id, json.dumps(group.members), group.group_mood.value,
-                    json.dumps(group.leadership_score), group.cooperation_level,
-                    group.conflict_level, group.formed_time, group.last_activity,
-                    json.dumps(group.shared_goals), json.dumps(group.group_achievements)
-                ))
-                conn.commit()
-                
+            self.store.submit(_UPSERT_GROUP_SQL, (
+                group.group_id, json.dumps(group.members), group.group_mood.value,
+                json.dumps(group.leadership_score), group.cooperation_level,
+                group.conflict_level, group.formed_time, group.last_activity,
+                json.dumps(group.shared_goals), json.dumps(group.group_achievements)
+            ))
+            
         except Exception as e:
             print(f"❌ 그룹 정보 저장 실패: {e}")
     
@@ -1037,6 +1048,7 @@ class AIInteractionSystem:
         self.running = False
         if self.processing_thread:
             self.processing_thread.join(timeout=1.0)
+        self.store.flush(timeout=5.0)
         print("🔄 AI 상호작용 시스템 종료")
 
 # 전역 인스턴스
@@ -22,6 +22,9 @@ from ai_character_database import AICharacterDatabase, LearningEvent
 from ai_interaction_system import AIInteractionSystem, EmotionState, InteractionType
 from ai_cooperation_system import AICooperationSystem
 from complete_27_job_system import Complete27JobSystem, job_system
+from game.json_store import schedule_json_save, flush_json_saves
+from game.battle_training_runner import (battle_engine_available, battle_success_rate, make_training_task,
+                                         run_training_battles)
 
 class TrainingMode(Enum):
     """훈련 모드 타입"""
@@ -85,6 +88,10 @@ class AILearningProfile:
     performance_history: List[Dict[str, Any]]
     adaptation_score: float  # 적응력 점수
 
+# 실제 헤드리스 전투 결과로 평가하는 훈련 단계
+COMBAT_STEP_TYPES = ("basic_combat", "skill_practice", "defensive_training", "combat_simulation")
+BATTLES_PER_PARTICIPANT = 4
+
 class AITrainingSystem:
     """AI 훈련 시스템 메인 클래스"""
     
@@ -222,6 +229,7 @@ class AITrainingSystem:
         """AI 학습 프로필 로드"""
         profile_file = os.path.join(self.training_data_dir, "ai_learning_profiles.json")
         
+        flush_json_saves(profile_file)
         if os.path.exists(profile_file):
             try:
                 with open(profile_file, 'r', encoding='utf-8') as f:
@@ -233,15 +241,11 @@ class AITrainingSystem:
                 print(f"⚠️ AI 프로필 로드 실패: {e}")
     
     def _save_ai_profiles(self):
-        """AI 학습 프로필 저장"""
+        """AI 학습 프로필 저장 예약"""
         profile_file = os.path.join(self.training_data_dir, "ai_learning_profiles.json")
-        
-        try:
-            data = {name: asdict(profile) for name, profile in self.ai_profiles.items()}
-            with open(profile_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
-        except Exception as e:
-            print(f"⚠️ AI 프로필 저장 실패: {e}")
+        schedule_json_save(profile_file,
+                           lambda: {name: asdict(profile) for name, profile in list(self.ai_profiles.items())},
+                           default=str)
     
     def _start_auto_save_thread(self):
         """자동 저장 스레드 시작"""
@@ -256,15 +260,11 @@ class AITrainingSystem:
         print("🔄 자동 저장 스레드 시작")
     
     def _save_training_history(self):
-        """훈련 히스토리 저장"""
+        """훈련 히스토리 저장 예약"""
         history_file = os.path.join(self.training_data_dir, "training_history.json")
-        
-        try:
-            data = [asdict(session) for session in self.training_history[-100:]]  # 최근 100개만
-            with open(history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
-        except Exception as e:
-            print(f"⚠️ 훈련 히스토리 저장 실패: {e}")
+        schedule_json_save(history_file,
+                           lambda: [asdict(session) for session in self.training_history[-100:]],  # 최근 100개만
+                           default=str)
     
     def create_ai_profile(self, ai_name: str, job_class: str) -> AILearningProfile:
         """새로운 AI 학습 프로필 생성"""
@@ -377,6 +377,10 @@ class AITrainingSystem:
         
         print(f"🔄 훈련 실행 시작: {scenario.name}")
         
+        # 전투 훈련은 실제 전투를 먼저 병렬로 치르고 그 결과로 단계별 성과 평가
+        if scenario.training_mode == TrainingMode.COMBAT_TRAINING and battle_engine_available():
+            session.performance_metrics["battle_scores"] = self._run_training_battles(session)
+        
         # 훈련 단계별 실행
         training_steps = self._generate_training_steps(scenario)
         total_steps = len(training_steps)
@@ -401,6 +405,28 @@ class AITrainingSystem:
         # 훈련 완료 처리
         self._complete_training_session(session_id)
     
+    def _run_training_battles(self, session: TrainingSession) -> Dict[str, float]:
+        """참가자별 헤드리스 전투 실행 → 참가자별 평균 성과 (0~1)"""
+        difficulty = {
+            TrainingDifficulty.BEGINNER: 0.75,
+            TrainingDifficulty.INTERMEDIATE: 1.0,
+            TrainingDifficulty.ADVANCED: 1.25,
+            TrainingDifficulty.EXPERT: 1.5,
+            TrainingDifficulty.MASTER: 2.0
+        }[session.scenario.difficulty]
+        
+        tasks = []
+        for participant in session.participants:
+            job_class = self.ai_profiles[participant].job_class
+            for _ in range(BATTLES_PER_PARTICIPANT):
+                tasks.append(make_training_task(len(tasks), participant, job_class, difficulty=difficulty))
+        
+        scores: Dict[str, List[float]] = {}
+        for result in run_training_battles(tasks):
+            if not result["error"]:
+                scores.setdefault(result["ai_name"], []).append(battle_success_rate(result))
+        return {name: sum(values) / len(values) for name, values in scores.items()}
+    
     def _generate_training_steps(self, scenario: TrainingScenario) -> List[Dict[str, Any]]:
         """훈련 단계 생성"""
         steps = []
@@ -450,25 +476,31 @@ class AITrainingSystem:
         
         # 각 참가자의 성과 시뮬레이션
         step_results = {}
+        battle_scores = session.performance_metrics.get("battle_scores", {})
         
         for participant in participants:
             profile = self.ai_profiles[participant]
             
             # 성과 계산 (학습률, 난이도, 개인 특성 고려)
-            base_performance = random.uniform(0.3, 0.9)
+            if step["type"] in COMBAT_STEP_TYPES and participant in battle_scores:
+                # 실제 전투 성과 (난이도는 적 HP로 이미 반영됨)
+                base_performance = battle_scores[participant]
+                difficulty_modifier = 0.0
+            else:
+                base_performance = random.uniform(0.3, 0.9)
+                
+                # 난이도 조정
+                difficulty_modifier = {
+                    TrainingDifficulty.BEGINNER: 0.2,
+                    TrainingDifficulty.INTERMEDIATE: 0.0,
+                    TrainingDifficulty.ADVANCED: -0.2,
+                    TrainingDifficulty.EXPERT: -0.3,
+                    TrainingDifficulty.MASTER: -0.4
+                }[scenario.difficulty]
             
             # 학습률 적용
             learning_bonus = (profile.learning_rate - 1.0) * 0.3
             
-            # 난이도 조정
-            difficulty_modifier = {
-                TrainingDifficulty.BEGINNER: 0.2,
-                TrainingDifficulty.INTERMEDIATE: 0.0,
-                TrainingDifficulty.ADVANCED: -0.2,
-                TrainingDifficulty.EXPERT: -0.3,
-                TrainingDifficulty.MASTER: -0.4
-            }[scenario.difficulty]
-            
             # 개인 특성 적용
             trait_bonus = 0.0
             if step["type"] in ["combat_simulation", "basic_combat"]:
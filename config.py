@@ -259,6 +259,15 @@ class GameConfig:
             "memory_duration": 10,  # 기억 지속 턴 수
         }
         
+        # 보스/정예 AI 수읽기 (몬테카를로 롤아웃, game/boss_lookahead.py)
+        self.BOSS_AI_SETTINGS = {
+            "lookahead_enabled": True,  # 보스 행동을 롤아웃 탐색으로 결정
+            "lookahead_budget_ms": 120,  # 결정당 탐색 시간 (밀리초)
+            "rollout_depth": 12,  # 롤아웃 한 번에 시뮬레이션할 행동 수
+            "include_elites": True,  # 정예/챔피언 적도 수읽기 사용
+            "use_worker_process": True,  # 별도 프로세스에서 탐색 (UI 멈춤 방지)
+        }
+        
         # 난이도별 적 AI 보정
         self.AI_DIFFICULTY_MODIFIERS = {
             "평온": {
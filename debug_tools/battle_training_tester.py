@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+헤드리스 훈련 전투 러너 디버그 테스터
+워커 프로세스(_init_worker) 환경에서 전투가 입력을 기다리며 멈추지 않는지,
+전투 실행이 게임의 전역 난수 흐름을 바꾸지 않는지 확인
+
+사용법:
+    python debug_tools/battle_training_tester.py
+"""
+
+import sys
+import os
+import random
+import tempfile
+import multiprocessing
+from contextlib import contextmanager
+
+# 게임 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WORKER_BATTLE_TIMEOUT = 60.0   # 이 시간 안에 끝나지 않으면 멈춘 것으로 판정
+SKIPPED = None                 # 테스트 함수가 확인하지 못했을 때 반환 (성공/실패와 구분)
+
+
+@contextmanager
+def scratch_working_directory():
+    """임시 디렉토리를 작업 디렉토리로 사용 - 전투가 남기는 게임로그/ 등이 저장소에 쌓이지 않도록"""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="battle_training_") as scratch:
+        os.chdir(scratch)
+        try:
+            yield scratch
+        finally:
+            os.chdir(previous)
+
+
+def _worker_battle(result_queue):
+    """spawn 프로세스 안에서 워커 초기화 후 전투 한 판 (stdin은 /dev/null)"""
+    from game.battle_training_runner import _init_worker, make_training_task, run_headless_battle
+    sys.stdin = open(os.devnull, 'r')
+    _init_worker()
+    task = make_training_task(1, "테스트AI", "성기사", random.Random(7))
+    result_queue.put(run_headless_battle(task))
+
+
+def test_worker_battle_does_not_hang():
+    """_init_worker() 환경에서 전투 한 판이 시간 안에 끝나는지"""
+    print("⚔️ 워커 환경 전투 테스트")
+    print("=" * 60)
+    from game.battle_training_runner import battle_engine_available
+
+    context = multiprocessing.get_context('spawn')
+    result_queue = context.Queue()
+    process = context.Process(target=_worker_battle, args=(result_queue,), daemon=True)
+    process.start()
+    try:
+        result = result_queue.get(timeout=WORKER_BATTLE_TIMEOUT)
+    except Exception:
+        process.terminate()
+        process.join(5)
+        print(f"❌ 전투가 {WORKER_BATTLE_TIMEOUT:.0f}초 안에 끝나지 않음 (입력 대기로 멈춤)")
+        return False
+    process.join(5)
+
+    print(f"  결과: 승리={result['victory']} 턴={result['turns']} 소요={result['elapsed']:.2f}초")
+    if result['error']:
+        if not battle_engine_available():
+            print(f"⏭️ 전투 엔진을 불러올 수 없어 실제 전투는 확인하지 못함: {result['error']}")
+            return SKIPPED
+        print(f"❌ 전투 오류: {result['error']}")
+        return False
+    print("✅ 워커 환경 전투 완료")
+    return True
+
+
+def test_battle_keeps_global_random_state():
+    """같은 프로세스에서 전투를 돌려도 전역 random 흐름이 그대로인지"""
+    print("🎲 전역 난수 상태 보존 테스트")
+    print("=" * 60)
+    from game.battle_training_runner import make_training_task, run_headless_battle
+
+    random.seed(12345)
+    expected = [random.random() for _ in range(3)]
+
+    random.seed(12345)
+    run_headless_battle(make_training_task(2, "테스트AI", "전사", random.Random(3)))
+    actual = [random.random() for _ in range(3)]
+
+    if actual != expected:
+        print(f"❌ 전투 후 난수 흐름이 바뀜: {actual} != {expected}")
+        return False
+    print("✅ 전역 난수 상태 유지")
+    return True
+
+
+def main():
+    """메인 테스트 실행"""
+    tests = [
+        ("워커 환경 전투", test_worker_battle_does_not_hang),
+        ("전역 난수 상태 보존", test_battle_keeps_global_random_state),
+    ]
+
+    results = {}
+    # 워커 프로세스는 작업 디렉토리를 물려받으므로 여기서 한 번만 옮김
+    with scratch_working_directory():
+        for test_name, test_func in tests:
+            print(f"\n🚀 {test_name} 테스트 시작...")
+            try:
+                outcome = test_func()
+                results[test_name] = SKIPPED if outcome is SKIPPED else bool(outcome)
+            except Exception as e:
+                print(f"💥 크래시: {e}")
+                results[test_name] = False
+
+    print("\n" + "=" * 60)
+    print("📋 테스트 결과 요약")
+    print("=" * 60)
+    for test_name, passed in results.items():
+        if passed is SKIPPED:
+            print(f"{test_name}: ⏭️ 건너뜀")
+        else:
+            print(f"{test_name}: {'✅ 성공' if passed else '❌ 실패'}")
+    # 건너뛴 테스트는 실패로 치지 않지만 성공으로도 보고하지 않음
+    return 1 if any(passed is False for passed in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+전투/필드 핫패스 마이크로 벤치마크
+고정 시드와 표준 파티/적 픽스처로 주요 경로의 ops/sec와 메모리 할당량을 측정하고
+저장된 기준치(benchmark_baseline.json) 대비 성능 회귀를 검사
+
+속도는 각 항목 바로 앞에서 잰 기준 작업(순수 파이썬 루프) 대비 비율로 비교하므로
+기준치를 만든 컴퓨터와 속도가 다른 환경에서도 그대로 쓸 수 있음.
+다른 프로세스 부하로 잠깐 느려진 측정은 회귀로 보인 항목만 다시 재서 걸러냄.
+필요한 모듈이 없어 픽스처를 만들 수 없는 항목은 "사용 불가"로 표시하고 실패로 치지 않음
+
+사용법:
+    python debug_tools/combat_benchmark.py                   # 측정 + 기준치 비교
+    python debug_tools/combat_benchmark.py --update-baseline # 기준치 갱신
+    python debug_tools/combat_benchmark.py --only atb,world  # 이름에 포함된 항목만 실행
+"""
+
+import sys
+import os
+import io
+import gc
+import json
+import time
+import random
+import shutil
+import argparse
+import builtins
+import tempfile
+import tracemalloc
+import contextlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# 게임 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+DEFAULT_THRESHOLD = 0.35   # 기준치 대비 35% 이상 느려지거나 할당이 늘면 회귀 (같은 실행 안의 측정 편차 감안)
+REFERENCE_ITERATIONS = 100 # 기준 작업 반복 횟수 (항목마다 바로 앞에서 측정)
+CONFIRM_ATTEMPTS = 3       # 회귀로 보인 항목을 다시 재는 횟수 (가장 빠른 값으로 재판정)
+BENCHMARK_SEED = 20250814
+WORLD_SEED = 424242
+
+PARTY_FIXTURE = [("벤치전사", "전사"), ("벤치아크메이지", "아크메이지"), ("벤치궁수", "궁수"), ("벤치성기사", "성기사")]
+ENEMY_FIXTURE = [("벤치적1", "전사"), ("벤치적2", "암살자"), ("벤치적3", "아크메이지")]
+
+
+@dataclass
+class BenchmarkCase:
+    """벤치마크 항목 하나"""
+    name: str
+    setup: Callable[[], Any]            # 픽스처 생성 (측정 제외)
+    run: Callable[[Any], Any]           # 측정 대상 1회 실행
+    iterations: int = 200
+    reset: Optional[Callable[[Any], None]] = None  # 매 반복 전 상태 복원 (측정 제외)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    ops_per_sec: float = 0.0
+    relative_speed: float = 0.0     # ops_per_sec / 바로 앞에서 잰 기준 작업 ops/sec
+    alloc_kb_per_op: float = 0.0
+    peak_kb: float = 0.0
+    unavailable: Optional[str] = None  # 저장소에 없는 모듈에 의존 - 측정 불가 (실패 아님)
+    skipped: Optional[str] = None      # 픽스처/실행 중 오류 - 실패
+    regressions: List[str] = field(default_factory=list)
+
+
+# =====================================
+# 🔇 측정 환경 (출력/대기/입력 차단)
+# =====================================
+
+class _NullWriter(io.TextIOBase):
+    """출력 버림"""
+
+    def write(self, text):
+        return len(text)
+
+
+@contextlib.contextmanager
+def quiet_game_runtime():
+    """게임 코드의 print/sleep/input이 측정값을 오염시키지 않도록 차단"""
+    original_sleep = time.sleep
+    original_input = builtins.input
+    time.sleep = lambda *_args, **_kwargs: None
+    builtins.input = lambda *_args, **_kwargs: ""
+    try:
+        # StringIO는 출력이 쌓이며 커지므로 버리는 싱크 사용
+        with contextlib.redirect_stdout(_NullWriter()):
+            yield
+    finally:
+        time.sleep = original_sleep
+        builtins.input = original_input
+
+
+@contextlib.contextmanager
+def scratch_working_directory():
+    """게임 모듈이 현재 디렉토리에 만드는 로그(게임로그/ 등)를 임시 디렉토리에 쓰도록 전환"""
+    original_cwd = os.getcwd()
+    scratch_dir = tempfile.mkdtemp(prefix="dos_bench_run_")
+    os.chdir(scratch_dir)
+    try:
+        yield scratch_dir
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+def reseed():
+    random.seed(BENCHMARK_SEED)
+
+
+# =====================================
+# 🧪 표준 픽스처
+# =====================================
+
+def make_party():
+    from game.character import Character
+    reseed()
+    return [Character(name, job) for name, job in PARTY_FIXTURE]
+
+
+def make_enemies():
+    from game.character import Character
+    reseed()
+    return [Character(name, job) for name, job in ENEMY_FIXTURE]
+
+
+def make_combat():
+    from game.brave_combat import BraveCombatSystem
+    combat = BraveCombatSystem()
+    party, enemies = make_party(), make_enemies()
+    combat.current_party = party
+    combat.current_enemies = enemies
+    return {'combat': combat, 'party': party, 'enemies': enemies, 'all': party + enemies}
+
+
+def reset_combatants(fixture):
+    """매 반복마다 HP/BRV/ATB를 같은 값으로 되돌림"""
+    reseed()
+    for char in fixture['all']:
+        char.current_hp = char.max_hp
+        char.atb_gauge = 500
+        if hasattr(char, 'brave_points'):
+            char.brave_points = 1500
+
+
+def make_world():
+    from game.world import GameWorld
+    reseed()
+    world = GameWorld(width=50, height=50)
+    world.generate_level(saved_seed=WORLD_SEED)
+    return world
+
+
+# =====================================
+# 📋 벤치마크 항목
+# =====================================
+
+def _combat_cases() -> List[BenchmarkCase]:
+    def bench_atb(fx):
+        fx['combat'].update_atb_gauges(fx['all'], show_animation=False)
+
+    def reset_atb(fx):
+        for char in fx['all']:
+            char.atb_gauge = 0
+
+    def bench_brave_attack(fx):
+        fx['combat'].execute_brave_attack(fx['party'][0], fx['enemies'][0])
+
+    def bench_hp_attack(fx):
+        fx['combat']._execute_hp_attack_on_target(fx['party'][0], fx['enemies'][0], None)
+
+    return [
+        BenchmarkCase("combat.update_atb_gauges", make_combat, bench_atb, 2000, reset_atb),
+        BenchmarkCase("combat.execute_brave_attack", make_combat, bench_brave_attack, 100, reset_combatants),
+        BenchmarkCase("combat.execute_hp_attack_on_target", make_combat, bench_hp_attack, 100, reset_combatants),
+    ]
+
+
+def _skill_cases() -> List[BenchmarkCase]:
+    def setup():
+        return {'party': make_party(), 'enemies': make_enemies()}
+
+    def bench(fx):
+        from game.new_skill_system import apply_special_effect
+        caster, target = fx['party'][0], fx['enemies'][0]
+        for effect in ("stance_adaptation", "enemy_analysis", "guardian_bonus", "melody_build"):
+            apply_special_effect(effect, caster, target, {"name": "벤치 스킬"})
+
+    return [BenchmarkCase("skill.apply_special_effect", setup, bench, 500)]
+
+
+def _gauge_cases() -> List[BenchmarkCase]:
+    def setup():
+        from game.optimized_gauge_system import OptimizedGaugeSystem
+        OptimizedGaugeSystem.clear_status_cache()
+        return make_party() + make_enemies()
+
+    def bench_cached(chars):
+        from game.optimized_gauge_system import OptimizedGaugeSystem
+        for char in chars:
+            OptimizedGaugeSystem.create_compact_character_status(char)
+
+    def bench_changing(chars):
+        from game.optimized_gauge_system import OptimizedGaugeSystem
+        for char in chars:
+            char.atb_gauge = (getattr(char, 'atb_gauge', 0) + 37) % 2000
+            OptimizedGaugeSystem.create_compact_character_status(char)
+
+    return [
+        BenchmarkCase("gauge.compact_status_cached", setup, bench_cached, 2000),
+        BenchmarkCase("gauge.compact_status_changing", setup, bench_changing, 500),
+    ]
+
+
+def _world_cases() -> List[BenchmarkCase]:
+    def bench_generate(world):
+        world.generate_level(saved_seed=WORLD_SEED)
+
+    def bench_visibility(world):
+        world.update_visibility()
+
+    def bench_move(world):
+        world.move_enemies()
+
+    def reset_enemies(world):
+        reseed()
+        world.enemies_positions = list(world._benchmark_enemy_positions)
+
+    def setup_move():
+        world = make_world()
+        world._benchmark_enemy_positions = list(world.enemies_positions)
+        return world
+
+    return [
+        BenchmarkCase("world.generate_level", make_world, bench_generate, 10),
+        BenchmarkCase("world.update_visibility", make_world, bench_visibility, 200),
+        BenchmarkCase("world.move_enemies", setup_move, bench_move, 200, reset_enemies),
+    ]
+
+
+def _save_cases() -> List[BenchmarkCase]:
+    def setup():
+        from game.save_system import SaveManager
+        temp_dir = tempfile.mkdtemp(prefix="dos_bench_")
+        party = make_party()
+        state = {
+            'party': [{'name': c.name, 'character_class': c.character_class, 'level': c.level,
+                       'current_hp': c.current_hp, 'max_hp': c.max_hp} for c in party],
+            'world': {'current_level': 3, 'seed': WORLD_SEED,
+                      'explored': [[(x * y) % 2 == 0 for x in range(50)] for y in range(50)]},
+        }
+        manager = SaveManager(save_dir=temp_dir)
+        manager.save_game(dict(state), "bench_slot")
+        return {'manager': manager, 'state': state, 'dir': temp_dir}
+
+    def bench_save(fx):
+        fx['manager'].save_game(dict(fx['state']), "bench_slot")
+
+    def bench_load(fx):
+        fx['manager'].load_game("bench_slot")
+
+    return [
+        BenchmarkCase("save.save_game", setup, bench_save, 50),
+        BenchmarkCase("save.load_game", setup, bench_load, 50),
+    ]
+
+
+def _item_cases() -> List[BenchmarkCase]:
+    def setup():
+        from game.items import ItemDatabase
+        names = [item.name for item in ItemDatabase.get_all_items()]
+        return names[::max(1, len(names) // 8)][:8]
+
+    def bench_lookup(names):
+        from game.items import ItemDatabase
+        for name in names:
+            ItemDatabase.get_item(name)
+
+    def bench_random(_names):
+        from game.items import ItemDatabase
+        ItemDatabase.get_random_item()
+
+    return [
+        BenchmarkCase("items.get_item", setup, bench_lookup, 20),
+        BenchmarkCase("items.get_random_item", setup, bench_random, 50),
+    ]
+
+
+def all_cases() -> List[BenchmarkCase]:
+    return _combat_cases() + _skill_cases() + _gauge_cases() + _world_cases() + _save_cases() + _item_cases()
+
+
+# =====================================
+# ⏱️ 측정
+# =====================================
+
+def _reference_workload():
+    """컴퓨터 속도 기준 작업 - 게임 코드와 비슷한 dict/list/문자열 위주의 순수 파이썬 연산"""
+    rng = random.Random(BENCHMARK_SEED)
+    stats = {f"stat{i}": rng.randint(1, 100) for i in range(32)}
+    total = 0
+    for _ in range(20):
+        ranked = sorted(stats.items(), key=lambda item: (item[1], item[0]))
+        total += sum(value for _, value in ranked[:8])
+        stats = {name: (value * 7 + total) % 101 for name, value in stats.items()}
+    return f"{total:08d}"
+
+
+def measure_reference_speed(repeats: int = 5) -> float:
+    """기준 작업 ops/sec (repeats번 중 가장 빠른 값)"""
+    case = BenchmarkCase("reference", lambda: None, lambda _fixture: _reference_workload(), REFERENCE_ITERATIONS)
+    best = min(_timed_loop(case, None, case.iterations) for _ in range(max(1, repeats)))
+    return case.iterations / best if best else 0.0
+
+
+def _is_repo_module(module_name: Optional[str]) -> bool:
+    """저장소 안에 있어야 하는 모듈인지 (game.xxx 등)"""
+    if not module_name:
+        return False
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    top = module_name.split(".")[0]
+    return os.path.isdir(os.path.join(root, top)) or os.path.isfile(os.path.join(root, top + ".py"))
+
+
+def run_case(case: BenchmarkCase, repeats: int = 5) -> BenchmarkResult:
+    """워밍업 1회 후 repeats번 측정해 가장 빠른 값 사용, 할당량은 별도 1회 측정
+
+    기준 작업을 바로 앞에서 재서 상대 속도(relative_speed)도 함께 계산
+    """
+    result = BenchmarkResult(case.name)
+    reference_ops = measure_reference_speed(repeats)
+    try:
+        with quiet_game_runtime():
+            reseed()
+            fixture = case.setup()
+            _timed_loop(case, fixture, max(1, case.iterations // 10))
+
+            best = None
+            for _ in range(repeats):
+                elapsed = _timed_loop(case, fixture, case.iterations)
+                best = elapsed if best is None else min(best, elapsed)
+
+            tracemalloc.start()
+            try:
+                tracemalloc.reset_peak() if hasattr(tracemalloc, 'reset_peak') else None
+                before, _ = tracemalloc.get_traced_memory()
+                _timed_loop(case, fixture, case.iterations)
+                after, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            if isinstance(fixture, dict) and 'dir' in fixture:
+                shutil.rmtree(fixture['dir'], ignore_errors=True)
+    except ModuleNotFoundError as e:
+        if _is_repo_module(e.name):
+            result.skipped = f"{type(e).__name__}: {e}"   # 저장소 안 모듈을 못 찾는 건 실제 오류
+        else:
+            result.unavailable = f"'{e.name}' 모듈 없음"
+        return result
+    except Exception as e:
+        result.skipped = f"{type(e).__name__}: {e}"
+        return result
+
+    result.ops_per_sec = case.iterations / best if best else 0.0
+    result.relative_speed = result.ops_per_sec / reference_ops if reference_ops else 0.0
+    result.alloc_kb_per_op = max(0, after - before) / 1024 / case.iterations
+    result.peak_kb = max(0, peak - before) / 1024
+    return result
+
+
+def _timed_loop(case: BenchmarkCase, fixture, iterations: int) -> float:
+    """reset은 측정 시간에서 제외, GC는 측정 중 정지 (timeit과 동일 - 수집 시점에 따른 편차 제거)"""
+    elapsed = 0.0
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            if case.reset:
+                case.reset(fixture)
+            start = time.perf_counter()
+            case.run(fixture)
+            elapsed += time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return elapsed
+
+
+# =====================================
+# 📊 기준치 비교
+# =====================================
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results: List[BenchmarkResult], threshold: float, path: str = BASELINE_PATH):
+    existing = load_baseline(path).get('benchmarks', {})
+    for r in results:
+        if r.skipped is None and r.unavailable is None:
+            existing[r.name] = {
+                'relative_speed': round(r.relative_speed, 6),
+                'ops_per_sec': round(r.ops_per_sec, 2),   # 참고용 (비교에는 relative_speed 사용)
+                'alloc_kb_per_op': round(r.alloc_kb_per_op, 3),
+            }
+    data = {'threshold': threshold, 'seed': BENCHMARK_SEED, 'benchmarks': existing}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def check_regressions(results: List[BenchmarkResult], baseline: Dict[str, Any], threshold: float):
+    """기준 작업 대비 속도가 (1-threshold)배 미만이거나 할당량이 (1+threshold)배 초과면 회귀"""
+    benchmarks = baseline.get('benchmarks', {})
+    for r in results:
+        base = benchmarks.get(r.name)
+        r.regressions = []
+        if r.skipped is not None or r.unavailable is not None or not base or 'relative_speed' not in base:
+            continue
+        if r.relative_speed < base['relative_speed'] * (1 - threshold):
+            r.regressions.append(f"상대 속도 {r.relative_speed:.4g} < 기준 {base['relative_speed']:.4g} "
+                                 f"({r.relative_speed / base['relative_speed']:.0%})")
+        # 작은 할당량은 노이즈가 크므로 1KB 여유를 둠
+        if r.alloc_kb_per_op > base['alloc_kb_per_op'] * (1 + threshold) + 1.0:
+            r.regressions.append(f"할당 {r.alloc_kb_per_op:,.2f} > 기준 {base['alloc_kb_per_op']:,.2f} KB/op")
+
+
+def confirm_regressions(cases: List[BenchmarkCase], results: List[BenchmarkResult],
+                        baseline: Dict[str, Any], threshold: float, repeats: int):
+    """회귀로 보인 항목만 CONFIRM_ATTEMPTS번 다시 재서 가장 빠른 값으로 재판정
+
+    느려지는 노이즈(다른 프로세스 부하)는 있어도 빨라지는 노이즈는 없으므로
+    여러 번 중 가장 빠른 측정이 실제 성능에 가장 가까움
+    """
+    check_regressions(results, baseline, threshold)
+    cases_by_name = {case.name: case for case in cases}
+    for result in results:
+        for _ in range(CONFIRM_ATTEMPTS):
+            if not result.regressions:
+                break
+            print(f"   🔁 {result.name} 재측정 ...", flush=True)
+            retry = run_case(cases_by_name[result.name], repeats)
+            if retry.skipped is not None:
+                break
+            if retry.relative_speed > result.relative_speed:
+                result.relative_speed, result.ops_per_sec = retry.relative_speed, retry.ops_per_sec
+            result.alloc_kb_per_op = min(result.alloc_kb_per_op, retry.alloc_kb_per_op)
+            check_regressions([result], baseline, threshold)
+
+
+def print_report(results: List[BenchmarkResult], baseline: Dict[str, Any]):
+    benchmarks = baseline.get('benchmarks', {})
+    print("\n📊 벤치마크 결과")
+    print("=" * 86)
+    print(f"{'항목':<38}{'ops/sec':>12}{'KB/op':>10}{'peak KB':>10}{'기준 대비':>12}")
+    print("-" * 86)
+    for r in results:
+        if r.unavailable is not None:
+            print(f"⏭️  {r.name:<35} 사용 불가 ({r.unavailable[:40]})")
+            continue
+        if r.skipped is not None:
+            print(f"💥 {r.name:<35} 측정 실패 ({r.skipped[:40]})")
+            continue
+        base = benchmarks.get(r.name)
+        if base and base.get('relative_speed'):
+            ratio = f"{r.relative_speed / base['relative_speed'] * 100:>10.0f}%"
+        else:
+            ratio = f"{'-':>11}"
+        mark = "❌" if r.regressions else "✅"
+        print(f"{mark} {r.name:<35}{r.ops_per_sec:>12,.1f}{r.alloc_kb_per_op:>10.2f}{r.peak_kb:>10.1f} {ratio}")
+        for reason in r.regressions:
+            print(f"     ⚠️ {reason}")
+    print("=" * 86)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Dawn of Stellar 핫패스 벤치마크")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 결과로 기준치 갱신")
+    parser.add_argument("--threshold", type=float, default=None, help="회귀 허용 비율 (기본: 기준치 파일 값)")
+    parser.add_argument("--only", default="", help="쉼표로 구분된 이름 필터")
+    parser.add_argument("--repeats", type=int, default=5, help="측정 반복 횟수")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline()
+    threshold = args.threshold if args.threshold is not None else baseline.get('threshold', DEFAULT_THRESHOLD)
+    filters = [f.strip() for f in args.only.split(",") if f.strip()]
+
+    cases = [c for c in all_cases() if not filters or any(f in c.name for f in filters)]
+    print(f"🏁 벤치마크 {len(cases)}개 실행 (시드 {BENCHMARK_SEED}, 허용 {threshold:.0%})")
+
+    results = []
+    with scratch_working_directory():
+        for case in cases:
+            print(f"   ⏱️ {case.name} ...", flush=True)
+            results.append(run_case(case, args.repeats))
+        if not args.update_baseline:
+            confirm_regressions(cases, results, baseline, threshold, args.repeats)
+
+    # 오류로 측정하지 못한 항목은 조용히 통과시키지 않음 - 회귀를 놓칠 수 있으므로 실패로 처리
+    # (저장소에 없는 모듈이 필요한 항목은 사용 불가로만 표시)
+    skipped = [r for r in results if r.skipped is not None]
+    unavailable = [r for r in results if r.unavailable is not None]
+    if unavailable:
+        print(f"⏭️ 사용 불가 {len(unavailable)}건 (필요한 모듈 없음): {', '.join(r.name for r in unavailable)}")
+
+    if args.update_baseline:
+        save_baseline(results, threshold)
+        print_report(results, load_baseline())
+        print(f"💾 기준치 저장: {BASELINE_PATH}")
+        if skipped:
+            print(f"❌ 측정 실패 {len(skipped)}건 (기준치에 반영되지 않음): {', '.join(r.name for r in skipped)}")
+            return 1
+        return 0
+
+    print_report(results, baseline)
+
+    regressed = [r.name for r in results if r.regressions]
+    if regressed:
+        print(f"❌ 성능 회귀 {len(regressed)}건: {', '.join(regressed)}")
+    if skipped:
+        print(f"❌ 측정 실패 {len(skipped)}건: {', '.join(r.name for r in skipped)}")
+        for r in skipped:
+            print(f"     ⚠️ {r.name}: {r.skipped}")
+    if regressed or skipped:
+        return 1
+    if not baseline:
+        print("💡 기준치가 없습니다. --update-baseline으로 생성하세요.")
+    print("✅ 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
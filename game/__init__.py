@@ -5,8 +5,12 @@
 __version__ = "4.3.0"
 __author__ = "Roguelike Game Developer"
 
-# 주요 모듈 import
-try:
-    from . import story_system
-except ImportError:
-    pass  # 모듈이 없어도 패키지는 로드됨
+# 주요 모듈은 첫 접근 시 import (story_system → pygame 로드로 패키지 import가 느려지지 않도록)
+def __getattr__(name):
+    if name == "story_system":
+        try:
+            from . import story_system
+        except ImportError:
+            raise AttributeError(name)  # 모듈이 없어도 패키지는 로드됨
+        return story_system
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,6 +10,8 @@ from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
 from dataclasses import dataclass, field
 
+from game.data_tables import register_data_table, get_data_table
+
 class EnemyType(Enum):
     """적 기본 타입"""
     BEAST = "야수"           # 물리 공격형
@@ -94,12 +96,14 @@ class AdvancedFieldEnemyAI:
     """고급 필드 적 AI 시스템"""
     
     def __init__(self):
-        self.enemy_templates = self._initialize_enemy_templates()
-        self.enemy_skills = self._initialize_enemy_skills()
-        self.enemy_passives = self._initialize_enemy_passives()
+        # 템플릿/스킬/패시브 정의는 읽기 전용 공유 테이블
+        self.enemy_templates = get_data_table("field_enemy.templates")
+        self.enemy_skills = get_data_table("field_enemy.skills")
+        self.enemy_passives = get_data_table("field_enemy.passives")
         self.floor_prefixes = self._initialize_floor_prefixes()
         
-    def _initialize_enemy_templates(self) -> Dict[str, EnemyTemplate]:
+    @staticmethod
+    def _initialize_enemy_templates() -> Dict[str, EnemyTemplate]:
         """적 템플릿 초기화"""
         templates = {}
         
@@ -266,7 +270,8 @@ class AdvancedFieldEnemyAI:
         
         return templates
     
-    def _initialize_enemy_skills(self) -> Dict[str, EnemySkill]:
+    @staticmethod
+    def _initialize_enemy_skills() -> Dict[str, EnemySkill]:
         """적 스킬 초기화"""
         skills = {}
         
@@ -448,7 +453,8 @@ class AdvancedFieldEnemyAI:
         
         return skills
     
-    def _initialize_enemy_passives(self) -> Dict[str, EnemyPassive]:
+    @staticmethod
+    def _initialize_enemy_passives() -> Dict[str, EnemyPassive]:
         """적 패시브 능력 초기화"""
         passives = {}
         
@@ -647,11 +653,16 @@ class AdvancedFieldEnemyAI:
         # 100층 이후는 모든 적 + 특별한 적들
         return list(self.enemy_templates.keys())
     
-    def generate_enemy(self, floor: int, force_prefix: EnemyPrefix = None) -> Dict[str, Any]:
-        """층수에 맞는 적 생성 (접두사 포함) - 기존 Enemy 시스템과 밸런스 통합"""
+    def generate_enemy(self, floor: int, force_prefix: EnemyPrefix = None,
+                       rng: random.Random = None) -> Dict[str, Any]:
+        """층수에 맞는 적 생성 (접두사 포함) - 기존 Enemy 시스템과 밸런스 통합
+        
+        rng: 월드 생성용 난수 스트림 (없으면 전역 random)
+        """
+        rng = rng or random
         # 층별 등장 적 목록에서 선택
         available_enemies = self.get_floor_enemies(floor)
-        enemy_name = random.choice(available_enemies)
+        enemy_name = rng.choice(available_enemies)
         
         if enemy_name not in self.enemy_templates:
             enemy_name = "늑대"  # 기본값
@@ -695,7 +706,7 @@ class AdvancedFieldEnemyAI:
         prefix_chance = min(0.05 + (floor * 0.02), 0.5)  # 최대 50%
         prefix = None
         
-        if force_prefix or random.random() < prefix_chance:
+        if force_prefix or rng.random() < prefix_chance:
             # 해당 층에서 사용 가능한 접두사 목록
             available_prefixes = []
             for min_floor, prefixes in self.floor_prefixes.items():
@@ -703,7 +714,7 @@ class AdvancedFieldEnemyAI:
                     available_prefixes = prefixes
             
             if available_prefixes:
-                prefix = force_prefix or random.choice(available_prefixes)
+                prefix = force_prefix or rng.choice(available_prefixes)
         
         # 🔥 기존 시스템 호환 레벨 스케일링 (더 보수적)
         level = max(1, floor)
@@ -1047,6 +1058,10 @@ class AdvancedFieldEnemyAI:
         
         return None
 
+register_data_table("field_enemy.templates", AdvancedFieldEnemyAI._initialize_enemy_templates)
+register_data_table("field_enemy.skills", AdvancedFieldEnemyAI._initialize_enemy_skills)
+register_data_table("field_enemy.passives", AdvancedFieldEnemyAI._initialize_enemy_passives)
+
 # 전역 인스턴스 생성
 advanced_field_ai = AdvancedFieldEnemyAI()
 
@@ -4,8 +4,10 @@
 적 AI의 타겟팅을 현실적으로 만드는 시스템
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from enum import Enum
+import heapq
+import itertools
 import random
 from dataclasses import dataclass
 
@@ -29,13 +31,144 @@ class AggroEvent:
     multiplier: float = 1.0  # 배율
     duration: int = 5  # 지속 턴수
 
+class AggroTable:
+    """적 하나의 어그로 테이블
+
+    - 아군별 값은 슬롯 배열(raw)에 두고 실제 값 = raw * scale + shift
+    - 매 턴 감소는 scale/shift에만 곱하고, 다른 아군 전체를 같은 양만큼 조정할 때는 shift만 바꿈 (항목을 건드리지 않음)
+    - scale > 0 이라 raw 순서 = 실제 값 순서 → 최솟값은 raw 힙(지연 삭제)으로 찾음
+    """
+
+    __slots__ = ('ids', 'index', 'raw', 'scale', 'shift', 'total', '_heap', '_versions', '_counter')
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.raw: List[float] = []
+        self.scale = 1.0
+        self.shift = 0.0
+        self.total = 0.0
+        self._heap: List[Tuple[float, int, int]] = []   # (raw, version, slot)
+        self._versions: List[int] = []
+        self._counter = itertools.count()
+
+    # dict처럼 읽기 (전황 분석/디버깅용)
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, ally_id) -> bool:
+        return ally_id in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __getitem__(self, ally_id: str) -> float:
+        return self.value(self.index[ally_id])
+
+    def keys(self) -> List[str]:
+        return list(self.ids)
+
+    def values(self) -> List[float]:
+        scale, shift = self.scale, self.shift
+        return [raw * scale + shift for raw in self.raw]
+
+    def items(self) -> List[Tuple[str, float]]:
+        return list(zip(self.ids, self.values()))
+
+    def copy(self) -> Dict[str, float]:
+        return dict(self.items())
+
+    # =====================================
+    # 슬롯 값
+    # =====================================
+
+    def value(self, slot: int) -> float:
+        return self.raw[slot] * self.scale + self.shift
+
+    def add_ally(self, ally_id: str, value: float) -> int:
+        slot = len(self.ids)
+        self.ids.append(ally_id)
+        self.index[ally_id] = slot
+        self.raw.append(0.0)
+        self._versions.append(-1)
+        self.total += self.shift   # set_value가 (value - 현재 값)만큼 더하므로 빈 슬롯의 현재 값(shift)을 먼저 반영
+        self.set_value(slot, value)
+        return slot
+
+    def set_value(self, slot: int, value: float):
+        old_value = self.value(slot)
+        self.raw[slot] = raw = (value - self.shift) / self.scale
+        self.total += value - old_value
+        version = next(self._counter)
+        self._versions[slot] = version
+        heapq.heappush(self._heap, (raw, version, slot))
+        if len(self._heap) > 4 * len(self.ids) + 8:
+            self._rebuild_heap()
+
+    def shift_all(self, delta: float):
+        """모든 아군에 같은 양을 더함 (O(1))"""
+        self.shift += delta
+        self.total += delta * len(self.ids)
+
+    def scale_all(self, factor: float):
+        """모든 아군에 같은 비율을 곱함 (O(1))"""
+        self.scale *= factor
+        self.shift *= factor
+        self.total *= factor
+        if self.scale < 1e-6:
+            # 배율이 너무 작아지면 정밀도 유지를 위해 실제 값으로 다시 저장
+            self.load(self.materialize())
+
+    def min_slot(self, exclude: Optional[int] = None) -> Optional[int]:
+        """가장 낮은 어그로 슬롯 (exclude 제외)"""
+        heap = self._heap
+        versions = self._versions
+        while heap and versions[heap[0][2]] != heap[0][1]:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        slot = heap[0][2]
+        if slot != exclude:
+            return slot
+        for raw, version, candidate in heapq.nsmallest(len(self.ids) + 1, heap)[1:]:
+            # nsmallest 결과에도 지난 항목이 섞여 있을 수 있음
+            if versions[candidate] == version and candidate != exclude:
+                return candidate
+        return None if len(self.ids) <= 1 else self._scan_min(exclude)
+
+    def _scan_min(self, exclude: Optional[int]) -> Optional[int]:
+        candidates = [slot for slot in range(len(self.ids)) if slot != exclude]
+        return min(candidates, key=self.raw.__getitem__) if candidates else None
+
+    # =====================================
+    # 일괄 재계산 (드물게 - 최소 비율 보정/바닥값 적용 시)
+    # =====================================
+
+    def materialize(self) -> List[float]:
+        return self.values()
+
+    def load(self, values: List[float]):
+        self.raw = list(values)
+        self.scale = 1.0
+        self.shift = 0.0
+        self.total = sum(self.raw)
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        versions = self._versions
+        for slot in range(len(versions)):
+            versions[slot] = next(self._counter)
+        self._heap = [(raw, versions[slot], slot) for slot, raw in enumerate(self.raw)]
+        heapq.heapify(self._heap)
+
+
 class DynamicAggroSystem:
     """동적 어그로 시스템"""
-    
+
     def __init__(self):
-        # 캐릭터별 어그로 테이블 {enemy_id: {ally_id: aggro_value}}
-        self.aggro_table: Dict[str, Dict[str, float]] = {}
-        
+        # 캐릭터별 어그로 테이블 {enemy_id: AggroTable(ally_id → aggro_value)}
+        self.aggro_table: Dict[str, AggroTable] = {}
+
         # 어그로 가중치 설정
         self.aggro_weights = {
             AggroType.DAMAGE: 1.0,      # 피해량 = 어그로
@@ -45,7 +178,7 @@ class DynamicAggroSystem:
             AggroType.PROTECTION: 0.8,  # 보호는 0.8배
             AggroType.DEBUFF: 1.2       # 디버프는 1.2배
         }
-        
+
         # 역할별 기본 어그로 배율
         self.role_aggro_multipliers = {
             "탱커": 1.2,    # 탱커는 기본적으로 높은 어그로
@@ -53,268 +186,289 @@ class DynamicAggroSystem:
             "딜러": 1.0,    # 딜러는 기본
             "서포터": 1.1   # 서포터는 낮은 어그로
         }
-        
+
         # 어그로 감소율 (매 턴마다)
         self.aggro_decay_rate = 0.03  # 3%씩 감소 (더 완만하게)
-        
+
         # 어그로는 상대적 개념 - 최대치 무제한
         self.min_aggro = 1.0   # 최소 1 (0이 되면 타겟팅에서 제외)
         self.max_aggro = float('inf')  # 실질적 무한
-        
+
         # 어그로 메시지 표시 여부 (테스트 후 False로 변경 예정)
         self.show_aggro_messages = False  # 기본적으로 숨김
-        
+
         # HP 비율 기반 어그로 배율 (비율 변동량을 실제 어그로로 변환)
         self.hp_ratio_multiplier = 100.0  # 10% HP 변동 = 10 어그로
-        
+
     def get_party_size(self, enemy_id: str) -> int:
         """해당 적에 대한 아군 파티 크기 반환"""
         if enemy_id not in self.aggro_table:
             return 4  # 기본값
         return len(self.aggro_table[enemy_id])
-        
+
     def initialize_enemy(self, enemy_id: str, allies: List):
         """적 캐릭터의 어그로 테이블 초기화"""
         if enemy_id not in self.aggro_table:
-            self.aggro_table[enemy_id] = {}
-            
+            self.aggro_table[enemy_id] = AggroTable()
+        table = self.aggro_table[enemy_id]
+
         # 모든 아군에 대해 기본 어그로 설정
         for ally in allies:
             ally_id = getattr(ally, 'name', str(ally))
-            if ally_id not in self.aggro_table[enemy_id]:
+            if ally_id not in table:
                 # 역할에 따른 기본 어그로
                 role = self._determine_role(ally)
                 base_aggro = 10.0 * self.role_aggro_multipliers.get(role, 1.0)
-                self.aggro_table[enemy_id][ally_id] = base_aggro
-    
+                table.add_ally(ally_id, base_aggro)
+
     def _determine_role(self, character) -> str:
         """캐릭터의 역할 판단"""
         char_class = getattr(character, 'character_class', '').lower()
-        
+
         # 탱커 계열
         if char_class in ['전사', '기사', '성기사', '암흑기사', '검투사']:
             return "탱커"
-        
-        # 힐러 계열  
+
+        # 힐러 계열
         elif char_class in ['신관', '드루이드', '연금술사']:
             return "힐러"
-            
+
         # 서포터 계열
         elif char_class in ['바드', '시간술사', '철학자']:
             return "서포터"
-            
+
         # 나머지는 딜러
         else:
             return "딜러"
-    
+
+    def _event_aggro_value(self, event: AggroEvent) -> float:
+        # HP 비율 기반 어그로 계산 (0.0~1.0 비율을 실제 어그로 값으로 변환)
+        aggro_value = event.base_value * self.hp_ratio_multiplier * event.multiplier
+        return aggro_value * self.aggro_weights[event.aggro_type]
+
     def add_aggro_event(self, enemy_id: str, event: AggroEvent):
         """어그로 이벤트 추가 (HP 비율 기반, 총합 균형 유지, 최소 10% 보장)"""
-        if enemy_id not in self.aggro_table:
+        table = self.aggro_table.get(enemy_id)
+        if table is None:
             return
-            
-        source_id = event.source
-        if source_id not in self.aggro_table[enemy_id]:
-            self.aggro_table[enemy_id][source_id] = 10.0
-        
-        # HP 비율 기반 어그로 계산 (0.0~1.0 비율을 실제 어그로 값으로 변환)
-        aggro_value = event.base_value * self.hp_ratio_multiplier * event.multiplier
-        aggro_value *= self.aggro_weights[event.aggro_type]
-        
-        # 타겟에게 어그로 추가
-        old_aggro = self.aggro_table[enemy_id][source_id]
-        self.aggro_table[enemy_id][source_id] += aggro_value
-        
-        # 증가한 어그로 양 계산
-        aggro_increase = self.aggro_table[enemy_id][source_id] - old_aggro
-        
-        # 다른 아군들의 어그로를 균형 조정 (총합 유지)
-        self._balance_aggro_distribution(enemy_id, source_id, aggro_increase)
-        
-        # 전체적으로 최소 10% 보장 재조정
-        self._enforce_minimum_aggro_percentage(enemy_id)
-        
+        self._add_aggro_value(table, event.source, self._event_aggro_value(event))
+
         # 어그로 메시지는 표시하지 않음 (전황 분석에서만 표시)
-    
-    def _enforce_minimum_aggro_percentage(self, enemy_id: str):
+
+    def add_aggro_events(self, enemy_ids: Iterable[str], event: AggroEvent):
+        """같은 어그로 이벤트를 여러 적에게 한 번에 추가 (광역 공격/힐 등)"""
+        aggro_value = self._event_aggro_value(event)
+        tables = self.aggro_table
+        for enemy_id in enemy_ids:
+            table = tables.get(enemy_id)
+            if table is not None:
+                self._add_aggro_value(table, event.source, aggro_value)
+
+    def _add_aggro_value(self, table: AggroTable, source_id: str, aggro_value: float):
+        slot = table.index.get(source_id)
+        if slot is None:
+            slot = table.add_ally(source_id, 10.0)
+        self._apply_aggro_change(table, slot, aggro_value)
+
+    def _apply_aggro_change(self, table: AggroTable, slot: int, aggro_change: float):
+        """한 아군의 어그로를 바꾸고 나머지 아군을 반대로 균등 조정 (총합 유지, 최소 10% 보장)
+
+        보정(최소 10%)이 필요 없는 평소에는 shift 한 번으로 끝나고,
+        누군가 10% 아래로 내려가는 경우에만 실제 값으로 풀어서 기존 규칙대로 재계산
+        """
+        ally_count = len(table)
+        old_total = table.total
+        new_value = table.value(slot) + aggro_change
+
+        if ally_count > 1 and aggro_change != 0:
+            # 변동 후 총합 기준 10% (분배 단계) / 분배 후 총합 기준 10% (최종 보정 단계)
+            balance_min = (old_total + aggro_change) * 0.10
+            enforce_min = old_total * 0.10
+            adjustment = -aggro_change / (ally_count - 1)
+            lowest_other = table.value(table.min_slot(exclude=slot)) + adjustment
+            if lowest_other >= balance_min and lowest_other >= enforce_min and new_value >= enforce_min:
+                table.shift_all(adjustment)
+                table.set_value(slot, new_value)
+                return
+            values = table.materialize()
+            values[slot] = new_value
+            self._balance_aggro_values(values, slot, aggro_change)
+        else:
+            table.set_value(slot, new_value)
+            lowest = table.min_slot()
+            if table.value(lowest) >= table.total * 0.10:
+                return
+            values = table.materialize()
+
+        # 전체적으로 최소 10% 보장 재조정
+        self._enforce_minimum_aggro_values(values)
+        table.load(values)
+
+    @staticmethod
+    def _enforce_minimum_aggro_values(values: List[float]):
         """모든 아군의 어그로가 최소 10% 이상이 되도록 강제 조정"""
-        if enemy_id not in self.aggro_table:
-            return
-            
-        aggro_dict = self.aggro_table[enemy_id]
-        if not aggro_dict:
+        if not values:
             return
-            
-        ally_count = len(aggro_dict)
-        total_aggro = sum(aggro_dict.values())
+
+        ally_count = len(values)
+        total_aggro = sum(values)
         min_aggro_per_ally = total_aggro * 0.10  # 전체의 10%
-        
+
         # 최소 어그로 미달 체크 및 조정
         adjustments_needed = {}
         total_shortage = 0
-        
-        for ally_id, aggro_value in aggro_dict.items():
+
+        for slot, aggro_value in enumerate(values):
             if aggro_value < min_aggro_per_ally:
                 shortage = min_aggro_per_ally - aggro_value
-                adjustments_needed[ally_id] = shortage
+                adjustments_needed[slot] = shortage
                 total_shortage += shortage
-        
+
         if not adjustments_needed:
             return  # 모든 아군이 이미 10% 이상
-            
+
         # 초과 어그로를 가진 아군들에서 부족분 차감
-        excess_allies = [aid for aid in aggro_dict.keys() if aid not in adjustments_needed]
+        excess_allies = [slot for slot in range(ally_count) if slot not in adjustments_needed]
         if not excess_allies:
             # 모든 아군이 최소치 미달이면 균등 분배
-            for ally_id in aggro_dict.keys():
-                aggro_dict[ally_id] = total_aggro / ally_count
+            for slot in range(ally_count):
+                values[slot] = total_aggro / ally_count
         else:
             # 부족분을 초과 어그로 아군들에게서 차감
             reduction_per_excess = total_shortage / len(excess_allies)
-            
+
             # 먼저 미달 아군들을 최소치로 올림
-            for ally_id, shortage in adjustments_needed.items():
-                aggro_dict[ally_id] = min_aggro_per_ally
-            
+            for slot in adjustments_needed:
+                values[slot] = min_aggro_per_ally
+
             # 초과 아군들에서 차감 (단, 최소치는 보장)
-            for ally_id in excess_allies:
-                new_value = aggro_dict[ally_id] - reduction_per_excess
-                aggro_dict[ally_id] = max(min_aggro_per_ally, new_value)
-    
+            for slot in excess_allies:
+                new_value = values[slot] - reduction_per_excess
+                values[slot] = max(min_aggro_per_ally, new_value)
+
     def add_damage_taken_event(self, enemy_id: str, damaged_ally: str, hp_ratio_lost: float):
         """아군이 피해를 받았을 때 어그로 감소 (최소 10% 보장)"""
-        if enemy_id not in self.aggro_table:
+        table = self.aggro_table.get(enemy_id)
+        if table is None:
             return
-            
-        if damaged_ally not in self.aggro_table[enemy_id]:
+
+        slot = table.index.get(damaged_ally)
+        if slot is None:
             return
-            
-        # 받은 피해 비율만큼 어그로 감소
+
+        # 받은 피해 비율만큼 어그로 감소 (감소한 만큼 다른 아군들이 증가)
         aggro_reduction = hp_ratio_lost * self.hp_ratio_multiplier * 0.8  # 80% 적용
-        
-        old_aggro = self.aggro_table[enemy_id][damaged_ally]
-        self.aggro_table[enemy_id][damaged_ally] -= aggro_reduction
-        
-        # 감소한 어그로 양 계산
-        aggro_decrease = old_aggro - self.aggro_table[enemy_id][damaged_ally]
-        
-        # 다른 아군들의 어그로를 균형 조정 (감소한 만큼 다른 아군들이 증가)
-        self._balance_aggro_distribution(enemy_id, damaged_ally, -aggro_decrease)
-        
-        # 전체적으로 최소 10% 보장 재조정
-        self._enforce_minimum_aggro_percentage(enemy_id)
-    
+        self._apply_aggro_change(table, slot, -aggro_reduction)
+
     def get_primary_target(self, enemy_id: str, alive_allies: List) -> Optional[str]:
         """확률 기반 타겟 선정 (어그로 비율로 확률 계산, 최소 10% 보장)"""
-        if enemy_id not in self.aggro_table:
+        table = self.aggro_table.get(enemy_id)
+        if table is None:
             return None
-            
-        alive_ally_names = [getattr(ally, 'name', str(ally)) for ally in alive_allies]
-        
-        # 살아있는 아군 중에서만 선택
-        valid_targets = {
-            ally_id: aggro for ally_id, aggro in self.aggro_table[enemy_id].items()
-            if ally_id in alive_ally_names and aggro >= self.min_aggro
-        }
-        
-        if not valid_targets:
+
+        alive_ally_names = {getattr(ally, 'name', str(ally)) for ally in alive_allies}
+
+        # 살아있는 아군 중에서만 선택 (슬롯 배열을 한 번만 훑음)
+        scale, shift, min_aggro = table.scale, table.shift, self.min_aggro
+        valid_ids = []
+        valid_aggro = []
+        for ally_id, raw in zip(table.ids, table.raw):
+            if ally_id in alive_ally_names:
+                aggro = raw * scale + shift
+                if aggro >= min_aggro:
+                    valid_ids.append(ally_id)
+                    valid_aggro.append(aggro)
+
+        if not valid_ids:
             return None
-        
+
         # 최소 확률 10% 보장 시스템
-        ally_count = len(valid_targets)
+        ally_count = len(valid_ids)
         min_probability = 0.10  # 10%
         guaranteed_total = min_probability * ally_count  # 전체 최소 보장 확률
-        
+
         # 원래 어그로 총합
-        original_total = sum(valid_targets.values())
-        
+        original_total = sum(valid_aggro)
+
         if original_total <= 0:
             # 모든 어그로가 0이면 균등 분배
-            adjusted_aggro = {ally_id: min_probability for ally_id in valid_targets.keys()}
+            adjusted_aggro = [min_probability] * ally_count
         else:
-            # 어그로 비율 계산
-            aggro_ratios = {ally_id: aggro / original_total for ally_id, aggro in valid_targets.items()}
-            
-            # 최소 확률 보장 조정
-            adjusted_aggro = {}
+            # 기본 최소 확률 + 남은 확률의 어그로 비율만큼
             remaining_probability = 1.0 - guaranteed_total
-            
-            for ally_id, ratio in aggro_ratios.items():
-                # 기본 최소 확률 + 남은 확률의 어그로 비율만큼
-                adjusted_aggro[ally_id] = min_probability + (ratio * remaining_probability)
-        
+            adjusted_aggro = [min_probability + ((aggro / original_total) * remaining_probability)
+                              for aggro in valid_aggro]
+
         # 확률 기반 선택
-        total_adjusted = sum(adjusted_aggro.values())
-        rand_value = random.uniform(0, total_adjusted)
+        rand_value = random.uniform(0, sum(adjusted_aggro))
         cumulative = 0
-        
-        for ally_id, probability in adjusted_aggro.items():
+
+        for ally_id, probability in zip(valid_ids, adjusted_aggro):
             cumulative += probability
             if rand_value <= cumulative:
                 return ally_id
-        
+
         # 혹시 모를 경우를 위한 백업
-        return list(valid_targets.keys())[-1]
-    
+        return valid_ids[-1]
+
     def get_aggro_distribution(self, enemy_id: str) -> Dict[str, float]:
         """어그로 분포 반환 (디버깅용)"""
         if enemy_id not in self.aggro_table:
             return {}
         return self.aggro_table[enemy_id].copy()
-    
+
     def decay_aggro(self, enemy_id: str):
-        """어그로 자연 감소 (매 턴 호출)"""
-        if enemy_id not in self.aggro_table:
+        """어그로 자연 감소 (매 턴 호출) - 배율만 바꾸고, 최소치 아래로 내려가는 아군이 생길 때만 실제 값에 적용"""
+        table = self.aggro_table.get(enemy_id)
+        if table is None or not len(table):
             return
-            
-        for ally_id in self.aggro_table[enemy_id]:
-            current = self.aggro_table[enemy_id][ally_id]
-            decayed = current * (1 - self.aggro_decay_rate)
-            self.aggro_table[enemy_id][ally_id] = max(decayed, self.min_aggro)
-    
+
+        factor = 1 - self.aggro_decay_rate
+        if table.value(table.min_slot()) * factor >= self.min_aggro:
+            table.scale_all(factor)
+            return
+        table.load([max(current * factor, self.min_aggro) for current in table.materialize()])
+
     def reset_enemy_aggro(self, enemy_id: str):
         """특정 적의 어그로 초기화"""
         if enemy_id in self.aggro_table:
             del self.aggro_table[enemy_id]
-    
+
     def clear_all_aggro(self):
         """모든 어그로 초기화"""
         self.aggro_table.clear()
-    
-    def _balance_aggro_distribution(self, enemy_id: str, target_id: str, aggro_change: float):
+
+    @staticmethod
+    def _balance_aggro_values(values: List[float], target_slot: int, aggro_change: float):
         """어그로 변동 시 다른 아군들의 어그로를 비례적으로 조정하여 총합 유지 + 최소 10% 보장"""
-        if enemy_id not in self.aggro_table:
-            return
-            
-        aggro_dict = self.aggro_table[enemy_id]
-        other_targets = [tid for tid in aggro_dict.keys() if tid != target_id]
-        
-        if not other_targets or aggro_change == 0:
+        other_slots = [slot for slot in range(len(values)) if slot != target_slot]
+
+        if not other_slots or aggro_change == 0:
             return
-            
+
         # 전체 어그로 총합 계산
-        total_aggro = sum(aggro_dict.values())
-        ally_count = len(aggro_dict)
+        total_aggro = sum(values)
         min_aggro_per_ally = total_aggro * 0.10  # 전체의 10%씩
-        
+
         # 변동량을 다른 아군들에게 역방향으로 분배
-        adjustment_per_target = -aggro_change / len(other_targets)
-        
-        for other_id in other_targets:
-            aggro_dict[other_id] += adjustment_per_target
-            
+        adjustment_per_target = -aggro_change / len(other_slots)
+
+        for other_slot in other_slots:
+            values[other_slot] += adjustment_per_target
+
             # 최소 10% 보장
-            if aggro_dict[other_id] < min_aggro_per_ally:
-                shortage = min_aggro_per_ally - aggro_dict[other_id]
-                aggro_dict[other_id] = min_aggro_per_ally
-                
+            if values[other_slot] < min_aggro_per_ally:
+                shortage = min_aggro_per_ally - values[other_slot]
+                values[other_slot] = min_aggro_per_ally
+
                 # 부족분을 다른 아군들에게서 차감 (균등 분배)
-                remaining_targets = [tid for tid in aggro_dict.keys() if tid != other_id]
-                if remaining_targets:
-                    reduction_per_remaining = shortage / len(remaining_targets)
-                    for remaining_id in remaining_targets:
-                        aggro_dict[remaining_id] = max(min_aggro_per_ally, 
-                                                     aggro_dict[remaining_id] - reduction_per_remaining)
-    
+                remaining_slots = [slot for slot in range(len(values)) if slot != other_slot]
+                if remaining_slots:
+                    reduction_per_remaining = shortage / len(remaining_slots)
+                    for remaining_slot in remaining_slots:
+                        values[remaining_slot] = max(min_aggro_per_ally,
+                                                     values[remaining_slot] - reduction_per_remaining)
+
     def get_aggro_status(self, enemy_id: str) -> str:
         """특정 적의 어그로 상태 정보 반환 (전황 분석용) - 실제 어그로 수치 표시"""
         if enemy_id not in self.aggro_table:
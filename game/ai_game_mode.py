@@ -827,6 +827,13 @@ class AIGameModeManager:
                 'enemy_formation': self._analyze_party_formation([e for e in enemies if e.is_alive])
             }
             
+            # 턴 순서 예측 (공유 예측기)
+            try:
+                from game.turn_forecast import get_turn_forecaster
+                battlefield_state['turn_forecast'] = get_turn_forecaster().get_forecast(alive_party + enemies, 8)
+            except Exception:
+                pass
+            
             # AI 행동 결정
             ai_action = smart_ai.choose_action(character, enemies, alive_party, battlefield_state)
             
@@ -5,6 +5,7 @@ ASCII 기반 효과음 및 시각 효과 시스템
 import time
 import random
 from typing import List
+from game.hot_path_profiler import profiled
 
 
 class ASCIISoundEffects:
@@ -186,6 +187,7 @@ def play_ascii_sound(effect_name: str):
     pass
 
 
+@profiled("combat.animation")
 def enhanced_battle_effect(effect_type: str, **kwargs):
     """강화된 전투 이펙트"""
     if effect_type == "damage":
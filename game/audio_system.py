@@ -6,6 +6,8 @@ from typing import Optional, Dict, List
 from pathlib import Path
 from enum import Enum
 
+from game.sfx_bank import SFXBank
+
 # pygame이 창을 띄우지 않도록 설정
 os.environ['SDL_VIDEODRIVER'] = 'dummy'
 
@@ -128,9 +130,18 @@ class UnifiedAudioSystem:
         # 매핑 초기화
         self._initialize_bgm_mapping()
         self._initialize_sfx_mapping()
+        self.sfx_bank = SFXBank(self.sfx_path, self.sfx_files, SFXType, debug_mode=debug_mode)
         
         # 초기화 시도
         self._initialize_pygame()
+        
+        # 전투 효과음은 미리 디코딩 (나머지는 첫 재생 시 로드)
+        if self.initialized:
+            try:
+                self.sfx_bank.preload()
+            except Exception as e:
+                if self.debug_mode:
+                    print(f"⚠️ SFX 미리 로드 실패: {e}")
     
     def _initialize_pygame(self):
         """Pygame 믹서만 초기화 (창 생성 방지)"""
@@ -419,47 +430,22 @@ class UnifiedAudioSystem:
         self.play_bgm(bgm_type, loop=loop)
     
     def play_sfx(self, sfx_type, volume_override: Optional[float] = None):
-        """SFX 재생 - 랜덤 선택 지원"""
+        """SFX 재생 - 랜덤 선택 지원 (디코딩된 사운드 뱅크 사용)"""
         if not self.initialized:
             return
         
         try:
-            # SFXType 변환
-            if isinstance(sfx_type, str):
-                # 문자열을 SFXType으로 변환 시도
-                for st in SFXType:
-                    if st.value == sfx_type or st.name.lower() == sfx_type.lower():
-                        sfx_type = st
-                        break
-                else:
-                    if self.debug_mode:
-                        print(f"⚠️ 알 수 없는 SFX 타입: {sfx_type}")
-                    return
-            
-            if sfx_type not in self.sfx_files:
+            resolved = self.sfx_bank.resolve(sfx_type)
+            if resolved is None:
                 if self.debug_mode:
-                    print(f"⚠️ SFX 타입이 매핑되지 않음: {sfx_type}")
+                    print(f"⚠️ 알 수 없거나 매핑되지 않은 SFX 타입: {sfx_type}")
                 return
             
-            # 랜덤 파일 선택
-            file_list = self.sfx_files[sfx_type]
-            selected_file = random.choice(file_list)
-            
-            # 파일 경로 확인
-            file_path = self.sfx_path / selected_file
-            if not file_path.exists():
-                if self.debug_mode:
-                    print(f"⚠️ SFX 파일이 없음: {file_path}")
-                return
-            
-            # SFX 재생
-            sound = pygame.mixer.Sound(str(file_path))
             volume = volume_override if volume_override is not None else (self.sfx_volume * self.master_volume)
-            sound.set_volume(volume)
-            sound.play()
+            selected_file = self.sfx_bank.play(resolved, volume)
             
-            if self.debug_mode:
-                print(f"🔊 SFX 재생: {selected_file} (타입: {sfx_type.name})")
+            if self.debug_mode and selected_file:
+                print(f"🔊 SFX 재생: {selected_file} (타입: {resolved.name})")
                 
         except Exception as e:
             if self.debug_mode:
@@ -547,6 +533,7 @@ class UnifiedAudioSystem:
         """오디오 시스템 정리"""
         if self.initialized:
             pygame.mixer.music.stop()
+            self.sfx_bank.clear()
             pygame.mixer.quit()
             self.initialized = False
             if self.debug_mode:
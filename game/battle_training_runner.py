@@ -0,0 +1,511 @@
+"""
+⚔️ 헤드리스 전투 훈련 러너
+AI 학습용 실제 전투(BraveCombatSystem 규칙)를 화면/입력 없이 여러 프로세스에서 동시에 실행
+
+- 아군은 BraveCombatSystem._auto_battle_action, 적은 SmartEnemyAI(실패 시 enemy_turn)로 행동
+- ATB 진행/행동 순서/종료 판정은 전투 시스템 메서드를 그대로 사용 (battle_loop의 플레이어 입력만 제외)
+- 작업마다 고정 시드 - 같은 BattleTask는 같은 전투를 재현
+- 워커 프로세스는 print/sleep/input을 끄고 실행 (화면 연출 대기 없이 최대 속도)
+- 결과는 batch_size개씩 모아 on_batch 콜백으로 학습 저장소에 반영, 처리량은 전투/시간으로 보고
+- 전투 스레드의 입력은 닫힌 큐 - 자동 전투 중 커서 메뉴가 입력을 기다리면 바로 EOFError로 빠져나감
+- 전투 하나가 BATTLE_TIMEOUT_SECONDS 안에 끝나지 않으면 시간 초과 결과로 기록하고 풀을 새로 띄워 계속
+- 프로세스 풀을 만들 수 없는 환경에서는 현재 프로세스에서 순차 실행
+  (게임의 다른 스레드에 영향을 주지 않도록 출력만 이 스레드에서 끄고 sleep은 그대로 둠,
+  전역 난수 상태는 전투가 끝나면 되돌림)
+"""
+
+import builtins
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# 훈련 파티/적 직업 풀
+TRAINING_PARTY_JOBS = ["전사", "아크메이지", "궁수", "도적", "성기사", "암흑기사", "몽크", "바드",
+                       "네크로맨서", "용기사", "검성", "정령술사", "암살자", "기계공학자"]
+TRAINING_ENEMY_JOBS = ["전사", "암살자", "아크메이지", "궁수", "암흑기사", "네크로맨서", "몽크"]
+
+DEFAULT_BATCH_SIZE = 50       # 학습 저장소에 한 번에 반영할 전투 수
+DEFAULT_MAX_TURNS = 300       # 끝나지 않는 전투 방지
+MAX_IDLE_TICKS = 2000         # 아무도 행동 불가한 ATB 틱이 이만큼 이어지면 중단
+ACTION_COST = 1000            # battle_loop와 같은 행동 비용
+BATTLE_TIMEOUT_SECONDS = 120.0  # 워커에서 전투 하나가 이보다 오래 걸리면 멈춘 것으로 보고 중단
+POOL_POLL_SECONDS = 1.0       # 시간 초과 확인 간격
+
+
+@dataclass
+class BattleTask:
+    """전투 하나 (워커로 보내므로 기본 타입만)"""
+    battle_id: int
+    ai_name: str
+    job_class: str
+    party_jobs: List[str]
+    enemy_jobs: List[str]
+    seed: int
+    enemy_hp_scale: float = 1.0
+    max_turns: int = DEFAULT_MAX_TURNS
+
+
+def make_training_task(battle_id: int, ai_name: str, job_class: str, rng: random.Random = None,
+                       party_size: int = 4, difficulty: float = 1.0) -> BattleTask:
+    """학습 AI(job_class) + 무작위 동료 vs 무작위 적 2~4명"""
+    rng = rng or random
+    companions = [rng.choice(TRAINING_PARTY_JOBS) for _ in range(max(0, party_size - 1))]
+    enemies = [rng.choice(TRAINING_ENEMY_JOBS) for _ in range(rng.randint(2, 4))]
+    return BattleTask(battle_id, ai_name, job_class, [job_class] + companions, enemies,
+                      seed=rng.getrandbits(32), enemy_hp_scale=difficulty)
+
+
+def battle_success_rate(result: Dict[str, Any]) -> float:
+    """전투 결과 → 0~1 성과 (승리는 0.6 이상, 남은 파티 HP가 많을수록 높음)"""
+    if result.get('error'):
+        return 0.0
+    if result.get('victory'):
+        return 0.6 + 0.4 * result.get('party_hp_ratio', 0.0)
+    return 0.5 * (1.0 - result.get('enemy_hp_ratio', 1.0))
+
+
+# =====================================
+# 🎮 헤드리스 전투 한 판
+# =====================================
+
+_local = threading.local()   # 스레드(프로세스)별 전투 시스템 재사용
+_smart_enemy_ai_enabled = True
+_engine_available = None
+
+
+def battle_engine_available() -> bool:
+    """전투 엔진(game.brave_combat)을 불러올 수 있는지 (결과 캐시)"""
+    global _engine_available
+    if _engine_available is None:
+        try:
+            import game.brave_combat  # noqa: F401
+            _engine_available = True
+        except Exception:
+            _engine_available = False
+    return _engine_available
+
+
+def _get_combat_system():
+    combat = getattr(_local, 'combat', None)
+    if combat is None:
+        from game.brave_combat import BraveCombatSystem
+        combat = _local.combat = BraveCombatSystem()
+    # 이전 전투 상태 정리
+    combat.auto_battle = True
+    combat.auto_battle_delay = 0
+    combat.vibration_enabled = False
+    combat._cancel_counters.clear()
+    combat._cancel_last_time.clear()
+    combat._cancel_cooldown_until.clear()
+    combat.is_player_turn_active = False
+    if hasattr(combat, 'aggro_system'):
+        combat.aggro_system.clear_all_aggro()
+    return combat
+
+
+def _build_combatants(task: BattleTask):
+    from game.character import Character
+    party = []
+    for index, job in enumerate(task.party_jobs):
+        name = task.ai_name if index == 0 else f"훈련동료{index}({job})"
+        party.append(Character(name, job))
+    enemies = []
+    for index, job in enumerate(task.enemy_jobs):
+        enemy = Character(f"훈련적{index + 1}({job})", job)
+        enemy.is_enemy = True
+        if task.enemy_hp_scale != 1.0:
+            enemy.max_hp = max(1, int(enemy.max_hp * task.enemy_hp_scale))
+            enemy.current_hp = enemy.max_hp
+        enemies.append(enemy)
+    return party, enemies
+
+
+def _hp_total(characters) -> int:
+    return sum(max(0, c.current_hp) for c in characters)
+
+
+def _ally_action(combat, actor, party, enemies) -> str:
+    """_auto_battle_action 실행 후 상태 변화로 행동 종류 분류"""
+    party_hp = _hp_total(party)
+    enemy_hp = _hp_total(enemies)
+    enemy_brv = sum(getattr(e, 'brave_points', 0) for e in enemies)
+    mp = actor.current_mp
+
+    if combat._auto_battle_action(actor, party, enemies) is None:
+        return "none"
+    if _hp_total(party) > party_hp:
+        return "heal"
+    if actor.current_mp < mp:
+        return "skill"
+    if _hp_total(enemies) < enemy_hp:
+        return "hp_attack"
+    if sum(getattr(e, 'brave_points', 0) for e in enemies) < enemy_brv:
+        return "brv_attack"
+    return "other"
+
+
+def _enemy_action(combat, enemy, party, enemies, enemy_ai) -> str:
+    """SmartEnemyAI가 고른 행동을 전투 시스템으로 실행 (AI 오류 시 기본 enemy_turn)"""
+    global _smart_enemy_ai_enabled
+    alive_party = [p for p in party if p.is_alive]
+    action = None
+    if _smart_enemy_ai_enabled and enemy_ai is not None:
+        try:
+            action = enemy_ai.choose_action(enemy, enemies, alive_party, {})
+        except Exception:
+            _smart_enemy_ai_enabled = False   # 같은 오류를 매 턴 반복하지 않음
+    if action is None:
+        combat.enemy_turn(enemy, party, enemies)
+        return "enemy_turn"
+
+    action_type = action.get('type', 'brv_attack')
+    target = action.get('target')
+    if target not in alive_party:
+        target = combat._select_enemy_target(alive_party, enemy)
+        if target not in alive_party:
+            target = alive_party[0]
+    if action_type in ('defend', 'heal'):
+        combat.defend_action(enemy)
+        return "defend"
+    if action_type == 'hp_attack' and getattr(enemy, 'brave_points', 0) > 0:
+        combat.execute_hp_attack(enemy, target)
+        return "hp_attack"
+    combat.execute_brave_attack(enemy, target)
+    return "brv_attack"
+
+
+def _play_battle(combat, party, enemies, max_turns: int) -> Dict[str, Any]:
+    from game.character import set_combat_active
+    try:
+        from game.smart_ai import AIPersonality, SmartEnemyAI
+        personalities = list(AIPersonality)
+        enemy_ais = {id(e): SmartEnemyAI(random.choice(personalities)) for e in enemies}
+    except Exception:
+        enemy_ais = {}
+
+    everyone = party + enemies
+    for combatant in everyone:
+        combatant.combat_system_ref = combat
+        combatant.atb_gauge = random.randint(0, 300)   # start_battle과 같은 0~30% 시작
+    combat._current_party = party
+    combat._current_enemies = enemies
+    for enemy in enemies:
+        combat.aggro_system.initialize_enemy(enemy.name, party)
+
+    party_hp_start = _hp_total(party) or 1
+    enemy_hp_start = _hp_total(enemies) or 1
+    ally_actions = Counter()
+    enemy_actions = Counter()
+    turns = 0
+    idle_ticks = 0
+
+    set_combat_active(True)
+    try:
+        while turns < max_turns and not combat.check_battle_end(party, enemies):
+            combat.update_atb_gauges(everyone, show_animation=False)
+            order = combat.get_action_order(everyone)
+            if not order:
+                idle_ticks += 1
+                if idle_ticks > MAX_IDLE_TICKS:
+                    break
+                continue
+            idle_ticks = 0
+            actor = order[0]
+            turns += 1
+
+            if hasattr(actor, 'status_manager'):
+                actor.status_manager.process_turn_effects(actor)
+            if actor.is_alive:
+                if actor in party:
+                    ally_actions[_ally_action(combat, actor, party, enemies)] += 1
+                else:
+                    enemy_actions[_enemy_action(combat, actor, party, enemies, enemy_ais.get(id(actor)))] += 1
+            actor.atb_gauge = max(0, actor.atb_gauge - ACTION_COST)
+            if hasattr(actor, 'status_manager'):
+                actor.status_manager.process_turn_effects(actor)
+            combat._process_support_fire_duration(actor)
+    finally:
+        set_combat_active(False)
+
+    party_hp_end = _hp_total(party)
+    enemy_hp_end = _hp_total(enemies)
+    return {
+        'victory': any(p.is_alive for p in party) and not any(e.is_alive for e in enemies),
+        'turns': turns,
+        'party_hp_ratio': party_hp_end / party_hp_start,
+        'enemy_hp_ratio': enemy_hp_end / enemy_hp_start,
+        'damage_dealt': enemy_hp_start - enemy_hp_end,
+        'damage_received': max(0, party_hp_start - party_hp_end),
+        'survivors': sum(1 for p in party if p.is_alive),
+        'actions': dict(ally_actions),
+        'enemy_actions': dict(enemy_actions),
+    }
+
+
+def run_headless_battle(task: BattleTask) -> Dict[str, Any]:
+    """전투 한 판 실행 → 결과 dict (오류도 결과로 반환)"""
+    started = time.perf_counter()
+    result = {
+        'battle_id': task.battle_id, 'ai_name': task.ai_name, 'job_class': task.job_class,
+        'seed': task.seed, 'victory': False, 'turns': 0, 'party_hp_ratio': 0.0, 'enemy_hp_ratio': 1.0,
+        'damage_dealt': 0, 'damage_received': 0, 'survivors': 0, 'actions': {}, 'enemy_actions': {},
+        'error': None,
+    }
+    # 전투 규칙이 전역 random을 쓰므로 시드를 고정하되, 같은 프로세스의 게임 난수 흐름은 되돌림
+    random_state = random.getstate()
+    random.seed(task.seed)
+    try:
+        with _quiet_current_thread():
+            party, enemies = _build_combatants(task)
+            combat = _get_combat_system()
+            result.update(_play_battle(combat, party, enemies, task.max_turns))
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        random.setstate(random_state)
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+
+def _timeout_result(task: BattleTask, timeout: float) -> Dict[str, Any]:
+    """시간 초과로 중단된 전투의 결과"""
+    return {
+        'battle_id': task.battle_id, 'ai_name': task.ai_name, 'job_class': task.job_class,
+        'seed': task.seed, 'victory': False, 'turns': 0, 'party_hp_ratio': 0.0, 'enemy_hp_ratio': 1.0,
+        'damage_dealt': 0, 'damage_received': 0, 'survivors': 0, 'actions': {}, 'enemy_actions': {},
+        'error': f"TimeoutError: {timeout:.0f}초 안에 끝나지 않음", 'elapsed': timeout,
+    }
+
+
+class _quiet_current_thread:
+    """현재 스레드의 print 출력을 버리고 입력은 닫힌 큐로 연결
+
+    워커 프로세스도 같은 GameIO를 씀 - builtins.input만 바꾸면 커서 메뉴
+    (input_utils.wait_for_input_with_repeat)가 콘솔 키를 기다리며 멈춤
+    """
+
+    def __enter__(self):
+        from game.io_bridge import GameIO, OutputSink, QueueInput, install_io_router, use_game_io
+
+        class NullOutput(OutputSink):
+            headless = True
+
+            def write(self, text: str) -> int:
+                return len(text)
+
+        install_io_router()
+        silent_input = QueueInput()
+        silent_input.close()   # 전투 중 입력 요청은 EOFError
+        self._io = use_game_io(GameIO(silent_input, NullOutput(), name="battle-training"))
+        self._io.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._io is not None:
+            self._io.__exit__(exc_type, exc, tb)
+        return False
+
+
+def _init_worker():
+    """워커 프로세스 초기화 - 출력/대기/입력 끄기"""
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    os.environ['SUBPROCESS_MODE'] = '1'
+    sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+    time.sleep = lambda *_args, **_kwargs: None
+    builtins.input = lambda *_args, **_kwargs: ""
+
+
+# =====================================
+# 📊 처리량 통계
+# =====================================
+
+@dataclass
+class TrainingStats:
+    workers: int = 0
+    battles: int = 0
+    wins: int = 0
+    errors: int = 0
+    turns: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+    last_error: Optional[str] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def battles_per_hour(self) -> float:
+        return self.battles * 3600 / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.battles if self.battles else 0.0
+
+    def add(self, result: Dict[str, Any]):
+        self.battles += 1
+        self.turns += result.get('turns', 0)
+        if result.get('victory'):
+            self.wins += 1
+        if result.get('error'):
+            self.errors += 1
+            self.last_error = result['error']
+
+    def summary(self) -> str:
+        mode = f"{self.workers}개 프로세스" if self.workers else "순차 실행"
+        return (f"⚔️ 훈련 전투 {self.battles:,}회 (승률 {self.win_rate * 100:.1f}%, 오류 {self.errors}) "
+                f"- {self.elapsed:.1f}초, 시간당 {self.battles_per_hour:,.0f}전 [{mode}]")
+
+
+# =====================================
+# 🏭 러너
+# =====================================
+
+class BattleTrainingRunner:
+    """BattleTask들을 프로세스 풀에 나눠 실행하고 결과를 배치로 전달"""
+
+    def __init__(self, workers: int = None, batch_size: int = DEFAULT_BATCH_SIZE, verbose: bool = True,
+                 battle_timeout: float = BATTLE_TIMEOUT_SECONDS):
+        self.workers = workers if workers is not None else max(1, (os.cpu_count() or 2) - 1)
+        self.batch_size = batch_size
+        self.verbose = verbose
+        self.battle_timeout = battle_timeout
+        self.stats = TrainingStats()
+
+    def run(self, tasks: Iterable[BattleTask],
+            on_batch: Callable[[List[Dict[str, Any]]], None] = None,
+            should_stop: Callable[[], bool] = None) -> TrainingStats:
+        """tasks(무한 제너레이터 가능)를 should_stop()이 참이 될 때까지 실행"""
+        self.stats = TrainingStats()
+        batch: List[Dict[str, Any]] = []
+
+        def collect(result):
+            self.stats.add(result)
+            batch.append(result)
+            if len(batch) >= self.batch_size:
+                self._emit(batch, on_batch)
+
+        task_iter = iter(tasks)
+        stop = should_stop or (lambda: False)
+        try:
+            if self.workers > 1:
+                task_iter = self._run_pool(task_iter, collect, stop)
+        except (OSError, ImportError, NotImplementedError, BrokenProcessPool) as e:
+            print(f"⚠️ 훈련 프로세스 풀 사용 불가 ({e}) - 순차 실행으로 전환")
+        if task_iter is not None:
+            for task in task_iter:
+                if stop():
+                    break
+                collect(run_headless_battle(task))
+
+        self._emit(batch, on_batch, report=False)
+        self.stats.finished_at = time.perf_counter()
+        if self.verbose:
+            print(self.stats.summary())
+        return self.stats
+
+    def _run_pool(self, task_iter, collect, stop):
+        """풀 실행 - 풀이 중간에 깨지면 남은 작업 이터레이터 반환, 끝까지 돌면 None
+
+        전투가 battle_timeout 안에 끝나지 않으면 시간 초과로 기록하고 워커를 종료한 뒤,
+        못 끝낸 나머지 작업은 새 풀에서 이어서 실행
+        """
+        self.stats.workers = self.workers
+        while True:
+            outcome, remaining = self._run_pool_once(task_iter, collect, stop)
+            if outcome != 'timeout':
+                return remaining
+            task_iter = remaining
+
+    def _run_pool_once(self, task_iter, collect, stop):
+        """풀 하나로 실행 - ('done', None), ('broken', 남은 작업) 또는 ('timeout', 남은 작업)"""
+        max_in_flight = self.workers * 4
+        pending = {}
+        started_at = {}   # 워커로 넘어간 시각 (future.running() 기준)
+        context = multiprocessing.get_context('spawn')   # 게임 스레드(오디오/DB writer)를 복제하지 않도록
+        executor = ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker)
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < max_in_flight and not stop():
+                    task = next(task_iter, None)
+                    if task is None:
+                        exhausted = True
+                        break
+                    pending[executor.submit(run_headless_battle, task)] = task
+                if not pending:
+                    return 'done', None
+                done, _ = wait(pending, timeout=POOL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = pending.pop(future)
+                    started_at.pop(future, None)
+                    try:
+                        collect(future.result())
+                    except BrokenProcessPool:
+                        # 못 끝낸 작업은 순차 실행으로 이어서
+                        remaining = [task] + list(pending.values())
+                        pending.clear()
+                        print("⚠️ 훈련 프로세스 풀이 중단되어 남은 전투는 순차 실행합니다")
+                        return 'broken', _chain(remaining, task_iter)
+
+                now = time.perf_counter()
+                for future in pending:
+                    if future not in started_at and future.running():
+                        started_at[future] = now
+                hung = [future for future, began in started_at.items()
+                        if now - began > self.battle_timeout and not future.done()]
+                if hung:
+                    for future in hung:
+                        collect(_timeout_result(pending.pop(future), self.battle_timeout))
+                    # 멈춘 워커는 취소할 수 없으므로 풀을 종료하고 나머지는 새 풀에서 다시 실행
+                    remaining = list(pending.values())
+                    pending.clear()
+                    print(f"⚠️ 훈련 전투 {len(hung)}개가 {self.battle_timeout:.0f}초 안에 끝나지 않아 워커를 재시작합니다")
+                    _terminate_pool(executor)
+                    return 'timeout', _chain(remaining, task_iter)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _emit(self, batch: List[Dict[str, Any]], on_batch, report: bool = True):
+        if not batch:
+            return
+        results = list(batch)
+        batch.clear()
+        if on_batch is not None:
+            try:
+                on_batch(results)
+            except Exception as e:
+                print(f"⚠️ 훈련 결과 반영 실패: {e}")
+        if self.verbose and report:
+            print(self.stats.summary())
+
+
+def _terminate_pool(executor: ProcessPoolExecutor):
+    """실행 중인 워커 프로세스 강제 종료 (shutdown이 멈춘 작업을 기다리지 않도록)"""
+    for future_process in list(getattr(executor, '_processes', {}).values()):
+        try:
+            future_process.terminate()
+        except Exception:
+            pass
+
+
+def _chain(first: List[BattleTask], rest):
+    yield from first
+    yield from rest
+
+
+def run_training_battles(tasks: Iterable[BattleTask], workers: int = None,
+                         batch_size: int = DEFAULT_BATCH_SIZE, verbose: bool = False) -> List[Dict[str, Any]]:
+    """전투 목록을 실행해 battle_id 순서의 결과 목록 반환"""
+    results: List[Dict[str, Any]] = []
+    BattleTrainingRunner(workers, batch_size, verbose).run(tasks, on_batch=results.extend)
+    results.sort(key=lambda r: r['battle_id'])
+    return results
@@ -0,0 +1,435 @@
+"""
+🔮 보스 몬테카를로 수읽기
+보스/정예 적 전용 - 헤드리스 BRV/HP 규칙 위에서 시간 제한 롤아웃 탐색으로 행동과 대상 선택
+
+- 전투원은 작은 튜플 스냅샷으로 복사 (능력치는 공유, HP/BRV/ATB/BREAK만 롤아웃마다 복사)
+- 후보 행동(대상별 BRV 공격/HP 공격)에 UCB1로 롤아웃을 배분하고, 결정당 밀리초 예산이 끝나면 중단
+- 탐색은 워커 프로세스 하나에서 실행 - 보스 ATB가 차오르는 동안 미리 요청(prefetch)해 두고
+  턴이 오면 같은 전장 상태의 결과를 바로 사용 (미리 요청한 결과가 없거나 아직 안 끝났으면
+  None → 기존 휴리스틱, 게임 스레드는 탐색을 기다리지 않음)
+- 워커는 전투 시작 시 warm_up()이 백그라운드 스레드에서 띄움 - 준비 전에는 탐색 요청 안 함
+- 대상은 어그로 시스템이 고른 파티원을 그대로 쓰고, 수읽기는 그 대상에 대한 행동(BRV/HP)만 고름
+- 롤아웃 규칙은 BraveCombatSystem의 기본 BRV/HP 공격 공식(통합 데미지 시스템 상수)만 사용,
+  특성/속성/상태이상은 생략
+"""
+
+import math
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_BUDGET_MS = 120          # 결정 하나당 탐색 시간
+DEFAULT_ROLLOUT_DEPTH = 12       # 롤아웃 한 번에 시뮬레이션할 행동 수
+MAX_ROLLOUTS = 20000             # 예산과 무관한 롤아웃 상한
+PREFETCH_ATB_RATIO = 0.6         # 보스 ATB가 이 비율을 넘으면 미리 탐색 요청
+RESULT_GRACE_MS = 30             # 미리 요청한 결과가 막 끝나가는 경우 기다려 주는 최대 시간
+UCB_EXPLORATION = 1.2
+
+ATB_READY = 1000                 # BraveCombatSystem.ATB_READY_THRESHOLD
+ATB_BASE_INCREASE = 30           # _update_atb_instant의 기본 증가량
+BASIC_BRV_POWER = 100            # 기본 BRV 공격 위력 (%)
+CRITICAL_CHANCE = 0.1
+CRITICAL_MULTIPLIER = 1.5
+BREAK_HP_MULTIPLIER = 1.5
+ENEMY_HP_ATTACK_BRV = 400        # enemy_turn의 HP 공격 기준 BRV
+
+BOSS_RANKS = ("보스", "레이드보스", "전설")
+ELITE_RANKS = ("정예", "챔피언")
+
+PARTY_SIDE = 0
+ENEMY_SIDE = 1
+
+# 스냅샷 인덱스 - 고정 능력치 / 롤아웃마다 바뀌는 값
+S_SIDE, S_SPEED, S_ATTACK, S_DEFENSE, S_INT_BRV, S_MAX_BRV, S_MAX_HP = range(7)
+D_HP, D_BRV, D_ATB, D_BROKEN = range(4)
+# 데미지 상수 인덱스 (BRV 기본 배율, HP 배율, HP 위력 스케일, HP 방어 감소)
+R_BRV_BASE, R_HP_MULTIPLIER, R_HP_SCALING, R_HP_DEFENSE = range(4)
+
+_damage_rules: Optional[tuple] = None
+
+
+def _get_damage_rules() -> tuple:
+    """통합 데미지 시스템 상수 (메인 프로세스에서 읽어 스냅샷에 담음 - 워커는 전투 모듈을 import하지 않음)"""
+    global _damage_rules
+    if _damage_rules is None:
+        try:
+            from game.unified_damage_system import UnifiedDamageSystem as damage
+            _damage_rules = (damage.BRV_BASE_MULTIPLIER, damage.HP_DAMAGE_MULTIPLIER,
+                             damage.HP_SKILL_POWER_SCALING, damage.HP_DEFENSE_REDUCTION)
+        except Exception:
+            _damage_rules = (2.0, 0.1, 1.5, 0.5)
+    return _damage_rules
+
+
+@dataclass
+class BattleSnapshot:
+    """워커 프로세스로 보내는 전장 상태 (피클링 가능한 튜플만)"""
+    stats: Tuple[tuple, ...]      # (side, speed, attack, defense, int_brv, max_brv, max_hp)
+    dynamic: Tuple[tuple, ...]    # (hp, brv, atb, broken)
+    actor: int                    # 결정하는 보스의 인덱스
+    targets: Tuple[int, ...]      # 공격 가능한 파티원 인덱스
+    rules: tuple                  # 데미지 상수 (_get_damage_rules)
+
+    @property
+    def key(self) -> tuple:
+        """결과 재사용 키 - ATB는 제외 (미리 요청한 뒤 턴이 올 때까지 ATB만 변함)"""
+        return (self.actor, self.stats, tuple(d[:D_ATB] + d[D_BROKEN:] for d in self.dynamic))
+
+
+def take_snapshot(boss, party: List, enemies: List) -> Optional[BattleSnapshot]:
+    """전투원 목록 → 스냅샷 (보스가 없거나 공격할 파티원이 없으면 None)"""
+    combatants = [c for c in party if c.is_alive] + [e for e in enemies if e.is_alive]
+    party_count = sum(1 for c in party if c.is_alive)
+    if party_count == 0:
+        return None
+    stats, dynamic, actor = [], [], None
+    for index, c in enumerate(combatants):
+        if c is boss:
+            actor = index
+        brv = max(0, int(getattr(c, 'brave_points', 0)))
+        stats.append((
+            PARTY_SIDE if index < party_count else ENEMY_SIDE,
+            max(1, int(getattr(c, 'speed', 50))),
+            max(1, int(getattr(c, 'physical_attack', 10))),
+            max(1, int(getattr(c, 'physical_defense', 10))),
+            max(1, int(getattr(c, 'int_brv', getattr(c, 'initial_brave', 40)))),
+            max(1, int(getattr(c, 'max_brv', 9999))),
+            max(1, int(c.max_hp)),
+        ))
+        dynamic.append((int(c.current_hp), brv, int(getattr(c, 'atb_gauge', 0)),
+                        bool(getattr(c, 'is_broken', False) or getattr(c, 'is_broken_state', False))))
+    if actor is None:
+        return None
+    return BattleSnapshot(tuple(stats), tuple(dynamic), actor, tuple(range(party_count)), _get_damage_rules())
+
+
+# =====================================
+# ⚔️ 헤드리스 규칙
+# =====================================
+
+def _brv_attack(rules, stats, state, attacker: int, target: int, rng: random.Random):
+    """BRV 공격 - 대상 BRV를 깎고 그만큼 획득, 이미 0이던 대상은 BREAK"""
+    a, t = state[attacker], state[target]
+    damage = stats[attacker][S_ATTACK] / stats[target][S_DEFENSE] * BASIC_BRV_POWER * rules[R_BRV_BASE]
+    if rng.random() < CRITICAL_CHANCE:
+        damage *= CRITICAL_MULTIPLIER
+    damage = max(1, int(damage))
+    was_zero = t[D_BRV] <= 0
+    t[D_BRV] -= damage
+    a[D_BRV] = min(stats[attacker][S_MAX_BRV], a[D_BRV] + damage)
+    if t[D_BRV] <= 0:
+        t[D_BRV] = 0
+        if was_zero and not t[D_BROKEN]:
+            t[D_BROKEN] = True
+            t[D_ATB] = 0
+
+
+def _hp_attack(rules, stats, state, attacker: int, target: int):
+    """HP 공격 - 현재 BRV만큼 HP 피해 후 BRV 0"""
+    a, t = state[attacker], state[target]
+    defense_multiplier = max(0.2, 1.0 - stats[target][S_DEFENSE] * rules[R_HP_DEFENSE] / 100)
+    damage = int(a[D_BRV] * rules[R_HP_MULTIPLIER] * rules[R_HP_SCALING] * defense_multiplier)
+    if t[D_BROKEN]:
+        damage = int(damage * BREAK_HP_MULTIPLIER)
+    t[D_HP] = max(0, t[D_HP] - damage)
+    a[D_BRV] = 0
+
+
+def _start_turn(stats, state, index: int):
+    """턴 시작 - BREAK 해제/BRV 0이면 INT BRV 회복"""
+    unit = state[index]
+    if unit[D_BROKEN] or unit[D_BRV] <= 0:
+        unit[D_BROKEN] = False
+        unit[D_BRV] = stats[index][S_INT_BRV]
+
+
+def _next_actor(stats, state) -> int:
+    """다음에 ATB가 가득 차는 전투원까지 시간을 진행"""
+    alive = [i for i, unit in enumerate(state) if unit[D_HP] > 0]
+    avg_speed = sum(stats[i][S_SPEED] for i in alive) / len(alive)
+    rates = {i: max(1, int(ATB_BASE_INCREASE * max(0.5, min(2.0, stats[i][S_SPEED] / avg_speed)))) for i in alive}
+    ticks = min(max(0, math.ceil((ATB_READY - state[i][D_ATB]) / rates[i])) for i in alive)
+    actor, best = alive[0], -1
+    for i in alive:
+        state[i][D_ATB] += rates[i] * ticks
+        if state[i][D_ATB] > best:
+            actor, best = i, state[i][D_ATB]
+    return actor
+
+
+def _side_alive(stats, state, side: int) -> List[int]:
+    return [i for i, unit in enumerate(state) if unit[D_HP] > 0 and stats[i][S_SIDE] == side]
+
+
+def _default_policy(stats, state, actor: int, rng: random.Random) -> Tuple[str, int]:
+    """롤아웃 기본 정책 - 적은 enemy_turn과 같은 규칙, 파티는 BRV를 모아 약한 적부터 HP 공격"""
+    unit = state[actor]
+    if stats[actor][S_SIDE] == ENEMY_SIDE:
+        targets = _side_alive(stats, state, PARTY_SIDE)
+        target = rng.choice(targets)
+        if unit[D_BRV] >= ENEMY_HP_ATTACK_BRV and rng.random() < 0.5:
+            return 'hp_attack', target
+        return 'brv_attack', target
+    targets = _side_alive(stats, state, ENEMY_SIDE)
+    broken = [i for i in targets if state[i][D_BROKEN]]
+    if unit[D_BRV] > 0 and (broken or unit[D_BRV] >= stats[actor][S_INT_BRV] * 2):
+        return 'hp_attack', (broken[0] if broken else min(targets, key=lambda i: state[i][D_HP]))
+    return 'brv_attack', rng.choice(targets)
+
+
+def _apply(rules, stats, state, actor: int, action: str, target: int, rng: random.Random):
+    if action == 'hp_attack':
+        _hp_attack(rules, stats, state, actor, target)
+    else:
+        _brv_attack(rules, stats, state, actor, target, rng)
+    state[actor][D_ATB] = 0
+
+
+def _evaluate(stats, state, initial) -> float:
+    """보스 진영 기준 점수 (-1 ~ 1): 파티에 준 HP 피해 비율 - 받은 HP 피해 비율 + BRV 우위"""
+    lost = [0.0, 0.0]
+    total = [0.0, 0.0]
+    brv = [0.0, 0.0]
+    for i, unit in enumerate(state):
+        side = stats[i][S_SIDE]
+        total[side] += stats[i][S_MAX_HP]
+        lost[side] += initial[i][D_HP] - unit[D_HP]
+        brv[side] += unit[D_BRV] / stats[i][S_MAX_BRV]
+    if not _side_alive(stats, state, PARTY_SIDE):
+        return 1.0
+    if not _side_alive(stats, state, ENEMY_SIDE):
+        return -1.0
+    score = lost[PARTY_SIDE] / total[PARTY_SIDE] - lost[ENEMY_SIDE] / total[ENEMY_SIDE]
+    score += 0.05 * (brv[ENEMY_SIDE] - brv[PARTY_SIDE]) / len(state)
+    return max(-1.0, min(1.0, score))
+
+
+def _rollout(snapshot: BattleSnapshot, action: str, target: int, depth: int, rng: random.Random) -> float:
+    stats = snapshot.stats
+    state = [list(d) for d in snapshot.dynamic]   # 값싼 복사 - 능력치 튜플은 공유
+    _apply(snapshot.rules, stats, state, snapshot.actor, action, target, rng)
+    for _ in range(depth):
+        if not _side_alive(stats, state, PARTY_SIDE) or not _side_alive(stats, state, ENEMY_SIDE):
+            break
+        actor = _next_actor(stats, state)
+        _start_turn(stats, state, actor)
+        next_action, next_target = _default_policy(stats, state, actor, rng)
+        _apply(snapshot.rules, stats, state, actor, next_action, next_target, rng)
+    return _evaluate(stats, state, snapshot.dynamic)
+
+
+def search(snapshot: BattleSnapshot, budget_ms: float = DEFAULT_BUDGET_MS,
+           depth: int = DEFAULT_ROLLOUT_DEPTH, seed: Optional[int] = None) -> Dict:
+    """UCB1 롤아웃 탐색 - 예산 안에서 가장 평균 점수가 높은 (행동, 대상 인덱스)"""
+    deadline = time.perf_counter() + budget_ms / 1000.0
+    rng = random.Random(seed)
+    actor_brv = snapshot.dynamic[snapshot.actor][D_BRV]
+    candidates = [('brv_attack', t) for t in snapshot.targets]
+    if actor_brv > 0:
+        candidates += [('hp_attack', t) for t in snapshot.targets]
+    visits = [0] * len(candidates)
+    totals = [0.0] * len(candidates)
+    rollouts = 0
+
+    while rollouts < MAX_ROLLOUTS and (rollouts < len(candidates) or time.perf_counter() < deadline):
+        if rollouts < len(candidates):
+            choice = rollouts
+        else:
+            log_total = math.log(rollouts)
+            choice = max(range(len(candidates)),
+                         key=lambda i: totals[i] / visits[i] + UCB_EXPLORATION * math.sqrt(log_total / visits[i]))
+        action, target = candidates[choice]
+        totals[choice] += _rollout(snapshot, action, target, depth, rng)
+        visits[choice] += 1
+        rollouts += 1
+
+    best = max(range(len(candidates)), key=lambda i: (visits[i], totals[i] / visits[i]))
+    action, target = candidates[best]
+    # 대상이 정해진 경우(어그로)를 위한 대상별 최선 행동 - 평균 점수 기준
+    by_target: Dict[int, Tuple[str, float]] = {}
+    for i, (candidate_action, candidate_target) in enumerate(candidates):
+        mean = totals[i] / visits[i]
+        if candidate_target not in by_target or mean > by_target[candidate_target][1]:
+            by_target[candidate_target] = (candidate_action, mean)
+    return {
+        'type': action,
+        'target_index': target,
+        'score': totals[best] / visits[best],
+        'rollouts': rollouts,
+        'by_target': by_target,
+    }
+
+
+# =====================================
+# 🧠 보스 수읽기 관리자
+# =====================================
+
+class BossLookahead:
+    """보스/정예 행동 결정 - 워커 프로세스에서 시간 제한 탐색, 미리 요청한 결과 재사용"""
+
+    def __init__(self, budget_ms: float = DEFAULT_BUDGET_MS, depth: int = DEFAULT_ROLLOUT_DEPTH,
+                 include_elites: bool = True, use_process: bool = True, enabled: bool = True):
+        self.enabled = enabled
+        self.budget_ms = budget_ms
+        self.depth = depth
+        self.include_elites = include_elites
+        self.use_process = use_process
+        self._executor: Optional[ProcessPoolExecutor] = None   # warm_up이 준비를 마친 워커만
+        self._warming = False
+        self._pending: Dict[int, Tuple[tuple, Future]] = {}   # id(보스) → (키, future)
+        self._lock = threading.Lock()
+        self.stats = {'searches': 0, 'prefetch_hits': 0, 'misses': 0, 'timeouts': 0, 'rollouts': 0}
+
+    def is_eligible(self, enemy) -> bool:
+        """수읽기 대상인지 (보스, 설정 시 정예/챔피언 포함)"""
+        if not self.enabled:
+            return False
+        if getattr(enemy, 'is_boss', False):
+            return True
+        rank = getattr(getattr(enemy, 'rank', None), 'value', None)
+        return rank in BOSS_RANKS or (self.include_elites and rank in ELITE_RANKS)
+
+    def _start_executor(self):
+        """워커 프로세스 시작 (백그라운드 스레드) - 첫 작업이 끝나 프로세스가 준비되면 사용 가능"""
+        try:
+            # spawn: pygame/오디오 상태를 물려받지 않는 깨끗한 워커
+            executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+            executor.submit(math.sqrt, 0).result()
+        except Exception:
+            self.use_process = False
+            executor = None
+        with self._lock:
+            self._executor = executor
+            self._warming = False
+
+    def _submit(self, snapshot: BattleSnapshot) -> Optional[Future]:
+        executor = self._executor
+        if executor is None:
+            self.warm_up()   # 아직 준비 전 - 이번 요청은 건너뜀
+            return None
+        try:
+            return executor.submit(search, snapshot, self.budget_ms, self.depth, random.getrandbits(32))
+        except (BrokenProcessPool, RuntimeError):
+            self._executor = None
+            self.use_process = False
+            return None
+
+    def prefetch(self, boss, party: List, enemies: List):
+        """보스 턴 전에 현재 전장 상태로 탐색 요청 (같은 상태로 이미 요청했으면 무시)"""
+        snapshot = take_snapshot(boss, party, enemies)
+        if snapshot is None:
+            return
+        key = snapshot.key
+        with self._lock:
+            pending = self._pending.get(id(boss))
+            if pending is not None:
+                if pending[0] == key:
+                    return
+                pending[1].cancel()   # 상태가 바뀐 이전 요청 (아직 대기 중이면 취소)
+            future = self._submit(snapshot)
+            if future is not None:
+                self._pending[id(boss)] = (key, future)
+
+    def observe_atb(self, party: List, enemies: List, ready_threshold: int = ATB_READY):
+        """ATB 갱신마다 호출 - 턴이 가까운 보스/정예의 탐색을 미리 요청"""
+        for enemy in enemies:
+            if (enemy.is_alive and self.is_eligible(enemy)
+                    and getattr(enemy, 'atb_gauge', 0) >= ready_threshold * PREFETCH_ATB_RATIO):
+                self.prefetch(enemy, party, enemies)
+
+    def choose(self, boss, party: List, enemies: List, target=None) -> Optional[Dict]:
+        """보스 행동 {'type': 'brv_attack'|'hp_attack', 'target': 파티원}
+
+        target을 주면(어그로 대상) 그 대상에 대한 최선 행동만 고름. 미리 요청한 같은 상태의
+        결과가 준비되어 있지 않으면 기다리지 않고 None (기존 휴리스틱 사용)
+        """
+        snapshot = take_snapshot(boss, party, enemies)
+        if snapshot is None:
+            return None
+        with self._lock:
+            pending = self._pending.pop(id(boss), None)
+
+        self.stats['searches'] += 1
+        if not self.use_process:
+            # 워커를 쓰지 않는 설정이면 같은 예산으로 현재 스레드에서 탐색
+            result = search(snapshot, self.budget_ms, self.depth)
+        elif pending is None or pending[0] != snapshot.key:
+            if pending is not None:
+                pending[1].cancel()
+            self.stats['misses'] += 1
+            return None
+        else:
+            self.stats['prefetch_hits'] += 1
+            future = pending[1]
+            try:
+                result = future.result(timeout=RESULT_GRACE_MS / 1000.0)
+            except FutureTimeoutError:
+                future.cancel()
+                self.stats['timeouts'] += 1
+                return None
+            except BrokenProcessPool:
+                self._executor = None
+                self.use_process = False
+                return None
+
+        self.stats['rollouts'] += result['rollouts']
+        alive_party = [c for c in party if c.is_alive]
+        if target is not None:
+            if target not in alive_party:
+                return None
+            action_type, score = result['by_target'][alive_party.index(target)]
+        else:
+            action_type, score = result['type'], result['score']
+            target = alive_party[result['target_index']]
+        return {
+            'type': action_type,
+            'target': target,
+            'score': score,
+            'rollouts': result['rollouts'],
+        }
+
+    def warm_up(self):
+        """워커 프로세스를 백그라운드에서 미리 띄움 (전투 시작 시 호출 - 게임 스레드는 기다리지 않음)"""
+        with self._lock:
+            if not self.use_process or self._executor is not None or self._warming:
+                return
+            self._warming = True
+        threading.Thread(target=self._start_executor, name="BossLookaheadWarmUp", daemon=True).start()
+
+    def shutdown(self):
+        with self._lock:
+            for _, future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 전역 보스 수읽기
+_boss_lookahead = None
+
+
+def get_boss_lookahead() -> BossLookahead:
+    """보스 수읽기 가져오기 (config.GameConfig.BOSS_AI_SETTINGS 반영)"""
+    global _boss_lookahead
+    if _boss_lookahead is None:
+        settings = {}
+        try:
+            from config import GameConfig
+            settings = getattr(GameConfig(), 'BOSS_AI_SETTINGS', {})
+        except Exception:
+            pass
+        _boss_lookahead = BossLookahead(
+            budget_ms=settings.get('lookahead_budget_ms', DEFAULT_BUDGET_MS),
+            depth=settings.get('rollout_depth', DEFAULT_ROLLOUT_DEPTH),
+            include_elites=settings.get('include_elites', True),
+            use_process=settings.get('use_worker_process', True),
+            enabled=settings.get('lookahead_enabled', True),
+        )
+    return _boss_lookahead
@@ -33,7 +33,9 @@ from game.trait_combat_integration import trait_integrator  # 특성 연동 모
 from game.optimized_gauge_system import OptimizedGaugeSystem
 from game.color_text import Color
 from game.ui_animations import get_gauge_animator  # 게이지 애니메이션
+from game.hot_path_profiler import profiled, hot_path  # 핫패스 프로파일러
 from game.aggro_system import get_aggro_system, create_damage_aggro, create_healing_aggro, create_taunt_aggro, create_debuff_aggro, AggroType  # 어그로 시스템
+from game.turn_forecast import atb_gain_per_tick, get_turn_forecaster  # 턴 순서 예측 (ATB 증가 규칙 공유)
 
 # 🎯 아이템 효과 처리 시스템 (combat.py에서 흡수)
 class ItemEffectProcessor:
@@ -715,6 +717,13 @@ try:
 except ImportError:
     WARRIOR_SYSTEM_AVAILABLE = False
 
+# 🔮 보스 수읽기 (몬테카를로 롤아웃) import
+try:
+    from game.boss_lookahead import get_boss_lookahead
+    BOSS_LOOKAHEAD_AVAILABLE = True
+except ImportError:
+    BOSS_LOOKAHEAD_AVAILABLE = False
+
 
 class BraveCombatSystem:
     """Brave 기반 전투 시스템"""
@@ -1407,6 +1416,12 @@ class BraveCombatSystem:
         self._last_action_completed = False
         self._recent_combat_logs.clear()  # 로그 초기화
         
+        # 🔮 보스/정예가 있으면 수읽기 워커를 미리 띄움 (첫 보스 턴에 프로세스 시작을 기다리지 않도록)
+        if BOSS_LOOKAHEAD_AVAILABLE:
+            boss_lookahead = get_boss_lookahead()
+            if any(boss_lookahead.is_eligible(enemy) for enemy in enemies):
+                boss_lookahead.warm_up()
+        
         # 🎯 어그로 시스템 초기화 (모든 적군에 대해)
         for enemy in enemies:
             enemy_name = getattr(enemy, 'name', str(enemy))
@@ -2059,7 +2074,8 @@ class BraveCombatSystem:
                 return self.player_turn(character, party, enemies)
             
             # AI 행동 결정
-            action_type, action_data = ai_companion.decide_action(party, enemies)
+            with hot_path("combat.ai_choice"):
+                action_type, action_data = ai_companion.decide_action(party, enemies)
             
             # AI 행동 실행
             print(f"\n💭 {character.name}이(가) 행동을 결정하고 있습니다...")
@@ -2887,6 +2903,7 @@ class BraveCombatSystem:
             print("🔸 자동 전투 중에도 메뉴에서 다시 끌 수 있습니다")
         return self.auto_battle
     
+    @profiled("combat.ai_choice")
     def _auto_battle_action(self, character: Character, party: List[Character], enemies: List[Character]):
         """자동 전투 행동 로직"""
         import time
@@ -3359,13 +3376,13 @@ class BraveCombatSystem:
                     healer_name = getattr(character, 'name', str(character))
                     heal_amount = best_item[0].stats.get("healing_power", 50)
                     
-                    # 모든 적에게 힐러의 어그로 추가
+                    # 모든 적에게 힐러의 어그로 추가 (한 번에)
                     if hasattr(self, '_current_enemies'):
-                        for enemy in self._current_enemies:
-                            if getattr(enemy, 'is_alive', True):
-                                enemy_name = getattr(enemy, 'name', str(enemy))
-                                aggro_event = create_healing_aggro(healer_name, heal_amount)
-                                self.aggro_system.add_aggro_event(enemy_name, aggro_event)
+                        aggro_event = create_healing_aggro(healer_name, heal_amount, getattr(character, 'max_hp', 1000))
+                        self.aggro_system.add_aggro_events(
+                            [getattr(enemy, 'name', str(enemy)) for enemy in self._current_enemies
+                             if getattr(enemy, 'is_alive', True)],
+                            aggro_event)
                 
                 return True
         return False
@@ -3481,6 +3498,7 @@ class BraveCombatSystem:
         # 가장 높은 점수의 적 선택
         return max(target_scores, key=lambda x: x[1])[0]
     
+    @profiled("combat.ai_choice")
     def _select_enemy_target(self, party: List[Character], enemy: Character = None) -> Character:
         """적 AI의 타겟 선택 (동적 어그로 시스템 전용)"""
         if not party:
@@ -5201,6 +5219,7 @@ class BraveCombatSystem:
             print("잘못된 선택입니다.")
             return False
         
+    @profiled("combat.damage")
     def execute_brave_attack(self, attacker: Character, target: Character):
         """Brave 공격 실행 + 그림자 시스템 통합"""
         from game.error_logger import log_combat
@@ -5538,13 +5557,13 @@ class BraveCombatSystem:
                 # 타겟된 적에게 어그로 추가
                 self.aggro_system.add_aggro_event(target_name, aggro_event)
                 
-                # 다른 적들에게도 절반의 어그로 추가 (관심 끌기)
+                # 다른 적들에게도 절반의 어그로 추가 (관심 끌기, 한 번에)
                 if hasattr(self, '_current_enemies'):
-                    for enemy in self._current_enemies:
-                        enemy_name = getattr(enemy, 'name', str(enemy))
-                        if enemy_name != target_name and getattr(enemy, 'is_alive', True):
-                            indirect_aggro = create_damage_aggro(attacker_name, brave_damage * 0.3)
-                            self.aggro_system.add_aggro_event(enemy_name, indirect_aggro)
+                    indirect_aggro = create_damage_aggro(attacker_name, brave_damage * 0.3, target_max_hp)
+                    self.aggro_system.add_aggro_events(
+                        [getattr(enemy, 'name', str(enemy)) for enemy in self._current_enemies
+                         if getattr(enemy, 'name', str(enemy)) != target_name and getattr(enemy, 'is_alive', True)],
+                        indirect_aggro)
         
         # BRV 공격 결과 확인 - 대기 시간 제거 (어차피 턴 정산에서 대기)
         
@@ -6900,6 +6919,7 @@ class BraveCombatSystem:
     
     def _execute_hp_attack_on_target(self, attacker: Character, target: Character, skill, consume_brave: bool = True):
         """단일 대상에게 HP 공격 실행 (내부 메서드)"""
+    @profiled("combat.damage")
     def _execute_hp_attack_on_target(self, attacker: Character, target: Character, skill, consume_brave: bool = True):
         """단일 대상에게 HP 공격 실행 (내부 메서드)"""
         # 스킬 사용 비주얼 이펙트
@@ -7132,7 +7152,25 @@ class BraveCombatSystem:
             enemy_name = getattr(enemy, 'name', str(enemy))
             self.aggro_system.decay_aggro(enemy_name)
         
-        if enemy.brave_points >= 400 and random.random() < 0.5:  # 1000 → 400, 40% → 50%
+        # 🔮 보스/정예: 어그로로 고른 대상에 대해 워커 프로세스의 롤아웃 탐색 결과로 행동 결정
+        # (미리 요청한 결과가 없으면 기존 판단 - 도발/탱커 어그로는 그대로 유지)
+        lookahead_action = None
+        if BOSS_LOOKAHEAD_AVAILABLE:
+            boss_lookahead = get_boss_lookahead()
+            if boss_lookahead.is_eligible(enemy):
+                lookahead_action = boss_lookahead.choose(enemy, party, enemies, target)
+        
+        if lookahead_action:
+            use_hp_attack = lookahead_action['type'] == 'hp_attack'
+            log_combat("보스수읽기", f"{enemy.name} 롤아웃 탐색 결과 사용", {
+                "행동": lookahead_action['type'],
+                "타겟": target.name,
+                "롤아웃": lookahead_action['rollouts']
+            })
+        else:
+            use_hp_attack = enemy.brave_points >= 400 and random.random() < 0.5  # 1000 → 400, 40% → 50%
+        
+        if use_hp_attack:
             # HP 공격 사용
             print(f"💀 {enemy.name}이(가) {target.name}에게 HP 공격을 시도합니다!")
             log_combat("적행동", f"{enemy.name}이 {target.name}에게 HP 공격 실행 시작", {
@@ -10066,67 +10104,52 @@ class BraveCombatSystem:
             
             print(f"  {i}. {side_icon} {combatant.name}: {status} ({atb_percent}%)")
         
-        # 다음 턴 예측
+        # 다음 턴 예측 (공유 턴 예측기 사용 - AI와 같은 예측 결과)
         print(f"\n🔮 다음 5턴 예측:")
-        prediction_combatants = [(c, getattr(c, 'atb_gauge', 0)) for c in valid_combatants]
+        ally_combatants = [c for c in all_combatants if hasattr(c, 'character_class') and c.character_class != 'Enemy']
         
-        for turn in range(1, 6):
-            # ATB 시뮬레이션
-            for i, (combatant, atb) in enumerate(prediction_combatants):
-                speed = getattr(combatant, 'speed', 50)
-                atb_increment = (speed / 50.0) * 8
-                prediction_combatants[i] = (combatant, min(self.ATB_READY_THRESHOLD, atb + atb_increment))
-            
-            # ATB_READY_THRESHOLD 도달한 캐릭터 찾기
-            ready_combatants = [(c, atb) for c, atb in prediction_combatants if atb >= self.ATB_READY_THRESHOLD]
-            if ready_combatants:
-                # 가장 높은 ATB의 캐릭터
-                next_combatant = max(ready_combatants, key=lambda x: x[1])[0]
-                is_ally = next_combatant in [c for c in all_combatants if hasattr(c, 'character_class') and c.character_class != 'Enemy']
-                
-                # 아이콘 설정
-                if is_ally:
-                    character_class = getattr(next_combatant, 'character_class', '모험가')
-                    class_icons = {
-                        '전사': '⚔️', '아크메이지': '🔮', '궁수': '🏹', '도적': '🗡️',
-                        '성기사': '🛡️', '암흑기사': '🌑', '몽크': '👊', '바드': '🎵', 
-                        '네크로맨서': '💀', '용기사': '🐉', '검성': '⚡', '정령술사': '🌟', 
-                        '암살자': '🥷', '기계공학자': '🔧', '무당': '🔯', '해적': '🏴‍☠️', 
-                        '사무라이': '🗾', '드루이드': '🌿', '철학자': '🧠', '시간술사': '⏰', 
-                        '연금술사': '⚗️', '검투사': '🏛️', '기사': '🐎', '신관': '✨',
-                        '마검사': '🗡️', '차원술사': '🌌', '광전사': '💥'
-                    }
-                    side_icon = class_icons.get(character_class, '🎭')
+        for turn, entry in enumerate(self.get_turn_forecast(5, valid_combatants), 1):
+            next_combatant = entry.combatant
+            
+            # 아이콘 설정
+            if next_combatant in ally_combatants:
+                character_class = getattr(next_combatant, 'character_class', '모험가')
+                class_icons = {
+                    '전사': '⚔️', '아크메이지': '🔮', '궁수': '🏹', '도적': '🗡️',
+                    '성기사': '🛡️', '암흑기사': '🌑', '몽크': '👊', '바드': '🎵', 
+                    '네크로맨서': '💀', '용기사': '🐉', '검성': '⚡', '정령술사': '🌟', 
+                    '암살자': '🥷', '기계공학자': '🔧', '무당': '🔯', '해적': '🏴‍☠️', 
+                    '사무라이': '🗾', '드루이드': '🌿', '철학자': '🧠', '시간술사': '⏰', 
+                    '연금술사': '⚗️', '검투사': '🏛️', '기사': '🐎', '신관': '✨',
+                    '마검사': '🗡️', '차원술사': '🌌', '광전사': '💥'
+                }
+                side_icon = class_icons.get(character_class, '🎭')
+            else:
+                enemy_name = next_combatant.name.lower()
+                if '고블린' in enemy_name:
+                    side_icon = '👹'
+                elif '슬라임' in enemy_name:
+                    side_icon = '🟢'
+                elif '쥐' in enemy_name:
+                    side_icon = '🐭'
+                elif '오크' in enemy_name:
+                    side_icon = '👺'
+                elif '스켈레톤' in enemy_name:
+                    side_icon = '💀'
+                elif '드래곤' in enemy_name:
+                    side_icon = '🐲'
                 else:
-                    enemy_name = next_combatant.name.lower()
-                    if '고블린' in enemy_name:
-                        side_icon = '👹'
-                    elif '슬라임' in enemy_name:
-                        side_icon = '🟢'
-                    elif '쥐' in enemy_name:
-                        side_icon = '🐭'
-                    elif '오크' in enemy_name:
-                        side_icon = '👺'
-                    elif '스켈레톤' in enemy_name:
-                        side_icon = '💀'
-                    elif '드래곤' in enemy_name:
-                        side_icon = '🐲'
-                    else:
-                        side_icon = '👾'
-                
-                print(f"  턴 {turn}: {side_icon} {next_combatant.name}")
-                
-                # 해당 캐릭터의 ATB를 0으로 리셋
-                for i, (c, atb) in enumerate(prediction_combatants):
-                    if c == next_combatant:
-                        prediction_combatants[i] = (c, 0)
-                        break
+                    side_icon = '👾'
+            
+            cast_mark = " 🔮" if entry.is_cast_completion else ""
+            print(f"  턴 {turn}: {side_icon} {next_combatant.name}{cast_mark}")
         
         # 자동 계속 (입력 대기 제거)
         print(f"\n{get_color('YELLOW')}💫 자동으로 계속됩니다... (0.5초){get_color('RESET')}")
         import time
         time.sleep(0.5)
             
+    @profiled("combat.atb")
     def update_atb_gauges(self, all_combatants: List[Character], show_animation: bool = False):
         """ATB 게이지 업데이트 - 상대적 속도 기반 차등 업데이트 및 캐스팅 체크 (애니메이션 지원)"""
         # ATB 정지 상태 체크
@@ -10167,6 +10190,12 @@ class BraveCombatSystem:
             self._update_atb_with_animation(valid_combatants, atb_settings)
         else:
             self._update_atb_instant(valid_combatants, atb_settings)
+        
+        # 🔮 턴이 가까운 보스/정예의 수읽기를 미리 요청 (워커 프로세스가 ATB가 차는 동안 탐색)
+        enemies = getattr(self, '_current_enemies', None)
+        if BOSS_LOOKAHEAD_AVAILABLE and enemies:
+            get_boss_lookahead().observe_atb([c for c in valid_combatants if c not in enemies], enemies,
+                                             self.ATB_READY_THRESHOLD)
     
     def _update_atb_instant(self, all_combatants: List[Character], atb_settings: dict):
         """ATB 즉시 업데이트 (애니메이션 없음) - 상대적 속도 기반 동시 업데이트"""
@@ -10184,8 +10213,11 @@ class BraveCombatSystem:
         total_speed = sum(getattr(c, 'speed', 50) for c in alive_combatants)
         avg_speed = total_speed / len(alive_combatants)
         
-        # 🏃‍♂️ 상대적 속도 기반 ATB 증가 - 평균 속도 대비 비율로 계산
-        base_atb_increase = 30  # ⚡ 원래대로 복원 (40 → 30)
+        # 🏃‍♂️ 상대적 속도 기반 ATB 증가 - 평균 속도 대비 비율로 계산 (기본 증가량 30)
+        # 난이도 기반 ATB 속도 조절은 플레이어 턴 중에만 (적과 아군 모두 공평하게)
+        speed_modifier = None
+        if hasattr(self, 'is_player_turn_active') and self.is_player_turn_active:
+            speed_modifier = self._get_turn_speed_modifier()
 
         # 모든 캐릭터의 ATB를 동시에 계산 후 동시에 업데이트
         atb_updates = {}
@@ -10198,34 +10230,18 @@ class BraveCombatSystem:
                 continue
                 
             if combatant.is_alive and hasattr(combatant, 'atb_gauge'):
-                # 🎯 개별 캐릭터의 속도와 평균 속도 비교로 상대적 ATB 증가 계산
-                character_speed = getattr(combatant, 'speed', 50)
-                
-                # 평균 속도 대비 상대적 비율 계산 (0.5 ~ 2.0 범위로 제한)
-                if avg_speed > 0:
-                    speed_ratio = character_speed / avg_speed
-                    speed_ratio = max(0.5, min(2.0, speed_ratio))  # 너무 극단적이지 않게 제한
-                else:
-                    speed_ratio = 1.0
-                
-                # 상대적 속도 기반 ATB 증가량 계산
-                atb_increase = int(base_atb_increase * speed_ratio)
-                
-                # 난이도 기반 ATB 속도 조절 (적과 아군 모두 공평하게)
-                if hasattr(self, 'is_player_turn_active') and self.is_player_turn_active:
-                    # 플레이어 턴 중에는 난이도 설정에 따른 속도 조절
-                    speed_modifier = self._get_turn_speed_modifier()
-                    atb_increase = int(atb_increase * speed_modifier)
-                    
-                    # 첫 번째 호출 시에만 로깅 (너무 많은 로그 방지)
-                    if not hasattr(self, '_speed_modifier_logged'):
-                        from game.error_logger import log_system
-                        log_system("ATB시스템", f"난이도 기반 ATB 속도 조절 적용", {
-                            "속도배수": speed_modifier,
-                            "기본증가량": base_atb_increase,
-                            "조절후증가량": atb_increase
-                        })
-                        self._speed_modifier_logged = True
+                # 🎯 개별 캐릭터의 속도와 평균 속도 비교로 상대적 ATB 증가 계산 (턴 예측기와 같은 규칙)
+                atb_increase = atb_gain_per_tick(getattr(combatant, 'speed', 50), avg_speed,
+                                                 speed_modifier=speed_modifier)
+                
+                # 첫 번째 호출 시에만 로깅 (너무 많은 로그 방지)
+                if speed_modifier is not None and not hasattr(self, '_speed_modifier_logged'):
+                    from game.error_logger import log_system
+                    log_system("ATB시스템", f"난이도 기반 ATB 속도 조절 적용", {
+                        "속도배수": speed_modifier,
+                        "조절후증가량": atb_increase
+                    })
+                    self._speed_modifier_logged = True
                 
                 # 캐스팅 중인 경우 특별 처리
                 if hasattr(combatant, 'is_casting') and combatant.is_casting:
@@ -10708,6 +10724,21 @@ class BraveCombatSystem:
         
         print()
                 
+    def get_turn_forecast(self, count: int = 5, combatants: List[Character] = None) -> list:
+        """🔮 다음 count번의 행동 예측 (UI/AI 공유 예측기 사용)"""
+        if combatants is None:
+            combatants = list(getattr(self, '_current_party', [])) + list(getattr(self, '_current_enemies', []))
+        
+        # _update_atb_instant와 같은 조건으로 난이도 속도 배수 적용
+        speed_modifier = None
+        if getattr(self, 'is_player_turn_active', False):
+            speed_modifier = self._get_turn_speed_modifier()
+        return get_turn_forecaster().get_forecast(
+            combatants, count,
+            atb_ready_threshold=self.ATB_READY_THRESHOLD, atb_max=self.ATB_MAX,
+            speed_modifier=speed_modifier,
+        )
+    
     def get_action_order(self, all_combatants: List[Character]) -> List[Character]:
         """행동 순서 결정 - 공정한 우선순위 기반 단일 선택"""
         # 유효한 캐릭터 객체만 필터링
@@ -10733,20 +10764,15 @@ class BraveCombatSystem:
         if not ready_combatants:
             return []
         
-        # ATB가 100% 이상인 캐릭터 중 우선순위 결정 (10000 스케일)
-        # 1. ATB 게이지가 더 높은 캐릭터 (더 중요한 가중치)
+        # ATB가 100% 이상인 캐릭터 중 우선순위 결정 (턴 예측기와 같은 순서)
+        # 1. ATB 게이지가 더 높은 캐릭터
         # 2. 속도가 더 빠른 캐릭터
-        # 3. 무작위 (동점인 경우 - 아군/적군 편향 방지)
+        # 3. 이름순 (동점인 경우 - 아군/적군 목록 순서와 무관하고 실행할 때마다 같음)
         def priority_key(combatant):
-            # ATB 게이지를 1000배로 가중치를 높여서 주요 우선순위로 만듦
-            atb_weight = combatant.atb_gauge * 1000
-            speed_weight = getattr(combatant, 'speed', 50)
-            # 완전한 무작위로 아군/적군 편향 제거
-            random_tiebreaker = random.random() * 100
-            return (atb_weight, speed_weight, random_tiebreaker)
+            return (-combatant.atb_gauge, -getattr(combatant, 'speed', 50), str(combatant.name))
         
         # 가장 높은 우선순위 캐릭터 선택
-        fastest = max(ready_combatants, key=priority_key)
+        fastest = min(ready_combatants, key=priority_key)
         
         # 선택된 캐릭터 반환 (디버그 출력 제거로 화면 안정성 향상)
         return [fastest]
@@ -10937,6 +10963,14 @@ class BraveCombatSystem:
         is_assassin = getattr(caster, 'character_class', '') == '암살자'
         shadow_results = None
         
+        # 🌊 광역 스킬은 대상 전체 데미지를 한 번에 계산
+        batch_damage = {}
+        if len(targets) > 1:
+            if skill_type == SkillType.BRV_ATTACK:
+                batch_damage = self._calculate_brv_damage_for_targets(skill, caster, targets, skill.get("brv_power", 100))
+            elif skill_type == SkillType.HP_ATTACK:
+                batch_damage = self._calculate_hp_damage_for_targets(skill, caster, targets, skill.get("hp_power", 120))
+        
         for target in targets:
             base_damage = 0  # 기본 피해량 저장용
             is_magic_skill = skill.get("sfx") == "magic_cast"  # 마법 스킬 여부 판단
@@ -10944,7 +10978,10 @@ class BraveCombatSystem:
             if skill_type == SkillType.BRV_ATTACK:
                 # Brave 공격 - BRV 데미지
                 brv_power = skill.get("brv_power", 100)
-                damage = self._calculate_brv_damage(skill, caster, target, brv_power)
+                if id(target) in batch_damage:
+                    damage = batch_damage[id(target)]
+                else:
+                    damage = self._calculate_brv_damage(skill, caster, target, brv_power)
                 base_damage = damage
                 
                 # 🛡️ 전사 자세 보너스 적용
@@ -10998,7 +11035,10 @@ class BraveCombatSystem:
             elif skill_type == SkillType.HP_ATTACK:
                 # HP 공격 - HP 데미지
                 hp_power = skill.get("hp_power", 120)
-                damage = self._calculate_hp_damage_from_skill(skill, caster, target, hp_power)
+                if id(target) in batch_damage:
+                    damage = batch_damage[id(target)]
+                else:
+                    damage = self._calculate_hp_damage_from_skill(skill, caster, target, hp_power)
                 base_damage = damage
                 
                 # 🛡️ 전사 자세 보너스 적용
@@ -11118,28 +11158,8 @@ class BraveCombatSystem:
             from game.unified_damage_system import calculate_brv_damage
             
             # 스킬 정보 변환 (CharacterTrait 객체 처리)
-            if hasattr(skill, '__dict__'):
-                # CharacterTrait 등의 객체인 경우
-                skill_name = getattr(skill, 'name', "기본 공격")
-                damage_type = getattr(skill, 'damage_type', "physical")
-                element = getattr(skill, 'element', "none")
-            elif isinstance(skill, dict):
-                # 딕셔너리인 경우
-                skill_name = skill.get("name", "기본 공격")
-                damage_type = skill.get("damage_type", "physical")
-                element = skill.get("element", "none")
-            else:
-                # 기타 경우
-                skill_name = "기본 공격"
-                damage_type = "physical"
-                element = "none"
-            
-            unified_skill = {
-                "name": skill_name,
-                "brv_power": brv_power,
-                "damage_type": damage_type,
-                "element": element
-            }
+            unified_skill = self._to_unified_skill(skill, "기본 공격")
+            unified_skill["brv_power"] = brv_power
             
             # 통합 시스템으로 데미지 계산 (우선 사용)
             result = calculate_brv_damage(caster, target, unified_skill)
@@ -11157,6 +11177,60 @@ class BraveCombatSystem:
             print(f"⚠️ 폴백 계산 사용: {simple_damage}")
             return simple_damage
     
+    def _to_unified_skill(self, skill, default_name: str) -> dict:
+        """스킬 객체/딕셔너리를 통합 데미지 시스템용 딕셔너리 정보로 변환"""
+        if hasattr(skill, '__dict__'):
+            # CharacterTrait 등의 객체인 경우
+            return {
+                "name": getattr(skill, 'name', default_name),
+                "damage_type": getattr(skill, 'damage_type', "physical"),
+                "element": getattr(skill, 'element', "none"),
+            }
+        elif isinstance(skill, dict):
+            return {
+                "name": skill.get("name", default_name),
+                "damage_type": skill.get("damage_type", "physical"),
+                "element": skill.get("element", "none"),
+            }
+        return {"name": default_name, "damage_type": "physical", "element": "none"}
+    
+    def _calculate_brv_damage_for_targets(self, skill, caster, targets, brv_power) -> dict:
+        """🌊 광역 BRV 데미지 일괄 계산 - {id(대상): 데미지}, 실패 시 오류를 기록하고 빈 딕셔너리 (개별 계산 폴백)"""
+        try:
+            from game.unified_damage_system import calculate_brv_damage_batch
+            
+            damage_by_target = {}
+            hit_targets = []
+            for target in targets:
+                if self._check_dodge_attempt(caster, target).get("is_dodged", False):
+                    damage_by_target[id(target)] = 0
+                else:
+                    hit_targets.append(target)
+            
+            if hit_targets:
+                unified_skill = self._to_unified_skill(skill, "기본 공격")
+                unified_skill["brv_power"] = brv_power
+                result = calculate_brv_damage_batch(caster, hit_targets, unified_skill)
+                for target, damage in zip(hit_targets, result.final_damage):
+                    damage_by_target[id(target)] = int(damage)
+            return damage_by_target
+        except Exception as e:
+            log_error("광역데미지", f"BRV 일괄 계산 실패 - 대상별 개별 계산으로 대체 ({len(targets)}명)", e)
+            return {}
+    
+    def _calculate_hp_damage_for_targets(self, skill, caster, targets, hp_power) -> dict:
+        """🌊 광역 HP 데미지 일괄 계산 - {id(대상): 데미지}, 실패 시 오류를 기록하고 빈 딕셔너리 (개별 계산 폴백)"""
+        try:
+            from game.unified_damage_system import calculate_hp_damage_batch
+            
+            unified_skill = self._to_unified_skill(skill, "HP 공격")
+            unified_skill["hp_power"] = hp_power / 100.0  # 100 기준을 1.0 기준으로 변환
+            result = calculate_hp_damage_batch(caster, list(targets), unified_skill)
+            return {id(target): int(damage) for target, damage in zip(targets, result.final_damage)}
+        except Exception as e:
+            log_error("광역데미지", f"HP 일괄 계산 실패 - 대상별 개별 계산으로 대체 ({len(targets)}명)", e)
+            return {}
+    
     def _check_dodge_attempt(self, attacker, target):
         """회피 시도 체크 및 결과 반환"""
         attacker_speed = getattr(attacker, 'speed', 100)
@@ -11183,28 +11257,8 @@ class BraveCombatSystem:
             from game.unified_damage_system import calculate_hp_damage
             
             # 스킬 정보 변환 (CharacterTrait 객체 처리)
-            if hasattr(skill, '__dict__'):
-                # CharacterTrait 등의 객체인 경우
-                skill_name = getattr(skill, 'name', "HP 공격")
-                damage_type = getattr(skill, 'damage_type', "physical")
-                element = getattr(skill, 'element', "none")
-            elif isinstance(skill, dict):
-                # 딕셔너리인 경우
-                skill_name = skill.get("name", "HP 공격")
-                damage_type = skill.get("damage_type", "physical")
-                element = skill.get("element", "none")
-            else:
-                # 기타 경우
-                skill_name = "HP 공격"
-                damage_type = "physical"
-                element = "none"
-            
-            unified_skill = {
-                "name": skill_name,
-                "hp_power": hp_power / 100.0,  # 100 기준을 1.0 기준으로 변환
-                "damage_type": damage_type,
-                "element": element
-            }
+            unified_skill = self._to_unified_skill(skill, "HP 공격")
+            unified_skill["hp_power"] = hp_power / 100.0  # 100 기준을 1.0 기준으로 변환
             
             # 통합 시스템으로 HP 데미지 계산 (hp_power 인수 제거)
             result, wound_damage = calculate_hp_damage(caster, target, unified_skill)
@@ -5,6 +5,7 @@
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 import random
 from game.new_skill_system import StatusType, get_status_icon
+from game.hot_path_profiler import profiled
 from game.color_text import bright_cyan, bright_yellow, yellow, green, red, bright_white, cyan, white, magenta, blue
 
 # 전역 전투 상태 변수
@@ -19,20 +20,229 @@ def is_combat_active() -> bool:
     """전투 상태 확인"""
     return _combat_active
 
+# 턴마다 최대 HP 비율만큼 피해를 주는 상태이상 (비율, 메시지)
+_HP_DOT_RULES = {
+    StatusType.POISON: (0.05, "☠️ {name}이(가) 독 데미지 {amount}를 받았습니다!"),
+    StatusType.BURN: (0.03, "🔥 {name}이(가) 화상 데미지 {amount}를 받았습니다!"),
+    StatusType.BLEED: (0.04, "🩸 {name}이(가) 출혈로 {amount} 피해를 받았습니다!"),
+    StatusType.CORRODE: (0.03, "🧪 {name}이(가) 부식으로 {amount} 피해를 받았습니다!"),
+    StatusType.NECROSIS: (0.08, "💀 {name}이(가) 괴사로 {amount} 피해를 받았습니다!"),
+}
+
+# 턴 시작마다 처리할 것이 있는 상태이상 - 나머지(강화/약화/가속 등)는 만료될 때만 건드림
+_TICKING_STATUS_TYPES = frozenset(_HP_DOT_RULES) | frozenset([
+    StatusType.REGENERATION, StatusType.CHILL, StatusType.SHOCK, StatusType.MP_REGEN, StatusType.MP_DRAIN,
+    StatusType.FEAR, StatusType.CHARM, StatusType.DOMINATE, StatusType.CONFUSION, StatusType.MADNESS,
+    StatusType.CURSE, StatusType.BLESSING,
+])
+
+# 스탯 배율 규칙 {상태: ((스탯, 기본 배율, 강도당 배율), ...)} - 배율 = 기본 + 강도 × 강도당 배율
+_STAT_MODIFIER_RULES = {
+    # 기본 버프/디버프
+    StatusType.BOOST_ATK: (('physical_attack', 1.0, 0.2), ('magic_attack', 1.0, 0.2)),
+    StatusType.BOOST_DEF: (('physical_defense', 1.0, 0.2), ('magic_defense', 1.0, 0.2)),
+    StatusType.BOOST_SPD: (('speed', 1.0, 0.3),),
+    StatusType.BOOST_ACCURACY: (('accuracy', 1.0, 0.15),),
+    StatusType.BOOST_CRIT: (('critical_rate', 1.0, 0.25),),
+    StatusType.BOOST_DODGE: (('evasion', 1.0, 0.2),),
+    StatusType.REDUCE_ATK: (('physical_attack', 1.0, -0.2), ('magic_attack', 1.0, -0.2)),
+    StatusType.REDUCE_DEF: (('physical_defense', 1.0, -0.2), ('magic_defense', 1.0, -0.2)),
+    StatusType.REDUCE_SPD: (('speed', 1.0, -0.3),),
+    StatusType.REDUCE_ACCURACY: (('accuracy', 1.0, -0.15),),
+    # 특수 상태
+    StatusType.VULNERABLE: (('physical_defense', 0.5, 0.0), ('magic_defense', 0.5, 0.0)),
+    StatusType.EXPOSED: (('evasion', 0.3, 0.0),),
+    StatusType.WEAKNESS: (('physical_attack', 0.7, 0.0), ('magic_attack', 0.7, 0.0)),
+    StatusType.HASTE: (('speed', 1.5, 0.0),),
+    StatusType.SLOW: (('speed', 0.6, 0.0),),
+    StatusType.FOCUS: (('accuracy', 1.3, 0.0), ('critical_rate', 1.2, 0.0)),
+    StatusType.RAGE: (('physical_attack', 1.4, 0.0), ('physical_defense', 0.8, 0.0)),
+    StatusType.BERSERK: (('physical_attack', 1.6, 0.0), ('magic_attack', 1.6, 0.0), ('physical_defense', 0.6, 0.0),
+                         ('magic_defense', 0.6, 0.0), ('accuracy', 0.8, 0.0)),
+    StatusType.BLIND: (('accuracy', 0.3, 0.0),),
+    StatusType.TERROR: (('physical_attack', 0.6, 0.0), ('magic_attack', 0.6, 0.0), ('speed', 0.7, 0.0)),
+}
+
+# 호환성을 위한 이전 버프/디버프 (상태 값 문자열에 포함된 이름으로 판단, 위에서부터 첫 번째 일치)
+_LEGACY_STAT_MODIFIER_RULES = (
+    ('BUFF_ATTACK', (('physical_attack', 1.0, 0.01), ('magic_attack', 1.0, 0.01))),
+    ('BUFF_DEFENSE', (('physical_defense', 1.0, 0.01), ('magic_defense', 1.0, 0.01))),
+    ('BUFF_SPEED', (('speed', 1.0, 0.01),)),
+    ('DEBUFF_ATTACK', (('physical_attack', 1.0, -0.01), ('magic_attack', 1.0, -0.01))),
+    ('DEBUFF_DEFENSE', (('physical_defense', 1.0, -0.01), ('magic_defense', 1.0, -0.01))),
+    ('DEBUFF_SPEED', (('speed', 1.0, -0.01),)),
+)
+
+_DEFAULT_STAT_MODIFIERS = {
+    'physical_attack': 1.0,
+    'magic_attack': 1.0,
+    'physical_defense': 1.0,
+    'magic_defense': 1.0,
+    'speed': 1.0,
+    'accuracy': 1.0,
+    'evasion': 1.0,
+    'critical_rate': 1.0
+}
+
+_stat_modifier_rule_cache: Dict[Any, tuple] = {}
+
+
+def _stat_modifier_rules(status_type) -> tuple:
+    """상태 타입별 스탯 배율 규칙 (처음 한 번 판단 후 캐시)"""
+    rules = _stat_modifier_rule_cache.get(status_type)
+    if rules is None:
+        rules = _STAT_MODIFIER_RULES.get(status_type)
+        if rules is None:
+            rules = ()
+            if hasattr(status_type, 'value'):
+                for keyword, legacy_rules in _LEGACY_STAT_MODIFIER_RULES:
+                    if keyword in status_type.value:
+                        rules = legacy_rules
+                        break
+        _stat_modifier_rule_cache[status_type] = rules
+    return rules
+
+
 class StatusEffect:
-    """상태이상 효과"""
+    """상태이상 효과
+
+    StatusManager에 등록되면 남은 턴은 (만료 턴 - 관리자의 현재 턴)으로 계산됨
+    - 매 턴 모든 효과의 duration을 줄이지 않고, 관리자의 턴만 올림
+    """
     def __init__(self, status_type: StatusType, duration: int, intensity: float = 1.0):
+        self._manager: Optional['StatusManager'] = None
+        self._expires_at = 0
+        self._tick_cache = None   # (최대 HP, 강도, 틱 피해량)
         self.status_type = status_type
         self.duration = duration
         self.intensity = intensity
         self.stack_count = 1
 
+    @property
+    def duration(self) -> int:
+        manager = self._manager
+        if manager is None:
+            return self._duration
+        return self._expires_at - manager.turn
+
+    @duration.setter
+    def duration(self, value: int):
+        manager = self._manager
+        if manager is None:
+            self._duration = value
+        else:
+            manager._schedule(self, value)
+
+    @property
+    def intensity(self) -> float:
+        return self._intensity
+
+    @intensity.setter
+    def intensity(self, value: float):
+        self._intensity = value
+        if self._manager is not None:
+            self._manager._modifiers = None
+
+    def hp_tick_amount(self, max_hp: int) -> int:
+        """턴당 HP 피해량 (최대 HP/강도가 바뀔 때만 다시 계산)"""
+        cache = self._tick_cache
+        if cache is not None and cache[0] == max_hp and cache[1] == self._intensity:
+            return cache[2]
+        rate = _HP_DOT_RULES[self.status_type][0]
+        amount = int(max_hp * rate * self._intensity)
+        self._tick_cache = (max_hp, self._intensity, amount)
+        return amount
+
+    def __setstate__(self, state):
+        # 이전 저장 데이터 (duration/intensity가 일반 속성이던 시절) 호환
+        state = dict(state)
+        if 'duration' in state:
+            state['_duration'] = state.pop('duration')
+        if 'intensity' in state:
+            state['_intensity'] = state.pop('intensity')
+        state.setdefault('_manager', None)
+        state.setdefault('_expires_at', 0)
+        state.setdefault('_tick_cache', None)
+        self.__dict__.update(state)
+
+
 class StatusManager:
-    """간단한 상태이상 관리자"""
+    """간단한 상태이상 관리자
+
+    - 만료 턴별 버킷(타이밍 휠): 턴 처리 시 이번 턴에 만료되는 효과만 꺼내서 제거
+    - 틱이 있는 효과(독/화상/재생 등) 목록은 효과 구성이 바뀔 때만 다시 만듦
+    - 스탯 배율 합계는 효과가 추가될 때 곱해 나가고, 제거/강도 변경 시에만 다시 계산
+    """
     def __init__(self):
         self.status_effects: List[StatusEffect] = []
         self.effects = self.status_effects  # 호환성을 위한 별칭
         self.name = "StatusManager"  # name 속성 추가
+        self._reset_schedule()
+
+    def _reset_schedule(self):
+        self.turn = 0
+        self._expiry_wheel: Dict[int, List[StatusEffect]] = {}
+        self._synced_ids: tuple = ()
+        self._tick_plan: List[Any] = []
+        self._tick_plan_ids: set = set()
+        self._has_foreign_effects = False
+        self._modifiers: Optional[dict] = None
+
+    def __setstate__(self, state):
+        # 이전 저장 데이터에는 턴/휠 정보가 없으므로 다시 등록
+        self.__dict__.update(state)
+        if 'turn' not in state:
+            self._reset_schedule()
+        self._synced_ids = ()
+
+    # =====================================
+    # 만료 스케줄
+    # =====================================
+
+    def _schedule(self, effect: StatusEffect, duration: int):
+        """남은 턴을 만료 턴으로 바꿔 해당 버킷에 넣음 (이전 버킷의 항목은 꺼낼 때 무시됨)"""
+        effect._expires_at = self.turn + duration
+        bucket = max(effect._expires_at, self.turn + 1)
+        self._expiry_wheel.setdefault(bucket, []).append(effect)
+
+    def _attach(self, effect):
+        if isinstance(effect, StatusEffect) and effect._manager is not self:
+            duration = effect.duration
+            effect._manager = self
+            self._schedule(effect, duration)
+
+    def _sync_effects(self):
+        """목록이 바뀌었으면(외부에서 직접 추가/제거한 경우 포함) 등록과 틱 목록 갱신"""
+        if self.effects is not self.status_effects:
+            self.effects = self.status_effects
+        effect_ids = tuple(map(id, self.status_effects))
+        if effect_ids == self._synced_ids:
+            return
+        self._synced_ids = effect_ids
+        self._modifiers = None
+        self._has_foreign_effects = False
+        plan = []
+        for effect in self.status_effects:
+            self._attach(effect)
+            foreign = not isinstance(effect, StatusEffect)
+            if foreign:
+                self._has_foreign_effects = True
+            if foreign or effect.status_type in _TICKING_STATUS_TYPES:
+                plan.append(effect)
+        self._tick_plan = plan
+        self._tick_plan_ids = {id(effect) for effect in plan}
+
+    def _expire(self, effect, messages: List[str]):
+        self.status_effects.remove(effect)
+        messages.append(f"✨ {self.name}의 {effect.status_type.value} 효과가 해제되었습니다!")
+        self._detach(effect)
+    
+    def _detach(self, effect):
+        # 관리자에서 빠지면 남은 턴을 일반 값으로 되돌림
+        if isinstance(effect, StatusEffect) and effect._manager is self:
+            remaining = effect.duration
+            effect._manager = None
+            effect._duration = remaining
         
     def add_status(self, status_effect, duration=None, intensity=None) -> bool:
         """상태이상 추가 (다양한 매개변수 형태 지원)"""
@@ -66,8 +276,16 @@ class StatusManager:
             existing.duration = max(existing.duration, status_obj.duration)
             return False
         else:
+            self._sync_effects()
             self.status_effects.append(status_obj)
             self.effects = self.status_effects  # 별칭 업데이트
+            self._attach(status_obj)
+            # 추가된 효과만 기존 합계에 곱함 (목록 순서대로 곱한 것과 같은 결과)
+            modifiers = self._modifiers
+            self._sync_effects()
+            if modifiers is not None and isinstance(status_obj, StatusEffect):
+                self._apply_stat_modifier_rules(modifiers, status_obj)
+                self._modifiers = modifiers
             return True
     
     def get_status(self, status_type: StatusType):
@@ -81,6 +299,7 @@ class StatusManager:
         """특정 상태이상이 있는지 확인"""
         return self.get_status(status_type) is not None
     
+    @profiled("combat.status_tick")
     def process_turn_effects(self, character=None) -> List[str]:
         """턴 처리 - 상태이상 효과 적용 (자동 애니메이션)"""
         messages = []
@@ -92,132 +311,137 @@ class StatusManager:
         # 캐릭터 이름 안전하게 가져오기
         char_name = getattr(character, 'name', '알 수 없는 캐릭터')
         
-        for effect in self.status_effects[:]:
-            # 독 데미지 처리
-            if effect.status_type == StatusType.POISON:
-                damage = int(character.max_hp * 0.05 * effect.intensity)
-                character.current_hp = max(1, character.current_hp - damage)
-                messages.append(f"☠️ {char_name}이(가) 독 데미지 {damage}를 받았습니다!")
-            
-            # 화상 데미지 처리
-            elif effect.status_type == StatusType.BURN:
-                damage = int(character.max_hp * 0.03 * effect.intensity)
-                character.current_hp = max(1, character.current_hp - damage)
-                messages.append(f"🔥 {char_name}이(가) 화상 데미지 {damage}를 받았습니다!")
-            
-            # 재생 효과 처리
-            elif effect.status_type == StatusType.REGENERATION:
-                heal = int(character.max_hp * 0.08 * effect.intensity)
-                old_hp = character.current_hp
-                character.current_hp = min(character.max_hp, character.current_hp + heal)
-                actual_heal = character.current_hp - old_hp
-                if actual_heal > 0:
-                    messages.append(f"💚 {char_name}이(가) 재생으로 {actual_heal} 회복했습니다!")
-            
-            # 출혈 효과
-            elif effect.status_type == StatusType.BLEED:
-                damage = int(character.max_hp * 0.04 * effect.intensity)
-                character.current_hp = max(1, character.current_hp - damage)
-                messages.append(f"🩸 {char_name}이(가) 출혈로 {damage} 피해를 받았습니다!")
-            
-            # 부식 효과
-            elif effect.status_type == StatusType.CORRODE:
-                damage = int(character.max_hp * 0.03 * effect.intensity)
-                character.current_hp = max(1, character.current_hp - damage)
-                messages.append(f"🧪 {char_name}이(가) 부식으로 {damage} 피해를 받았습니다!")
-            
-            # 괴사 효과
-            elif effect.status_type == StatusType.NECROSIS:
-                damage = int(character.max_hp * 0.08 * effect.intensity)
+        self._sync_effects()
+        self.turn += 1
+        turn = self.turn
+        
+        # 틱이 있는 효과 + 이번 턴 버킷에서 만료되는 효과만 처리 (지난 예약/이미 제거된 효과는 무시)
+        expiring_ids = {id(effect) for effect in self._expiry_wheel.pop(turn, ())
+                        if effect._manager is self and effect._expires_at <= turn}
+        if expiring_ids:
+            # 메시지 순서를 목록 순서와 맞추기 위해 목록 순서대로 모음
+            tick_plan_ids = self._tick_plan_ids
+            touched = [effect for effect in self.status_effects
+                       if id(effect) in tick_plan_ids or id(effect) in expiring_ids]
+        else:
+            touched = self._tick_plan
+        
+        for effect in touched:
+            status_type = effect.status_type
+            dot_rule = _HP_DOT_RULES.get(status_type)
+            if dot_rule is not None:
+                # 독/화상/출혈/부식/괴사: 효과별 틱 피해량은 미리 계산된 값 사용
+                if isinstance(effect, StatusEffect):
+                    damage = effect.hp_tick_amount(character.max_hp)
+                else:
+                    damage = int(character.max_hp * dot_rule[0] * effect.intensity)
                 character.current_hp = max(1, character.current_hp - damage)
-                messages.append(f"💀 {char_name}이(가) 괴사로 {damage} 피해를 받았습니다!")
-            
-            # 냉기 효과
-            elif effect.status_type == StatusType.CHILL:
-                if hasattr(character, 'temp_speed_bonus'):
-                    character.temp_speed_bonus = getattr(character, 'temp_speed_bonus', 0) - int(character.speed * 0.2 * effect.intensity)
-                messages.append(f"🧊 {char_name}이(가) 냉기에 움직임이 둔해졌습니다!")
-            
-            # 감전 효과
-            elif effect.status_type == StatusType.SHOCK:
-                if hasattr(character, 'temp_cooldown_increase'):
-                    character.temp_cooldown_increase = getattr(character, 'temp_cooldown_increase', 0) + 1
-                messages.append(f"⚡ {char_name}이(가) 감전으로 인해 행동이 둔해졌습니다!")
-            
-            # MP 재생
-            elif effect.status_type == StatusType.MP_REGEN:
-                if hasattr(character, 'current_mp') and hasattr(character, 'max_mp'):
-                    mp_heal = int(character.max_mp * 0.05 * effect.intensity)
-                    old_mp = character.current_mp
-                    character.current_mp = min(character.max_mp, character.current_mp + mp_heal)
-                    actual_mp_heal = character.current_mp - old_mp
-                    if actual_mp_heal > 0:
-                        messages.append(f"💙 {char_name}이(가) {actual_mp_heal} MP를 회복했습니다!")
-            
-            # MP 소모
-            elif effect.status_type == StatusType.MP_DRAIN:
-                if hasattr(character, 'current_mp'):
-                    mp_damage = int(character.max_mp * 0.04 * effect.intensity)
-                    character.current_mp = max(0, character.current_mp - mp_damage)
-                    messages.append(f"💜 {char_name}이(가) {mp_damage} MP를 잃었습니다!")
-            
-            # 공포 효과
-            elif effect.status_type == StatusType.FEAR:
-                if hasattr(self, 'temp_accuracy_penalty'):
-                    character.temp_accuracy_penalty = getattr(self, 'temp_accuracy_penalty', 0) + int(20 * effect.intensity)
-                    character.temp_dodge_penalty = getattr(self, 'temp_dodge_penalty', 0) + int(15 * effect.intensity)
-                messages.append(f"😰 {character.name}이(가) 공포에 떨고 있습니다!")
-            
-            # 매혹 효과
-            elif effect.status_type == StatusType.CHARM:
-                messages.append(f"💖 {character.name}이(가) 매혹에 빠져 있습니다!")
-            
-            # 지배 효과
-            elif effect.status_type == StatusType.DOMINATE:
-                messages.append(f"👁️ {character.name}이(가) 정신을 지배당하고 있습니다!")
-            
-            # 혼란 효과
-            elif effect.status_type == StatusType.CONFUSION:
-                messages.append(f"😵‍💫 {character.name}이(가) 혼란에 빠져 있습니다!")
-            
-            # 광기 효과
-            elif effect.status_type == StatusType.MADNESS:
-                if hasattr(self, 'temp_attack_bonus'):
-                    character.temp_attack_bonus = getattr(self, 'temp_attack_bonus', 0) + int(15 * effect.intensity)
-                if hasattr(self, 'temp_defense_bonus'):
-                    self.temp_defense_bonus = getattr(self, 'temp_defense_bonus', 0) - int(10 * effect.intensity)
-                messages.append(f"🤪 {self.name}이(가) 광기에 휩싸였습니다!")
-            
-            # 저주 효과
-            elif effect.status_type == StatusType.CURSE:
-                curse_penalty = int(5 * effect.intensity)
-                for stat in ['temp_attack_bonus', 'temp_defense_bonus', 'temp_magic_bonus', 'temp_speed_bonus']:
-                    if hasattr(self, stat):
-                        setattr(self, stat, getattr(self, stat, 0) - curse_penalty)
-                messages.append(f"🌑 {self.name}이(가) 저주에 걸려 모든 능력이 감소했습니다!")
-            
-            # 축복 효과
-            elif effect.status_type == StatusType.BLESSING:
-                blessing_bonus = int(8 * effect.intensity)
-                for stat in ['temp_attack_bonus', 'temp_defense_bonus', 'temp_magic_bonus', 'temp_speed_bonus']:
-                    if hasattr(self, stat):
-                        setattr(self, stat, getattr(self, stat, 0) + blessing_bonus)
-                messages.append(f"✨ {self.name}이(가) 축복을 받아 모든 능력이 증가했습니다!")
-            
-            # 버프/디버프 효과는 스탯 계산에서 처리
-            elif effect.status_type in [StatusType.STRENGTHEN, StatusType.WEAKEN, 
-                                       StatusType.HASTE, StatusType.SLOW, StatusType.SHIELD]:
-                # 이미 get_stat_modifiers에서 처리됨
-                pass
+                messages.append(dot_rule[1].format(name=char_name, amount=damage))
+            elif status_type in _TICKING_STATUS_TYPES:
+                self._apply_tick_effect(effect, character, char_name, messages)
             
-            # 상태이상 지속시간 감소
-            effect.duration -= 1
-            if effect.duration <= 0:
-                self.status_effects.remove(effect)
-                messages.append(f"✨ {self.name}의 {effect.status_type.value} 효과가 해제되었습니다!")
+            if isinstance(effect, StatusEffect):
+                if effect._expires_at <= turn:
+                    self._expire(effect, messages)
+            else:
+                # 다른 모듈의 상태이상 객체는 기존처럼 직접 감소
+                effect.duration -= 1
+                if effect.duration <= 0:
+                    self._expire(effect, messages)
         
+        self._sync_effects()
         return messages
     
+    def get_dot_damage_per_tick(self, character) -> int:
+        """다음 턴 시작 시 받을 독/화상/출혈 등 지속 피해 합계 (효과별 미리 계산된 값의 합)"""
+        self._sync_effects()
+        max_hp = getattr(character, 'max_hp', 0)
+        return sum(effect.hp_tick_amount(max_hp) for effect in self._tick_plan
+                   if isinstance(effect, StatusEffect) and effect.status_type in _HP_DOT_RULES)
+    
+    def _apply_tick_effect(self, effect, character, char_name: str, messages: List[str]):
+        """재생/냉기/감전/MP/정신계 등 턴 시작 효과 (지속 피해는 process_turn_effects에서 처리)"""
+        # 재생 효과 처리
+        if effect.status_type == StatusType.REGENERATION:
+            heal = int(character.max_hp * 0.08 * effect.intensity)
+            old_hp = character.current_hp
+            character.current_hp = min(character.max_hp, character.current_hp + heal)
+            actual_heal = character.current_hp - old_hp
+            if actual_heal > 0:
+                messages.append(f"💚 {char_name}이(가) 재생으로 {actual_heal} 회복했습니다!")
+        
+        # 냉기 효과
+        elif effect.status_type == StatusType.CHILL:
+            if hasattr(character, 'temp_speed_bonus'):
+                character.temp_speed_bonus = getattr(character, 'temp_speed_bonus', 0) - int(character.speed * 0.2 * effect.intensity)
+            messages.append(f"🧊 {char_name}이(가) 냉기에 움직임이 둔해졌습니다!")
+        
+        # 감전 효과
+        elif effect.status_type == StatusType.SHOCK:
+            if hasattr(character, 'temp_cooldown_increase'):
+                character.temp_cooldown_increase = getattr(character, 'temp_cooldown_increase', 0) + 1
+            messages.append(f"⚡ {char_name}이(가) 감전으로 인해 행동이 둔해졌습니다!")
+        
+        # MP 재생
+        elif effect.status_type == StatusType.MP_REGEN:
+            if hasattr(character, 'current_mp') and hasattr(character, 'max_mp'):
+                mp_heal = int(character.max_mp * 0.05 * effect.intensity)
+                old_mp = character.current_mp
+                character.current_mp = min(character.max_mp, character.current_mp + mp_heal)
+                actual_mp_heal = character.current_mp - old_mp
+                if actual_mp_heal > 0:
+                    messages.append(f"💙 {char_name}이(가) {actual_mp_heal} MP를 회복했습니다!")
+        
+        # MP 소모
+        elif effect.status_type == StatusType.MP_DRAIN:
+            if hasattr(character, 'current_mp'):
+                mp_damage = int(character.max_mp * 0.04 * effect.intensity)
+                character.current_mp = max(0, character.current_mp - mp_damage)
+                messages.append(f"💜 {char_name}이(가) {mp_damage} MP를 잃었습니다!")
+        
+        # 공포 효과
+        elif effect.status_type == StatusType.FEAR:
+            if hasattr(self, 'temp_accuracy_penalty'):
+                character.temp_accuracy_penalty = getattr(self, 'temp_accuracy_penalty', 0) + int(20 * effect.intensity)
+                character.temp_dodge_penalty = getattr(self, 'temp_dodge_penalty', 0) + int(15 * effect.intensity)
+            messages.append(f"😰 {character.name}이(가) 공포에 떨고 있습니다!")
+        
+        # 매혹 효과
+        elif effect.status_type == StatusType.CHARM:
+            messages.append(f"💖 {character.name}이(가) 매혹에 빠져 있습니다!")
+        
+        # 지배 효과
+        elif effect.status_type == StatusType.DOMINATE:
+            messages.append(f"👁️ {character.name}이(가) 정신을 지배당하고 있습니다!")
+        
+        # 혼란 효과
+        elif effect.status_type == StatusType.CONFUSION:
+            messages.append(f"😵‍💫 {character.name}이(가) 혼란에 빠져 있습니다!")
+        
+        # 광기 효과
+        elif effect.status_type == StatusType.MADNESS:
+            if hasattr(self, 'temp_attack_bonus'):
+                character.temp_attack_bonus = getattr(self, 'temp_attack_bonus', 0) + int(15 * effect.intensity)
+            if hasattr(self, 'temp_defense_bonus'):
+                self.temp_defense_bonus = getattr(self, 'temp_defense_bonus', 0) - int(10 * effect.intensity)
+            messages.append(f"🤪 {self.name}이(가) 광기에 휩싸였습니다!")
+        
+        # 저주 효과
+        elif effect.status_type == StatusType.CURSE:
+            curse_penalty = int(5 * effect.intensity)
+            for stat in ['temp_attack_bonus', 'temp_defense_bonus', 'temp_magic_bonus', 'temp_speed_bonus']:
+                if hasattr(self, stat):
+                    setattr(self, stat, getattr(self, stat, 0) - curse_penalty)
+            messages.append(f"🌑 {self.name}이(가) 저주에 걸려 모든 능력이 감소했습니다!")
+        
+        # 축복 효과
+        elif effect.status_type == StatusType.BLESSING:
+            blessing_bonus = int(8 * effect.intensity)
+            for stat in ['temp_attack_bonus', 'temp_defense_bonus', 'temp_magic_bonus', 'temp_speed_bonus']:
+                if hasattr(self, stat):
+                    setattr(self, stat, getattr(self, stat, 0) + blessing_bonus)
+            messages.append(f"✨ {self.name}이(가) 축복을 받아 모든 능력이 증가했습니다!")
+    
     def get_status_display(self) -> str:
         """상태이상 표시"""
         if not self.status_effects:
@@ -311,98 +535,20 @@ class StatusManager:
     
     def get_stat_modifiers(self) -> dict:
         """스탯 수정치 반환 (곱셈용 배율) - 확장된 상태이상 포함"""
-        modifiers = {
-            'physical_attack': 1.0,
-            'magic_attack': 1.0,
-            'physical_defense': 1.0,
-            'magic_defense': 1.0,
-            'speed': 1.0,
-            'accuracy': 1.0,
-            'evasion': 1.0,
-            'critical_rate': 1.0
-        }
-        
-        for effect in self.status_effects:
-            # 기본 버프/디버프
-            if effect.status_type == StatusType.BOOST_ATK:
-                modifiers['physical_attack'] *= (1.0 + effect.intensity * 0.2)
-                modifiers['magic_attack'] *= (1.0 + effect.intensity * 0.2)
-            elif effect.status_type == StatusType.BOOST_DEF:
-                modifiers['physical_defense'] *= (1.0 + effect.intensity * 0.2)
-                modifiers['magic_defense'] *= (1.0 + effect.intensity * 0.2)
-            elif effect.status_type == StatusType.BOOST_SPD:
-                modifiers['speed'] *= (1.0 + effect.intensity * 0.3)
-            elif effect.status_type == StatusType.BOOST_ACCURACY:
-                modifiers['accuracy'] *= (1.0 + effect.intensity * 0.15)
-            elif effect.status_type == StatusType.BOOST_CRIT:
-                modifiers['critical_rate'] *= (1.0 + effect.intensity * 0.25)
-            elif effect.status_type == StatusType.BOOST_DODGE:
-                modifiers['evasion'] *= (1.0 + effect.intensity * 0.2)
-                
-            # 디버프
-            elif effect.status_type == StatusType.REDUCE_ATK:
-                modifiers['physical_attack'] *= (1.0 - effect.intensity * 0.2)
-                modifiers['magic_attack'] *= (1.0 - effect.intensity * 0.2)
-            elif effect.status_type == StatusType.REDUCE_DEF:
-                modifiers['physical_defense'] *= (1.0 - effect.intensity * 0.2)
-                modifiers['magic_defense'] *= (1.0 - effect.intensity * 0.2)
-            elif effect.status_type == StatusType.REDUCE_SPD:
-                modifiers['speed'] *= (1.0 - effect.intensity * 0.3)
-            elif effect.status_type == StatusType.REDUCE_ACCURACY:
-                modifiers['accuracy'] *= (1.0 - effect.intensity * 0.15)
-                
-            # 특수 상태
-            elif effect.status_type == StatusType.VULNERABLE:
-                modifiers['physical_defense'] *= 0.5
-                modifiers['magic_defense'] *= 0.5
-            elif effect.status_type == StatusType.EXPOSED:
-                modifiers['evasion'] *= 0.3
-            elif effect.status_type == StatusType.WEAKNESS:
-                modifiers['physical_attack'] *= 0.7
-                modifiers['magic_attack'] *= 0.7
-            elif effect.status_type == StatusType.HASTE:
-                modifiers['speed'] *= 1.5
-            elif effect.status_type == StatusType.SLOW:
-                modifiers['speed'] *= 0.6
-            elif effect.status_type == StatusType.FOCUS:
-                modifiers['accuracy'] *= 1.3
-                modifiers['critical_rate'] *= 1.2
-            elif effect.status_type == StatusType.RAGE:
-                modifiers['physical_attack'] *= 1.4
-                modifiers['physical_defense'] *= 0.8
-            elif effect.status_type == StatusType.BERSERK:
-                modifiers['physical_attack'] *= 1.6
-                modifiers['magic_attack'] *= 1.6
-                modifiers['physical_defense'] *= 0.6
-                modifiers['magic_defense'] *= 0.6
-                modifiers['accuracy'] *= 0.8
-            elif effect.status_type == StatusType.BLIND:
-                modifiers['accuracy'] *= 0.3
-            elif effect.status_type == StatusType.TERROR:
-                modifiers['physical_attack'] *= 0.6
-                modifiers['magic_attack'] *= 0.6
-                modifiers['speed'] *= 0.7
-                
-            # 호환성을 위한 이전 버프/디버프
-            elif hasattr(effect.status_type, 'value'):
-                if 'BUFF_ATTACK' in effect.status_type.value:
-                    modifiers['physical_attack'] *= (1.0 + effect.intensity * 0.01)
-                    modifiers['magic_attack'] *= (1.0 + effect.intensity * 0.01)
-                elif 'BUFF_DEFENSE' in effect.status_type.value:
-                    modifiers['physical_defense'] *= (1.0 + effect.intensity * 0.01)
-                    modifiers['magic_defense'] *= (1.0 + effect.intensity * 0.01)
-                elif 'BUFF_SPEED' in effect.status_type.value:
-                    modifiers['speed'] *= (1.0 + effect.intensity * 0.01)
-                elif 'DEBUFF_ATTACK' in effect.status_type.value:
-                    modifiers['physical_attack'] *= (1.0 - effect.intensity * 0.01)
-                    modifiers['magic_attack'] *= (1.0 - effect.intensity * 0.01)
-                elif 'DEBUFF_DEFENSE' in effect.status_type.value:
-                    modifiers['physical_defense'] *= (1.0 - effect.intensity * 0.01)
-                    modifiers['magic_defense'] *= (1.0 - effect.intensity * 0.01)
-                elif 'DEBUFF_SPEED' in effect.status_type.value:
-                    modifiers['speed'] *= (1.0 - effect.intensity * 0.01)
-        
-        return modifiers
+        self._sync_effects()
+        modifiers = self._modifiers
+        if modifiers is None or self._has_foreign_effects:
+            # 효과 구성/강도가 바뀐 뒤 처음 한 번만 전체를 다시 곱함
+            modifiers = dict(_DEFAULT_STAT_MODIFIERS)
+            for effect in self.status_effects:
+                self._apply_stat_modifier_rules(modifiers, effect)
+            self._modifiers = modifiers
+        return dict(modifiers)
+    
+    @staticmethod
+    def _apply_stat_modifier_rules(modifiers: dict, effect):
+        for stat, base, per_intensity in _stat_modifier_rules(effect.status_type):
+            modifiers[stat] *= (base + effect.intensity * per_intensity) if per_intensity else base
     
     def add_effect(self, effect: StatusEffect):
         """상태이상 효과 추가 (호환성)"""
@@ -411,8 +557,12 @@ class StatusManager:
     
     def clear_all_effects(self):
         """모든 상태이상 효과 제거"""
+        for effect in self.status_effects:
+            self._detach(effect)
         self.status_effects.clear()
         self.effects = self.status_effects  # 별칭 업데이트
+        self._expiry_wheel.clear()
+        self._sync_effects()
     
     def get_active_effects(self) -> List[str]:
         """활성 상태이상 목록"""
@@ -2037,6 +2187,56 @@ class CharacterClassManager:
         })
 
 
+# 상황마다 다시 계산해야 하는 패시브 특성 (특성 이름 → 상황, None이면 모든 상황)
+# 현재 HP/스택을 읽거나 확률을 굴리거나 캐릭터 상태를 바꾸는 규칙들 - 나머지는 (특성, 상황)만으로 결과가 정해져 표로 미리 계산
+_DYNAMIC_PASSIVE_TRAITS = {
+    "그림자 조작": frozenset({"combat_start"}),
+    "그림자 강화": frozenset({"attacking"}),
+    "그림자 숙련": None,
+    "그림자 방어": frozenset({"defending"}),
+    "야생 본능": frozenset({"combat_start"}),
+    "플라스크 달인": frozenset({"attacking"}),
+    "원소 변환": frozenset({"attacking"}),
+    "검기 집중": frozenset({"sword_aura_gain"}),
+    "명경지수": frozenset({"attacking"}),
+    "검신의 축복": frozenset({"attacking"}),
+    "생존 본능": frozenset({"parrying"}),
+    "광기의 힘": frozenset({"shield_generation", "shield_creation"}),
+    "혈투의 광기": frozenset({"stat_calculation"}),
+    "불굴의 의지": frozenset({"damage_taken", "turn_start"}),
+    "차원 방벽": frozenset({"combat_start"}),
+    "차원 도약": frozenset({"being_attacked"}),
+    "차원 귀환": frozenset({"damage_taken"}),
+    "기사도 정신": frozenset({"stat_calculation"}),
+    "신성한 힘": frozenset({"healing"}),
+    "마나 순환": frozenset({"spell_cast"}),
+}
+
+_TRIGGER_TRAIT_SITUATIONS = frozenset({"combat_start", "on_attack", "on_kill", "on_damage"})
+
+# 턴마다 줄어드는 임시 효과 (지속시간 속성, 종료 시 초기화할 효과 속성, 이름)
+_DURATION_EFFECT_ATTRIBUTES = (
+    # 버프 지속시간
+    ('temp_attack_duration', 'temp_attack_bonus', '공격력 버프'),
+    ('temp_defense_duration', 'temp_defense_bonus', '방어력 버프'),
+    ('temp_magic_duration', 'temp_magic_bonus', '마법력 버프'),
+    ('temp_speed_duration', 'temp_speed_bonus', '속도 버프'),
+    ('temp_weapon_blessing_duration', 'temp_crit_bonus', '무기 축복'),
+    ('temp_armor_blessing_duration', 'temp_defense_bonus', '방어구 축복'),
+    ('temp_immunity_duration', 'temp_status_immunity', '상태이상 면역'),
+    ('temp_overflow_duration', 'temp_mana_overflow', '마나 오버플로우'),
+    ('temp_exp_duration', 'temp_exp_multiplier', '경험치 부스트'),
+    ('temp_gold_duration', 'temp_gold_multiplier', '골드 부스트'),
+    ('temp_transform_duration', 'temp_transformation', '변신 효과'),
+    # 특수 지속시간 효과
+    ('temp_treasure_vision_duration', 'temp_treasure_vision', '보물 탐지'),
+    ('temp_teleport_duration', 'temp_dodge_bonus', '순간이동'),
+    ('temp_ally_duration', 'temp_summoned_ally', '소환수'),
+    ('stealth_turns', 'stealth_turns', '은신'),
+    ('temp_enemy_accuracy_duration', 'temp_enemy_accuracy_down', '연막탄'),
+)
+
+
 class Character(BraveMixin):
     """게임 캐릭터 클래스 (Brave 시스템 포함) - 자동 애니메이션 지원"""
     
@@ -2773,33 +2973,97 @@ class Character(BraveMixin):
         return base_critical_by_class.get(character_class, 10.0)
         
     def apply_trait_effects(self, situation: str, **kwargs) -> Dict[str, Any]:
-        """특성 효과 적용"""
+        """특성 효과 적용 (고정 효과는 상황별 표에서, 상태/확률 의존 효과만 매번 계산)"""
         effects = {}
         
-        # active_traits 사용 (traits 대신)
+        for kind, payload in self._get_trait_effect_plan(situation):
+            if kind == "static":
+                effects.update(payload)
+            elif kind == "passive":
+                effects.update(self._apply_passive_trait(payload, situation, **kwargs))
+            elif kind == "trigger":
+                effects.update(self._apply_trigger_trait(payload, situation, **kwargs))
+            else:
+                effects.update(self._apply_active_trait(payload, **kwargs))
+                
+        return effects
+    
+    def _trait_signature(self) -> tuple:
+        """active_traits 구성/활성 상태 서명 - 바뀌면 특성 효과 표를 다시 만듦"""
+        signature = []
+        for trait in self.active_traits:
+            if isinstance(trait, dict):
+                signature.append((id(trait), trait.get('name', ''), trait.get('is_active', True),
+                                  trait.get('effect_type', 'passive')))
+            else:
+                signature.append((id(trait), getattr(trait, 'name', ''), getattr(trait, 'is_active', True),
+                                  getattr(trait, 'effect_type', 'passive')))
+        return tuple(signature)
+    
+    def refresh_trait_effect_table(self):
+        """특성 선택/레벨업 후 상황별 특성 효과 표 초기화 (상황은 처음 쓰일 때 계산)"""
+        if not hasattr(self, 'active_traits'):
+            self.active_traits = []
+        self._trait_effect_signature = self._trait_signature()
+        self._trait_effect_table = {}
+        self._active_trait_names = frozenset(sig[1] for sig in self._trait_effect_signature)
+    
+    def has_active_trait(self, trait_name: str) -> bool:
+        """active_traits에 해당 이름의 특성이 있는지 (목록을 매번 훑지 않고 표와 같은 서명으로 확인)"""
+        self._get_trait_effect_plan(None)
+        return trait_name in self._active_trait_names
+    
+    def _get_trait_effect_plan(self, situation) -> list:
+        """상황별 특성 효과 계획: [("static", dict) | ("passive"/"trigger"/"active", trait), ...]
+        
+        active_traits 목록 교체/추가나 is_active 변경은 서명 비교로 감지합니다.
+        """
         if not hasattr(self, 'active_traits'):
             self.active_traits = []
+        if getattr(self, '_trait_effect_signature', None) != self._trait_signature():
+            self.refresh_trait_effect_table()
+        if situation is None:
+            return []
         
+        plan = self._trait_effect_table.get(situation)
+        if plan is not None:
+            return plan
+        
+        plan = []
         for trait in self.active_traits:
-            # trait가 딕셔너리인 경우와 객체인 경우 모두 처리
             if isinstance(trait, dict):
                 is_active = trait.get('is_active', True)
                 effect_type = trait.get('effect_type', 'passive')
+                trait_name = trait.get('name', '')
             else:
                 is_active = getattr(trait, 'is_active', True)
                 effect_type = getattr(trait, 'effect_type', 'passive')
+                trait_name = getattr(trait, 'name', '')
             
             if not is_active:
                 continue
-                
+            
             if effect_type == "passive":
-                effects.update(self._apply_passive_trait(trait, situation, **kwargs))
-            elif effect_type == "trigger" and situation in ["combat_start", "on_attack", "on_kill", "on_damage"]:
-                effects.update(self._apply_trigger_trait(trait, situation, **kwargs))
+                if trait_name in _DYNAMIC_PASSIVE_TRAITS:
+                    situations = _DYNAMIC_PASSIVE_TRAITS[trait_name]
+                    if situations is None or situation in situations:
+                        plan.append(("passive", trait))
+                        continue
+                static_effects = self._apply_passive_trait(trait, situation)
+                if not static_effects:
+                    continue
+                # 연속된 고정 효과는 하나로 합쳐서 update 순서를 그대로 유지
+                if plan and plan[-1][0] == "static":
+                    plan[-1][1].update(static_effects)
+                else:
+                    plan.append(("static", dict(static_effects)))
+            elif effect_type == "trigger" and situation in _TRIGGER_TRAIT_SITUATIONS:
+                plan.append(("trigger", trait))
             elif effect_type == "active" and situation == "active_use":
-                effects.update(self._apply_active_trait(trait, **kwargs))
-                
-        return effects
+                plan.append(("active", trait))
+        
+        self._trait_effect_table[situation] = plan
+        return plan
     
     def _apply_passive_trait(self, trait, situation: str, **kwargs) -> Dict[str, Any]:
         """패시브 특성 효과 적용 - 새로운 직업 시스템 대응"""
@@ -3335,6 +3599,7 @@ class Character(BraveMixin):
         
         self.active_traits = selected_traits
         self.selected_traits = selected_traits  # easy_character_creator 호환성을 위해 추가
+        self.refresh_trait_effect_table()
         
         if len(selected_traits) == 0:
             print(f"{YELLOW}{self.name}이(가) 패시브 특성을 선택하지 않았습니다.{RESET}")
@@ -3457,6 +3722,7 @@ class Character(BraveMixin):
             # 선택된 특성 적용
             self.active_traits = selected_traits
             self.selected_traits = selected_traits  # easy_character_creator 호환성을 위해 추가
+            self.refresh_trait_effect_table()
             
             # 최종 결과 표시
             print(f"\n{bright_cyan('='*50)}")
@@ -4230,12 +4496,7 @@ class Character(BraveMixin):
             return False
             
         # 아이템 데이터베이스에서 아이템 찾기
-        all_items = ItemDatabase.get_all_items()
-        item = None
-        for db_item in all_items:
-            if db_item.name == item_name:
-                item = db_item
-                break
+        item = ItemDatabase.get_item(item_name)
                 
         if item and item.use_item(self):
             self.inventory.remove_item(item_name, 1)
@@ -5688,50 +5949,16 @@ class PartyManager:
         """모든 지속시간 효과 업데이트"""
         messages = []
         
-        # 버프 지속시간 관리
-        duration_attributes = [
-            ('temp_attack_duration', 'temp_attack_bonus', '공격력 버프'),
-            ('temp_defense_duration', 'temp_defense_bonus', '방어력 버프'),
-            ('temp_magic_duration', 'temp_magic_bonus', '마법력 버프'),
-            ('temp_speed_duration', 'temp_speed_bonus', '속도 버프'),
-            ('temp_weapon_blessing_duration', 'temp_crit_bonus', '무기 축복'),
-            ('temp_armor_blessing_duration', 'temp_defense_bonus', '방어구 축복'),
-            ('temp_immunity_duration', 'temp_status_immunity', '상태이상 면역'),
-            ('temp_overflow_duration', 'temp_mana_overflow', '마나 오버플로우'),
-            ('temp_exp_duration', 'temp_exp_multiplier', '경험치 부스트'),
-            ('temp_gold_duration', 'temp_gold_multiplier', '골드 부스트'),
-            ('temp_transform_duration', 'temp_transformation', '변신 효과')
-        ]
-        
-        for duration_attr, effect_attr, effect_name in duration_attributes:
-            if hasattr(self, duration_attr):
-                duration = getattr(self, duration_attr)
-                if duration > 0:
-                    setattr(self, duration_attr, duration - 1)
-                    if duration - 1 <= 0:
-                        # 효과 종료
-                        if hasattr(self, effect_attr):
-                            setattr(self, effect_attr, False if isinstance(getattr(self, effect_attr), bool) else 0)
-                        messages.append(f"⏰ {effect_name} 효과가 종료되었습니다!")
-        
-        # 특수 지속시간 효과들
-        special_durations = [
-            ('temp_treasure_vision_duration', 'temp_treasure_vision', '보물 탐지'),
-            ('temp_teleport_duration', 'temp_dodge_bonus', '순간이동'),
-            ('temp_ally_duration', 'temp_summoned_ally', '소환수'),
-            ('stealth_turns', 'stealth_turns', '은신'),
-            ('temp_enemy_accuracy_duration', 'temp_enemy_accuracy_down', '연막탄')
-        ]
-        
-        for duration_attr, effect_attr, effect_name in special_durations:
-            if hasattr(self, duration_attr):
-                duration = getattr(self, duration_attr)
-                if duration > 0:
-                    setattr(self, duration_attr, duration - 1)
-                    if duration - 1 <= 0:
-                        if hasattr(self, effect_attr):
-                            setattr(self, effect_attr, False if isinstance(getattr(self, effect_attr), bool) else 0)
-                        messages.append(f"⏰ {effect_name} 효과가 종료되었습니다!")
+        # 버프 지속시간 관리 + 특수 지속시간 효과들
+        for duration_attr, effect_attr, effect_name in _DURATION_EFFECT_ATTRIBUTES:
+            duration = getattr(self, duration_attr, 0)
+            if duration > 0:
+                setattr(self, duration_attr, duration - 1)
+                if duration - 1 <= 0:
+                    # 효과 종료
+                    if hasattr(self, effect_attr):
+                        setattr(self, effect_attr, False if isinstance(getattr(self, effect_attr), bool) else 0)
+                    messages.append(f"⏰ {effect_name} 효과가 종료되었습니다!")
         
         return messages
     
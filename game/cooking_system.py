@@ -5,10 +5,14 @@
 import random
 import json
 import os
+from bisect import bisect_left
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from game.data_tables import register_data_table, get_data_table
+from game.json_store import schedule_json_save, flush_json_saves
+
 # SFX 시스템 import
 try:
     from game.audio_system import get_audio_manager, SFXType
@@ -208,6 +212,190 @@ GATHERING_LOCATIONS = {
     }
 }
 
+def _round_up_count(amount: float) -> int:
+    """대체 계획의 사용량(소수) → 실제 소모 개수"""
+    return int(amount) + (1 if amount % 1 > 0 else 0)
+
+
+class IngredientInventory(dict):
+    """보유 식재료 (재료명 → 개수) - 변경 시 RecipePlanner에 알림"""
+
+    def __init__(self, *args, on_change=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_change = on_change
+
+    def _notify(self, name):
+        if self._on_change is not None:
+            self._on_change(name, name in self)
+
+    def __setitem__(self, name, amount):
+        super().__setitem__(name, amount)
+        self._notify(name)
+
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self._notify(name)
+
+    def pop(self, name, *default):
+        result = super().pop(name, *default)
+        self._notify(name)
+        return result
+
+    def popitem(self):
+        name, amount = super().popitem()
+        self._notify(name)
+        return name, amount
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def update(self, *args, **kwargs):
+        for name, amount in dict(*args, **kwargs).items():
+            self[name] = amount
+
+    def clear(self):
+        names = list(self)
+        super().clear()
+        for name in names:
+            self._notify(name)
+
+    def __reduce__(self):
+        # 복사/저장 시에는 일반 dict로 (알림 대상까지 복사하지 않음)
+        return (dict, (dict(self),))
+
+
+class RecipePlanner:
+    """재료 타입별 가용 버킷 + 레시피별 대체 계획 증분 계산
+
+    - 버킷: 타입 → 보유 재료를 가치 내림차순(동률은 재료 정의 순서)으로 정렬한 목록
+    - 재료가 바뀌면 그 타입을 쓰는 레시피만 다음 조회 때 다시 계획
+    - 계획 방식은 기존 can_cook_with_substitutes의 탐욕 배분과 동일
+    """
+
+    def __init__(self, ingredients: Dict[str, Ingredient], recipes: Dict[str, Recipe]):
+        self.ingredients = ingredients
+        self.recipes = recipes
+        self.inventory: Dict[str, int] = {}
+        self._order = {name: index for index, name in enumerate(ingredients)}
+        self._buckets: Dict[str, list] = {}                 # 타입 → [(-가치, 순서, 재료명)]
+        self._recipes_by_type: Dict[str, List[str]] = {}
+        for recipe_name, recipe in recipes.items():
+            for ingredient_type in recipe.ingredients:
+                self._recipes_by_type.setdefault(ingredient_type, []).append(recipe_name)
+        self._plans: Dict[str, Optional[Dict[str, List[Tuple[str, float]]]]] = {}
+        self._dirty = set(recipes)
+
+    def attach(self, inventory: Dict[str, int]):
+        """인벤토리 연결 후 버킷 전체 재구성"""
+        self.inventory = inventory
+        self._buckets.clear()
+        for name in inventory:
+            ingredient = self.ingredients.get(name)
+            if ingredient is not None:
+                self._buckets.setdefault(ingredient.type.value, []).append(self._bucket_key(name, ingredient))
+        for bucket in self._buckets.values():
+            bucket.sort()
+        self._dirty = set(self.recipes)
+
+    def _bucket_key(self, name: str, ingredient: Ingredient) -> tuple:
+        return (-ingredient.value, self._order[name], name)
+
+    def on_inventory_change(self, name: str, present: bool):
+        """재료 개수 변경/추가/제거 알림"""
+        ingredient = self.ingredients.get(name)
+        if ingredient is None:
+            return
+        ingredient_type = ingredient.type.value
+        bucket = self._buckets.setdefault(ingredient_type, [])
+        key = self._bucket_key(name, ingredient)
+        index = bisect_left(bucket, key)
+        exists = index < len(bucket) and bucket[index] == key
+        if present and not exists:
+            bucket.insert(index, key)
+        elif not present and exists:
+            del bucket[index]
+        self._dirty.update(self._recipes_by_type.get(ingredient_type, ()))
+
+    @staticmethod
+    def _allocate(entries, needed_value: float) -> Optional[List[Tuple[str, float]]]:
+        """한 타입의 필요 가치를 가치 높은 재료부터 배분 ((재료명, 가치, 개수) 목록 기준)"""
+        current_value = 0.0
+        selected = []
+        for name, value, count in entries:
+            if current_value >= needed_value:
+                break
+            remaining_needed = needed_value - current_value
+            use_count = min(count, int(remaining_needed / value) + (1 if remaining_needed % value > 0 else 0))
+            if use_count > 0:
+                use_amount = min(remaining_needed / value, use_count)
+                selected.append((name, use_amount))
+                current_value += value * use_amount
+        if current_value < needed_value:
+            return None
+        return selected
+
+    def _entries(self, ingredient_type: str, counts: Dict[str, int]):
+        for negative_value, _, name in self._buckets.get(ingredient_type, ()):
+            yield name, -negative_value, counts.get(name, 0)
+
+    def _plan_recipe(self, recipe: Recipe, counts: Dict[str, int]) -> Optional[Dict[str, List[Tuple[str, float]]]]:
+        plan = {}
+        for ingredient_type, needed_value in recipe.ingredients.items():
+            if not self._buckets.get(ingredient_type):
+                return None
+            selected = self._allocate(self._entries(ingredient_type, counts), needed_value)
+            if selected is None:
+                return None
+            plan[ingredient_type] = selected
+        return plan
+
+    def _refresh(self, recipe_name: str):
+        if recipe_name in self._dirty:
+            self._dirty.discard(recipe_name)
+            self._plans[recipe_name] = self._plan_recipe(self.recipes[recipe_name], self.inventory)
+
+    def get_plan(self, recipe_name: str) -> Optional[Dict[str, List[Tuple[str, float]]]]:
+        """현재 재료로 한 접시 만드는 대체 계획 (불가능하면 None)"""
+        if recipe_name not in self.recipes:
+            return None
+        self._refresh(recipe_name)
+        plan = self._plans[recipe_name]
+        return None if plan is None else {t: list(selected) for t, selected in plan.items()}
+
+    def get_cookable(self) -> List[str]:
+        """현재 만들 수 있는 레시피 (레시피 정의 순서)"""
+        for recipe_name in list(self._dirty):
+            self._refresh(recipe_name)
+        return [name for name in self.recipes if self._plans.get(name) is not None]
+
+    def plan_batch(self, recipe_name: str, max_count: int) -> List[Dict[str, List[Tuple[str, float]]]]:
+        """같은 요리를 최대 max_count개 연속으로 만들 때의 접시별 계획 (한 번에 계산)
+
+        접시마다 기존 방식대로 가치 높은 재료부터 쓰고 소수 사용량은 올림해 소모.
+        실제 인벤토리는 건드리지 않음.
+        """
+        recipe = self.recipes.get(recipe_name)
+        if recipe is None or max_count <= 0:
+            return []
+        counts = {}
+        for ingredient_type in recipe.ingredients:
+            for _, _, name in self._buckets.get(ingredient_type, ()):
+                counts[name] = self.inventory.get(name, 0)
+
+        plans = []
+        while len(plans) < max_count:
+            plan = self._plan_recipe(recipe, counts)
+            if plan is None:
+                break
+            for selected in plan.values():
+                for name, use_amount in selected:
+                    counts[name] -= _round_up_count(use_amount)
+            plans.append(plan)
+        return plans
+
+
 class CookingSystem:
     """개선된 요리 시스템 메인 클래스"""
     
@@ -223,8 +411,28 @@ class CookingSystem:
         
         self._init_ingredients()
         self._init_recipes()
+        self.planner = RecipePlanner(self.all_ingredients, self.all_recipes)  # 제작 가능 레시피 증분 계산
+        self.planner.attach(self._ingredients_inventory)
         self._load_permanent_recipes()  # 영구 레시피 로드
     
+    @property
+    def ingredients_inventory(self) -> Dict[str, int]:
+        """보유 식재료 (재료명 → 개수)"""
+        return self._ingredients_inventory
+    
+    @ingredients_inventory.setter
+    def ingredients_inventory(self, inventory: Dict[str, int]):
+        # 통째로 교체돼도 (불러오기 등) 플래너 버킷이 따라가도록 감싸서 보관
+        self._ingredients_inventory = IngredientInventory(inventory, on_change=self._on_ingredient_change)
+        planner = getattr(self, 'planner', None)
+        if planner is not None:
+            planner.attach(self._ingredients_inventory)
+    
+    def _on_ingredient_change(self, ingredient_name: str, present: bool):
+        planner = getattr(self, 'planner', None)
+        if planner is not None:
+            planner.on_inventory_change(ingredient_name, present)
+    
     def show_cooking_menu(self):
         """요리 메뉴 표시 - 메인 인터페이스"""
         try:
@@ -358,12 +566,21 @@ class CookingSystem:
             print(f"\n{GREEN}⚡ 빠른 요리 (발견한 레시피):{RESET}")
             for i, recipe_name in enumerate(quick_recipes[:10], 1):
                 recipe = self.all_recipes[recipe_name]
-                print(f"  [{i}] {recipe.icon} {recipe_name} - {recipe.description}")
+                max_count = self.get_max_batch_count(recipe_name)
+                print(f"  [{i}] {recipe.icon} {recipe_name} (최대 {max_count}개) - {recipe.description}")
             
             try:
-                choice = input(f"\n빠른 요리 선택 (1-{len(quick_recipes[:10])}) 또는 0(돌아가기): ").strip()
+                choice = input(f"\n빠른 요리 선택 (1-{len(quick_recipes[:10])}, 여러 개: 번호x개수 예) 2x5) 또는 0(돌아가기): ").strip().lower()
                 if choice == '0':
                     return
+                # 일괄 제작 (재료 배분은 한 번에 계산)
+                number, _, count = choice.partition('x')
+                if count and number.isdigit() and count.isdigit() and 1 <= int(number) <= len(quick_recipes[:10]):
+                    selected_recipe = quick_recipes[int(number) - 1]
+                    cooked, message = self.cook_batch(selected_recipe, int(count))
+                    print(f"\n{GREEN if cooked else RED}{message}{RESET}")
+                    input("아무 키나 눌러 계속...")
+                    return
                 elif choice.isdigit() and 1 <= int(choice) <= len(quick_recipes[:10]):
                     selected_recipe = quick_recipes[int(choice) - 1]
                     success, message = self.quick_cook_dish(selected_recipe)
@@ -377,13 +594,7 @@ class CookingSystem:
         print(f"\n{YELLOW}🧪 실험적 요리 (모든 레시피 시도 가능):{RESET}")
         print("재료가 있으면 모든 레시피를 시도할 수 있습니다.")
         
-        available_recipes = []
-        for recipe_name, recipe in self.all_recipes.items():
-            if recipe_name == "곤죽":  # 실패작은 제외
-                continue
-            can_cook, _ = self.can_cook_with_substitutes(recipe_name)
-            if can_cook:
-                available_recipes.append(recipe_name)
+        available_recipes = [name for name in self.get_cookable_recipes() if name != "곤죽"]  # 실패작은 제외
         
         if available_recipes:
             print(f"\n{CYAN}제작 가능한 레시피:{RESET}")
@@ -468,6 +679,7 @@ class CookingSystem:
     def _load_permanent_recipes(self):
         """영구 진행 상황에서 발견한 레시피 로드"""
         try:
+            flush_json_saves("permanent_progress.json")
             if os.path.exists("permanent_progress.json"):
                 with open("permanent_progress.json", "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -480,23 +692,19 @@ class CookingSystem:
             print(f"영구 레시피 로드 실패: {e}")
     
     def _save_permanent_recipes(self):
-        """영구 진행 상황에 발견한 레시피 저장"""
-        try:
-            # 기존 파일 로드
-            data = {}
-            if os.path.exists("permanent_progress.json"):
-                with open("permanent_progress.json", "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            
-            # 발견한 레시피 추가
-            data["discovered_recipes"] = list(self.discovered_recipes)
-            
-            # 파일 저장
-            with open("permanent_progress.json", "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                
-        except Exception as e:
-            print(f"영구 레시피 저장 실패: {e}")
+        """영구 진행 상황에 발견한 레시피 저장 예약 (다른 키는 저장 시점의 파일 내용 유지)"""
+        schedule_json_save("permanent_progress.json", self._merge_permanent_recipes)
+    
+    def _merge_permanent_recipes(self) -> Dict:
+        """기존 영구 진행 파일에 발견한 레시피를 합친 데이터"""
+        data = {}
+        if os.path.exists("permanent_progress.json"):
+            with open("permanent_progress.json", "r", encoding="utf-8") as f:
+                data = json.load(f)
+        
+        # 발견한 레시피 추가
+        data["discovered_recipes"] = list(self.discovered_recipes)
+        return data
     
     def get_max_inventory_weight(self) -> float:
         """파티의 총 무게한계 반환"""
@@ -509,8 +717,13 @@ class CookingSystem:
         return 60.0  # 기본값
     
     def _init_ingredients(self):
-        """식재료 데이터 초기화 (무게 포함)"""
-        self.all_ingredients = {
+        """식재료 데이터 초기화 (공유 테이블)"""
+        self.all_ingredients = get_data_table("cooking.ingredients")
+    
+    @staticmethod
+    def _build_ingredients() -> Dict[str, Ingredient]:
+        """식재료 데이터 정의 (무게 포함)"""
+        return {
             # 고기류 - 대폭 확장
             "작은 고기": Ingredient("작은 고기", IngredientType.MEAT, 1, "작은 동물의 고기", "🥩", 0.5, 0.2),
             "토끼 고기": Ingredient("토끼 고기", IngredientType.MEAT, 1, "부드러운 토끼 고기", "🐰", 0.8, 0.5),
@@ -709,8 +922,13 @@ class CookingSystem:
         }
     
     def _init_recipes(self):
-        """레시피 데이터 초기화 (BRV, 상처, 최대 HP 시스템 연동)"""
-        self.all_recipes = {
+        """레시피 데이터 초기화 (공유 테이블)"""
+        self.all_recipes = get_data_table("cooking.recipes")
+    
+    @staticmethod
+    def _build_recipes() -> Dict[str, Recipe]:
+        """레시피 데이터 정의 (BRV, 상처, 최대 HP 시스템 연동)"""
+        return {
             # 기본 요리들 - 돈스타브 스타일 제약 조건 추가
             "구운 고기": Recipe(
                 name="구운 고기",
@@ -1535,15 +1753,12 @@ class CookingSystem:
     
     def get_quick_cooking_menu(self) -> List[str]:
         """한 번 만든 요리들의 빠른 제작 목록"""
-        available_quick_recipes = []
-        
-        for recipe_name in self.discovered_recipes:
-            # 재료 확인 없이 제작 가능한지만 체크
-            can_cook, _ = self.can_cook_with_substitutes(recipe_name)
-            if can_cook:
-                available_quick_recipes.append(recipe_name)
-        
-        return sorted(available_quick_recipes)
+        # 재료 확인 없이 제작 가능한지만 체크
+        return sorted(name for name in self.get_cookable_recipes() if name in self.discovered_recipes)
+    
+    def get_cookable_recipes(self) -> List[str]:
+        """현재 재료로 만들 수 있는 레시피 목록 (레시피 정의 순서)"""
+        return self.planner.get_cookable()
     
     def quick_cook_dish(self, recipe_name: str) -> Tuple[bool, str]:
         """빠른 요리 제작 (발견한 레시피만, 재료 표시 없음)"""
@@ -1699,43 +1914,10 @@ class CookingSystem:
                 f"  최대 동시 드롭: {max_drops}개")
     
     def can_cook_with_substitutes(self, recipe_name: str) -> Tuple[bool, Dict[str, List[Tuple[str, float]]]]:
-        """레시피를 재료 대체로 요리할 수 있는지 확인"""
-        if recipe_name not in self.all_recipes:
+        """레시피를 재료 대체로 요리할 수 있는지 확인 (타입별 재료 버킷 기반, 변경된 타입만 재계산)"""
+        substitution_plan = self.planner.get_plan(recipe_name)
+        if substitution_plan is None:
             return False, {}
-        
-        recipe = self.all_recipes[recipe_name]
-        substitution_plan = {}
-        
-        for ingredient_type, needed_value in recipe.ingredients.items():
-            available_ingredients = []
-            for name, ingredient in self.all_ingredients.items():
-                if ingredient.type.value == ingredient_type and name in self.ingredients_inventory:
-                    available_count = self.ingredients_inventory[name]
-                    available_ingredients.append((name, ingredient.value, available_count))
-            
-            if not available_ingredients:
-                return False, {}
-            
-            available_ingredients.sort(key=lambda x: x[1], reverse=True)
-            current_value = 0.0
-            selected_ingredients = []
-            
-            for name, value, count in available_ingredients:
-                if current_value >= needed_value:
-                    break
-                
-                remaining_needed = needed_value - current_value
-                use_count = min(count, int(remaining_needed / value) + (1 if remaining_needed % value > 0 else 0))
-                
-                if use_count > 0:
-                    selected_ingredients.append((name, min(remaining_needed / value, use_count)))
-                    current_value += value * min(remaining_needed / value, use_count)
-            
-            if current_value < needed_value:
-                return False, {}
-            
-            substitution_plan[ingredient_type] = selected_ingredients
-        
         return True, substitution_plan
     
     def validate_recipe_constraints(self, recipe: Recipe, substitution_plan: Dict) -> Tuple[bool, str]:
@@ -1787,16 +1969,10 @@ class CookingSystem:
         # 재료 소모
         for ingredient_type, selected_ingredients in substitution_plan.items():
             for ingredient_name, use_amount in selected_ingredients:
-                use_count = int(use_amount) + (1 if use_amount % 1 > 0 else 0)
-                self.ingredients_inventory[ingredient_name] -= use_count
-                if self.ingredients_inventory[ingredient_name] <= 0:
-                    del self.ingredients_inventory[ingredient_name]
+                self._consume_ingredient(ingredient_name, _round_up_count(use_amount))
         
         # 성공 확률 계산
-        base_success_rate = 0.85
-        level_bonus = min(self.cooking_level * 0.05, 0.4)
-        difficulty_penalty = recipe.difficulty * 0.08
-        success_rate = max(0.2, base_success_rate + level_bonus - difficulty_penalty)
+        success_rate = self._get_success_rate(recipe)
         
         if random.random() > success_rate:
             # 실패 - 곤죽 생성
@@ -1829,6 +2005,95 @@ class CookingSystem:
         self._gain_cooking_exp(recipe.duration_steps // 8)
         return True, f"{recipe_name}을(를) 성공적으로 만들었습니다!"
     
+    def _get_success_rate(self, recipe: Recipe) -> float:
+        """요리 성공 확률"""
+        base_success_rate = 0.85
+        level_bonus = min(self.cooking_level * 0.05, 0.4)
+        difficulty_penalty = recipe.difficulty * 0.08
+        return max(0.2, base_success_rate + level_bonus - difficulty_penalty)
+    
+    def _consume_ingredient(self, ingredient_name: str, count: int):
+        self.ingredients_inventory[ingredient_name] -= count
+        if self.ingredients_inventory[ingredient_name] <= 0:
+            del self.ingredients_inventory[ingredient_name]
+    
+    def get_max_batch_count(self, recipe_name: str, limit: int = 99) -> int:
+        """현재 재료로 연속 제작할 수 있는 최대 개수 (limit까지)"""
+        return len(self.planner.plan_batch(recipe_name, limit))
+    
+    def cook_batch(self, recipe_name: str, max_count: int) -> Tuple[int, str]:
+        """같은 요리를 최대 max_count개 일괄 제작 - 재료 배분은 한 번에 계산
+        
+        접시마다 제약 조건/무게/성공 판정은 cook_dish와 같음 (성공 확률은 시작 시점 요리 레벨 기준).
+        (제작한 개수, 메시지) 반환
+        """
+        plans = self.planner.plan_batch(recipe_name, max_count)
+        if not plans:
+            return 0, "재료가 부족합니다."
+        
+        recipe = self.all_recipes[recipe_name]
+        success_rate = self._get_success_rate(recipe)
+        failed_recipe = self.all_recipes.get("곤죽")
+        failed_weight = failed_recipe.weight if failed_recipe else recipe.weight
+        current_weight = self.get_total_inventory_weight()
+        
+        consumed: Dict[str, int] = {}
+        successes = failures = 0
+        stop_reason = ""
+        for substitution_plan in plans:
+            constraint_valid, constraint_message = self.validate_recipe_constraints(recipe, substitution_plan)
+            if not constraint_valid:
+                stop_reason = constraint_message
+                break
+            if current_weight + recipe.weight > 60.0:
+                stop_reason = f"완성된 요리가 너무 무거워서 인벤토리에 넣을 수 없습니다! (무게: {recipe.weight}kg)"
+                break
+            
+            for selected_ingredients in substitution_plan.values():
+                for ingredient_name, use_amount in selected_ingredients:
+                    use_count = _round_up_count(use_amount)
+                    consumed[ingredient_name] = consumed.get(ingredient_name, 0) + use_count
+                    current_weight -= self.all_ingredients[ingredient_name].weight * use_count
+            
+            if random.random() > success_rate:
+                failures += 1
+                current_weight += failed_weight
+            else:
+                successes += 1
+                current_weight += recipe.weight
+        
+        cooked = successes + failures
+        if cooked == 0:
+            return 0, stop_reason or "재료가 부족합니다."
+        
+        if audio_manager:
+            audio_manager.play_sfx(SFXType.MENU_SELECT)  # 요리 시작음
+        
+        # 재료 소모 (재료당 한 번)
+        for ingredient_name, use_count in consumed.items():
+            self._consume_ingredient(ingredient_name, use_count)
+        
+        if failures:
+            self.cooked_food_inventory["곤죽"] = self.cooked_food_inventory.get("곤죽", 0) + failures
+            self._gain_cooking_exp(5 * failures)
+        if successes:
+            if audio_manager:
+                audio_manager.play_sfx(SFXType.ITEM_GET)  # 요리 성공음
+            self.cooked_food_inventory[recipe_name] = self.cooked_food_inventory.get(recipe_name, 0) + successes
+            if recipe_name not in self.discovered_recipes:
+                self.discovered_recipes.add(recipe_name)
+                self._save_permanent_recipes()  # 영구 저장
+            self._gain_cooking_exp((recipe.duration_steps // 8) * successes)
+        elif audio_manager:
+            audio_manager.play_sfx(SFXType.MENU_CANCEL)  # 요리 실패음
+        
+        message = f"{recipe_name} {cooked}개 제작: 성공 {successes}개"
+        if failures:
+            message += f", 실패 {failures}개 (곤죽)"
+        if stop_reason:
+            message += f" - {stop_reason}"
+        return cooked, message
+    
     def consume_food(self, food_name: str) -> Tuple[bool, str]:
         """요리 섭취 (버프 적용) - 중복 섭취 방지"""
         if food_name not in self.cooked_food_inventory or self.cooked_food_inventory[food_name] <= 0:
@@ -2062,6 +2327,9 @@ class CookingSystem:
         print(f"  • 특정 몬스터는 해당 몬스터만의 특별한 식재료 드롭")
         print(f"  • 전설급 몬스터는 최고급 식재료 확정 드롭")
 
+register_data_table("cooking.ingredients", CookingSystem._build_ingredients)
+register_data_table("cooking.recipes", CookingSystem._build_recipes)
+
 # 전역 인스턴스
 cooking_system = CookingSystem()
 
@@ -223,6 +223,13 @@ class CursorMenu:
         import sys
         import os
         
+        # 웹 세션 - 세션 가상 터미널만 지움
+        from game.io_bridge import get_game_io
+        game_io = get_game_io()
+        if game_io.headless:
+            game_io.clear_screen()
+            return
+        
         if self._ansi_inplace_supported:
             # PowerShell/Windows Terminal - ANSI 시퀀스 사용
             try:
@@ -487,10 +494,14 @@ class CursorMenu:
             for _ in range(100):
                 print()
             
-            # cls 시도
+            # cls 시도 (웹 세션은 세션 터미널에서 처리)
             try:
                 import os
-                os.system('cls')
+                from game.io_bridge import get_game_io
+                if get_game_io().headless:
+                    get_game_io().clear_screen()
+                else:
+                    os.system('cls')
             except:
                 pass
             
@@ -0,0 +1,152 @@
+"""
+📚 컴파일된 데이터 테이블 레지스트리
+스킬/아이템/적/요리/상태이상처럼 큰 리터럴로 정의된 데이터를 프로세스당 한 번만 만들어 공유
+
+- 각 테이블은 빌더 함수의 컴파일된 코드(바이트코드 + 상수)와 참조하는 전역 객체로 해시를 만들어 검증
+- 핫 리로드로 빌더 코드나 참조 enum/클래스가 바뀐 테이블만 다시 만들고 나머지는 그대로 재사용
+- 빌더 정의(.py)는 그대로 원본 데이터로 유지 (.pyc가 이미 소스 해시 검증된 바이너리 캐시 역할)
+"""
+
+import copy
+import hashlib
+import marshal
+import threading
+import time
+from types import CodeType
+from typing import Any, Callable, Dict, Optional
+
+# 데이터 형식이 바뀌면 올려서 모든 테이블을 무효화
+TABLE_FORMAT_VERSION = 1
+
+
+def _code_names(code: CodeType, names: set):
+    """코드 객체(중첩 함수/컴프리헨션 포함)가 참조하는 전역 이름 수집"""
+    names.update(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _code_names(const, names)
+
+
+def compute_fingerprint(builder: Callable, version: int = 1) -> str:
+    """빌더 함수의 컴파일된 코드 + 참조 전역 객체 식별자로 테이블 해시 생성"""
+    func = getattr(builder, '__func__', builder)
+    code = func.__code__
+    digest = hashlib.sha256()
+    digest.update(f"{TABLE_FORMAT_VERSION}:{version}:{func.__module__}.{func.__qualname__}".encode())
+    digest.update(marshal.dumps(code))
+
+    # 리로드로 enum/클래스가 새로 만들어지면 같은 코드여도 다시 빌드해야 함
+    names = set()
+    _code_names(code, names)
+    func_globals = func.__globals__
+    for name in sorted(names):
+        if name in func_globals:
+            digest.update(f"{name}={id(func_globals[name])};".encode())
+    return digest.hexdigest()
+
+
+class DataTable:
+    """빌더 함수 하나로 만들어지는 공유 테이블"""
+
+    def __init__(self, name: str, builder: Callable[[], Any], version: int = 1):
+        self.name = name
+        self.builder = builder
+        self.version = version
+        self.fingerprint = compute_fingerprint(builder, version)
+        self.build_count = 0
+        self.last_build_seconds = 0.0
+        self._value = None
+        self._built_fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_fingerprint == self.fingerprint
+
+    def get(self) -> Any:
+        """공유 테이블 (읽기 전용으로 사용)"""
+        if self._built_fingerprint == self.fingerprint:
+            return self._value
+        with self._lock:
+            if self._built_fingerprint != self.fingerprint:
+                started = time.perf_counter()
+                self._value = self.builder()
+                self.last_build_seconds = time.perf_counter() - started
+                self._built_fingerprint = self.fingerprint
+                self.build_count += 1
+        return self._value
+
+    def invalidate(self):
+        with self._lock:
+            self._value = None
+            self._built_fingerprint = None
+
+
+class DataTableRegistry:
+    """이름 → 데이터 테이블"""
+
+    def __init__(self):
+        self._tables: Dict[str, DataTable] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, builder: Callable[[], Any], version: int = 1) -> DataTable:
+        """테이블 등록 - 모듈이 다시 import되면 해시가 같을 때 기존 테이블 유지"""
+        with self._lock:
+            table = self._tables.get(name)
+            if table is None:
+                table = self._tables[name] = DataTable(name, builder, version)
+                return table
+            fingerprint = compute_fingerprint(builder, version)
+            table.builder = builder
+            table.version = version
+            if fingerprint != table.fingerprint:
+                table.fingerprint = fingerprint   # 다음 get()에서 다시 빌드
+            return table
+
+    def get(self, name: str) -> Any:
+        return self._tables[name].get()
+
+    def get_copy(self, name: str) -> Any:
+        """호출자가 수정할 수 있는 깊은 복사본"""
+        return copy.deepcopy(self.get(name))
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._tables
+
+    def invalidate(self, name: str = None):
+        """테이블 강제 재빌드 (name=None이면 전체)"""
+        tables = list(self._tables.values()) if name is None else [self._tables[name]]
+        for table in tables:
+            table.invalidate()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                'built': table.is_built,
+                'builds': table.build_count,
+                'last_build_ms': table.last_build_seconds * 1000,
+                'fingerprint': table.fingerprint[:12],
+            }
+            for name, table in self._tables.items()
+        }
+
+
+# 전역 데이터 테이블 레지스트리
+_data_table_registry = None
+
+def get_data_table_registry() -> DataTableRegistry:
+    """전역 데이터 테이블 레지스트리 가져오기"""
+    global _data_table_registry
+    if _data_table_registry is None:
+        _data_table_registry = DataTableRegistry()
+    return _data_table_registry
+
+
+def register_data_table(name: str, builder: Callable[[], Any], version: int = 1) -> DataTable:
+    """전역 레지스트리에 테이블 등록"""
+    return get_data_table_registry().register(name, builder, version)
+
+
+def get_data_table(name: str) -> Any:
+    """전역 레지스트리에서 공유 테이블 가져오기"""
+    return get_data_table_registry().get(name)
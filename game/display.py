@@ -10,6 +10,8 @@ from game.character import Character, PartyManager
 from game.ui_formatters import format_item_brief
 from game.world import GameWorld
 from game.color_text import *
+from game.hot_path_profiler import profiled
+from game.io_bridge import get_game_io
 
 
 class GameDisplay:
@@ -18,8 +20,11 @@ class GameDisplay:
     - clear_screen: 플랫폼별 화면 클리어
     """
     
-    def __init__(self):
+    def __init__(self, game_io=None):
         """GameDisplay 초기화 - 로-바트 마스터 연결"""
+        # game_io가 없으면 호출 시점에 현재 스레드에 바인딩된 입출력 사용 (기본: 콘솔)
+        self.game_io = game_io
+
         # 화면 크기 기본값 설정
         self.screen_width = 120
         self.screen_height = 60
@@ -36,7 +41,17 @@ class GameDisplay:
             except Exception:
                 pass  # 로-바트 없어도 동작
 
+    def _clear_headless(self) -> bool:
+        """웹 세션이면 세션 가상 터미널만 지우고 True (실제 콘솔에 cls/clear 실행 안 함)"""
+        game_io = self.game_io or get_game_io()
+        if not game_io.headless:
+            return False
+        game_io.clear_screen()
+        return True
+
     def clear_screen(self):
+        if self._clear_headless():
+            return
         try:
             # PowerShell/Windows Terminal ANSI 우선
             try:
@@ -457,6 +472,7 @@ class GameDisplay:
         except Exception:
             return "전투 지휘 오류"
 
+    @profiled("field.render")
     def show_game_screen(self, party_manager, world, cooking_system=None):
         """메인 게임 화면 표시 - 풍부한 파티 정보 포함 버전"""
         from game.color_text import bright_cyan, bright_green, green, yellow, red, cyan, bright_yellow, bright_red
@@ -468,7 +484,8 @@ class GameDisplay:
             safe_height = min(60, max(30, self.screen_height))  # 최소 30, 최대 60줄
 
             # 화면 클리어 (한 번만)
-            os.system('cls' if os.name == 'nt' else 'clear')
+            if not self._clear_headless():
+                os.system('cls' if os.name == 'nt' else 'clear')
             
             # 상단 정보 표시
             title = f"차원 공간 {world.current_level}층 - Dawn Of Stellar"
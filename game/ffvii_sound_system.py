@@ -10,6 +10,9 @@ import random
 from typing import Dict, Optional, Any
 from enum import Enum
 from pathlib import Path
+from collections import ChainMap
+
+from game.lazy_loader import LazyValueDict
 
 class AudioCategory(Enum):
     BGM = "bgm"
@@ -274,33 +277,40 @@ class FFVIISoundSystem:
             'piano_si': '512.wav',         # 512 - Piano Si
         }
         
-        # SFX 파일들을 실제로 로드
-        loaded_count = 0
+        # SFX 파일은 첫 재생 시 디코딩 (시작 시간 단축, 같은 파일은 한 번만 디코딩)
+        self.sfx_sounds = LazyValueDict()
+        self._decoded_sfx_files = {}
+        registered_count = 0
         for name, filename in self.sfx_mapping.items():
             file_path = self.sfx_path / filename
             if file_path.exists():
-                try:
-                    sound = pygame.mixer.Sound(str(file_path))
-                    self.sfx_sounds[name] = sound
-                    loaded_count += 1
-                except Exception as e:
-                    if self.debug_mode:
-                        print(f"  ❌ {name} 로드 실패: {e}")
-                    # Fallback 비활성화 - 로드 실패한 SFX는 건너뜀
+                self.sfx_sounds.set_loader(name, lambda path=str(file_path): self._decode_sfx_file(path))
+                registered_count += 1
             else:
                 # 파일이 없으면 건너뜀 (Fallback 비활성화)
                 if self.debug_mode:
                     print(f"  ⚠️ {name} 파일 없음: {file_path}")
         
         if self.debug_mode:
-            print(f"  ✅ {loaded_count}개 SFX 로드됨")
+            print(f"  ✅ {registered_count}개 SFX 등록됨 (첫 재생 시 로드)")
+    
+    def _decode_sfx_file(self, file_path: str):
+        """SFX 파일 디코딩 (파일 단위 캐시) - 실패 시 예외로 해당 SFX 제외"""
+        sound = self._decoded_sfx_files.get(file_path)
+        if sound is None:
+            try:
+                sound = pygame.mixer.Sound(file_path)
+            except Exception as e:
+                if self.debug_mode:
+                    print(f"  ❌ {file_path} 로드 실패: {e}")
+                raise
+            self._decoded_sfx_files[file_path] = sound
+        return sound
     
     def _setup_game_sound_mapping(self):
         """게임에서 사용할 수 있도록 사운드 매핑 통합"""
         # BGM과 SFX를 통합하여 하나의 sounds 딕셔너리로 관리
-        self.sounds = {}
-        self.sounds.update(self.bgm_tracks)
-        self.sounds.update({name: sound for name, sound in self.sfx_sounds.items()})
+        self.sounds = ChainMap({}, self.sfx_sounds, self.bgm_tracks)
         
         if self.debug_mode:
             print(f"🎵 총 {len(self.sounds)}개 사운드 준비 완료!")
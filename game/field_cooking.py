@@ -333,14 +333,9 @@ class FieldCookingInterface:
         print(f"{CYAN}{'='*80}{RESET}")
         
         # 우선도순으로 레시피 정렬
-        available_recipes = []
-        for recipe_name, recipe in self.cooking_system.all_recipes.items():
-            if recipe_name == "곤죽":  # 곤죽은 제외
-                continue
-            
-            can_cook, _ = self.cooking_system.can_cook_with_substitutes(recipe_name)
-            if can_cook:
-                available_recipes.append((recipe_name, recipe))
+        available_recipes = [(recipe_name, self.cooking_system.all_recipes[recipe_name])
+                             for recipe_name in self.cooking_system.get_cookable_recipes()
+                             if recipe_name != "곤죽"]  # 곤죽은 제외
         
         available_recipes.sort(key=lambda x: x[1].priority, reverse=True)
         
@@ -0,0 +1,270 @@
+"""
+🔥 핫패스 프로파일러
+필드 턴(입력/적 이동/시야/렌더), 전투 단계(ATB/AI 선택/피해/연출/상태 틱), 저장/불러오기
+구간의 소요 시간을 롤링 히스토그램으로 모으고, 플레임그래프용 collapsed-stack 파일로 내보냄
+
+비활성화 상태에서는 플래그 확인 한 번만 하므로 항상 켜둔 채로 코드에 심어둘 수 있음
+"""
+
+import time
+import threading
+import datetime
+from collections import deque
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# 히스토그램 버킷 상한 (ms) - 마지막 버킷은 그 이상 전부
+HISTOGRAM_BUCKETS_MS = (1, 2, 4, 8, 16, 33, 66, 133)
+# 이 시간(초)을 넘은 구간은 ComprehensiveLogger.log_performance로 기록
+SLOW_SECTION_SECONDS = 0.1
+
+
+class _NullSection:
+    """비활성화 시 반환되는 공용 빈 컨텍스트"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _SectionStats:
+    """구간별 롤링 샘플 (최근 window개)"""
+    __slots__ = ('samples', 'total_calls', 'total_seconds')
+
+    def __init__(self, window: int):
+        self.samples = deque(maxlen=window)
+        self.total_calls = 0
+        self.total_seconds = 0.0
+
+    def add(self, seconds: float):
+        self.samples.append(seconds)
+        self.total_calls += 1
+        self.total_seconds += seconds
+
+    def percentile(self, ratio: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+    def histogram(self) -> List[int]:
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for seconds in self.samples:
+            ms = seconds * 1000
+            for index, upper in enumerate(HISTOGRAM_BUCKETS_MS):
+                if ms < upper:
+                    counts[index] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+
+class _ActiveSection:
+    """측정 중인 구간 (중첩 시 자식 시간을 빼서 self time 계산)"""
+    __slots__ = ('profiler', 'name', 'start', 'child_seconds')
+
+    def __init__(self, profiler: 'HotPathProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+        self.child_seconds = 0.0
+
+    def __enter__(self):
+        self.profiler._stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        self.profiler._finish(self, elapsed)
+        return False
+
+
+class HotPathProfiler:
+    """핫패스 구간 프로파일러"""
+
+    def __init__(self, window: int = 240):
+        self.enabled = False
+        self.window = window
+        self._sections: Dict[str, _SectionStats] = {}
+        self._collapsed: Dict[str, float] = {}   # "a;b;c" → self time(초)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    # =====================================
+    # 계측 API
+    # =====================================
+
+    def section(self, name: str):
+        """with profiler.section("field.render"): ... 형태로 사용"""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _ActiveSection(self, name)
+
+    def profiled(self, name: str) -> Callable:
+        """함수/메서드용 데코레이터"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _ActiveSection(self, name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _finish(self, active: _ActiveSection, elapsed: float):
+        stack = self._stack()
+        path = ";".join(section.name for section in stack)
+        # 예외 등으로 스택이 어긋나도 해당 구간까지 정리
+        while stack and stack[-1] is not active:
+            stack.pop()
+        if stack:
+            stack.pop()
+        if stack:
+            stack[-1].child_seconds += elapsed
+
+        self_seconds = max(0.0, elapsed - active.child_seconds)
+        with self._lock:
+            stats = self._sections.get(active.name)
+            if stats is None:
+                stats = self._sections[active.name] = _SectionStats(self.window)
+            stats.add(elapsed)
+            self._collapsed[path] = self._collapsed.get(path, 0.0) + self_seconds
+
+        if elapsed >= SLOW_SECTION_SECONDS:
+            try:
+                from game.error_logger import get_comprehensive_logger
+                get_comprehensive_logger().log_performance(active.name, elapsed, {"스택": path})
+            except Exception:
+                pass
+
+    # =====================================
+    # 제어
+    # =====================================
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def reset(self):
+        with self._lock:
+            self._sections.clear()
+            self._collapsed.clear()
+
+    # =====================================
+    # 보고
+    # =====================================
+
+    def get_summary(self) -> Dict[str, Dict[str, float]]:
+        """구간별 호출 수/평균/p50/p95/최대 (ms)"""
+        summary = {}
+        with self._lock:
+            for name, stats in self._sections.items():
+                if not stats.samples:
+                    continue
+                summary[name] = {
+                    'calls': stats.total_calls,
+                    'avg_ms': stats.total_seconds / stats.total_calls * 1000,
+                    'p50_ms': stats.percentile(0.5) * 1000,
+                    'p95_ms': stats.percentile(0.95) * 1000,
+                    'max_ms': max(stats.samples) * 1000,
+                }
+        return summary
+
+    def render_overlay(self, compact: bool = False) -> str:
+        """게임 화면에 붙여 출력할 히스토그램 오버레이 문자열"""
+        summary = self.get_summary()
+        if not summary:
+            return "🔥 프로파일러: 아직 측정된 구간이 없습니다"
+
+        ordered = sorted(summary.items(), key=lambda item: item[1]['p95_ms'], reverse=True)
+        if compact:
+            parts = [f"{name} {data['p95_ms']:.1f}ms" for name, data in ordered[:4]]
+            return "🔥 p95 | " + " | ".join(parts)
+
+        bars = " ▁▂▃▄▅▆▇█"
+        header = "<" + " <".join(str(ms) for ms in HISTOGRAM_BUCKETS_MS) + f" {HISTOGRAM_BUCKETS_MS[-1]}+"
+        lines = [
+            "🔥 핫패스 프로파일러 (최근 샘플 기준, ms)",
+            f"{'구간':<26}{'호출':>7}{'평균':>8}{'p50':>8}{'p95':>8}{'최대':>9}  분포({header})",
+        ]
+        for name, data in ordered:
+            with self._lock:
+                counts = self._sections[name].histogram()
+            peak = max(counts) or 1
+            spark = "".join(bars[min(len(bars) - 1, round(c / peak * (len(bars) - 1)))] for c in counts)
+            lines.append(f"{name:<26}{data['calls']:>7}{data['avg_ms']:>8.2f}{data['p50_ms']:>8.2f}"
+                         f"{data['p95_ms']:>8.2f}{data['max_ms']:>9.2f}  {spark}")
+        return "\n".join(lines)
+
+    def dump_collapsed(self, path: Optional[str] = None) -> Path:
+        """flamegraph.pl / speedscope 호환 collapsed-stack 파일 저장 (단위: 마이크로초)"""
+        if path is None:
+            log_dir = Path("게임로그")
+            log_dir.mkdir(exist_ok=True)
+            stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = log_dir / f"프로파일_{stamp}.folded"
+        path = Path(path)
+        with self._lock:
+            lines = [f"{stack} {int(seconds * 1_000_000)}"
+                     for stack, seconds in sorted(self._collapsed.items()) if seconds > 0]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + ("\n" if lines else ""))
+        return path
+
+
+# 전역 프로파일러
+_hot_path_profiler = None
+
+def get_hot_path_profiler() -> HotPathProfiler:
+    """전역 핫패스 프로파일러 인스턴스 가져오기"""
+    global _hot_path_profiler
+    if _hot_path_profiler is None:
+        _hot_path_profiler = HotPathProfiler()
+    return _hot_path_profiler
+
+
+def hot_path(name: str):
+    """전역 프로파일러 구간 컨텍스트 매니저"""
+    return get_hot_path_profiler().section(name)
+
+
+def profiled(name: str) -> Callable:
+    """전역 프로파일러 데코레이터"""
+    return get_hot_path_profiler().profiled(name)
+
+
+def handle_profiler_key() -> str:
+    """디버그 키(`) 처리 - 켜기 / 끄면서 히스토그램 출력 + collapsed-stack 저장"""
+    profiler = get_hot_path_profiler()
+    if profiler.toggle():
+        profiler.reset()
+        return "🔥 핫패스 프로파일러 켜짐 (` 키로 끄고 결과 보기)"
+    report = profiler.render_overlay()
+    try:
+        dump_path = profiler.dump_collapsed()
+        report += f"\n💾 플레임그래프 데이터 저장: {dump_path}"
+    except OSError as e:
+        report += f"\n⚠️ 플레임그래프 데이터 저장 실패: {e}"
+    return report
@@ -6,10 +6,22 @@
 import sys
 import os
 
+from game.io_bridge import get_game_io
+
+
+def _headless_io(game_io=None):
+    """헤드리스(웹 세션) 입출력이면 GameIO, 콘솔이면 None"""
+    game_io = game_io or get_game_io()
+    return game_io if game_io.headless else None
+
+
 class KeyboardInput:
     """키보드 입력을 바로 받는 클래스"""
     
-    def __init__(self, sound_manager=None):
+    def __init__(self, sound_manager=None, game_io=None):
+        # game_io가 없으면 호출 시점에 현재 스레드에 바인딩된 입출력 사용 (기본: 콘솔)
+        self.game_io = game_io
+
         # subprocess 환경에서는 강제로 input() 모드 사용
         self.use_subprocess_mode = os.getenv('SUBPROCESS_MODE') == '1'
         
@@ -81,6 +93,10 @@ class KeyboardInput:
         """키 입력 받기 (디바운싱 적용)"""
         import time
         
+        game_io = _headless_io(self.game_io)
+        if game_io:
+            return game_io.input.read_key().lower()
+        
         try:
             # subprocess 모드에서는 항상 input() 사용
             if self.use_subprocess_mode:
@@ -130,6 +146,10 @@ class KeyboardInput:
     
     def clear_input_buffer(self):
         """입력 버퍼 클리어 - 선입력 방지 (강화된 버전)"""
+        game_io = _headless_io(self.game_io)
+        if game_io:
+            game_io.input.clear()
+            return
         try:
             if os.name == 'nt':
                 # Windows - 키 버퍼 완전히 클리어 (Q키 문제 해결)
@@ -195,6 +215,9 @@ class KeyboardInput:
                 return ""
             
             # 실제 문자열 입력 받기
+            game_io = _headless_io(self.game_io)
+            if game_io:
+                return game_io.input.read_line().strip()
             result = input().strip()
             return result
             
@@ -677,8 +700,9 @@ class GamepadInput:
 class UnifiedInputManager:
     """키보드와 게임패드를 통합한 입력 관리자"""
     
-    def __init__(self, enable_gamepad=True):
-        self.keyboard = KeyboardInput()
+    def __init__(self, enable_gamepad=True, game_io=None):
+        self.game_io = game_io
+        self.keyboard = KeyboardInput(game_io=game_io)
         self.enable_gamepad = enable_gamepad
         
         # 환경 변수로 게임패드 강제 비활성화 옵션
@@ -689,9 +713,10 @@ class UnifiedInputManager:
         
         # 터미널 환경 감지 - 터미널에서는 게임패드 비활성화
         terminal_mode = self._is_running_in_terminal()
+        headless_mode = _headless_io(game_io) is not None
         
         # 게임패드 비활성화 조건들
-        if disable_gamepad or mobile_mode or web_mode or subprocess_mode or terminal_mode:
+        if disable_gamepad or mobile_mode or web_mode or subprocess_mode or terminal_mode or headless_mode:
             self.gamepad = None
             self.gamepad_enabled = False
             # 메시지 출력 완전 제거 (UI 겹침 방지)
@@ -759,6 +784,10 @@ class UnifiedInputManager:
         if not hasattr(self, '_key_burst_threshold'):
             self._key_burst_threshold = 12  # 연속 12회 이상은 홀드로 판정 (증가)
         
+        game_io = _headless_io(self.game_io)
+        if game_io:
+            return game_io.input.poll_key()
+        
         # 홀드 방지에서 제외할 중요한 키들
         important_keys = ['\r', '\n', 'w', 's', 'a', 'd', 'q', ' ', 'i', 'b']
         
@@ -853,6 +882,9 @@ class UnifiedInputManager:
           없으면 키보드 블로킹 입력(KeyboardInput.get_key)을 사용합니다.
         - 버퍼 클리어는 호출자에서 필요 시 수행합니다.
         """
+        game_io = _headless_io(self.game_io)
+        if game_io:
+            return game_io.input.read_key()
         # 게임패드에서 즉시 입력이 가능하면 반환
         try:
             if self.enable_gamepad and self.gamepad and self.gamepad.is_available():
@@ -878,6 +910,11 @@ class UnifiedInputManager:
         if message:
             print(message)
         
+        # 웹 세션은 폴링 없이 입력 큐에서 대기
+        game_io = _headless_io(self.game_io)
+        if game_io:
+            return game_io.input.read_key(timeout)
+        
         start_time = time.time()
         
         while True:
@@ -957,6 +994,10 @@ class UnifiedInputManager:
         if message:
             print(message)
         
+        game_io = _headless_io(self.game_io)
+        if game_io:
+            return game_io.input.read_key()
+        
         while True:
             # 게임패드 입력 체크 (논블로킹, 활성화된 경우에만)
             if self.enable_gamepad and self.gamepad and self.gamepad.is_available():
@@ -111,27 +111,29 @@ class IntegratedEnemyManager:
         # 최고층을 넘으면 최고층 스케일 사용
         return self.level_scaling_curve[available_floors[-1]]
     
-    def generate_integrated_enemy(self, floor: int, force_advanced: bool = False) -> Dict[str, Any]:
-        """통합된 적 생성 시스템"""
+    def generate_integrated_enemy(self, floor: int, force_advanced: bool = False,
+                                  rng: random.Random = None) -> Dict[str, Any]:
+        """통합된 적 생성 시스템 (rng: 월드 생성용 난수 스트림, 없으면 전역 random)"""
+        rng = rng or random
         classic_ratio, advanced_ratio, boss_chance = self.get_floor_scaling_ratios(floor)
         
         # 보스 적 생성 확률 체크
-        if random.random() < boss_chance:
-            return self._generate_boss_enemy(floor)
+        if rng.random() < boss_chance:
+            return self._generate_boss_enemy(floor, rng)
         
         # 강제 고급 AI 또는 확률 기반 선택
-        if force_advanced or random.random() < advanced_ratio:
-            return self._generate_advanced_enemy(floor)
+        if force_advanced or rng.random() < advanced_ratio:
+            return self._generate_advanced_enemy(floor, rng)
         else:
-            return self._generate_classic_enemy(floor)
+            return self._generate_classic_enemy(floor, rng)
     
-    def _generate_advanced_enemy(self, floor: int) -> Dict[str, Any]:
+    def _generate_advanced_enemy(self, floor: int, rng=random) -> Dict[str, Any]:
         """고급 AI 적 생성"""
         if not self.advanced_field_ai:
-            return self._generate_classic_enemy(floor)  # fallback
+            return self._generate_classic_enemy(floor, rng)  # fallback
         
         try:
-            enemy_data = self.advanced_field_ai.generate_enemy(floor)
+            enemy_data = self.advanced_field_ai.generate_enemy(floor, rng=rng)
             # 통합 스케일링 적용
             scale = self.get_level_scale(floor)
             
@@ -147,13 +149,13 @@ class IntegratedEnemyManager:
             return enemy_data
         except Exception as e:
             print(f"고급 AI 적 생성 실패: {e}")
-            return self._generate_classic_enemy(floor)
+            return self._generate_classic_enemy(floor, rng)
     
-    def _generate_classic_enemy(self, floor: int) -> Dict[str, Any]:
+    def _generate_classic_enemy(self, floor: int, rng=random) -> Dict[str, Any]:
         """클래식 적 생성"""
         if not self.classic_enemy_system:
             # 간단한 기본 적 생성
-            return self._generate_simple_enemy(floor)
+            return self._generate_simple_enemy(floor, rng)
         
         try:
             from game.enemy_system import Enemy, EnemyType, EnemyAI
@@ -169,7 +171,7 @@ class IntegratedEnemyManager:
                 ("오크", EnemyType.HUMANOID, 55, 22, 12, 11),
             ]
             
-            name, enemy_type, base_hp, base_attack, base_defense, base_speed = random.choice(classic_enemies)
+            name, enemy_type, base_hp, base_attack, base_defense, base_speed = rng.choice(classic_enemies)
             
             # 통합 스케일링 적용
             scale = self.get_level_scale(floor)
@@ -206,12 +208,12 @@ class IntegratedEnemyManager:
             
         except Exception as e:
             print(f"클래식 적 생성 실패: {e}")
-            return self._generate_simple_enemy(floor)
+            return self._generate_simple_enemy(floor, rng)
     
-    def _generate_simple_enemy(self, floor: int) -> Dict[str, Any]:
+    def _generate_simple_enemy(self, floor: int, rng=random) -> Dict[str, Any]:
         """가장 간단한 적 생성 (fallback)"""
         simple_enemies = ["늑대", "거미", "스켈레톤", "곰", "좀비"]
-        name = random.choice(simple_enemies)
+        name = rng.choice(simple_enemies)
         
         # 기본 스탯
         base_stats = {
@@ -252,14 +254,14 @@ class IntegratedEnemyManager:
             "last_skill_use": {}
         }
     
-    def _generate_boss_enemy(self, floor: int) -> Dict[str, Any]:
+    def _generate_boss_enemy(self, floor: int, rng=random) -> Dict[str, Any]:
         """보스 적 생성"""
         boss_names = [
             "거대한 곰", "늑대왕", "고대 골렘", "데스나이트", 
             "화염정령왕", "얼음용", "어둠의군주", "기계왕"
         ]
         
-        name = random.choice(boss_names)
+        name = rng.choice(boss_names)
         scale = self.get_level_scale(floor) * 2.5  # 보스는 2.5배 강함
         
         # 보스 기본 스탯 (일반 적보다 강함)
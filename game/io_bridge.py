@@ -0,0 +1,389 @@
+"""
+🔌 게임 입출력 브리지
+입력 소스(InputSource) + 출력 싱크(OutputSink)를 묶은 GameIO를 스레드에 바인딩해
+한 프로세스에서 여러 게임 세션을 각자의 메모리 터미널과 입력 큐로 동시에 실행
+
+- 콘솔 실행(기본)은 기존 동작 그대로 (CONSOLE_IO)
+- GameDisplay / KeyboardInput / UnifiedInputManager / CursorMenu는 game_io 인자 또는
+  현재 스레드에 바인딩된 GameIO를 사용
+- 게임 코드 곳곳의 print()/input()은 웹 서버 진입점(start_server)과 헤드리스 훈련 러너가 설치하는 스레드별
+  라우터(sys.stdout/sys.stdin)가 각 세션으로 보냄 - 세션마다 전역 스트림을 바꿔 끼우지 않음
+  (세션 스레드에서 새로 만든 스레드의 출력은 콘솔로 감)
+- 라우터는 프로세스 전역 스트림을 감싸므로 GameSession이 직접 설치하지 않음 - 콘솔 실행과
+  이 모듈만 가져다 쓰는 코드는 sys.stdout/sys.stdin이 그대로
+"""
+
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Optional
+
+from game.web_terminal import TerminalStreamer
+
+# 라우터 설치 전의 실제 콘솔 스트림
+_CONSOLE_STDOUT = sys.stdout
+_CONSOLE_STDIN = sys.stdin
+
+# 웹/모바일 명령 → 게임 키
+WEB_KEY_ALIASES = {
+    'enter': '\r', 'return': '\r', 'ok': '\r',
+    'space': ' ', 'tab': '\t',
+    'up': 'w', 'down': 's', 'left': 'a', 'right': 'd',
+    'esc': 'q', 'escape': 'q', 'cancel': 'q',
+}
+
+
+class SessionClosed(EOFError):
+    """세션이 종료되어 더 이상 입력이 없음 (기존 EOFError 처리 경로로 빠져나감)"""
+
+
+# =====================================
+# 📥 입력 소스
+# =====================================
+
+class InputSource(ABC):
+    """입력 소스 기본형 - headless=False면 호출자가 기존 콘솔 입력 코드를 그대로 사용"""
+    headless = False
+
+    @abstractmethod
+    def read_key(self, timeout: Optional[float] = None) -> str:
+        """키 하나 (timeout초 안에 없으면 '')"""
+
+    def poll_key(self) -> str:
+        """논블로킹 키 확인"""
+        return self.read_key(timeout=0)
+
+    @abstractmethod
+    def read_line(self, timeout: Optional[float] = None) -> str:
+        """한 줄 입력 (timeout초 안에 없으면 지금까지 모은 내용)"""
+
+    def clear(self):
+        pass
+
+
+class ConsoleInput(InputSource):
+    """실제 키보드 - KeyboardInput/UnifiedInputManager의 플랫폼별 코드가 처리"""
+    headless = False
+
+    def read_key(self, timeout: Optional[float] = None) -> str:
+        from game.input_utils import KeyboardInput
+        return KeyboardInput().get_key()
+
+    def read_line(self, timeout: Optional[float] = None) -> str:
+        return _CONSOLE_STDIN.readline().rstrip('\n')
+
+
+class QueueInput(InputSource):
+    """웹소켓 등에서 push()로 채우는 입력 큐 (스레드 안전)"""
+    headless = True
+
+    def __init__(self, max_pending: int = 64):
+        self._pending = deque(maxlen=max_pending)   # 느린 게임 루프에 키가 무한히 쌓이지 않도록
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def push(self, command: str):
+        """명령 추가 - 'enter'/'up' 같은 별칭은 게임 키로, 두 글자 이상은 한 줄 입력으로 처리"""
+        if not isinstance(command, str) or not command:
+            return
+        key = WEB_KEY_ALIASES.get(command.lower(), command)
+        with self._condition:
+            self._pending.append(key)
+            self._condition.notify()
+
+    def _pop(self, timeout: Optional[float]) -> Optional[str]:
+        with self._condition:
+            if not self._pending and not self._closed and timeout != 0:
+                self._condition.wait_for(lambda: self._pending or self._closed, timeout)
+            if self._pending:
+                return self._pending.popleft()
+            if self._closed:
+                raise SessionClosed()
+            return None
+
+    def read_key(self, timeout: Optional[float] = None) -> str:
+        item = self._pop(timeout)
+        if item is None:
+            return ''
+        return item if len(item) == 1 else item[0].lower()
+
+    def read_line(self, timeout: Optional[float] = None) -> str:
+        """한 줄 입력 - 한 글자 키는 Enter가 올 때까지 모음"""
+        chars = []
+        while True:
+            item = self._pop(timeout)
+            if item is None:
+                return ''.join(chars)
+            if item in ('\r', '\n'):
+                return ''.join(chars)
+            if len(item) > 1 and not chars:
+                return item
+            chars.append(item)
+
+    def clear(self):
+        with self._condition:
+            self._pending.clear()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
+# =====================================
+# 📤 출력 싱크
+# =====================================
+
+class OutputSink(ABC):
+    """출력 싱크 기본형"""
+    headless = False
+
+    @abstractmethod
+    def write(self, text: str) -> int:
+        """텍스트 출력 - 쓴 글자 수 반환"""
+
+    def flush(self):
+        pass
+
+    def clear_screen(self):
+        self.write('\x1b[2J\x1b[H')
+
+    def isatty(self) -> bool:
+        return False
+
+
+class ConsoleOutput(OutputSink):
+    """실제 콘솔"""
+
+    def write(self, text: str) -> int:
+        return _CONSOLE_STDOUT.write(text)
+
+    def flush(self):
+        _CONSOLE_STDOUT.flush()
+
+    def isatty(self) -> bool:
+        try:
+            return _CONSOLE_STDOUT.isatty()
+        except Exception:
+            return False
+
+
+class TerminalOutput(OutputSink):
+    """메모리 가상 터미널 - TerminalStreamer가 접속한 클라이언트에 바뀐 줄만 전송"""
+    headless = True
+
+    def __init__(self, streamer: TerminalStreamer):
+        self.streamer = streamer
+
+    def write(self, text: str) -> int:
+        self.streamer.feed(text)
+        return len(text)
+
+    def clear_screen(self):
+        self.streamer.update('')
+
+
+# =====================================
+# 🎮 GameIO / 스레드 바인딩
+# =====================================
+
+class GameIO:
+    """한 게임 세션의 입출력"""
+
+    def __init__(self, input_source: InputSource, output_sink: OutputSink, name: str = "console"):
+        self.input = input_source
+        self.output = output_sink
+        self.name = name
+
+    @property
+    def headless(self) -> bool:
+        return self.input.headless
+
+    def write(self, text: str):
+        self.output.write(text)
+
+    def clear_screen(self):
+        self.output.clear_screen()
+
+
+CONSOLE_IO = GameIO(ConsoleInput(), ConsoleOutput())
+
+_bound = threading.local()
+
+
+def get_game_io() -> GameIO:
+    """현재 스레드의 GameIO (바인딩이 없으면 콘솔)"""
+    return getattr(_bound, 'io', None) or CONSOLE_IO
+
+
+def bind_game_io(game_io: Optional[GameIO]):
+    """현재 스레드에 GameIO 바인딩 (None이면 해제)"""
+    _bound.io = game_io
+
+
+class use_game_io:
+    """with use_game_io(io): ... - 블록 안에서 현재 스레드의 입출력 교체"""
+
+    def __init__(self, game_io: GameIO):
+        self.game_io = game_io
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = getattr(_bound, 'io', None)
+        bind_game_io(self.game_io)
+        return self.game_io
+
+    def __exit__(self, exc_type, exc, tb):
+        bind_game_io(self._previous)
+        return False
+
+
+# =====================================
+# 🔀 print()/input() 스레드별 라우터
+# =====================================
+
+class _RoutedStdout:
+    """세션 스레드의 출력은 세션 터미널로, 나머지는 원래 콘솔로"""
+
+    def __init__(self, console):
+        self._console = console
+
+    def _target(self):
+        game_io = getattr(_bound, 'io', None)
+        return game_io.output if game_io is not None and game_io.output.headless else None
+
+    def write(self, text):
+        sink = self._target()
+        return sink.write(text) if sink is not None else self._console.write(text)
+
+    def flush(self):
+        sink = self._target()
+        if sink is not None:
+            sink.flush()
+        else:
+            self._console.flush()
+
+    def isatty(self):
+        return False if self._target() is not None else self._console.isatty()
+
+    def __getattr__(self, name):
+        return getattr(self._console, name)
+
+
+class _RoutedStdin:
+    """세션 스레드의 input()/readline()은 세션 입력 큐에서"""
+
+    def __init__(self, console):
+        self._console = console
+
+    def readline(self, *args):
+        game_io = getattr(_bound, 'io', None)
+        if game_io is not None and game_io.input.headless:
+            return game_io.input.read_line() + '\n'
+        return self._console.readline(*args)
+
+    def isatty(self):
+        game_io = getattr(_bound, 'io', None)
+        return False if game_io is not None and game_io.input.headless else self._console.isatty()
+
+    def __getattr__(self, name):
+        return getattr(self._console, name)
+
+
+_router_lock = threading.Lock()
+
+
+def install_io_router():
+    """스레드별 라우터 설치 (여러 번 호출해도 한 번만) - 웹 서버/헤드리스 훈련처럼 스레드별로 출력을 나눠야 하는 진입점에서만 호출"""
+    with _router_lock:
+        if not isinstance(sys.stdout, _RoutedStdout):
+            sys.stdout = _RoutedStdout(sys.stdout)
+        if sys.stdin is not None and not isinstance(sys.stdin, _RoutedStdin):
+            sys.stdin = _RoutedStdin(sys.stdin)
+
+
+# =====================================
+# 🧵 헤드리스 게임 세션
+# =====================================
+
+class GameSession:
+    """자기 스레드 + 입력 큐 + 메모리 터미널을 가진 게임 세션"""
+
+    def __init__(self, session_id: str, target: Callable[[], None],
+                 emit: Callable[[str, dict, str], None], colors: bool = True, max_rows: int = 200):
+        self.session_id = session_id
+        self.target = target
+        self.input = QueueInput()
+        self.streamer = TerminalStreamer(emit, max_rows=max_rows)
+        self.streamer.add_client(session_id, colors)   # 세션 화면은 해당 클라이언트에게만 전송
+        self.io = GameIO(self.input, TerminalOutput(self.streamer), name=session_id)
+        self.thread: Optional[threading.Thread] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, start_task: Callable = None, sleep: Callable[[float], None] = None):
+        """게임 스레드 시작 - start_task/sleep은 socketio.start_background_task/socketio.sleep"""
+        self.thread = threading.Thread(target=self._run, name=f"GameSession-{self.session_id}", daemon=True)
+        self.thread.start()
+        if start_task is not None:
+            start_task(self.streamer.run, sleep) if sleep else start_task(self.streamer.run)
+        else:
+            threading.Thread(target=self.streamer.run, name=f"Screen-{self.session_id}", daemon=True).start()
+
+    def _run(self):
+        bind_game_io(self.io)
+        try:
+            self.target()
+        except (SessionClosed, SystemExit):
+            pass
+        except BaseException as e:
+            self.error = e
+            print(f"\n❌ 게임 세션 오류: {e}")
+        finally:
+            bind_game_io(None)
+            self.streamer.flush(force=True)
+
+    def send_input(self, command: str):
+        self.input.push(command)
+
+    def stop(self):
+        self.input.close()
+        self.streamer.stop()
+
+
+class GameSessionManager:
+    """클라이언트 ID → 게임 세션"""
+
+    def __init__(self, max_sessions: int = 8):
+        self.max_sessions = max_sessions
+        self.sessions = {}
+        self._lock = threading.Lock()
+
+    def start_session(self, session_id: str, target: Callable[[], None],
+                      emit: Callable[[str, dict, str], None], colors: bool = True,
+                      **start_kwargs) -> Optional[GameSession]:
+        """세션 시작 (이미 있으면 기존 세션, 한도 초과면 None)"""
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is not None and session.is_running:
+                return session
+            running = sum(1 for s in self.sessions.values() if s.is_running)
+            if running >= self.max_sessions:
+                return None
+            session = GameSession(session_id, target, emit, colors=colors)
+            self.sessions[session_id] = session
+        session.start(**start_kwargs)
+        return session
+
+    def get(self, session_id: str) -> Optional[GameSession]:
+        return self.sessions.get(session_id)
+
+    def stop_session(self, session_id: str):
+        with self._lock:
+            session = self.sessions.pop(session_id, None)
+        if session is not None:
+            session.stop()
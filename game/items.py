@@ -5,8 +5,11 @@
 
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
+import copy
 import random
 
+from game.data_tables import register_data_table, get_data_table
+
 
 class ItemType(Enum):
     """아이템 타입"""
@@ -112,13 +115,14 @@ class DropRateManager:
         return min(base_chance + stage_bonus, 0.8)  # 최대 80%
     
     @staticmethod
-    def select_rarity_by_stage(stage: int) -> ItemRarity:
-        """스테이지를 고려한 희귀도 선택"""
+    def select_rarity_by_stage(stage: int, rng: random.Random = None) -> ItemRarity:
+        """스테이지를 고려한 희귀도 선택 (rng: 월드 생성용 난수 스트림, 없으면 전역 random)"""
+        rng = rng or random
         weights = DropRateManager.get_rarity_weights(stage)
         
         # 가중치 기반 랜덤 선택
         total_weight = sum(weights.values())
-        random_value = random.uniform(0, total_weight)
+        random_value = rng.uniform(0, total_weight)
         
         current_weight = 0
         for rarity, weight in weights.items():
@@ -770,7 +774,32 @@ class ItemDatabase:
     
     @staticmethod
     def get_all_items() -> List[Item]:
-        """모든 아이템 데이터"""
+        """모든 아이템 데이터 (호출마다 새 객체 - 조회만 할 때는 _catalog() 사용)"""
+        return ItemDatabase._build_all_items()
+    
+    @staticmethod
+    def _catalog() -> Dict[str, Any]:
+        """이름/희귀도/타입 인덱스가 있는 공유 아이템 카탈로그 (읽기 전용)"""
+        return get_data_table("items.catalog")
+    
+    @staticmethod
+    def _build_catalog() -> Dict[str, Any]:
+        items = ItemDatabase._build_all_items()
+        by_name, by_rarity, by_type = {}, {}, {}
+        for item in items:
+            by_name.setdefault(item.name, item)   # 같은 이름은 먼저 정의된 것 우선
+            by_rarity.setdefault(item.rarity, []).append(item)
+            by_type.setdefault(item.item_type, []).append(item)
+        return {'items': items, 'by_name': by_name, 'by_rarity': by_rarity, 'by_type': by_type}
+    
+    @staticmethod
+    def _copy_item(item: Item) -> Item:
+        """카탈로그 원본을 보호하기 위한 복사본"""
+        return copy.deepcopy(item)
+    
+    @staticmethod
+    def _build_all_items() -> List[Item]:
+        """모든 아이템 정의"""
         items = []
         
         # === 소모품 ===
@@ -2707,11 +2736,8 @@ class ItemDatabase:
     @staticmethod
     def get_item(item_name: str) -> Optional[Item]:
         """이름으로 아이템 검색"""
-        all_items = ItemDatabase.get_all_items()
-        for item in all_items:
-            if item.name == item_name:
-                return item
-        return None
+        item = ItemDatabase._catalog()['by_name'].get(item_name)
+        return ItemDatabase._copy_item(item) if item is not None else None
         items.append(magic_staff)
         
         # 방어구
@@ -2802,8 +2828,9 @@ class ItemDatabase:
                 item.min_level = max(item.min_level, 16)
     
     @staticmethod
-    def get_random_item_by_stage(stage: int) -> Optional[Item]:
-        """스테이지를 고려한 랜덤 아이템 생성 (레벨 제한 포함)"""
+    def get_random_item_by_stage(stage: int, rng: random.Random = None) -> Optional[Item]:
+        """스테이지를 고려한 랜덤 아이템 생성 (레벨 제한 포함, rng: 월드 생성용 난수 스트림)"""
+        rng = rng or random
         # 층수별 아이템 등급 제한
         if stage <= 5:
             # 1~5층: UNCOMMON 이하만 허용
@@ -2817,20 +2844,20 @@ class ItemDatabase:
         
         # 드롭 확률 체크
         drop_chance = DropRateManager.get_drop_chance(stage)
-        if random.random() > drop_chance:
+        if rng.random() > drop_chance:
             return None
             
         # 희귀도 선택
-        target_rarity = DropRateManager.select_rarity_by_stage(stage)
+        target_rarity = DropRateManager.select_rarity_by_stage(stage, rng)
         
         # 층수별 제한 적용
         if max_allowed_rarity and target_rarity.value > max_allowed_rarity.value:
             target_rarity = max_allowed_rarity
         
         # 해당 희귀도의 아이템들 필터링 (레벨 제한 고려)
-        all_items = ItemDatabase.get_all_items()
-        items_by_rarity = [item for item in all_items 
-                          if item.rarity == target_rarity and item.min_level <= stage]
+        catalog_by_rarity = ItemDatabase._catalog()['by_rarity']
+        items_by_rarity = [item for item in catalog_by_rarity.get(target_rarity, [])
+                          if item.min_level <= stage]
         
         # 레벨 제한으로 인해 해당 희귀도 아이템이 없으면 낮은 희귀도로 대체
         if not items_by_rarity:
@@ -2838,8 +2865,8 @@ class ItemDatabase:
             fallback_rarities = [ItemRarity.RARE, ItemRarity.UNCOMMON, ItemRarity.COMMON]
             for fallback_rarity in fallback_rarities:
                 if fallback_rarity.value <= max_allowed_rarity.value:
-                    items_by_rarity = [item for item in all_items 
-                                      if item.rarity == fallback_rarity and item.min_level <= stage]
+                    items_by_rarity = [item for item in catalog_by_rarity.get(fallback_rarity, [])
+                                      if item.min_level <= stage]
                     if items_by_rarity:
                         break
             
@@ -2847,7 +2874,7 @@ class ItemDatabase:
             return None
             
         # 랜덤 선택
-        selected_item = random.choice(items_by_rarity)
+        selected_item = rng.choice(items_by_rarity)
         
         # 아이템 복사본 생성 (원본 보호)
         new_item = Item(
@@ -2899,8 +2926,7 @@ class ItemDatabase:
     def get_special_reward(stage: int) -> Optional[Item]:
         """특수 보상 아이템 (5, 10, 15, 20층 등)"""
         if stage % 20 == 0:  # 20층마다 전설 아이템
-            legendary_items = [item for item in ItemDatabase.get_all_items() 
-                             if item.rarity == ItemRarity.LEGENDARY]
+            legendary_items = ItemDatabase._catalog()['by_rarity'].get(ItemRarity.LEGENDARY, [])
             if legendary_items:
                 selected = random.choice(legendary_items)
                 # 복사본 생성 및 스케일링
@@ -2912,8 +2938,7 @@ class ItemDatabase:
                 return reward
                 
         elif stage % 10 == 0:  # 10층마다 영웅 아이템
-            epic_items = [item for item in ItemDatabase.get_all_items() 
-                         if item.rarity == ItemRarity.EPIC]
+            epic_items = ItemDatabase._catalog()['by_rarity'].get(ItemRarity.EPIC, [])
             if epic_items:
                 selected = random.choice(epic_items)
                 reward = Item(selected.name, selected.item_type, selected.rarity,
@@ -2924,8 +2949,7 @@ class ItemDatabase:
                 return reward
                 
         elif stage % 5 == 0:  # 5층마다 희귀 아이템
-            rare_items = [item for item in ItemDatabase.get_all_items() 
-                         if item.rarity == ItemRarity.RARE]
+            rare_items = ItemDatabase._catalog()['by_rarity'].get(ItemRarity.RARE, [])
             if rare_items:
                 selected = random.choice(rare_items)
                 reward = Item(selected.name, selected.item_type, selected.rarity,
@@ -2940,14 +2964,12 @@ class ItemDatabase:
     @staticmethod
     def get_items_by_rarity(rarity: ItemRarity) -> List[Item]:
         """희귀도별 아이템 목록 반환"""
-        all_items = ItemDatabase.get_all_items()
-        return [item for item in all_items if item.rarity == rarity]
+        return [ItemDatabase._copy_item(item) for item in ItemDatabase._catalog()['by_rarity'].get(rarity, [])]
     
     @staticmethod
     def get_items_by_type(item_type: ItemType) -> List[Item]:
         """타입별 아이템 목록 반환"""
-        all_items = ItemDatabase.get_all_items()
-        return [item for item in all_items if item.item_type == item_type]
+        return [ItemDatabase._copy_item(item) for item in ItemDatabase._catalog()['by_type'].get(item_type, [])]
         items.append(courage_ring)
         
         mystic_orb = Item("신비의 오브", ItemType.ACCESSORY, ItemRarity.UNCOMMON,
@@ -2959,8 +2981,9 @@ class ItemDatabase:
         return items
     
     @staticmethod
-    def get_random_item(rarity_weights: Dict[ItemRarity, float] = None) -> Item:
-        """랜덤 아이템 생성"""
+    def get_random_item(rarity_weights: Dict[ItemRarity, float] = None, rng: random.Random = None) -> Item:
+        """랜덤 아이템 생성 (rng를 주면 그 난수 스트림 사용)"""
+        rng = rng or random
         if rarity_weights is None:
             rarity_weights = {
                 ItemRarity.COMMON: 0.5,
@@ -2973,17 +2996,19 @@ class ItemDatabase:
         # 희귀도 결정
         rarity_list = list(rarity_weights.keys())
         weights = list(rarity_weights.values())
-        selected_rarity = random.choices(rarity_list, weights=weights)[0]
+        selected_rarity = rng.choices(rarity_list, weights=weights)[0]
         
         # 해당 희귀도의 아이템 중 선택
-        all_items = ItemDatabase.get_all_items()
-        items_of_rarity = [item for item in all_items if item.rarity == selected_rarity]
+        catalog = ItemDatabase._catalog()
+        items_of_rarity = catalog['by_rarity'].get(selected_rarity)
         
         if items_of_rarity:
-            return random.choice(items_of_rarity)
+            return ItemDatabase._copy_item(rng.choice(items_of_rarity))
         else:
-            return ItemDatabase.get_all_items()[0]  # 기본 아이템
+            return ItemDatabase._copy_item(catalog['items'][0])  # 기본 아이템
+
 
+register_data_table("items.catalog", ItemDatabase._build_catalog)
 
 class Inventory:
     """인벤토리 클래스 (무게 제한 포함)"""
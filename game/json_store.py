@@ -0,0 +1,208 @@
+"""
+💾 JSON 저장 일괄 처리
+메타 진행/창고/파티 히스토리/요리 레시피/AI 프로필처럼 자주 바뀌는 JSON 파일을 모아서 저장하는 계층
+
+- schedule_json_save(path, provider): 파일을 '변경됨'으로 표시만 하고 바로 반환
+- 마지막 표시 후 DEFAULT_DEBOUNCE_SECONDS 동안 조용하면 저장 (계속 바뀌어도 DEFAULT_MAX_DELAY_SECONDS 안에는 저장)
+- provider는 저장 시점에 호출 - 그 사이 여러 번 바뀐 내용이 한 번의 쓰기로 합쳐짐
+- 임시 파일에 쓰고 os.replace로 교체: 저장 도중 종료되어도 파일이 반쯤 쓰인 채로 남지 않음
+- 들여쓰기 없는 압축 인코딩, 종료 시(atexit) 남은 저장을 모두 반영
+- 파일을 다시 읽기 전에는 flush_json_saves(path)로 대기 중인 저장을 먼저 반영
+- 파일을 지우거나 초기화할 때는 discard_json_save(path)로 대기 중인 저장을 버림 (지운 뒤 옛 데이터가 다시 써지지 않도록)
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_DEBOUNCE_SECONDS = 1.0    # 마지막 변경 후 이만큼 조용하면 저장
+DEFAULT_MAX_DELAY_SECONDS = 5.0   # 계속 변경되어도 첫 변경 후 이 시간 안에는 저장
+
+
+def write_json_atomic(path, data: Any, default: Optional[Callable] = None):
+    """JSON을 임시 파일에 쓴 뒤 원자적으로 교체 (압축 인코딩)"""
+    path = os.fspath(path)
+    text = json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=default)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class _PendingSave:
+    __slots__ = ('provider', 'default', 'first_marked', 'last_marked')
+
+    def __init__(self, provider: Callable[[], Any], default: Optional[Callable], now: float):
+        self.provider = provider
+        self.default = default
+        self.first_marked = now
+        self.last_marked = now
+
+
+class JsonWriter:
+    """파일별 변경 표시 + 디바운스된 백그라운드 저장"""
+
+    def __init__(self, debounce: float = DEFAULT_DEBOUNCE_SECONDS, max_delay: float = DEFAULT_MAX_DELAY_SECONDS):
+        self.debounce = debounce
+        self.max_delay = max_delay
+
+        self._pending: Dict[str, _PendingSave] = {}
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()      # 같은 파일을 두 스레드가 동시에 쓰지 않도록
+        self._writer: Optional[threading.Thread] = None
+
+        self.last_error: Optional[Exception] = None
+        self.stats = {'marks': 0, 'writes': 0, 'errors': 0}
+
+    @staticmethod
+    def _key(path) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    # =====================================
+    # 변경 표시
+    # =====================================
+
+    def mark_dirty(self, path, provider: Callable[[], Any], default: Optional[Callable] = None):
+        """저장 예약 - provider()가 저장 시점의 데이터를 돌려줌"""
+        key = self._key(path)
+        now = time.monotonic()
+        with self._condition:
+            entry = self._pending.get(key)
+            if entry is None:
+                self._pending[key] = _PendingSave(provider, default, now)
+            else:
+                entry.provider = provider
+                entry.default = default
+                entry.last_marked = now
+            self.stats['marks'] += 1
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="JsonWriter", daemon=True)
+                self._writer.start()
+            self._condition.notify_all()
+
+    def discard(self, path) -> bool:
+        """대기 중인 저장 취소 (쓰는 중이면 끝날 때까지 기다린 뒤 취소) - 취소한 저장이 있었으면 True"""
+        key = self._key(path)
+        with self._write_lock:
+            with self._condition:
+                return self._pending.pop(key, None) is not None
+
+    def is_dirty(self, path) -> bool:
+        return self._key(path) in self._pending
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _due_time(self, entry: _PendingSave) -> float:
+        return min(entry.last_marked + self.debounce, entry.first_marked + self.max_delay)
+
+    # =====================================
+    # 저장
+    # =====================================
+
+    def flush(self, path=None) -> bool:
+        """대기 중인 저장을 호출 스레드에서 바로 반영 (path가 없으면 전부, writer가 쓰는 중이면 끝날 때까지 대기)"""
+        keys = None if path is None else [self._key(path)]
+        return self._write_pending(keys)
+
+    def _write_pending(self, keys) -> bool:
+        # 꺼내기와 쓰기를 같은 잠금 안에서 - flush가 반환되면 파일에 이미 반영되어 있음
+        with self._write_lock:
+            with self._condition:
+                if keys is None:
+                    keys = list(self._pending)
+                entries = [(key, self._pending.pop(key)) for key in keys if key in self._pending]
+            ok = True
+            for key, entry in entries:
+                ok = self._write_entry(key, entry) and ok
+            return ok
+
+    def _write_entry(self, key: str, entry: _PendingSave) -> bool:
+        try:
+            write_json_atomic(key, entry.provider(), default=entry.default)
+            self.stats['writes'] += 1
+            return True
+        except RuntimeError as e:
+            # 직렬화 도중 다른 스레드가 데이터를 바꾼 경우 - 다음 기회에 다시 저장
+            self.last_error = e
+            with self._condition:
+                if key not in self._pending:
+                    entry.first_marked = entry.last_marked = time.monotonic()
+                    self._pending[key] = entry
+                    self._condition.notify_all()
+            return False
+        except Exception as e:
+            self.last_error = e
+            self.stats['errors'] += 1
+            print(f"⚠️ 저장 실패 ({os.path.basename(key)}): {e}")
+            return False
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    due = [key for key, entry in self._pending.items() if self._due_time(entry) <= now]
+                    if due:
+                        break
+                    if self._pending:
+                        timeout = min(self._due_time(entry) for entry in self._pending.values()) - now
+                    else:
+                        timeout = None
+                    self._condition.wait(timeout)
+            self._write_pending(due)
+
+
+_json_writer: Optional[JsonWriter] = None
+_json_writer_lock = threading.Lock()
+
+
+def get_json_writer() -> JsonWriter:
+    """전역 JSON 저장기 가져오기"""
+    global _json_writer
+    if _json_writer is None:
+        with _json_writer_lock:
+            if _json_writer is None:
+                _json_writer = JsonWriter()
+    return _json_writer
+
+
+def schedule_json_save(path, provider: Callable[[], Any], default: Optional[Callable] = None):
+    """JSON 파일 저장 예약 (디바운스 후 한 번에 저장)"""
+    get_json_writer().mark_dirty(path, provider, default)
+
+
+def flush_json_saves(path=None) -> bool:
+    """대기 중인 JSON 저장 즉시 반영 - 파일을 다시 읽기 전이나 종료 전에 호출"""
+    if _json_writer is None:
+        return True
+    return _json_writer.flush(path)
+
+
+def discard_json_save(path) -> bool:
+    """대기 중인 JSON 저장 취소 - 파일을 지우거나 초기화하기 전에 호출"""
+    if _json_writer is None:
+        return False
+    return _json_writer.discard(path)
+
+
+@atexit.register
+def _flush_on_exit():
+    # writer는 데몬 스레드라서 종료 전에 남은 저장을 반영
+    flush_json_saves()
@@ -0,0 +1,379 @@
+"""
+⏳ 지연 로딩 / 서비스 로케이터 / 시작 시간 측정
+무거운 모듈과 서브시스템을 첫 사용 시점(또는 타이틀 메뉴 표시 후 백그라운드)에 로드해
+게임 시작을 빠르게 함
+
+이 모듈은 표준 라이브러리만 사용 (main.py 최상단에서 가장 먼저 import됨)
+"""
+
+import sys
+import time
+import importlib
+import importlib.abc
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+_PROCESS_START = time.perf_counter()
+
+
+# =====================================
+# 📦 지연 모듈 / 함수
+# =====================================
+
+class LazyModule:
+    """속성에 처음 접근할 때 import되는 모듈 프록시"""
+
+    def __init__(self, module_name: str, fallback: Callable[[], Any] = None):
+        self.__dict__['_module_name'] = module_name
+        self.__dict__['_fallback'] = fallback
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            try:
+                module = importlib.import_module(self._module_name)
+            except ImportError:
+                if self._fallback is None:
+                    raise
+                module = self._fallback()
+            self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__['_module'] is not None
+
+    def __repr__(self):
+        state = "로드됨" if self.is_loaded else "대기"
+        return f"<LazyModule {self._module_name} ({state})>"
+
+
+def lazy_import(module_name: str, fallback: Callable[[], Any] = None) -> LazyModule:
+    """import 문 대신 사용 - 실제 로드는 첫 속성 접근 시"""
+    return LazyModule(module_name, fallback)
+
+
+def lazy_function(module_name: str, attr_name: str, fallback: Callable = None,
+                  error_message: str = None) -> Callable:
+    """모듈 함수를 첫 호출 시 import하는 래퍼
+
+    import 실패 시 error_message를 한 번 출력하고 fallback(없으면 None 반환)을 사용.
+    """
+    resolved = []
+
+    def wrapper(*args, **kwargs):
+        if not resolved:
+            try:
+                resolved.append(getattr(importlib.import_module(module_name), attr_name))
+            except (ImportError, AttributeError):
+                if error_message:
+                    print(error_message)
+                resolved.append(fallback or (lambda *a, **kw: None))
+        return resolved[0](*args, **kwargs)
+
+    wrapper.__name__ = attr_name
+    wrapper.__qualname__ = attr_name
+    wrapper.__doc__ = f"{module_name}.{attr_name} (지연 로드)"
+    return wrapper
+
+
+class LazyValueDict(Mapping):
+    """키는 미리 알고 값은 첫 조회 시 만드는 딕셔너리 (예: 디코딩된 효과음)
+
+    로더가 예외를 던지면 해당 키를 제거하고 KeyError로 알림.
+    """
+
+    def __init__(self, loaders: Dict[Any, Callable[[], Any]] = None):
+        self._loaders: Dict[Any, Callable[[], Any]] = dict(loaders or {})
+        self._values: Dict[Any, Any] = {}
+        self._lock = threading.RLock()
+
+    def set_loader(self, key, loader: Callable[[], Any]):
+        with self._lock:
+            self._loaders[key] = loader
+            self._values.pop(key, None)
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            loader = self._loaders[key]
+            try:
+                value = loader()
+            except Exception as e:
+                del self._loaders[key]
+                raise KeyError(key) from e
+            self._values[key] = value
+            return value
+
+    def __contains__(self, key):
+        return key in self._loaders
+
+    def __iter__(self):
+        return iter(list(self._loaders))
+
+    def __len__(self):
+        return len(self._loaders)
+
+    @property
+    def loaded_count(self) -> int:
+        return len(self._values)
+
+    def warm(self, keys: Iterable = None) -> int:
+        """값 미리 만들기 (백그라운드 워밍업용)"""
+        loaded = 0
+        for key in list(self._loaders if keys is None else keys):
+            try:
+                self[key]
+                loaded += 1
+            except KeyError:
+                pass
+        return loaded
+
+
+# =====================================
+# 🧭 서비스 로케이터
+# =====================================
+
+class ServiceLocator:
+    """이름 → 팩토리 등록, 첫 사용 시 생성 (스레드 안전)"""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._warm_up: List[str] = []
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+        self._warm_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, factory: Callable[[], Any], warm_up: bool = True):
+        """warm_up=True면 warm_up_in_background()에서 미리 생성"""
+        with self._registry_lock:
+            self._factories[name] = factory
+            self._locks.setdefault(name, threading.Lock())
+            self._instances.pop(name, None)
+            if warm_up and name not in self._warm_up:
+                self._warm_up.append(name)
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._factories
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def get(self, name: str):
+        try:
+            return self._instances[name]
+        except KeyError:
+            pass
+        with self._locks[name]:
+            if name not in self._instances:
+                with get_startup_profiler().phase(f"서비스:{name}"):
+                    self._instances[name] = self._factories[name]()
+        return self._instances[name]
+
+    def warm_up_in_background(self, names: Iterable[str] = None, delay: float = 0.0) -> Optional[threading.Thread]:
+        """아직 생성되지 않은 서비스를 데몬 스레드에서 미리 생성 (delay초 후 시작 - 메뉴 렌더링 우선)"""
+        if self._warm_thread is not None and self._warm_thread.is_alive():
+            return self._warm_thread
+        pending = [n for n in (self._warm_up if names is None else names)
+                   if n in self._factories and n not in self._instances]
+        if not pending:
+            return None
+
+        def warm():
+            if delay > 0:
+                time.sleep(delay)
+            for service_name in pending:
+                try:
+                    self.get(service_name)
+                except Exception:
+                    pass  # 실제 사용 시점에 다시 시도/보고
+
+        self._warm_thread = threading.Thread(target=warm, name="ServiceWarmUp", daemon=True)
+        self._warm_thread.start()
+        return self._warm_thread
+
+
+class LazyService:
+    """클래스 속성으로 선언하면 인스턴스의 services(ServiceLocator)에서 첫 접근 시 생성
+
+    비데이터 디스크립터라서 한 번 조회되거나 직접 대입되면 인스턴스 속성이 우선함.
+    """
+
+    def __init__(self, service_name: str = None):
+        self.service_name = service_name
+
+    def __set_name__(self, owner, name):
+        if self.service_name is None:
+            self.service_name = name
+        self.attr_name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        services = instance.__dict__.get('services')
+        if services is None or not services.is_registered(self.service_name):
+            raise AttributeError(self.attr_name)
+        value = services.get(self.service_name)
+        instance.__dict__[self.attr_name] = value
+        return value
+
+
+# =====================================
+# ⏱️ 시작 시간 측정 (-X importtime 형식)
+# =====================================
+
+class _TimingLoader(importlib.abc.Loader):
+    """exec_module 시간을 측정하는 로더 래퍼"""
+
+    def __init__(self, loader, profiler: 'StartupProfiler'):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._import_started(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._import_finished(module.__name__)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, profiler: 'StartupProfiler'):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimingLoader(spec.loader, self._profiler)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """모듈 import 시간과 시작 단계별 시간 기록"""
+
+    def __init__(self):
+        self.enabled = False
+        self.imports: List[tuple] = []      # (이름, 깊이, self초, 누적초) - 완료 순서
+        self.phases: List[tuple] = []       # (이름, 초)
+        self.marks: List[tuple] = []        # (이름, 프로세스 시작 후 초)
+        self._import_stack: List[list] = []
+        self._finder: Optional[_TimingFinder] = None
+        self._lock = threading.Lock()
+
+    def install_import_hook(self):
+        """이후의 모든 import 시간을 기록 (리포트용, 기본 비활성화)"""
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+        self.enabled = True
+
+    def uninstall_import_hook(self):
+        if self._finder is not None and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def _import_started(self, name: str):
+        if threading.current_thread() is threading.main_thread():
+            self._import_stack.append([name, time.perf_counter(), 0.0])
+
+    def _import_finished(self, name: str):
+        if threading.current_thread() is not threading.main_thread() or not self._import_stack:
+            return
+        entry_name, started, child_seconds = self._import_stack.pop()
+        cumulative = time.perf_counter() - started
+        if self._import_stack:
+            self._import_stack[-1][2] += cumulative
+        self.imports.append((entry_name, len(self._import_stack), cumulative - child_seconds, cumulative))
+
+    def phase(self, name: str):
+        """with profiler.phase("게임 초기화"): ... - 비활성화 시 빈 컨텍스트"""
+        return _PhaseTimer(self, name) if self.enabled else _NULL_PHASE
+
+    def mark(self, name: str):
+        """프로세스 시작 후 경과 시간 표시 (예: 타이틀 메뉴 표시)"""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter() - _PROCESS_START))
+
+    def report(self, top: int = 25) -> str:
+        lines = ["⏱️ 시작 시간 리포트", "=" * 70]
+        for name, elapsed in self.marks:
+            lines.append(f"📍 {name:<40} {elapsed * 1000:>10.1f} ms")
+        if self.phases:
+            lines.append("-" * 70)
+            for name, seconds in self.phases:
+                lines.append(f"🔧 {name:<40} {seconds * 1000:>10.1f} ms")
+        if self.imports:
+            lines.append("-" * 70)
+            lines.append(f"{'import (누적 상위)':<44}{'self ms':>12}{'누적 ms':>12}")
+            for name, depth, self_s, cumulative in sorted(self.imports, key=lambda i: i[3], reverse=True)[:top]:
+                lines.append(f"{'  ' * min(depth, 6) + name:<44}{self_s * 1000:>12.1f}{cumulative * 1000:>12.1f}")
+            total = sum(i[2] for i in self.imports)
+            lines.append(f"{'총 import 시간 (' + str(len(self.imports)) + '개 모듈)':<44}{total * 1000:>12.1f}")
+        lines.append("=" * 70)
+        return "\n".join(lines)
+
+
+class _PhaseTimer:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: StartupProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self.profiler._lock:
+            self.profiler.phases.append((self.name, time.perf_counter() - self.start))
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+# 전역 시작 시간 측정기
+_startup_profiler = None
+
+def get_startup_profiler() -> StartupProfiler:
+    """전역 시작 시간 측정기 가져오기"""
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler()
+    return _startup_profiler
@@ -5,7 +5,9 @@
 2025년 8월 11일 구현
 """
 
+import math
 import random
+from collections import OrderedDict, deque
 from typing import List, Tuple, Dict, Optional, Set
 from enum import Enum
 from dataclasses import dataclass
@@ -42,6 +44,25 @@ except ImportError:
     Character = None
     AICharacterProfile = None
 
+SCAN_HISTORY_LIMIT = 32   # 보관할 최근 스캔 결과 수
+SCAN_CACHE_LIMIT = 64     # (위치, 범위, 시야, 맵 버전)별 스캔 결과 캐시 크기
+
+# 타일 문자 -> 타일 타입 이름
+TILE_TYPE_BY_CHAR = {
+    "#": "WALL", ".": "FLOOR", "+": "DOOR", "&": "LOCKED_DOOR",
+    "?": "SECRET_DOOR", "<": "STAIRS_UP", ">": "STAIRS_DOWN",
+    "@": "PLAYER", "E": "ENEMY", "♔": "BOSS", "!": "ITEM",
+    "$": "TREASURE", "=": "CHEST", "^": "TRAP", "/": "LEVER",
+    "T": "ALTAR", "~": "FOUNTAIN", "B": "BOOKSHELF", "F": "FORGE",
+    "G": "GARDEN", "*": "CRYSTAL", "X": "CURSED_ALTAR", "P": "POISON_CLOUD",
+    "O": "DARK_PORTAL", "C": "CURSED_CHEST", "U": "UNSTABLE_FLOOR"
+}
+
+# 스캔할 필요 없는 타일 문자 (벽/바닥/미탐험/어둠)
+_PLAIN_TILE_CHARS = frozenset(["#", ".", " ", "·"])
+
+ENEMY_TILE_TYPES = ("ENEMY", "BOSS")
+
 class ScanRange(Enum):
     """스캔 범위"""
     CLOSE = 3      # 근거리 (3x3)
@@ -65,6 +86,33 @@ class ActionPriority(Enum):
     LOW = "낮음"
     OPTIONAL = "선택"
 
+# 타일 타입 -> (설명, 필요 스킬, 위험도, 보상)
+TILE_INFO = {
+    "DOOR": ("문", None, ThreatLevel.SAFE, None),
+    "LOCKED_DOOR": ("잠긴 문", "자물쇠해제", ThreatLevel.LOW, "통로 개방"),
+    "SECRET_DOOR": ("비밀 문", "탐지 스킬", ThreatLevel.SAFE, "숨겨진 통로"),
+    "STAIRS_UP": ("위층 계단", None, ThreatLevel.SAFE, "상층 이동"),
+    "STAIRS_DOWN": ("아래층 계단", None, ThreatLevel.SAFE, "하층 이동"),
+    "ENEMY": ("적", None, ThreatLevel.HIGH, "경험치/아이템"),
+    "BOSS": ("보스", None, ThreatLevel.CRITICAL, "희귀 아이템"),
+    "ITEM": ("아이템", None, ThreatLevel.SAFE, "장비/소모품"),
+    "TREASURE": ("보물", None, ThreatLevel.SAFE, "귀중품"),
+    "CHEST": ("보물상자", "자물쇠해제", ThreatLevel.SAFE, "다량의 아이템"),
+    "TRAP": ("함정", "함정감지", ThreatLevel.MEDIUM, "함정 해제 후 보상"),
+    "LEVER": ("레버", "기계조작", ThreatLevel.SAFE, "숨겨진 통로/보물"),
+    "ALTAR": ("신성한 제단", "신성마법", ThreatLevel.SAFE, "축복 효과"),
+    "FOUNTAIN": ("치유의 샘", None, ThreatLevel.SAFE, "체력/마나 회복"),
+    "BOOKSHELF": ("고대 서적", "지식탐구", ThreatLevel.SAFE, "새로운 지식"),
+    "FORGE": ("마법 대장간", "기계조작", ThreatLevel.SAFE, "장비 강화"),
+    "GARDEN": ("신비한 정원", "자연친화", ThreatLevel.SAFE, "특수 재료"),
+    "CRYSTAL": ("마법 수정", "정령술", ThreatLevel.SAFE, "마나 충전"),
+    "CURSED_ALTAR": ("저주받은 제단", "신성마법", ThreatLevel.HIGH, "정화 후 강력한 축복"),
+    "POISON_CLOUD": ("독성 구름", "자연친화", ThreatLevel.MEDIUM, "중화 후 안전 통로"),
+    "DARK_PORTAL": ("어둠의 포털", "정령술", ThreatLevel.HIGH, "차단 후 마법 에너지"),
+    "CURSED_CHEST": ("저주받은 상자", "신성마법", ThreatLevel.MEDIUM, "정화 후 희귀 아이템"),
+    "UNSTABLE_FLOOR": ("불안정한 바닥", "기계조작", ThreatLevel.MEDIUM, "보강 후 안전 통로")
+}
+
 @dataclass
 class MapObject:
     """맵 객체 정보"""
@@ -95,7 +143,8 @@ class MapScanner:
         self.world = world
         self.party_members = party_members
         self.last_scan_position = None
-        self.scan_history = []
+        self.scan_history = deque(maxlen=SCAN_HISTORY_LIMIT)
+        self._scan_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
         self.discovered_objects = []
         self.tactical_memory = []
         
@@ -132,8 +181,12 @@ class MapScanner:
     
     def scan_area(self, center_pos: Tuple[int, int], scan_range: ScanRange = ScanRange.MEDIUM, 
                   vision_range: int = None) -> Dict:
-        """지정된 범위 내 맵 스캔 (시야 시스템 기반)"""
-        if not self.world or not self.world.current_map:
+        """지정된 범위 내 맵 스캔 (시야 시스템 기반)
+        
+        월드의 시야 좌표(visible_cells)와 적/아이템 위치 목록에서 관심 있는 칸만 골라 분석하고,
+        같은 (위치, 범위, 시야, 맵 버전)의 결과는 캐시에서 돌려줍니다.
+        """
+        if not self.world or not (hasattr(self.world, 'visible_cells') or getattr(self.world, 'current_map', None)):
             return {"error": "맵 정보를 찾을 수 없습니다"}
         
         # 실제 시야 범위 확인
@@ -143,10 +196,17 @@ class MapScanner:
             else:
                 vision_range = 3  # 기본 시야 범위
         
-        x, y = center_pos
         # 스캔 범위를 시야 범위로 제한
         radius = min(scan_range.value, vision_range)
         
+        cache_key = self._scan_cache_key(center_pos, scan_range, vision_range)
+        if cache_key is not None and cache_key in self._scan_cache:
+            self._scan_cache.move_to_end(cache_key)
+            scan_results = self._copy_scan_results(self._scan_cache[cache_key])
+            self.last_scan_position = center_pos
+            self.scan_history.append(scan_results)
+            return scan_results
+        
         scan_results = {
             "scan_center": center_pos,
             "scan_range": scan_range.name,
@@ -162,40 +222,22 @@ class MapScanner:
         
         log_system("맵스캔", f"위치 {center_pos}에서 시야 {vision_range}, 스캔 {radius} 범위 스캔 시작")
         
-        # 스캔 범위 내 모든 타일 조사 (시야 범위 내에서만)
-        for scan_x in range(x - radius, x + radius + 1):
-            for scan_y in range(y - radius, y + radius + 1):
-                if self._is_valid_position(scan_x, scan_y):
-                    # 유클리드 거리로 원형 시야 구현
-                    dx, dy = scan_x - x, scan_y - y
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    
-                    # 시야 범위를 벗어나면 스킵
-                    if distance > vision_range:
-                        continue
-                    
-                    # 타일이 실제로 보이는지 확인
-                    if hasattr(self.world, 'tiles') and self.world.tiles:
-                        try:
-                            if not self.world.tiles[scan_y][scan_x].visible:
-                                continue  # 보이지 않는 타일은 스캔하지 않음
-                        except (IndexError, AttributeError):
-                            pass  # 시야 시스템이 없으면 계속 진행
-                    
-                    tile_info = self._analyze_tile(scan_x, scan_y, int(distance))
-                    
-                    if tile_info:
-                        scan_results["objects_found"].append(tile_info)
-                        
-                        # 카테고리별 분류
-                        if tile_info.tile_type in [TileType.ENEMY, TileType.BOSS]:
-                            scan_results["enemies_detected"].append(tile_info)
-                        elif tile_info.interaction_required:
-                            scan_results["interactive_objects"].append(tile_info)
-                        elif tile_info.threat_level != ThreatLevel.SAFE:
-                            scan_results["hazards"].append(tile_info)
-                        elif tile_info.potential_reward:
-                            scan_results["opportunities"].append(tile_info)
+        # 시야 안의 관심 있는 칸만 분석 (좌표 순으로 정렬해 결과 순서 고정)
+        for (scan_x, scan_y), distance_sq, tile_char in sorted(self._collect_candidates(center_pos, radius, vision_range)):
+            tile_info = self._classify_tile(scan_x, scan_y, tile_char, math.isqrt(distance_sq))
+            
+            if tile_info:
+                scan_results["objects_found"].append(tile_info)
+                
+                # 카테고리별 분류
+                if tile_info.tile_type in ENEMY_TILE_TYPES:
+                    scan_results["enemies_detected"].append(tile_info)
+                elif tile_info.interaction_required:
+                    scan_results["interactive_objects"].append(tile_info)
+                elif tile_info.threat_level != ThreatLevel.SAFE:
+                    scan_results["hazards"].append(tile_info)
+                elif tile_info.potential_reward:
+                    scan_results["opportunities"].append(tile_info)
         
         # 전술적 제안 생성
         scan_results["tactical_suggestions"] = self._generate_tactical_suggestions(scan_results)
@@ -203,36 +245,118 @@ class MapScanner:
         # 스캔 결과 저장
         self.last_scan_position = center_pos
         self.scan_history.append(scan_results)
+        if cache_key is not None:
+            self._scan_cache[cache_key] = self._copy_scan_results(scan_results)
+            if len(self._scan_cache) > SCAN_CACHE_LIMIT:
+                self._scan_cache.popitem(last=False)
         
         log_system("맵스캔", f"스캔 완료: 객체 {len(scan_results['objects_found'])}개, 적 {len(scan_results['enemies_detected'])}개, 상호작용 객체 {len(scan_results['interactive_objects'])}개 발견")
         
         return scan_results
     
+    def _scan_cache_key(self, center_pos: Tuple[int, int], scan_range: ScanRange, vision_range: int) -> Optional[tuple]:
+        """스캔 캐시 키 - 맵 버전을 알 수 없는 월드는 캐시하지 않음"""
+        if not hasattr(self.world, 'get_scan_version'):
+            return None
+        party_key = tuple(id(member) for member in self.party_members or ())
+        return (tuple(center_pos), scan_range, vision_range, self.world.get_scan_version(), party_key)
+    
+    @staticmethod
+    def _copy_scan_results(scan_results: Dict) -> Dict:
+        """호출한 쪽이 목록을 정렬/수정해도 캐시가 바뀌지 않도록 목록만 복사"""
+        return {key: list(value) if isinstance(value, list) else value for key, value in scan_results.items()}
+    
+    def _collect_candidates(self, center_pos: Tuple[int, int], radius: int, vision_range: int):
+        """스캔 범위 안에서 보이는 관심 칸 -> [(좌표, 거리², 타일 문자)]"""
+        x, y = center_pos
+        vision_sq = vision_range * vision_range
+        
+        def in_range(pos) -> Optional[int]:
+            dx, dy = pos[0] - x, pos[1] - y
+            if abs(dx) > radius or abs(dy) > radius:
+                return None
+            distance_sq = dx * dx + dy * dy
+            return distance_sq if distance_sq <= vision_sq else None
+        
+        visible_cells = getattr(self.world, 'visible_cells', None)
+        tiles = getattr(self.world, 'tiles', None)
+        if visible_cells is None or not tiles:
+            return self._collect_candidates_from_char_map(center_pos, radius, vision_sq)
+        
+        # 1) 지형: 시야 안 칸 중 벽/바닥이 아닌 것만
+        found = {}
+        for pos in visible_cells:
+            distance_sq = in_range(pos)
+            if distance_sq is None:
+                continue
+            tile = tiles[pos[1]][pos[0]]
+            tile_type = getattr(tile, 'type', None)
+            if tile_type is not None and getattr(tile_type, 'value', None) in _PLAIN_TILE_CHARS:
+                continue
+            tile_char = tile.get_display_char()
+            if tile_char not in _PLAIN_TILE_CHARS:
+                found[pos] = (distance_sq, tile_char)
+        
+        # 2) 아이템/적 위치 목록 (화면 표시와 같은 우선순위: 적 > 아이템 > 지형)
+        for pos in getattr(self.world, 'items_positions', ()):
+            if pos in visible_cells:
+                distance_sq = in_range(pos)
+                if distance_sq is not None:
+                    found[pos] = (distance_sq, "!")
+        floor_enemies = getattr(self.world, 'floor_enemies', {}) or {}
+        for pos in getattr(self.world, 'enemies_positions', ()):
+            pos = tuple(pos)
+            if pos in visible_cells:
+                distance_sq = in_range(pos)
+                if distance_sq is not None:
+                    enemy_data = floor_enemies.get(pos)
+                    is_boss = isinstance(enemy_data, dict) and enemy_data.get('is_boss', False)
+                    found[pos] = (distance_sq, "♔" if is_boss else "E")
+        
+        return [(pos, distance_sq, tile_char) for pos, (distance_sq, tile_char) in found.items()]
+    
+    def _collect_candidates_from_char_map(self, center_pos: Tuple[int, int], radius: int, vision_sq: int):
+        """시야 좌표가 없는 문자 맵(current_map[x][y]) 월드용 - 범위 사각형을 직접 조사"""
+        x, y = center_pos
+        tiles = getattr(self.world, 'tiles', None)
+        candidates = []
+        for scan_x in range(x - radius, x + radius + 1):
+            for scan_y in range(y - radius, y + radius + 1):
+                if not self._is_valid_position(scan_x, scan_y):
+                    continue
+                dx, dy = scan_x - x, scan_y - y
+                distance_sq = dx * dx + dy * dy
+                if distance_sq > vision_sq:
+                    continue
+                tile_char = self.world.current_map[scan_x][scan_y]
+                if tile_char in _PLAIN_TILE_CHARS:
+                    continue
+                # 타일이 실제로 보이는지 확인
+                if tiles:
+                    try:
+                        if not tiles[scan_y][scan_x].visible:
+                            continue
+                    except (IndexError, AttributeError):
+                        pass  # 시야 시스템이 없으면 계속 진행
+                candidates.append(((scan_x, scan_y), distance_sq, tile_char))
+        return candidates
+    
     def _is_valid_position(self, x: int, y: int) -> bool:
         """유효한 위치인지 확인"""
-        if not self.world or not self.world.current_map:
+        current_map = getattr(self.world, 'current_map', None) if self.world else None
+        if not current_map:
             return False
-        return 0 <= x < len(self.world.current_map) and 0 <= y < len(self.world.current_map[0])
+        return 0 <= x < len(current_map) and 0 <= y < len(current_map[0])
     
     def _analyze_tile(self, x: int, y: int, distance: int) -> Optional[MapObject]:
         """특정 타일 분석"""
         if not self._is_valid_position(x, y):
             return None
-        
-        tile_char = self.world.current_map[x][y]
-        
-        # 타일 타입 결정 (문자 -> TileType 매핑)
-        tile_type_map = {
-            "#": "WALL", ".": "FLOOR", "+": "DOOR", "&": "LOCKED_DOOR",
-            "?": "SECRET_DOOR", "<": "STAIRS_UP", ">": "STAIRS_DOWN",
-            "@": "PLAYER", "E": "ENEMY", "♔": "BOSS", "!": "ITEM",
-            "$": "TREASURE", "=": "CHEST", "^": "TRAP", "/": "LEVER",
-            "T": "ALTAR", "~": "FOUNTAIN", "B": "BOOKSHELF", "F": "FORGE",
-            "G": "GARDEN", "*": "CRYSTAL", "X": "CURSED_ALTAR", "P": "POISON_CLOUD",
-            "O": "DARK_PORTAL", "C": "CURSED_CHEST", "U": "UNSTABLE_FLOOR"
-        }
-        
-        tile_type_str = tile_type_map.get(tile_char)
+        return self._classify_tile(x, y, self.world.current_map[x][y], distance)
+    
+    def _classify_tile(self, x: int, y: int, tile_char: str, distance: int) -> Optional[MapObject]:
+        """타일 문자 -> 맵 객체 (일반 벽/바닥은 None)"""
+        tile_type_str = TILE_TYPE_BY_CHAR.get(tile_char)
         if not tile_type_str or tile_type_str in ["WALL", "FLOOR"]:
             return None  # 일반 벽이나 바닥은 무시
         
@@ -251,33 +375,7 @@ class MapScanner:
     
     def _get_tile_info(self, tile_type: str) -> Tuple[str, str, ThreatLevel, str]:
         """타일 타입별 정보 반환"""
-        tile_info = {
-            "DOOR": ("문", None, ThreatLevel.SAFE, None),
-            "LOCKED_DOOR": ("잠긴 문", "자물쇠해제", ThreatLevel.LOW, "통로 개방"),
-            "SECRET_DOOR": ("비밀 문", "탐지 스킬", ThreatLevel.SAFE, "숨겨진 통로"),
-            "STAIRS_UP": ("위층 계단", None, ThreatLevel.SAFE, "상층 이동"),
-            "STAIRS_DOWN": ("아래층 계단", None, ThreatLevel.SAFE, "하층 이동"),
-            "ENEMY": ("적", None, ThreatLevel.HIGH, "경험치/아이템"),
-            "BOSS": ("보스", None, ThreatLevel.CRITICAL, "희귀 아이템"),
-            "ITEM": ("아이템", None, ThreatLevel.SAFE, "장비/소모품"),
-            "TREASURE": ("보물", None, ThreatLevel.SAFE, "귀중품"),
-            "CHEST": ("보물상자", "자물쇠해제", ThreatLevel.SAFE, "다량의 아이템"),
-            "TRAP": ("함정", "함정감지", ThreatLevel.MEDIUM, "함정 해제 후 보상"),
-            "LEVER": ("레버", "기계조작", ThreatLevel.SAFE, "숨겨진 통로/보물"),
-            "ALTAR": ("신성한 제단", "신성마법", ThreatLevel.SAFE, "축복 효과"),
-            "FOUNTAIN": ("치유의 샘", None, ThreatLevel.SAFE, "체력/마나 회복"),
-            "BOOKSHELF": ("고대 서적", "지식탐구", ThreatLevel.SAFE, "새로운 지식"),
-            "FORGE": ("마법 대장간", "기계조작", ThreatLevel.SAFE, "장비 강화"),
-            "GARDEN": ("신비한 정원", "자연친화", ThreatLevel.SAFE, "특수 재료"),
-            "CRYSTAL": ("마법 수정", "정령술", ThreatLevel.SAFE, "마나 충전"),
-            "CURSED_ALTAR": ("저주받은 제단", "신성마법", ThreatLevel.HIGH, "정화 후 강력한 축복"),
-            "POISON_CLOUD": ("독성 구름", "자연친화", ThreatLevel.MEDIUM, "중화 후 안전 통로"),
-            "DARK_PORTAL": ("어둠의 포털", "정령술", ThreatLevel.HIGH, "차단 후 마법 에너지"),
-            "CURSED_CHEST": ("저주받은 상자", "신성마법", ThreatLevel.MEDIUM, "정화 후 희귀 아이템"),
-            "UNSTABLE_FLOOR": ("불안정한 바닥", "기계조작", ThreatLevel.MEDIUM, "보강 후 안전 통로")
-        }
-        
-        info = tile_info.get(tile_type, ("알 수 없는 객체", None, ThreatLevel.SAFE, None))
+        info = TILE_INFO.get(tile_type, ("알 수 없는 객체", None, ThreatLevel.SAFE, None))
         return info[0], info[1], info[2], info[3]
     
     def _generate_tactical_suggestions(self, scan_results: Dict) -> List[TacticalSuggestion]:
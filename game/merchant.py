@@ -3,13 +3,68 @@
 상인 및 상점 시스템
 """
 
+import hashlib
 import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Dict, Tuple
 from game.items import Item, ItemDatabase, ItemType, ItemRarity
 from game.ui_formatters import format_item_brief
 from game.character import Character
 
 
+# =====================================
+# 💰 강화/리롤 비용표 (희귀도 등급 × 강화 단계로 미리 계산)
+# =====================================
+
+MAX_ENHANCEMENT_LEVEL = 15   # unified_equipment_system의 기본 최대 강화 단계
+
+ENHANCEMENT_BASE_COST = 100
+ENHANCEMENT_RARITY_MULTIPLIER = {
+    'COMMON': 1.0,
+    'UNCOMMON': 1.5,
+    'RARE': 2.0,
+    'EPIC': 3.0,
+    'LEGENDARY': 5.0
+}
+
+REROLL_BASE_COST = 200
+REROLL_RARITY_MULTIPLIER = {
+    'COMMON': 1.0,
+    'UNCOMMON': 1.5,
+    'RARE': 2.5,
+    'EPIC': 4.0,
+    'LEGENDARY': 7.0
+}
+
+
+def _enhancement_cost(rarity_multiplier: float, level: int) -> int:
+    return int(ENHANCEMENT_BASE_COST * (level + 1) ** 2 * rarity_multiplier)
+
+
+def _reroll_cost(rarity_multiplier: float, level: int) -> int:
+    return int(REROLL_BASE_COST * (1.0 + level * 0.5) * rarity_multiplier)
+
+
+# 희귀도 이름 -> [강화 단계별 비용]
+ENHANCEMENT_COST_TABLE = {
+    rarity: [_enhancement_cost(multiplier, level) for level in range(MAX_ENHANCEMENT_LEVEL + 1)]
+    for rarity, multiplier in ENHANCEMENT_RARITY_MULTIPLIER.items()
+}
+REROLL_COST_TABLE = {
+    rarity: [_reroll_cost(multiplier, level) for level in range(MAX_ENHANCEMENT_LEVEL + 1)]
+    for rarity, multiplier in REROLL_RARITY_MULTIPLIER.items()
+}
+
+
+def _lookup_cost(table: Dict[str, List[int]], multipliers: Dict[str, float], formula, rarity_name: str, level: int) -> int:
+    """비용표 조회 (표에 없는 희귀도/단계는 같은 공식으로 계산)"""
+    costs = table.get(rarity_name)
+    if costs is not None and 0 <= level < len(costs):
+        return costs[level]
+    return formula(multipliers.get(rarity_name, 1.0), level)
+
+
 class ShopItem:
     """상점 아이템 (가격 포함)"""
     
@@ -28,10 +83,11 @@ class ShopItem:
 class Merchant:
     """상인 클래스"""
     
-    def __init__(self, name: str, merchant_type: str = "일반", floor: int = 1):
+    def __init__(self, name: str, merchant_type: str = "일반", floor: int = 1, rng: random.Random = None):
         self.name = name
         self.merchant_type = merchant_type
         self.floor = floor  # 현재 층 정보 추가
+        self.rng = rng or random  # 층 시드로 만든 난수 스트림 (없으면 전역 random)
         self.shop_items: List[ShopItem] = []
         self.gold = 1000  # 상인의 보유 골드
         self.last_refresh_floor = floor  # 마지막으로 상품을 갱신한 층
@@ -39,6 +95,7 @@ class Merchant:
         
     def generate_inventory(self):
         """상인 인벤토리 생성 - 층수에 따라 다른 상품"""
+        rng = self.rng
         self.shop_items.clear()  # 기존 상품 제거
         db = ItemDatabase()
         
@@ -47,7 +104,7 @@ class Merchant:
         
         # 층수에 따른 추가 아이템 개수 및 품질 조정
         base_item_count = 3 + (self.floor // 3)  # 3층마다 아이템 1개씩 추가
-        additional_item_count = random.randint(base_item_count, base_item_count + 3)
+        additional_item_count = rng.randint(base_item_count, base_item_count + 3)
         
         # 상인 타입과 층수에 따른 추가 아이템 생성
         for _ in range(additional_item_count):
@@ -73,50 +130,51 @@ class Merchant:
                     rarity_weights = [70, 20, 8, 2, 0]
             
             # 랜덤 아이템 생성
-            item = db.get_random_item()
+            item = db.get_random_item(rng=rng)
             if item:
                 # 층수에 따른 가격 조정 (깊을수록 비싸짐)
                 floor_multiplier = 1.0 + (self.floor * 0.1)
-                price_multiplier = random.uniform(1.2, 1.8) * floor_multiplier
+                price_multiplier = rng.uniform(1.2, 1.8) * floor_multiplier
                 price = int(item.value * price_multiplier)
                 
                 # 재고 설정 (깊은 층일수록 희귀 아이템은 재고 적음)
                 if item.item_type == ItemType.CONSUMABLE:
                     if self.floor >= 15:
-                        stock = random.randint(1, 3)  # 깊은 층에서는 재고 적음
+                        stock = rng.randint(1, 3)  # 깊은 층에서는 재고 적음
                     else:
-                        stock = random.randint(2, 5)
+                        stock = rng.randint(2, 5)
                 else:
-                    stock = 1 if self.floor >= 10 else random.randint(1, 2)
+                    stock = 1 if self.floor >= 10 else rng.randint(1, 2)
                 
                 shop_item = ShopItem(item, price, stock)
                 self.shop_items.append(shop_item)
         
         # 최소 6종 상품 보장
         while len(self.shop_items) < 6:
-            item = db.get_random_item()
+            item = db.get_random_item(rng=rng)
             if item:
-                price = int(item.value * random.uniform(1.2, 1.8))
-                stock = random.randint(1, 3)
+                price = int(item.value * rng.uniform(1.2, 1.8))
+                stock = rng.randint(1, 3)
                 shop_item = ShopItem(item, price, stock)
                 self.shop_items.append(shop_item)
         
         # 층수에 따른 상인 골드 조정
-        self.gold = 500 + (self.floor * 100) + random.randint(0, 500)
+        self.gold = 500 + (self.floor * 100) + rng.randint(0, 500)
         self.last_refresh_floor = self.floor
     
     def add_basic_items(self, db: ItemDatabase):
         """기본 상품 추가 - 항상 판매하는 필수 아이템들"""
+        rng = self.rng
         basic_items = [
             # 포션류
-            ("치료 포션", 30, random.randint(3, 6)),
-            ("마나 포션", 25, random.randint(2, 4)),
+            ("치료 포션", 30, rng.randint(3, 6)),
+            ("마나 포션", 25, rng.randint(2, 4)),
             # 장비류  
             ("가죽 모자", 26, 1),
             ("가죽 갑옷", 45, 1),
             # 특수 아이템
-            ("안약", 45, random.randint(2, 5)),
-            ("해독제", 35, random.randint(2, 4)),
+            ("안약", 45, rng.randint(2, 5)),
+            ("해독제", 35, rng.randint(2, 4)),
         ]
         
         for item_name, base_price, stock in basic_items:
@@ -696,32 +754,16 @@ class Merchant:
             print("추가 옵션 리롤 메뉴를 표시할 수 없습니다.")
     
     def _calculate_enhancement_cost(self, item):
-        """강화 비용 계산"""
-        base_cost = 100
-        level_multiplier = (item.enhancement_level + 1) ** 2
-        rarity_multiplier = {
-            'COMMON': 1.0,
-            'UNCOMMON': 1.5,
-            'RARE': 2.0,
-            'EPIC': 3.0,
-            'LEGENDARY': 5.0
-        }.get(item.rarity.name if hasattr(item, 'rarity') else 'COMMON', 1.0)
-        
-        return int(base_cost * level_multiplier * rarity_multiplier)
+        """강화 비용 계산 (비용표 조회)"""
+        rarity_name = item.rarity.name if hasattr(item, 'rarity') else 'COMMON'
+        return _lookup_cost(ENHANCEMENT_COST_TABLE, ENHANCEMENT_RARITY_MULTIPLIER, _enhancement_cost,
+                            rarity_name, item.enhancement_level)
     
     def _calculate_reroll_cost(self, item):
-        """리롤 비용 계산"""
-        base_cost = 200
-        enhancement_multiplier = 1.0 + (item.enhancement_level * 0.5) if hasattr(item, 'enhancement_level') else 1.0
-        rarity_multiplier = {
-            'COMMON': 1.0,
-            'UNCOMMON': 1.5,
-            'RARE': 2.5,
-            'EPIC': 4.0,
-            'LEGENDARY': 7.0
-        }.get(item.rarity.name if hasattr(item, 'rarity') else 'COMMON', 1.0)
-        
-        return int(base_cost * enhancement_multiplier * rarity_multiplier)
+        """리롤 비용 계산 (비용표 조회)"""
+        rarity_name = item.rarity.name if hasattr(item, 'rarity') else 'COMMON'
+        level = item.enhancement_level if hasattr(item, 'enhancement_level') else 0
+        return _lookup_cost(REROLL_COST_TABLE, REROLL_RARITY_MULTIPLIER, _reroll_cost, rarity_name, level)
     
     def _enhance_equipment(self, party_manager, owner, item, cost):
         """장비 강화 실행"""
@@ -811,14 +853,96 @@ class Merchant:
                 break
 
 
+# 미리 생성하는 상인 종류: 순회 상인(try_spawn_merchant), 필드 상인(get_field_merchant)
+MERCHANT_KINDS = ("travel", "field")
+
+_merchant_executor = None
+_merchant_executor_lock = threading.Lock()
+
+
+def _get_merchant_executor() -> ThreadPoolExecutor:
+    """상인 재고 미리 생성 워커 (스레드 1개, 처음 쓸 때 생성)"""
+    global _merchant_executor
+    if _merchant_executor is None:
+        with _merchant_executor_lock:
+            if _merchant_executor is None:
+                _merchant_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MerchantStock")
+    return _merchant_executor
+
+
 class MerchantManager:
     """상인 관리자"""
     
     def __init__(self):
         self.merchants: Dict[int, Optional[Merchant]] = {}  # 층별 상인 관리
+        self.field_merchants: Dict[int, Merchant] = {}      # 층별 필드 상인
         self.base_spawn_chance = 0.25  # 25% 기본 확률
         self.last_merchant_floor = -1  # 마지막 상인이 나타난 층
         
+        # ⏩ 현재/다음 층 상인 재고를 워커에서 미리 생성 (상점을 열 때 바로 표시)
+        self._prepared: Dict[Tuple[int, str], Future] = {}  # (층, 종류) -> 미리 만든 상인
+        
+    @staticmethod
+    def _merchant_seed(floor_seed: int, floor: int, kind: str) -> int:
+        """층 시드에서 상인별 시드 유도 (층 생성 난수열과 겹치지 않도록 분리)"""
+        seed_string = f"{floor_seed}_{floor}_merchant_{kind}"
+        return int(hashlib.md5(seed_string.encode()).hexdigest()[:8], 16)
+    
+    def prepare_floor(self, floor: int, seed_for=None):
+        """층 이동 시 호출 - 다른 층의 캐시는 버리고 floor, floor+1 상인을 워커에서 미리 생성
+        
+        seed_for(floor) -> 층 시드 (없으면 비결정적 난수 사용)
+        """
+        if floor is None or not isinstance(floor, int):
+            floor = 1
+        keep = (floor, floor + 1)
+        
+        for key in list(self._prepared):
+            if key[0] not in keep:
+                self._prepared.pop(key).cancel()
+        for old_floor in list(self.field_merchants):
+            if old_floor != floor:
+                del self.field_merchants[old_floor]
+        
+        executor = _get_merchant_executor()
+        for target_floor in keep:
+            floor_seed = None
+            if seed_for is not None:
+                try:
+                    floor_seed = seed_for(target_floor)
+                except Exception as e:
+                    print(f"⚠️ 층 시드 계산 실패: {e}")
+            for kind in MERCHANT_KINDS:
+                if (target_floor, kind) in self._prepared:
+                    continue
+                if kind == "travel" and target_floor in self.merchants:
+                    continue
+                if kind == "field" and target_floor in self.field_merchants:
+                    continue
+                self._prepared[(target_floor, kind)] = executor.submit(
+                    self._build_merchant, target_floor, kind, floor_seed)
+    
+    def _build_merchant(self, floor: int, kind: str, floor_seed: Optional[int]) -> Merchant:
+        """상인 생성 (워커 스레드에서 실행)"""
+        if floor_seed is not None:
+            rng = random.Random(self._merchant_seed(floor_seed, floor, kind))
+        else:
+            rng = random.Random()
+        if kind == "travel":
+            return self.create_random_merchant(floor, rng=rng)
+        return Merchant("필드 상인", "일반", floor, rng=rng)
+    
+    def _take_prepared(self, floor: int, kind: str) -> Optional[Merchant]:
+        """미리 생성한 상인 꺼내기 (아직 생성 중이면 완료까지 대기)"""
+        future = self._prepared.pop((floor, kind), None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"⚠️ 상인 미리 생성 실패: {e}")
+            return None
+        
     def get_spawn_chance(self, floor: int) -> float:
         """층수에 따른 상인 생성 확률 계산"""
         # 안전한 타입 체크
@@ -854,16 +978,30 @@ class MerchantManager:
         spawn_chance = self.get_spawn_chance(floor)
         
         if random.random() < spawn_chance:
-            merchant = self.create_random_merchant(floor)
+            merchant = self._take_prepared(floor, "travel") or self.create_random_merchant(floor)
             self.merchants[floor] = merchant
             self.last_merchant_floor = floor
             return merchant
         else:
             self.merchants[floor] = None  # 이 층에는 상인이 없음을 기록
+            future = self._prepared.pop((floor, "travel"), None)
+            if future is not None:
+                future.cancel()
             return None
     
-    def create_random_merchant(self, floor: int) -> Merchant:
+    def get_field_merchant(self, floor: int) -> Merchant:
+        """층별 필드 상인 (같은 층에서는 재고가 유지됨)"""
+        if floor is None or not isinstance(floor, int):
+            floor = 1
+        merchant = self.field_merchants.get(floor)
+        if merchant is None:
+            merchant = self._take_prepared(floor, "field") or Merchant("필드 상인", "일반", floor)
+            self.field_merchants[floor] = merchant
+        return merchant
+    
+    def create_random_merchant(self, floor: int, rng: random.Random = None) -> Merchant:
         """랜덤 상인 생성 - 층수 고려"""
+        rng = rng or random
         merchant_names = [
             "바르간", "로사", "델피", "카엘", "미르",
             "토란", "세라", "주노", "레이나", "케인",
@@ -888,10 +1026,10 @@ class MerchantManager:
             merchant_types = ["일반", "고급"]
             weights = [75, 25]
         
-        name = random.choice(merchant_names)
-        merchant_type = random.choices(merchant_types, weights=weights)[0]
+        name = rng.choice(merchant_names)
+        merchant_type = rng.choices(merchant_types, weights=weights)[0]
         
-        merchant = Merchant(name, merchant_type, floor)
+        merchant = Merchant(name, merchant_type, floor, rng=rng)
         
         return merchant
     
@@ -7,6 +7,7 @@ import json
 import os
 from typing import Dict, List
 from game.color_text import bright_cyan, bright_yellow, bright_green, bright_red, bright_white
+from game.json_store import schedule_json_save, flush_json_saves, discard_json_save
 
 
 class MetaProgression:
@@ -87,6 +88,7 @@ class MetaProgression:
             }
         }
         
+        flush_json_saves(self.save_file)  # 다른 인스턴스가 예약한 저장 먼저 반영
         if os.path.exists(self.save_file):
             try:
                 with open(self.save_file, 'r', encoding='utf-8') as f:
@@ -100,12 +102,12 @@ class MetaProgression:
                 return default_data
         return default_data
     def save_data(self):
-        """진행 데이터 저장"""
-        try:
-            with open(self.save_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"저장 실패: {e}")
+        """진행 데이터 저장 예약 (아이템 발견처럼 연달아 호출되어도 한 번만 기록)"""
+        schedule_json_save(self.save_file, lambda: self.data)
+    
+    def flush(self):
+        """예약된 저장을 즉시 파일에 반영"""
+        flush_json_saves(self.save_file)
     
     # 혹시 기존 permanent_upgrades 키가 있다면 제거
     @property
@@ -2425,6 +2427,7 @@ class MetaProgression:
                 
     def reset_progress(self):
         """진행도 초기화 (개발/테스트용)"""
+        discard_json_save(self.save_file)  # 예약된 옛 데이터 저장이 초기화를 덮어쓰지 않도록
         if os.path.exists(self.save_file):
             os.remove(self.save_file)
         self.data = self.load_data()
@@ -3,6 +3,8 @@ from typing import Dict, List, Any
 from enum import Enum
 import random
 
+from game.data_tables import register_data_table, get_data_table
+
 # StatusType은 이 파일에서 정의됩니다 (아래에 있음)
 
 class SkillType(Enum):
@@ -653,7 +655,8 @@ def get_status_icon(status_type: StatusType) -> str:
 class NewSkillSystem:
     
     def __init__(self):
-        self.skills_by_class = self._initialize_all_skills()
+        # 직업별 스킬 정의는 프로세스당 한 번만 만들어 모든 인스턴스가 공유
+        self.skills_by_class = get_data_table("skills_by_class")
         self.cooldowns = {}  # {character_id: {skill_name: remaining_turns}}
         # 스킬 계수 전역 배수 (1.5배로 모든 스킬 데미지 증가)
         self.skill_power_multiplier = 1.0
@@ -662,7 +665,8 @@ class NewSkillSystem:
         # 아군 스킬 MP 소모량 배수 (1.6배로 증가)
         self.ally_mp_cost_multiplier = 1.0
     
-    def _initialize_all_skills(self) -> Dict[str, List[Dict[str, Any]]]:
+    @staticmethod
+    def _initialize_all_skills() -> Dict[str, List[Dict[str, Any]]]:
         return {
             # === 적응형 전투마스터 - 전사 ===
             "전사": [
@@ -2579,6 +2583,9 @@ class NewSkillSystem:
     def get_enemy_skill_power(self, skill_power: float) -> float:
         """적 스킬의 위력에 배수 적용"""
         return skill_power * self.enemy_skill_power_multiplier
+
+register_data_table("skills_by_class", NewSkillSystem._initialize_all_skills)
+
 skill_system = NewSkillSystem()
 
 # 편의 함수들
@@ -51,6 +51,219 @@ class OptimizedGaugeSystem:
     _last_gauge_display_time = {}
     _gauge_display_cooldown = 0.1  # 0.1초 간격으로 제한
     
+    # 클래스 변수: 렌더링된 상태 라인 캐시 {(종류, id(캐릭터)): (상태 지문, 문자열)}
+    _status_line_cache = {}
+    _status_line_cache_limit = 256  # 전투 참가자 수 대비 넉넉한 상한
+    
+    # 클래스 변수: 길이/색상별로 미리 계산된 게이지 글리프 테이블
+    _visual_gauge_tables = {}
+    _clean_gauge_tables = {}
+    _partial_block_glyphs = ("", "▏", "▎", "▍", "▌", "▋", "▊", "▉")
+    
+    # 직업별 기믹 표시에 쓰이는 속성 (상태 지문 계산용)
+    _mechanic_attributes = {
+        "궁수": ('aim_points', 'precision_points'),
+        "도적": ('poison_stacks', 'venom_power'),
+        "암살자": ('shadow_count', 'shadows'),
+        "검성": ('sword_aura', 'sword_aura_stacks'),
+        "바드": ('melody_notes', 'melody_stacks', 'song_power'),
+        "광전사": ('rage_stacks', 'berserk_level'),
+        "아크메이지": ('fire_count', 'ice_count', 'lightning_count'),
+        "몽크": ('chi_points', 'ki_energy', 'strike_marks'),
+        "전사": ('current_stance', 'warrior_stance', 'warrior_focus', 'stance'),
+        "용기사": ('dragon_marks', 'dragon_power'),
+        "검투사": ('arena_points', 'gladiator_experience'),
+        "네크로맨서": ('soul_count', 'undead_power', 'necromancy_stacks'),
+        "정령술사": ('spirit_attunement', 'elemental_harmony', 'spirit_bond'),
+        "시간술사": ('time_energy', 'chrono_power', 'temporal_stacks'),
+        "연금술사": ('reaction_stacks', 'alchemy_power', 'chemical_energy'),
+        "차원술사": ('dimension_rifts', 'dimension_power', 'dimensional_energy'),
+        "기계공학자": ('overcharge_stacks', 'mechanical_power', 'tech_energy'),
+        "무당": ('spiritual_power', 'shaman_energy', 'spirit_power'),
+        "해적": ('treasure_stacks', 'pirate_loot', 'plunder_count'),
+        "사무라이": ('bushido_spirit', 'sword_spirit', 'samurai_focus'),
+        "드루이드": ('nature_power', 'druid_harmony', 'wild_energy'),
+        "철학자": ('wisdom_stacks', 'enlightenment', 'philosophy_power'),
+        "기사": ('honor_points', 'chivalry_power', 'knight_spirit'),
+        "신관": ('faith_power', 'divine_energy', 'holy_power', 'faith_points'),
+        "마검사": ('magic_sword_sync', 'mystic_blade_power', 'sword_magic_fusion'),
+        "성기사": ('holy_blessing', 'paladin_power', 'sacred_energy', 'holy_power'),
+        "암흑기사": ('dark_power', 'shadow_energy', 'darkness_stacks'),
+    }
+    
+    @staticmethod
+    def _get_cached_status(cache_key, fingerprint, render_func, *args) -> str:
+        """상태 지문이 바뀐 경우에만 다시 렌더링"""
+        cache = OptimizedGaugeSystem._status_line_cache
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        rendered = render_func(*args)
+        if len(cache) >= OptimizedGaugeSystem._status_line_cache_limit and cache_key not in cache:
+            cache.clear()  # 전투가 바뀌며 쌓인 오래된 항목 정리
+        cache[cache_key] = (fingerprint, rendered)
+        return rendered
+    
+    @staticmethod
+    def clear_status_cache():
+        """렌더링된 상태 라인 캐시 초기화"""
+        OptimizedGaugeSystem._status_line_cache.clear()
+    
+    @staticmethod
+    def _mechanics_fingerprint(character, character_class: str) -> tuple:
+        """직업 기믹/상처 관련 값만 모은 튜플"""
+        attributes = OptimizedGaugeSystem._mechanic_attributes.get(character_class, ())
+        values = []
+        for attribute in attributes:
+            value = getattr(character, attribute, None)
+            values.append(tuple(value) if isinstance(value, list) else value)
+        values.append(getattr(character, 'wounds', 0))
+        return tuple(values)
+    
+    @staticmethod
+    def _status_effects_fingerprint(character) -> tuple:
+        """상태이상 집합 지문 (BREAK/독/화상/빙결/기절 + 상태효과 목록)"""
+        status_manager = getattr(character, 'status_manager', None)
+        try:
+            manager_poison = bool(status_manager and status_manager.has_status('독'))
+        except Exception:
+            manager_poison = False
+        
+        effects = getattr(character, 'status_effects', None)
+        effect_keys = ()
+        if isinstance(effects, list):
+            effect_keys = tuple(
+                (str(getattr(effect, 'status_type', effect)), getattr(effect, 'intensity', None))
+                for effect in effects
+            )
+        
+        return (
+            getattr(character, 'is_broken', False),
+            manager_poison,
+            getattr(character, 'is_poisoned', False),
+            getattr(character, 'poison_turns', 0),
+            getattr(character, 'poison_damage', 0),
+            getattr(character, 'is_burning', False),
+            getattr(character, 'is_frozen', False),
+            getattr(character, 'is_stunned', False),
+            effect_keys,
+        )
+    
+    @staticmethod
+    def _casting_fingerprint(character) -> tuple:
+        """캐스팅 상태 지문"""
+        if not getattr(character, 'is_casting', False):
+            return (False,)
+        
+        casting_skill = getattr(character, 'casting_skill', None)
+        if isinstance(casting_skill, dict):
+            skill_key = casting_skill.get('name', '스킬')
+        else:
+            skill_key = str(casting_skill)
+        
+        combat_system = getattr(character, 'combat_system_ref', None)
+        progress = None
+        if combat_system and hasattr(combat_system, 'calculate_casting_progress_method4'):
+            try:
+                progress = int(combat_system.calculate_casting_progress_method4(character) * 100)
+            except Exception:
+                progress = None
+        
+        return (
+            True, skill_key, progress,
+            getattr(character, 'casting_progress', None),
+            getattr(character, 'casting_duration', None),
+            getattr(character, 'casting_start_atb', None),
+            getattr(character, 'atb_gauge', 0),
+        )
+    
+    @staticmethod
+    def _compact_status_fingerprint(character, shadow_system=None) -> tuple:
+        """create_compact_character_status 입력값 지문"""
+        character_class = getattr(character, 'character_class', '모험가')
+        atb = getattr(character, 'atb_gauge', 0)
+        # ATB 버킷: 게이지 칸(200 단위)과 퍼센트(10 단위)만 화면에 보임
+        atb_bucket = 'READY' if atb >= 1000 else int((atb / 1000) * 100)
+        
+        shadow_count = None
+        if shadow_system and character_class == "암살자":
+            shadow_count = shadow_system.get_shadow_count(character)
+        
+        return (
+            getattr(character, 'name', None), character_class, getattr(character, 'level', 1),
+            getattr(character, 'current_hp', 0), getattr(character, 'max_hp', 1),
+            getattr(character, 'current_mp', 0), getattr(character, 'max_mp', 1),
+            getattr(character, 'brv', 0), getattr(character, 'brave_points', 0),
+            getattr(character, 'current_brv', 0), getattr(character, 'brave', 0),
+            getattr(character, 'speed', 50),
+            atb_bucket, int(min(1.0, atb / 2000) * 10),
+            shadow_count,
+            OptimizedGaugeSystem._status_effects_fingerprint(character),
+            OptimizedGaugeSystem._casting_fingerprint(character),
+            OptimizedGaugeSystem._mechanics_fingerprint(character, character_class),
+        )
+    
+    @staticmethod
+    def _status_line_fingerprint(character, current_char=None, all_characters=None) -> tuple:
+        """create_status_line 입력값 지문"""
+        character_class = getattr(character, 'character_class', '모험가')
+        speed = getattr(character, 'speed', 50)
+        if all_characters:
+            avg_speed = sum(getattr(char, 'speed', 50) for char in all_characters) / len(all_characters)
+        else:
+            avg_speed = 50
+        speed_bucket = 1 if speed >= avg_speed * 1.3 else (-1 if speed <= avg_speed * 0.7 else 0)
+        
+        atb = max(0, getattr(character, 'atb_gauge', 0))
+        # ATB 버킷: 퍼센트(반올림)와 1/8 블록 단위 게이지 칸만 화면에 보임
+        if atb >= 1000:
+            atb_bucket = ('READY',)
+        else:
+            atb_bucket = (int(round(atb / 10)), int(atb / 12.5))
+        
+        return (
+            character == current_char,
+            character.name, character_class, getattr(character, 'level', 1),
+            character.current_hp, character.max_hp, character.current_mp, character.max_mp,
+            getattr(character, 'brave_points', 0), getattr(character, 'max_brave_points', 9999),
+            speed, speed_bucket, atb_bucket,
+            OptimizedGaugeSystem._status_effects_fingerprint(character),
+            OptimizedGaugeSystem._casting_fingerprint(character),
+            OptimizedGaugeSystem._mechanics_fingerprint(character, character_class),
+        )
+    
+    @staticmethod
+    def _get_visual_gauge_table(length: int) -> list:
+        """길이별 █/░ 게이지 문자열 테이블 (채운 칸 수 → 문자열)"""
+        table = OptimizedGaugeSystem._visual_gauge_tables.get(length)
+        if table is None:
+            table = ["{" + "█" * filled + "░" * (length - filled) + "}" for filled in range(length + 1)]
+            OptimizedGaugeSystem._visual_gauge_tables[length] = table
+        return table
+    
+    @staticmethod
+    def _get_clean_gauge_table(length: int, color: str) -> list:
+        """길이/색상별 정밀 게이지 테이블 (채운 칸 수 * 8 + 부분 블록 단계 → 문자열)"""
+        key = (length, color)
+        table = OptimizedGaugeSystem._clean_gauge_tables.get(key)
+        if table is None:
+            reset = get_color('RESET')
+            table = []
+            for full_blocks in range(length + 1):
+                for partial_step in range(8):
+                    content = ""
+                    if full_blocks > 0:
+                        content += color + "█" * full_blocks + reset
+                    used_blocks = full_blocks
+                    if partial_step and full_blocks < length:
+                        content += color + OptimizedGaugeSystem._partial_block_glyphs[partial_step] + reset
+                        used_blocks += 1
+                    content += " " * (length - used_blocks)
+                    table.append("{" + content + "}")
+            OptimizedGaugeSystem._clean_gauge_tables[key] = table
+        return table
+    
     @staticmethod
     def _can_display_gauge(character_name: str) -> bool:
         """게이지 표시 가능 여부 확인 (중복 방지)"""
@@ -113,7 +326,16 @@ class OptimizedGaugeSystem:
     
     @staticmethod
     def create_compact_character_status(character, shadow_system=None) -> str:
-        """컴팩트한 캐릭터 상태 표시 생성"""
+        """컴팩트한 캐릭터 상태 표시 생성 (상태 지문이 같으면 캐시 재사용)"""
+        fingerprint = OptimizedGaugeSystem._compact_status_fingerprint(character, shadow_system)
+        return OptimizedGaugeSystem._get_cached_status(
+            ('compact', id(character)), fingerprint,
+            OptimizedGaugeSystem._render_compact_character_status, character, shadow_system
+        )
+    
+    @staticmethod
+    def _render_compact_character_status(character, shadow_system=None) -> str:
+        """컴팩트한 캐릭터 상태 표시 실제 렌더링"""
         # 기본 정보
         level = getattr(character, 'level', 1)
         name = getattr(character, 'name', '알 수 없음')
@@ -492,12 +714,8 @@ class OptimizedGaugeSystem:
         
         ratio = min(1.0, current / maximum)
         filled_length = int(ratio * length)
-        empty_length = length - filled_length
         
-        filled = "█" * filled_length
-        empty = "░" * empty_length
-        
-        return "{" + filled + empty + "}"
+        return OptimizedGaugeSystem._get_visual_gauge_table(length)[max(0, filled_length)]
     
     @staticmethod
     def create_clean_gauge(current: int, maximum: int, length: int = 10, gauge_type: str = "hp", hp_ratio: float = 1.0, mp_ratio: float = 1.0, is_casting: bool = False, atb_speed_state: str = "normal") -> str:
@@ -560,50 +778,34 @@ class OptimizedGaugeSystem:
         else:
             color = get_color('WHITE')
         
-        # 완전히 새로운 게이지 생성 로직 - 길이 일관성 보장
+        # 게이지 생성 로직 - 길이 일관성 보장 (미리 계산된 글리프 테이블 사용)
         filled_length = ratio * length  # 실제 채워야 할 길이 (소수점 포함)
         full_blocks = int(filled_length)  # 완전히 채워진 블록 수
         partial_amount = filled_length - full_blocks  # 부분 블록의 채움 정도
         
-        gauge_content = ""
-        
-        # 1. 완전히 채워진 블록들 추가
-        if full_blocks > 0:
-            gauge_content += color + "█" * full_blocks + get_color('RESET')
-        
-        # 2. 부분 블록 처리 (정확한 1개 블록 공간만 사용)
+        # 부분 블록 단계 (0: 없음, 1~7: ▏~▉)
+        partial_step = 0
         if full_blocks < length and partial_amount > 0:
-            if partial_amount >= 0.875:
-                gauge_content += color + "▉" + get_color('RESET')
-            elif partial_amount >= 0.75:
-                gauge_content += color + "▊" + get_color('RESET')
-            elif partial_amount >= 0.625:
-                gauge_content += color + "▋" + get_color('RESET')
-            elif partial_amount >= 0.5:
-                gauge_content += color + "▌" + get_color('RESET')
-            elif partial_amount >= 0.375:
-                gauge_content += color + "▍" + get_color('RESET')
-            elif partial_amount >= 0.25:
-                gauge_content += color + "▎" + get_color('RESET')
-            elif partial_amount >= 0.125:
-                gauge_content += color + "▏" + get_color('RESET')
-            else:
-                # 부분 블록이 너무 작으면 빈 공간으로 처리
-                gauge_content += " "
-            used_blocks = full_blocks + 1
-        else:
-            used_blocks = full_blocks
-        
-        # 3. 나머지 공간은 빈 블록으로 채움
-        remaining_blocks = length - used_blocks
-        if remaining_blocks > 0:
-            gauge_content += " " * remaining_blocks
+            for step in range(7, 0, -1):
+                if partial_amount >= step * 0.125:
+                    partial_step = step
+                    break
         
-        return "{" + gauge_content + "}"
+        table = OptimizedGaugeSystem._get_clean_gauge_table(length, color)
+        return table[max(0, full_blocks) * 8 + partial_step]
     
     @staticmethod
     def create_status_line(character, current_char=None, all_characters=None) -> str:
-        """정확한 색상 로직을 가진 캐릭터 상태 표시"""
+        """정확한 색상 로직을 가진 캐릭터 상태 표시 (상태 지문이 같으면 캐시 재사용)"""
+        fingerprint = OptimizedGaugeSystem._status_line_fingerprint(character, current_char, all_characters)
+        return OptimizedGaugeSystem._get_cached_status(
+            ('line', id(character)), fingerprint,
+            OptimizedGaugeSystem._render_status_line, character, current_char, all_characters
+        )
+    
+    @staticmethod
+    def _render_status_line(character, current_char=None, all_characters=None) -> str:
+        """정확한 색상 로직을 가진 캐릭터 상태 표시 실제 렌더링"""
         # 현재 턴 캐릭터 표시
         arrow = "▶ " if character == current_char else "  "
         
@@ -1305,6 +1507,7 @@ class OptimizedGaugeSystem:
     def clear_all_gauge_cooldowns():
         """모든 게이지 쿨다운 초기화 (전투 시작/종료 시 사용)"""
         OptimizedGaugeSystem._last_gauge_display_time.clear()
+        OptimizedGaugeSystem._status_line_cache.clear()
     
     @staticmethod
     def show_single_gauge_update(character, gauge_type: str = "brv", old_value: int = 0, new_value: int = 0, reason: str = "") -> str:
@@ -9,6 +9,7 @@ import time
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from game.character import Character
+from game.json_store import schedule_json_save, flush_json_saves
 
 class PartyHistoryManager:
     """최근 탐험한 파티들을 관리하는 시스템"""
@@ -21,6 +22,7 @@ class PartyHistoryManager:
     def _load_history(self) -> List[Dict]:
         """파티 히스토리 데이터 로드"""
         try:
+            flush_json_saves(self.history_file)
             if os.path.exists(self.history_file):
                 with open(self.history_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
@@ -30,12 +32,8 @@ class PartyHistoryManager:
             return []
     
     def _save_history(self):
-        """파티 히스토리 데이터 저장"""
-        try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history_data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"⚠️ 파티 히스토리 저장 실패: {e}")
+        """파티 히스토리 데이터 저장 예약"""
+        schedule_json_save(self.history_file, lambda: self.history_data)
     
     def add_party_to_history(self, party: List[Character], exploration_info: Dict = None):
         """파티를 히스토리에 추가"""
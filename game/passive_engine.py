@@ -0,0 +1,301 @@
+"""
+🌟 파티 패시브 효과 엔진
+선택한 파티 패시브를 한 번 컴파일해서 발동 시점(트리거)별 핸들러 목록으로 보관
+
+- 핸들러는 @passive_handler(effect_type, trigger, 기본값...)으로 등록
+- compile 시 effect_value + 핸들러 기본값을 합쳐 파라미터를 미리 확정 (숫자형은 float로 정규화)
+- 이벤트마다 그 트리거를 구독한 핸들러만 실행 - effect_type 문자열 if/elif 체인을 매번 돌지 않음
+- 패시브 상태(스택, 사용 횟수)는 게임의 passive_states[effect_type]를 그대로 사용 (저장/불러오기 호환)
+- get_passive_bonus / has_passive_effect 조회는 컴파일 때 만든 표에서 바로 반환
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 트리거 (발동 시점)
+FIELD_TURN = "field_turn"        # 필드 20걸음 = 1턴 (게임 루프에서 아직 발동하지 않음)
+COMBAT_START = "combat_start"
+COMBAT_END = "combat_end"
+POST_BATTLE = "post_battle"      # 전투 승리 후
+ON_DAMAGE = "on_damage"          # 아군이 피해를 받을 때 (event['damage'] 수정)
+ON_KILL = "on_kill"              # 적 처치 시
+FLOOR_START = "floor_start"      # 새 층 진입 (게임 루프에서 아직 발동하지 않음)
+
+TRIGGERS = (FIELD_TURN, COMBAT_START, COMBAT_END, POST_BATTLE, ON_DAMAGE, ON_KILL, FLOOR_START)
+
+# 패시브 상태 기본값 (기존 passive_states 형식)
+_DEFAULT_STATE = {
+    'uses_per_battle': 0,
+    'uses_per_floor': 0,
+    'uses_this_floor': 0,
+    'stacks': 0,
+    'field_turns': 0,
+}
+
+# effect_type → [(trigger, handler, 파라미터 기본값)]
+_HANDLERS: Dict[str, List[Tuple[str, Callable, Dict[str, Any]]]] = {}
+
+
+def passive_handler(effect_type: str, trigger: str, **defaults):
+    """패시브 핸들러 등록 - handler(game, passive, params, event)"""
+    if trigger not in TRIGGERS:
+        raise ValueError(f"알 수 없는 패시브 트리거: {trigger}")
+
+    def register(func):
+        _HANDLERS.setdefault(effect_type, []).append((trigger, func, defaults))
+        return func
+    return register
+
+
+def _resolve_params(effect_value: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """effect_value + 기본값 → 핸들러 파라미터 (기본값이 숫자면 같은 형으로 변환)"""
+    params = dict(effect_value)
+    for key, default in defaults.items():
+        value = params.get(key, default)
+        if isinstance(default, float) and not isinstance(value, bool):
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                value = default
+        params[key] = value
+    return params
+
+
+@dataclass
+class CompiledPassive:
+    """컴파일된 패시브 하나"""
+    name: str
+    effect_type: str
+    effect_value: Dict[str, Any]
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _Subscription:
+    handler: Callable
+    passive: CompiledPassive
+    params: Dict[str, Any]
+
+
+class PassiveEngine:
+    """트리거별 핸들러 목록 + 보너스 조회 표"""
+
+    def __init__(self, passives: List[Dict], passive_states: Optional[Dict[str, Dict]] = None):
+        self.source = passives
+        self.passive_states = passive_states if passive_states is not None else {}
+        self.passives: List[CompiledPassive] = []
+        self.handlers: Dict[str, List[_Subscription]] = {trigger: [] for trigger in TRIGGERS}
+        self.effect_types = set()
+        self._bonus_table: Dict[Tuple[str, Optional[str]], float] = {}
+        self._compile(passives or [])
+
+    def _compile(self, passives: List[Dict]):
+        for passive in passives:
+            effect_type = passive.get('effect_type')
+            if not effect_type:
+                continue
+            effect_value = passive.get('effect_value', {})
+            if not isinstance(effect_value, dict):
+                effect_value = {'value': effect_value}
+
+            state = self.passive_states.setdefault(effect_type, {})
+            for key, default in _DEFAULT_STATE.items():
+                state.setdefault(key, default)
+
+            compiled = CompiledPassive(passive.get('name', effect_type), effect_type, effect_value, state)
+            self.passives.append(compiled)
+            self.effect_types.add(effect_type)
+
+            for trigger, handler, defaults in _HANDLERS.get(effect_type, ()):
+                self.handlers[trigger].append(_Subscription(handler, compiled, _resolve_params(effect_value, defaults)))
+
+            # 보너스 조회 표 (get_passive_bonus와 같은 합산 규칙)
+            raw_value = passive.get('effect_value', {})
+            if isinstance(raw_value, dict):
+                for key, value in raw_value.items():
+                    if isinstance(value, (int, float)):
+                        self._bonus_table[(effect_type, key)] = self._bonus_table.get((effect_type, key), 0) + value
+            elif isinstance(raw_value, (int, float)):
+                self._bonus_table[(effect_type, None)] = self._bonus_table.get((effect_type, None), 0) + raw_value
+
+    def matches(self, passives: List[Dict], passive_states: Dict[str, Dict]) -> bool:
+        """같은 패시브 목록/상태 객체로 컴파일됐는지 (다시 컴파일할 필요 없음)"""
+        return self.source is passives and self.passive_states is passive_states
+
+    def subscribes(self, trigger: str) -> bool:
+        return bool(self.handlers.get(trigger))
+
+    def fire(self, trigger: str, game, **event) -> Dict[str, Any]:
+        """트리거를 구독한 핸들러만 실행 - 핸들러가 고친 event를 반환"""
+        self._reset_builtin_state(trigger)
+        for subscription in self.handlers.get(trigger, ()):
+            try:
+                subscription.handler(game, subscription.passive, subscription.params, event)
+            except Exception as e:
+                print(f"⚠️ 패시브 효과 오류 ({subscription.passive.name}): {e}")
+        return event
+
+    def _reset_builtin_state(self, trigger: str):
+        # 전투/층 단위 사용 횟수 초기화는 모든 패시브에 공통
+        if trigger == COMBAT_START:
+            for passive in self.passives:
+                if 'uses_per_battle' in passive.effect_value:
+                    passive.state['uses_per_battle'] = 0
+        elif trigger == FLOOR_START:
+            for passive in self.passives:
+                passive.state['uses_per_floor'] = 0
+                passive.state['uses_this_floor'] = 0
+
+    def has(self, effect_type: str) -> bool:
+        return effect_type in self.effect_types
+
+    def bonus(self, effect_type: str, bonus_type: str = None) -> float:
+        return self._bonus_table.get((effect_type, bonus_type), 0)
+
+
+# =====================================
+# 💚 필드 턴 (20걸음)
+# =====================================
+
+def _heal_party_percent(game, hp_rate: float, wound_rate: float = 0.0, mp_rate: float = 0.0):
+    for member in game.party_manager.members:
+        if not member.is_alive:
+            continue
+        heal_amount = int(member.max_hp * hp_rate)
+        if heal_amount > 0:
+            member.heal(heal_amount)
+        if mp_rate > 0:
+            mp_amount = int(member.max_mp * mp_rate)
+            if mp_amount > 0:
+                member.current_mp = min(member.max_mp, member.current_mp + mp_amount)
+        if wound_rate > 0 and hasattr(member, 'wounds') and member.wounds > 0:
+            wound_heal_amount = int(member.max_hp * wound_rate)
+            member.wounds = max(0, member.wounds - wound_heal_amount)
+
+
+@passive_handler("life_seed", FIELD_TURN, hp_regen_per_turn=0.02, wound_heal_per_turn=0.01)
+def _life_seed_field(game, passive, params, event):
+    _heal_party_percent(game, params['hp_regen_per_turn'], params['wound_heal_per_turn'])
+
+
+@passive_handler("life_circulation", FIELD_TURN, hp_regen_per_turn=0.04)
+def _life_circulation_field(game, passive, params, event):
+    _heal_party_percent(game, params['hp_regen_per_turn'])
+
+
+@passive_handler("nature_blessing", FIELD_TURN, hp_regen_per_turn=0.06, mp_regen_per_turn=0.04)
+def _nature_blessing_field(game, passive, params, event):
+    _heal_party_percent(game, params['hp_regen_per_turn'], mp_rate=params['mp_regen_per_turn'])
+
+
+@passive_handler("soul_healer", FIELD_TURN, hp_regen_per_turn=0.08, wound_heal_per_turn=0.04)
+def _soul_healer_field(game, passive, params, event):
+    _heal_party_percent(game, params['hp_regen_per_turn'], params['wound_heal_per_turn'])
+
+
+@passive_handler("combat_healing_art", FIELD_TURN, hp_regen_per_turn=0.08, wound_heal_per_turn=0.03)
+def _combat_healing_art_field(game, passive, params, event):
+    _heal_party_percent(game, params['hp_regen_per_turn'], params['wound_heal_per_turn'])
+
+
+@passive_handler("step_power", FIELD_TURN, damage_per_100steps=0.15, max_stacks=5)
+def _step_power_field(game, passive, params, event):
+    # 100걸음 = 필드 5턴마다 스택 1
+    passive.state['field_turns'] += 1
+    if passive.state['field_turns'] % 5 != 0:
+        return
+    if passive.state['stacks'] < params['max_stacks']:
+        passive.state['stacks'] += 1
+        game.add_game_message(f"💪 걸음마다 힘 발동! 다음 공격 데미지 +{int(params['damage_per_100steps']*100)}% "
+                              f"(스택: {passive.state['stacks']})")
+
+
+# =====================================
+# ⚔️ 전투 시작/종료
+# =====================================
+
+@passive_handler("combat_healing_art", COMBAT_START, battle_start_heal=0.0)
+def _combat_healing_art_start(game, passive, params, event):
+    if params['battle_start_heal'] <= 0:
+        return
+    for member in game.party_manager.members:
+        if member.current_hp > 0:
+            member.heal(int(member.max_hp * params['battle_start_heal']))
+    print("⚔️ 전투 치유술: 전투 시작 시 파티 전체 HP 회복!")
+
+
+@passive_handler("dawn_focus", COMBAT_START, first_turn_speed=1.0)
+def _dawn_focus_start(game, passive, params, event):
+    for member in game.party_manager.members:
+        if hasattr(member, 'speed'):
+            member.speed *= (1 + params['first_turn_speed'])
+    print(f"🌅 새벽의 집중: 첫 턴 행동속도 +{params['first_turn_speed']*100:.0f}%!")
+
+
+@passive_handler("dawn_focus", COMBAT_END, first_turn_speed=1.0)
+def _dawn_focus_end(game, passive, params, event):
+    for member in game.party_manager.members:
+        if hasattr(member, 'speed'):
+            member.speed /= (1 + params['first_turn_speed'])
+
+
+@passive_handler("immortal_regeneration", COMBAT_END, post_battle_threshold=0.30, restore_to=0.30)
+def _immortal_regeneration_end(game, passive, params, event):
+    threshold, restore_to = params['post_battle_threshold'], params['restore_to']
+    for member in game.party_manager.members:
+        if member.current_hp <= 0:  # 살아있는 멤버만
+            continue
+        if member.current_hp / member.max_hp <= threshold:
+            member.current_hp = int(member.max_hp * restore_to)
+            print(f"💫 불멸의 재생력: {member.name}의 HP가 {restore_to*100:.0f}%로 회복!")
+        if member.current_mp / member.max_mp <= threshold:
+            member.current_mp = int(member.max_mp * restore_to)
+            print(f"💫 불멸의 재생력: {member.name}의 MP가 {restore_to*100:.0f}%로 회복!")
+
+
+# =====================================
+# 🏆 전투 승리 후
+# =====================================
+
+@passive_handler("immortal_regeneration", POST_BATTLE, post_battle_threshold=0.30, restore_to=0.30)
+def _immortal_regeneration_post_battle(game, passive, params, event):
+    threshold, restore_to = params['post_battle_threshold'], params['restore_to']
+    for member in game.party_manager.members:
+        if not member.is_alive:
+            continue
+        if member.current_hp < (member.max_hp * threshold):
+            member.current_hp = int(member.max_hp * restore_to)
+            game.add_game_message(f"💚 {member.name}의 불멸의 재생력으로 HP가 {int(restore_to*100)}%로 회복되었습니다!")
+        if member.current_mp < (member.max_mp * threshold):
+            member.current_mp = int(member.max_mp * restore_to)
+            game.add_game_message(f"💙 {member.name}의 불멸의 재생력으로 MP가 {int(restore_to*100)}%로 회복되었습니다!")
+
+
+@passive_handler("blood_regen", POST_BATTLE, hp_restore=0.06, wound_heal=0.03)
+def _blood_regen_post_battle(game, passive, params, event):
+    for member in game.party_manager.members:
+        if not member.is_alive:
+            continue
+        heal_amount = int(member.max_hp * params['hp_restore'])
+        if heal_amount > 0:
+            member.heal(heal_amount)
+            game.add_game_message(f"🩸 {member.name}의 혈액 재생으로 HP {heal_amount} 회복!")
+        if hasattr(member, 'wounds') and member.wounds > 0:
+            wound_heal_amount = int(member.max_hp * params['wound_heal'])
+            member.wounds = max(0, member.wounds - wound_heal_amount)
+
+
+# =====================================
+# 🛡️ 피해
+# =====================================
+
+@passive_handler("survival_instinct", ON_DAMAGE, hp_threshold=0.15, emergency_heal=0.15, damage_reduction=0.20)
+def _survival_instinct_damage(game, passive, params, event):
+    member = event['member']
+    # HP가 임계점 이하이고, 아직 이번 층에서 사용하지 않았을 때
+    if member.current_hp / member.max_hp > params['hp_threshold'] or passive.state['uses_per_floor'] != 0:
+        return
+    member.heal(int(member.max_hp * params['emergency_heal']))
+    event['damage'] = int(event['damage'] * (1 - params['damage_reduction']))
+    passive.state['uses_per_floor'] = 1
+    print(f"🛡️ 생존 본능 발동! {member.name}이 응급 회복하고 피해 감소!")
@@ -19,6 +19,8 @@ import time
 import random
 import hashlib
 
+from game.sqlite_store import get_sqlite_store
+
 class JobClass(Enum):
     """27개 전체 직업"""
     # 전투 직업군 (8개)
@@ -119,20 +121,52 @@ class JobSpecificKnowledge:
         if self.unique_strategies is None:
             self.unique_strategies = []
 
+# 지식 저장: (ai_name, job_class, knowledge_type) 고유 인덱스 기반 UPSERT
+_UPSERT_KNOWLEDGE_SQL = """
+    INSERT INTO ai_knowledge (ai_name, job_class, knowledge_type, data_json, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(ai_name, job_class, knowledge_type) DO UPDATE SET
+        data_json = excluded.data_json,
+        updated_at = excluded.updated_at,
+        version = ai_knowledge.version + 1
+"""
+
+_LOAD_KNOWLEDGE_SQL = """
+    SELECT data_json FROM ai_knowledge 
+    WHERE ai_name = ? AND job_class = ? AND knowledge_type = ?
+"""
+
+_SET_STATISTIC_SQL = """
+    INSERT INTO global_statistics (stat_name, stat_value, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(stat_name) DO UPDATE SET
+        stat_value = excluded.stat_value,
+        updated_at = excluded.updated_at
+"""
+
+_INSERT_SESSION_SQL = """
+    INSERT INTO learning_sessions (ai_name, session_type, duration_minutes, performance_improvement, started_at, ended_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 class PermanentLearningDatabase:
-    """영구 학습 데이터베이스"""
+    """영구 학습 데이터베이스 (공용 SQLite 저장소 - 연결 재사용 + 쓰기 일괄 처리)"""
     
     def __init__(self, db_path: str = "ai_permanent_learning.db"):
         self.db_path = Path(db_path)
-        self.connection = None
+        self.store = get_sqlite_store(self.db_path)
         self._initialize_database()
         
         print(f"🗄️ 영구 학습 데이터베이스 초기화: {self.db_path}")
     
+    @property
+    def connection(self):
+        """현재 스레드의 DB 연결 (자동 커밋)"""
+        return self.store.connection()
+    
     def _initialize_database(self):
         """데이터베이스 초기화"""
-        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.connection.execute("""
+        self.store.executescript("""
             CREATE TABLE IF NOT EXISTS ai_knowledge (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 ai_name TEXT NOT NULL,
@@ -142,10 +176,8 @@ class PermanentLearningDatabase:
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL,
                 version INTEGER DEFAULT 1
-            )
-        """)
-        
-        self.connection.execute("""
+            );
+            
             CREATE TABLE IF NOT EXISTS learning_sessions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 ai_name TEXT NOT NULL,
@@ -154,72 +186,94 @@ class PermanentLearningDatabase:
                 performance_improvement REAL NOT NULL,
                 started_at TEXT NOT NULL,
                 ended_at TEXT NOT NULL
-            )
-        """)
-        
-        self.connection.execute("""
+            );
+            
             CREATE TABLE IF NOT EXISTS global_statistics (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 stat_name TEXT UNIQUE NOT NULL,
                 stat_value TEXT NOT NULL,
                 updated_at TEXT NOT NULL
-            )
+            );
         """)
         
-        self.connection.commit()
+        # 이전 버전 DB의 중복 행 정리 (최신 행만 유지) 후 고유 인덱스
+        with self.store.transaction() as conn:
+            conn.execute("""
+                DELETE FROM ai_knowledge WHERE id NOT IN (
+                    SELECT MAX(id) FROM ai_knowledge GROUP BY ai_name, job_class, knowledge_type
+                )
+            """)
+            conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS uq_ai_knowledge_key
+                ON ai_knowledge(ai_name, job_class, knowledge_type)
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ai_knowledge_type_updated ON ai_knowledge(knowledge_type, updated_at)")
     
     def save_knowledge(self, ai_name: str, job_class: str, knowledge_type: str, data: Any):
-        """지식 저장"""
+        """지식 저장 (쓰기 큐에 예약 - 여러 건이 한 트랜잭션으로 커밋됨)"""
         data_json = json.dumps(data, ensure_ascii=False, default=str)
         now = datetime.now().isoformat()
-        
-        # 기존 데이터 확인
-        cursor = self.connection.execute("""
-            SELECT id, version FROM ai_knowledge 
-            WHERE ai_name = ? AND job_class = ? AND knowledge_type = ?
-        """, (ai_name, job_class, knowledge_type))
-        
-        existing = cursor.fetchone()
-        
-        if existing:
-            # 업데이트
-            self.connection.execute("""
-                UPDATE ai_knowledge 
-                SET data_json = ?, updated_at = ?, version = version + 1
-                WHERE id = ?
-            """, (data_json, now, existing[0]))
-        else:
-            # 새로 삽입
-            self.connection.execute("""
-                INSERT INTO ai_knowledge (ai_name, job_class, knowledge_type, data_json, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (ai_name, job_class, knowledge_type, data_json, now, now))
-        
-        self.connection.commit()
+        self.store.submit(_UPSERT_KNOWLEDGE_SQL, (ai_name, job_class, knowledge_type, data_json, now, now))
+    
+    def set_statistic(self, stat_name: str, stat_value: Any):
+        """전역 통계 값 저장"""
+        self.store.submit(_SET_STATISTIC_SQL, (stat_name, str(stat_value), datetime.now().isoformat()))
+    
+    def get_statistic(self, stat_name: str) -> Optional[str]:
+        """전역 통계 값 조회"""
+        result = self.store.query_one("SELECT stat_value FROM global_statistics WHERE stat_name = ?", (stat_name,))
+        return result[0] if result else None
+    
+    def flush(self, timeout: float = None) -> bool:
+        """예약된 쓰기를 모두 반영"""
+        return self.store.flush(timeout)
+    
+    def record_training_battles(self, results: List[Dict[str, Any]]):
+        """헤드리스 훈련 전투 결과 배치 반영 - AI별 누적 전투 기록 + 학습 세션 1건"""
+        by_ai: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for result in results:
+            if not result.get('error'):
+                by_ai.setdefault((result['ai_name'], result['job_class']), []).append(result)
+        
+        now = datetime.now()
+        for (ai_name, job_class), battles in by_ai.items():
+            record = self.load_knowledge(ai_name, job_class, "combat_training") or {
+                "encounters": 0, "victories": 0, "defeats": 0, "total_turns": 0, "actions": {}
+            }
+            wins = sum(1 for b in battles if b['victory'])
+            record["encounters"] += len(battles)
+            record["victories"] += wins
+            record["defeats"] += len(battles) - wins
+            record["total_turns"] += sum(b['turns'] for b in battles)
+            record["average_combat_duration"] = record["total_turns"] / record["encounters"]
+            for battle in battles:
+                for action, count in battle['actions'].items():
+                    record["actions"][action] = record["actions"].get(action, 0) + count
+            self.save_knowledge(ai_name, job_class, "combat_training", record)
+            
+            seconds = sum(b.get('elapsed', 0.0) for b in battles)
+            self.store.submit(_INSERT_SESSION_SQL, (
+                ai_name, "headless_battle", int(round(seconds / 60)), wins / len(battles),
+                (now - timedelta(seconds=seconds)).isoformat(), now.isoformat()
+            ))
     
     def load_knowledge(self, ai_name: str, job_class: str, knowledge_type: str) -> Optional[Any]:
         """지식 로드"""
-        cursor = self.connection.execute("""
-            SELECT data_json FROM ai_knowledge 
-            WHERE ai_name = ? AND job_class = ? AND knowledge_type = ?
-            ORDER BY updated_at DESC LIMIT 1
-        """, (ai_name, job_class, knowledge_type))
-        
-        result = cursor.fetchone()
+        result = self.store.query_one(_LOAD_KNOWLEDGE_SQL, (ai_name, job_class, knowledge_type))
         if result:
             return json.loads(result[0])
         return None
     
     def get_all_ai_knowledge(self, ai_name: str) -> Dict[str, Any]:
         """AI의 모든 지식 가져오기"""
-        cursor = self.connection.execute("""
+        rows = self.store.query("""
             SELECT knowledge_type, data_json FROM ai_knowledge 
             WHERE ai_name = ?
             ORDER BY updated_at DESC
         """, (ai_name,))
         
         knowledge = {}
-        for row in cursor.fetchall():
+        for row in rows:
             knowledge[row[0]] = json.loads(row[1])
         
         return knowledge
@@ -273,14 +327,12 @@ class PermanentLearningDatabase:
     def get_learning_statistics(self) -> Dict[str, Any]:
         """학습 통계 가져오기"""
         try:
-            cursor = self.connection.execute("""
+            stats = self.store.query_one("""
                 SELECT COUNT(*) as total_knowledge,
                        COUNT(DISTINCT ai_name) as unique_ais,
                        COUNT(DISTINCT job_class) as learned_jobs
                 FROM ai_knowledge
             """)
-            
-            stats = cursor.fetchone()
             return {
                 "total_knowledge": stats[0] if stats else 0,
                 "unique_ais": stats[1] if stats else 0,
@@ -296,19 +348,18 @@ class PermanentLearningDatabase:
     def save_backup_data(self):
         """학습 데이터 백업 저장"""
         try:
-            # 데이터베이스 백업
+            # 데이터베이스 백업 (WAL 모드라 파일 복사 대신 온라인 백업 API 사용)
             backup_path = f"ai_permanent_learning_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
+            self.flush()
+            backup = sqlite3.connect(backup_path)
+            try:
+                self.connection.backup(backup)
+            finally:
+                backup.close()
             
             # 통계 정보 저장
             stats = self.get_learning_statistics()
-            self.connection.execute("""
-                INSERT OR REPLACE INTO global_statistics (stat_name, stat_value, updated_at)
-                VALUES ('last_backup', ?, ?)
-            """, (datetime.now().isoformat(), datetime.now().isoformat()))
-            
-            self.connection.commit()
+            self.set_statistic('last_backup', datetime.now().isoformat())
             print(f"💾 학습 데이터 백업 완료: {backup_path}")
             
         except Exception as e:
@@ -318,11 +369,10 @@ class PermanentLearningDatabase:
         """오래된 데이터 정리"""
         try:
             cutoff_date = (datetime.now() - timedelta(days=days_old)).isoformat()
-            self.connection.execute("""
+            self.store.execute("""
                 DELETE FROM ai_knowledge 
-                WHERE updated_at < ? AND knowledge_type = 'temporary_data'
+                WHERE knowledge_type = 'temporary_data' AND updated_at < ?
             """, (cutoff_date,))
-            self.connection.commit()
         except Exception as e:
             print(f"데이터 정리 실패: {e}")
 
@@ -614,19 +664,12 @@ class PermanentAIEvolutionSystem:
     
     def _load_generation_count(self) -> int:
         """세대 수 로드"""
-        cursor = self.db.connection.execute("""
-            SELECT stat_value FROM global_statistics WHERE stat_name = 'current_generation'
-        """)
-        result = cursor.fetchone()
-        return int(result[0]) if result else 0
+        result = self.db.get_statistic('current_generation')
+        return int(result) if result else 0
     
     def _save_generation_count(self, generation: int):
         """세대 수 저장"""
-        self.db.connection.execute("""
-            INSERT OR REPLACE INTO global_statistics (stat_name, stat_value, updated_at)
-            VALUES ('current_generation', ?, ?)
-        """, (str(generation), datetime.now().isoformat()))
-        self.db.connection.commit()
+        self.db.set_statistic('current_generation', generation)
     
     def get_evolution_status(self) -> Dict[str, Any]:
         """진화 상태 확인"""
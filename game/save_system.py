@@ -12,6 +12,8 @@ from typing import Dict, Any, Optional, List
 from pathlib import Path
 from enum import Enum
 
+from game.hot_path_profiler import profiled
+
 
 class GameStateEncoder(json.JSONEncoder):
     """게임 상태를 JSON으로 직렬화하기 위한 커스텀 인코더"""
@@ -457,6 +459,7 @@ class SaveManager:
         
         return save_data
     
+    @profiled("io.save_game")
     def save_game(self, game_state: Dict[str, Any], save_name: str = None) -> bool:
         """게임 저장"""
         try:
@@ -522,6 +525,7 @@ class SaveManager:
             traceback.print_exc()
             return False
     
+    @profiled("io.load_game")
     def load_game(self, save_name: str) -> Optional[Dict[str, Any]]:
         """게임 불러오기"""
         try:
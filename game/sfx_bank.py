@@ -0,0 +1,212 @@
+"""
+🔊 SFX 사운드 뱅크
+매핑된 효과음 파일을 한 번만 디코딩해 메모리에 보관하고 채널을 직접 관리
+
+- 전투 효과음은 미리 로드(고정), 나머지는 첫 재생 시 로드 후 메모리 한도 내 LRU로 관리
+- 이름 → SFXType 변환은 dict 조회 (enum 순회 없음)
+- 전투 효과음 전용 예약 채널 + 가장 오래된 소리를 끊는 보이스 스틸링으로 연타 시에도 누락 방지
+- SDL_AUDIODRIVER=dummy 환경에서도 동작
+"""
+
+import time
+import random
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pygame
+
+# 전투 중 연달아 재생되는 효과음 (SFXType 이름 기준)
+COMBAT_SFX_NAMES = (
+    'SWORD_HIT', 'CRITICAL_HIT', 'MAGIC_CAST', 'MAGIC_HIT', 'ARROW_SHOT', 'GUN_SHOT',
+    'EXPLOSION', 'MISS', 'BLOCK', 'DODGE', 'HEAL', 'POISON', 'BURN', 'FREEZE', 'SHOCK',
+    'BUFF_ON', 'DEBUFF_ON', 'BUFF_OFF', 'DEBUFF_OFF', 'ULTIMATE', 'DEATH', 'BATTLE_SWIRL',
+)
+
+DEFAULT_MAX_CACHE_BYTES = 48 * 1024 * 1024   # 지연 로드 효과음 디코딩 데이터 상한
+DEFAULT_NUM_CHANNELS = 24
+DEFAULT_RESERVED_CHANNELS = 8                 # 전투 효과음 전용 채널 수
+
+
+class SFXBank:
+    """디코딩된 효과음 캐시 + 채널 관리자"""
+
+    def __init__(self, sfx_path: Path, sfx_files: Dict, sfx_enum,
+                 max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+                 num_channels: int = DEFAULT_NUM_CHANNELS,
+                 reserved_channels: int = DEFAULT_RESERVED_CHANNELS,
+                 debug_mode: bool = False):
+        self.sfx_path = Path(sfx_path)
+        self.sfx_files = sfx_files
+        self.max_cache_bytes = max_cache_bytes
+        self.num_channels = num_channels
+        self.reserved_count = min(reserved_channels, num_channels)
+        self.debug_mode = debug_mode
+
+        # 이름/값(대소문자 무시) → enum 멤버
+        self._name_index = {}
+        for member in sfx_enum:
+            self._name_index[member.value.lower()] = member
+            self._name_index[member.name.lower()] = member
+
+        self._combat_types = {member for member in sfx_enum if member.name in COMBAT_SFX_NAMES}
+
+        self._pinned: Dict[str, pygame.mixer.Sound] = {}            # 전투 효과음 (제거 안 함)
+        self._lru: "OrderedDict[str, tuple]" = OrderedDict()       # 파일명 → (Sound, 바이트)
+        self._cache_bytes = 0
+        self._missing_files = set()
+
+        self._reserved: List[pygame.mixer.Channel] = []
+        self._reserved_started: List[float] = []
+        self._channels_ready = False
+
+        self.stats = {'hits': 0, 'decodes': 0, 'evictions': 0, 'steals': 0}
+
+    # =====================================
+    # 이름 변환 / 로드
+    # =====================================
+
+    def resolve(self, sfx_type):
+        """문자열/enum → 매핑된 SFXType (없으면 None)"""
+        if isinstance(sfx_type, str):
+            sfx_type = self._name_index.get(sfx_type.lower())
+        if sfx_type is None or sfx_type not in self.sfx_files:
+            return None
+        return sfx_type
+
+    def _setup_channels(self):
+        if self._channels_ready or not pygame.mixer.get_init():
+            return
+        pygame.mixer.set_num_channels(self.num_channels)
+        pygame.mixer.set_reserved(self.reserved_count)
+        self._reserved = [pygame.mixer.Channel(i) for i in range(self.reserved_count)]
+        self._reserved_started = [0.0] * self.reserved_count
+        self._channels_ready = True
+
+    def _decode(self, filename: str) -> Optional[pygame.mixer.Sound]:
+        if filename in self._missing_files:
+            return None
+        file_path = self.sfx_path / filename
+        if not file_path.exists():
+            self._missing_files.add(filename)
+            if self.debug_mode:
+                print(f"⚠️ SFX 파일이 없음: {file_path}")
+            return None
+        self.stats['decodes'] += 1
+        return pygame.mixer.Sound(str(file_path))
+
+    @staticmethod
+    def _sound_bytes(sound: pygame.mixer.Sound) -> int:
+        """디코딩된 PCM 크기 추정 (get_raw 복사 없이 길이로 계산)"""
+        mixer_info = pygame.mixer.get_init()
+        if not mixer_info:
+            return 0
+        frequency, size, channels = mixer_info
+        return int(sound.get_length() * frequency * (abs(size) // 8) * channels)
+
+    def get_sound(self, filename: str) -> Optional[pygame.mixer.Sound]:
+        """파일명 → 디코딩된 Sound (캐시 우선)"""
+        sound = self._pinned.get(filename)
+        if sound is not None:
+            self.stats['hits'] += 1
+            return sound
+
+        cached = self._lru.get(filename)
+        if cached is not None:
+            self._lru.move_to_end(filename)
+            self.stats['hits'] += 1
+            return cached[0]
+
+        sound = self._decode(filename)
+        if sound is None:
+            return None
+        nbytes = self._sound_bytes(sound)
+        self._lru[filename] = (sound, nbytes)
+        self._cache_bytes += nbytes
+        while self._cache_bytes > self.max_cache_bytes and len(self._lru) > 1:
+            _, (_, evicted_bytes) = self._lru.popitem(last=False)
+            self._cache_bytes -= evicted_bytes
+            self.stats['evictions'] += 1
+        return sound
+
+    def preload(self, sfx_types: Iterable = None) -> int:
+        """효과음 미리 디코딩 후 고정 (기본: 전투 효과음)"""
+        if not pygame.mixer.get_init():
+            return 0
+        self._setup_channels()
+        loaded = 0
+        for sfx_type in (self._combat_types if sfx_types is None else sfx_types):
+            for filename in self.sfx_files.get(sfx_type, []):
+                if filename in self._pinned:
+                    continue
+                cached = self._lru.pop(filename, None)
+                if cached is not None:
+                    self._cache_bytes -= cached[1]
+                    sound = cached[0]
+                else:
+                    sound = self._decode(filename)
+                if sound is not None:
+                    self._pinned[filename] = sound
+                    loaded += 1
+        if self.debug_mode:
+            print(f"🔊 SFX 미리 로드: {loaded}개")
+        return loaded
+
+    # =====================================
+    # 재생
+    # =====================================
+
+    def _combat_channel(self) -> Optional[pygame.mixer.Channel]:
+        """예약 채널 중 빈 채널, 없으면 가장 오래 재생 중인 채널을 빼앗음"""
+        if not self._reserved:
+            return None
+        for index, channel in enumerate(self._reserved):
+            if not channel.get_busy():
+                self._reserved_started[index] = time.monotonic()
+                return channel
+        index = min(range(len(self._reserved)), key=self._reserved_started.__getitem__)
+        self._reserved[index].stop()
+        self._reserved_started[index] = time.monotonic()
+        self.stats['steals'] += 1
+        return self._reserved[index]
+
+    def play(self, sfx_type, volume: float) -> Optional[str]:
+        """SFX 재생 - 재생한 파일명 반환 (실패 시 None)"""
+        resolved = self.resolve(sfx_type)
+        if resolved is None:
+            return None
+        self._setup_channels()
+
+        selected_file = random.choice(self.sfx_files[resolved])
+        sound = self.get_sound(selected_file)
+        if sound is None:
+            return None
+
+        if resolved in self._combat_types:
+            channel = self._combat_channel()
+        else:
+            # 일반 채널 - 모두 사용 중이면 가장 오래된 소리를 끊고 재생
+            channel = pygame.mixer.find_channel(False)
+            if channel is None:
+                channel = pygame.mixer.find_channel(True)
+                self.stats['steals'] += 1
+        if channel is None:
+            return None
+
+        channel.set_volume(volume)
+        channel.play(sound)
+        return selected_file
+
+    def clear(self):
+        """캐시 비우기 (믹서 종료 전 호출)"""
+        self._pinned.clear()
+        self._lru.clear()
+        self._cache_bytes = 0
+        self._missing_files.clear()
+        self._reserved = []
+        self._reserved_started = []
+        self._channels_ready = False
+
+    @property
+    def cache_bytes(self) -> int:
+        return self._cache_bytes
@@ -6,6 +6,9 @@
 
 import random
 import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional, Any
 from enum import Enum, IntEnum
 from dataclasses import dataclass
@@ -48,6 +51,701 @@ class AIMemory:
             self.target_preferences = {}
 
 
+def _analyze_turn_forecast(character, allies: List, enemies: List, battlefield_state: Dict) -> Dict:
+    """턴 순서 예측 분석 - battlefield_state의 예측을 우선 사용하고, 없으면 공유 예측기에서 가져옴"""
+    forecast = (battlefield_state or {}).get('turn_forecast')
+    if forecast is None:
+        try:
+            from game.turn_forecast import get_turn_forecaster
+            forecast = get_turn_forecaster().get_forecast(list(allies) + list(enemies) + [character], 8)
+        except Exception:
+            forecast = []
+    
+    opponent_ids = {id(e) for e in enemies}
+    acting_first = []
+    turns_until_self = None
+    for index, entry in enumerate(forecast):
+        if entry.combatant is character:
+            turns_until_self = index
+            break
+        if id(entry.combatant) in opponent_ids:
+            acting_first.append(entry.combatant)
+    
+    return {
+        'turn_forecast': forecast,
+        'turns_until_self': turns_until_self,
+        'opponents_acting_first': acting_first,
+    }
+
+
+# =====================================
+# 🧮 전장 분석 캐시
+# =====================================
+
+# 성격별 행동 가중치 (SmartEnemyAI/AllyAI 공용)
+_PERSONALITY_WEIGHTS = {
+    AIPersonality.AGGRESSIVE: {
+        'attack': 0.7, 'skill': 0.2, 'defend': 0.05, 'heal': 0.05
+    },
+    AIPersonality.DEFENSIVE: {
+        'attack': 0.3, 'skill': 0.2, 'defend': 0.4, 'heal': 0.1
+    },
+    AIPersonality.TACTICAL: {
+        'attack': 0.4, 'skill': 0.35, 'defend': 0.15, 'heal': 0.1
+    },
+    AIPersonality.BERSERKER: {
+        'attack': 0.8, 'skill': 0.15, 'defend': 0.02, 'heal': 0.03
+    },
+    AIPersonality.SUPPORT: {
+        'attack': 0.2, 'skill': 0.4, 'defend': 0.2, 'heal': 0.2
+    },
+    AIPersonality.ADAPTIVE: {
+        'attack': 0.4, 'skill': 0.3, 'defend': 0.2, 'heal': 0.1
+    }
+}
+
+BATTLEFIELD_CACHE_SIZE = 32   # 동시에 진행되는 전투(학습 러너 스레드 등)를 고려한 보관 개수
+
+
+def _threat_level_for(total_enemy_power: float, character) -> ThreatLevel:
+    """상대 진영 총 공격력 대비 내 방어력으로 위협 수준 평가"""
+    character_defense = character.physical_defense + character.magic_defense
+    threat_ratio = total_enemy_power / max(1, character_defense)
+    
+    if threat_ratio > 3.0:
+        return ThreatLevel.CRITICAL
+    elif threat_ratio > 2.0:
+        return ThreatLevel.HIGH
+    elif threat_ratio > 1.0:
+        return ThreatLevel.MEDIUM
+    else:
+        return ThreatLevel.LOW
+
+
+@lru_cache(maxsize=4096)
+def _estimated_damage(attack: int, defense: int) -> float:
+    """예상 데미지 (공격력/방어력 값이 곧 능력치 버전이라 값 쌍으로 메모이즈)"""
+    # 간단한 데미지 공식
+    estimated_damage = max(1, attack - defense * 0.5)
+    
+    # 크리티컬 확률 고려
+    crit_chance = 0.1
+    return estimated_damage * (1 + crit_chance * 0.5)
+
+
+def _combatant_state(combatant) -> tuple:
+    """분석 결과에 영향을 주는 전투원 상태 (ATB 게이지는 제외 - 누군가 행동하기 전까지 같은 분석 재사용)"""
+    return (id(combatant), combatant.current_hp, combatant.max_hp, combatant.current_mp, combatant.max_mp,
+            combatant.is_alive, combatant.physical_attack, combatant.magic_attack,
+            combatant.physical_defense, combatant.magic_defense, getattr(combatant, 'is_player', False))
+
+
+class BattlefieldAnalysis:
+    """한 진영(allies)이 본 전장 분석 - 같은 상태에서 행동하는 모든 AI가 공유"""
+    
+    def __init__(self, allies: List, enemies: List):
+        self.allies = list(allies)
+        self.enemies = list(enemies)
+        self.alive_allies = [a for a in self.allies if a.is_alive]
+        self.alive_enemies = [e for e in self.enemies if e.is_alive]
+        
+        power = lambda c: c.physical_attack + c.magic_attack
+        self.strongest_enemy = max(self.enemies, key=power) if self.enemies else None
+        self.weakest_enemy = min(self.enemies, key=lambda e: e.current_hp) if self.enemies else None
+        self.strongest_alive_enemy = max(self.alive_enemies, key=power) if self.alive_enemies else None
+        self.total_enemy_power = sum(power(e) for e in self.alive_enemies)
+        self.low_hp_enemies = [e for e in self.enemies
+                               if getattr(e, 'current_hp', 100) / getattr(e, 'max_hp', 100) < 0.4]
+        
+        ally_ratios = [(a, a.current_hp / a.max_hp) for a in self.alive_allies]
+        self.allies_need_healing = any(ratio < 0.4 for _, ratio in ally_ratios)
+        self.party_health_avg = sum(ratio for _, ratio in ally_ratios) / len(ally_ratios) if ally_ratios else 0.0
+        self.critical_members = [a for a, ratio in ally_ratios if ratio < 0.25]
+        self.injured_members = [a for a, ratio in ally_ratios if ratio < 0.6]
+        self.player_needs_help = any(m.current_hp / m.max_hp < 0.3 for m in self.allies
+                                     if hasattr(m, 'is_player') and m.is_player)
+    
+    def threat_level(self, character) -> ThreatLevel:
+        """행동하는 캐릭터 기준 위협 수준 (공유 합계로 O(1))"""
+        if not self.enemies:
+            return ThreatLevel.LOW
+        return _threat_level_for(self.total_enemy_power, character)
+
+
+class BattlefieldAnalysisCache:
+    """전투원 상태 지문 → BattlefieldAnalysis (여러 AI가 같은 틱에 행동해도 분석은 한 번)"""
+    
+    def __init__(self, max_entries: int = BATTLEFIELD_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, BattlefieldAnalysis]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+    
+    def get(self, allies: List, enemies: List) -> BattlefieldAnalysis:
+        key = (tuple(_combatant_state(a) for a in allies), tuple(_combatant_state(e) for e in enemies))
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is not None:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return analysis
+        
+        analysis = BattlefieldAnalysis(allies, enemies)
+        with self._lock:
+            self.stats['misses'] += 1
+            self._entries[key] = analysis
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return analysis
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 전역 전장 분석 캐시
+_battlefield_analysis_cache = None
+
+
+def get_battlefield_analysis_cache() -> BattlefieldAnalysisCache:
+    """전장 분석 캐시 가져오기"""
+    global _battlefield_analysis_cache
+    if _battlefield_analysis_cache is None:
+        _battlefield_analysis_cache = BattlefieldAnalysisCache()
+    return _battlefield_analysis_cache
+
+# =====================================
+# 📋 스킬 우선순위 테이블
+# =====================================
+
+# 스킬 타입 → (기본 우선순위, 성격 가중치 키)
+_SKILL_TYPE_PRIORITY = {
+    'BRV_ATTACK': (60, 'attack'), 'brv_attack': (60, 'attack'),
+    'HP_ATTACK': (80, 'attack'), 'hp_attack': (80, 'attack'),
+    'HEAL': (70, 'heal'), 'heal': (70, 'heal'), 'SUPPORT': (70, 'heal'), 'support': (70, 'heal'),
+    'DEBUFF': (65, 'skill'), 'debuff': (65, 'skill'),
+}
+
+# 직업별 가상 스킬 (스킬 DB를 쓸 수 없을 때의 폴백)
+_VIRTUAL_CLASS_SKILLS = {
+    '전사': [
+        {'name': '강공격', 'type': 'BRV_ATTACK', 'power': 1.5, 'mp_cost': 20, 'target': 'single_enemy'},
+        {'name': '결정타', 'type': 'HP_ATTACK', 'power': 2.0, 'mp_cost': 40, 'target': 'single_enemy'}
+    ],
+    '궁수': [
+        {'name': '연속사격', 'type': 'BRV_ATTACK', 'power': 1.3, 'mp_cost': 15, 'target': 'single_enemy'},
+        {'name': '관통사격', 'type': 'HP_ATTACK', 'power': 1.8, 'mp_cost': 35, 'target': 'single_enemy'}
+    ],
+    '성기사': [
+        {'name': '치유술', 'type': 'HEAL', 'power': 1.5, 'mp_cost': 30, 'target': 'ally'},
+        {'name': '신성공격', 'type': 'BRV_ATTACK', 'power': 1.4, 'mp_cost': 25, 'target': 'single_enemy'}
+    ]
+}
+
+_SKILL_DB_CLASS_SKILLS: Dict[str, Optional[List[Dict]]] = {}   # 직업 → 스킬 DB 스킬 목록 (DB가 없으면 None)
+
+
+def _class_skills_from_db(character_class: str) -> Optional[List[Dict]]:
+    """실제 게임 스킬 DB의 직업 스킬 (직업마다 한 번만 조회, 스킬 시스템이 없으면 None)"""
+    if character_class not in _SKILL_DB_CLASS_SKILLS:
+        try:
+            from game.new_skill_system import SkillDatabase
+            skills = SkillDatabase().get_skills(character_class)
+        except ImportError:
+            skills = None
+        _SKILL_DB_CLASS_SKILLS[character_class] = skills
+    return _SKILL_DB_CLASS_SKILLS[character_class]
+
+
+# 특성 이름 키워드 → 스킬 속성 키워드 (특성 하나당 처음 일치한 속성만 적용)
+_TRAIT_ELEMENT_KEYWORDS = (('화염', 'fire'), ('빙결', 'ice'), ('번개', 'lightning'))
+
+
+def _trait_profile(character) -> Dict[tuple, int]:
+    """스킬 우선순위에 쓰이는 특성 요약 (행동 선택마다 한 번 - 스킬마다 특성을 다시 훑지 않음)"""
+    profile = {}
+    for trait in getattr(character, 'traits', []):
+        trait_name = getattr(trait, 'name', '')
+        key = ('공격력' in trait_name, '마법' in trait_name,
+               '크리티컬' in trait_name or '치명타' in trait_name, '독' in trait_name,
+               tuple(element for keyword, element in _TRAIT_ELEMENT_KEYWORDS if keyword in trait_name))
+        profile[key] = profile.get(key, 0) + 1
+    return profile
+
+
+def _trait_multiplier(profile: Dict[tuple, int], skill: Dict, skill_type: str) -> float:
+    """특성 기반 우선순위 배율"""
+    multiplier = 1.0
+    if not profile:
+        return multiplier
+    element = skill.get('element', '').lower()
+    status_effect = skill.get('status_effect', '')
+    is_attack = skill_type in ['BRV_ATTACK', 'HP_ATTACK', 'BRV_HP_ATTACK']
+    for (attack, magic, critical, poison, elements), count in profile.items():
+        factor = 1.0
+        if attack and is_attack:
+            factor *= 1.2          # 공격력 증가 특성
+        if magic and 'magic' in element:
+            factor *= 1.15         # 마법 특화 특성
+        if critical:
+            factor *= 1.1          # 크리티컬 특성
+        if poison and 'poison' in status_effect:
+            factor *= 1.3          # 상태이상 특성
+        if any(e in element for e in elements):
+            factor *= 1.2          # 속성 특화 특성
+        multiplier *= factor ** count
+    return multiplier
+
+
+# 직업별 스킬 우선순위 배율 - (skill_name, character, enemies, situation, shadow_analysis) → 배율
+
+def _sword_saint_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 검기 스택 관련 스킬 우선순위
+    sword_stacks = getattr(character, 'sword_aura_stacks', 0)
+    if '검기' in skill_name:
+        if sword_stacks < 2:
+            return 1.3  # 검기 쌓기 우선
+        elif sword_stacks == 2 and '검압' in skill_name:
+            return 1.8  # 최대 스택에서 소모 스킬 우선
+    return 1.0
+
+
+def _gladiator_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 처치 스택이 많을수록 명예의 일격 우선
+    kill_stacks = getattr(character, 'kill_stacks', 0)
+    if '명예의 일격' in skill_name and kill_stacks > 0:
+        return 1.0 + kill_stacks * 0.2
+    elif '패링' in skill_name and situation.get('threat_level', 1) >= ThreatLevel.HIGH:
+        return 1.6  # 위험 상황에서 패링 우선
+    return 1.0
+
+
+def _berserker_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # HP가 낮을수록 광기 스킬 우선
+    hp_ratio = character.current_hp / character.max_hp
+    if '광기' in skill_name and hp_ratio < 0.5:
+        return 2.0 - hp_ratio  # HP 낮을수록 우선순위 증가
+    return 1.0
+
+
+def _knight_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 아군이 위험할 때 보호 스킬 우선
+    allies_in_danger = 1 if character.current_hp / character.max_hp < 0.4 else 0
+    if '성스러운 돌격' in skill_name and allies_in_danger > 0:
+        return 1.0 + allies_in_danger * 0.5
+    return 1.0
+
+
+def _paladin_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 성역 히트 카운트가 3에 가까울수록 확장 우선
+    if '성역 확장' in skill_name and getattr(character, 'sanctuary_hits', 0) >= 2:
+        return 1.7
+    return 1.0
+
+
+def _dark_knight_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 흡혈 관련 스킬 우선 (체력이 낮을 때)
+    hp_ratio = character.current_hp / character.max_hp
+    if ('흡혈' in skill_name or '생명력 흡수' in skill_name) and hp_ratio < 0.6:
+        return 1.5 - hp_ratio * 0.5
+    return 1.0
+
+
+def _dragon_knight_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 용의표식이 쌓였을 때 폭발 스킬 우선
+    if '용의 분노' in skill_name and sum(getattr(enemy, 'dragon_mark_stacks', 0) for enemy in enemies) >= 2:
+        return 1.6
+    return 1.0
+
+
+def _archmage_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 원소 순환 시스템 고려
+    if getattr(character, 'elemental_combo', 0) >= 2 and any(elem in skill_name for elem in ['라이트닝', '파이어', '아이스']):
+        return 1.4  # 원소 연쇄 기회
+    return 1.0
+
+
+def _assassin_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 그림자 시스템 고려 (그림자 분석이 있을 때만)
+    if not shadow_analysis:
+        return 1.0
+    shadow_count = getattr(character, 'shadow_count', 0)
+    if '그림자' in skill_name and shadow_count < 3:
+        return 1.4  # 그림자 부족 시 생성 우선
+    elif '폭발' in skill_name and shadow_count >= 2:
+        return 1.6  # 그림자 충분 시 폭발 우선
+    return 1.0
+
+
+def _time_mage_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 시간 되돌리기 스택 시스템
+    time_rewind_stacks = getattr(character, 'time_rewind_stacks', 0)
+    hp_ratio = character.current_hp / character.max_hp
+    
+    if '시간왜곡' in skill_name and time_rewind_stacks < 3:
+        return 1.3  # 시간 스택 쌓기 우선
+    elif '시간되돌리기' in skill_name and (hp_ratio < 0.4 or time_rewind_stacks >= 2):
+        return 1.8  # 위험하거나 스택 충분할 때 회복 우선
+    elif '시간정지' in skill_name and situation.get('threat_level', 1) >= ThreatLevel.HIGH:
+        return 1.7  # 위험 상황에서 시간정지 우선
+    return 1.0
+
+
+def _dimension_mage_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 차원 방패와 잔상 스택 시스템
+    dimension_shield = getattr(character, 'dimension_shield_stacks', 0)
+    afterimage_stacks = getattr(character, 'afterimage_stacks', 0)
+    threat_level = situation.get('threat_level', 1)
+    
+    if '차원장막' in skill_name and (dimension_shield < 3 or threat_level >= ThreatLevel.HIGH):
+        return 1.4  # 방어 부족 시 장막 우선
+    elif '잔상분신' in skill_name and afterimage_stacks < 5:
+        return 1.2  # 잔상 부족 시 분신 우선
+    elif '공간도약' in skill_name and afterimage_stacks >= 3:
+        return 1.5  # 잔상 충분할 때 도약 강화
+    return 1.0
+
+
+def _philosopher_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 지혜 스택 시스템
+    wisdom_stacks = getattr(character, 'wisdom_stacks', 0)
+    
+    if '진실간파' in skill_name and not any(hasattr(enemy, 'analyzed') for enemy in enemies):
+        return 1.6  # 적 분석 우선
+    elif '철학적사고' in skill_name and wisdom_stacks < 5:
+        return 1.3  # 지혜 스택 부족 시 사고 우선
+    elif '존재부정' in skill_name and wisdom_stacks >= 3:
+        return 1.0 + wisdom_stacks * 0.15  # 지혜에 비례 강화
+    return 1.0
+
+
+def _alchemist_priority(skill_name, character, enemies, situation, shadow_analysis):
+    # 포션 제작 스택 시스템
+    potion_stacks = getattr(character, 'potion_craft_stacks', 0)
+    team_hp_ratio = character.current_hp / character.max_hp
+    multiplier = 1.0
+    
+    if '물질변환' in skill_name and potion_stacks < 3:
+        multiplier *= 1.3  # 포션 스택 부족 시 변환 우선
+    elif '회복포션' in skill_name and (team_hp_ratio < 0.6 or potion_stacks >= 2):
+        multiplier *= 1.5  # 체력 부족하거나 포션 충분할 때 회복 우선
+    elif '산성용해' in skill_name and potion_stacks >= 1:
+        multiplier *= 1.2  # 포션으로 공격 강화
+    
+    shadow_analysis = shadow_analysis or {}
+    # 그림자 생성 스킬 (기본 공격류)
+    if '그림자 강타' in skill_name:
+        if shadow_analysis.get('should_generate_shadows', False):
+            multiplier *= 1.5  # 그림자가 필요하면 우선순위 상승
+    
+    # 그림자 소모 스킬
+    elif any(name in skill_name for name in ['그림자 분신', '그림자 칼날', '그림자 폭발', '암영 난무']):
+        if shadow_analysis.get('should_consume_shadows', False) and shadow_analysis.get('has_shadows', False):
+            multiplier *= 1.8  # 그림자 소모가 유리하면 높은 우선순위
+        elif not shadow_analysis.get('has_shadows', False):
+            multiplier *= 0.3  # 그림자가 없으면 우선순위 하락
+    
+    # 궁극기 (그림자 전부 소모)
+    elif '그림자 처형' in skill_name:
+        shadow_count = shadow_analysis.get('shadow_count', 0)
+        if shadow_analysis.get('optimal_shadow_use', False) and shadow_count >= 3:
+            multiplier *= 2.0  # 최적 상황에서 궁극기 우선순위 최대
+        elif shadow_count == 0:
+            multiplier *= 0.1  # 그림자가 없으면 거의 사용 안함
+    return multiplier
+
+
+_CLASS_SKILL_PRIORITY_RULES = {
+    "검성": _sword_saint_priority,
+    "검투사": _gladiator_priority,
+    "광전사": _berserker_priority,
+    "기사": _knight_priority,
+    "성기사": _paladin_priority,
+    "암흑기사": _dark_knight_priority,
+    "용기사": _dragon_knight_priority,
+    "아크메이지": _archmage_priority,
+    "암살자": _assassin_priority,
+    "시간술사": _time_mage_priority,
+    "차원술사": _dimension_mage_priority,
+    "철학자": _philosopher_priority,
+    "연금술사": _alchemist_priority,
+}
+
+
+# =====================================
+# 🎭 직업별 상황 분석
+# =====================================
+
+def _analyze_shadow_state(character, situation: Dict) -> Dict:
+    """그림자 상태 분석 (암살자 클래스 전용)"""
+    # 암살자가 아닌 경우 빈 딕셔너리 반환
+    if getattr(character, 'character_class', '') != "암살자":
+        return {}
+
+    from game.shadow_system import get_shadow_system
+    shadow_count = get_shadow_system().get_shadow_count(character)
+
+    analysis = {
+        'has_shadows': shadow_count > 0,
+        'shadow_count': shadow_count,
+        'can_empower': shadow_count >= 1,
+        'optimal_shadow_use': False,
+        'shadow_priority': 0.0,
+        'should_generate_shadows': False,
+        'should_consume_shadows': False
+    }
+
+    # 상황에 따른 그림자 사용 전략
+    health_ratio = situation.get('self_health_ratio', 1.0)
+    threat_level = situation.get('threat_level', ThreatLevel.LOW)
+    enemy_count = situation.get('enemies_count', 0)
+
+    # 위급 상황에서는 그림자 소모 공격 우선
+    if health_ratio < 0.3 or threat_level == ThreatLevel.CRITICAL:
+        if shadow_count >= 3:
+            analysis['optimal_shadow_use'] = True
+            analysis['should_consume_shadows'] = True
+            analysis['shadow_priority'] = 0.9
+        elif shadow_count >= 1:
+            analysis['should_consume_shadows'] = True
+            analysis['shadow_priority'] = 0.7
+
+    # 적이 많을 때는 그림자 축적 우선
+    elif enemy_count >= 3 and shadow_count < 5:
+        analysis['should_generate_shadows'] = True
+        analysis['shadow_priority'] = 0.6
+
+    # 적이 적고 그림자가 많을 때는 소모 공격
+    elif enemy_count <= 2 and shadow_count >= 3:
+        analysis['should_consume_shadows'] = True
+        analysis['shadow_priority'] = 0.8
+
+    # 그림자가 없을 때는 생성 우선
+    elif shadow_count == 0:
+        analysis['should_generate_shadows'] = True
+        analysis['shadow_priority'] = 0.9
+
+    return analysis
+
+
+def _analyze_druid_nature_gauge(character, party_members: List, enemies: List) -> Dict:
+    """드루이드 자연 게이지 분석"""
+    analysis = {}
+
+    # 자연 친화도 스택과 야생 게이지 확인
+    nature_stacks = getattr(character, 'nature_stacks', 0)
+    wild_gauge = getattr(character, 'wild_gauge', 0)
+    hp_ratio = character.current_hp / character.max_hp
+
+    # HP가 낮으면 자연 회복 우선
+    if hp_ratio < 0.4:
+        analysis['prioritize_nature_healing'] = True
+        analysis['nature_priority'] = 0.9
+
+    # 자연 스택이 높으면 강력한 자연 스킬 사용
+    elif nature_stacks >= 7:
+        analysis['use_nature_ultimate'] = True
+        analysis['nature_priority'] = 0.8
+
+    # 야생 게이지가 높으면 변신 스킬 우선
+    elif wild_gauge >= 80:
+        analysis['should_transform'] = True
+        analysis['wild_priority'] = 0.85
+
+    # 적이 많을 때는 자연 스택 축적
+    enemy_count = len([e for e in enemies if e.is_alive])
+    if enemy_count >= 3 and nature_stacks < 5:
+        analysis['build_nature_stacks'] = True
+        analysis['nature_priority'] = 0.6
+
+    return analysis
+
+
+def _analyze_priest_atonement_system(character, party_members: List, enemies: List) -> Dict:
+    """신관 속죄 시스템 분석"""
+    analysis = {}
+
+    # 속죄 스택과 신성 에너지 확인
+    atonement_stacks = getattr(character, 'atonement_stacks', 0)
+    divine_energy = getattr(character, 'divine_energy', 0)
+
+    # 아군 HP 상태 확인
+    injured_allies = [ally for ally in party_members if ally.is_alive and ally.current_hp / ally.max_hp < 0.6]
+    critically_injured = [ally for ally in party_members if ally.is_alive and ally.current_hp / ally.max_hp < 0.3]
+
+    # 심각한 부상자가 있으면 즉시 치유
+    if critically_injured:
+        analysis['emergency_heal'] = True
+        analysis['heal_priority'] = 1.0
+
+    # 속죄 스택이 높고 신성 에너지가 충분하면 대규모 치유
+    elif atonement_stacks >= 6 and divine_energy >= 80:
+        analysis['mass_divine_heal'] = True
+        analysis['divine_priority'] = 0.9
+
+    # 부상자가 많으면 속죄 스택 활용한 광역 치유
+    elif len(injured_allies) >= 2 and atonement_stacks >= 4:
+        analysis['atonement_heal'] = True
+        analysis['heal_priority'] = 0.8
+
+    # 스택이 부족하면 축적 우선
+    elif atonement_stacks < 3:
+        analysis['build_atonement'] = True
+        analysis['stack_priority'] = 0.7
+
+    return analysis
+
+
+def _analyze_mystic_sword_elemental_harmony(character, party_members: List, enemies: List) -> Dict:
+    """마검사 원소 조화 분석"""
+    analysis = {}
+
+    # 원소 조화 스택과 임시 원소 확인
+    harmony_stacks = getattr(character, 'elemental_harmony', 0)
+    temp_element = getattr(character, 'temp_element', None)
+
+    enemy_count = len([e for e in enemies if e.is_alive])
+
+    # 원소 조화 스택이 최대치면 폭발 스킬 사용
+    if harmony_stacks >= 6:
+        analysis['elemental_explosion'] = True
+        analysis['explosion_priority'] = 0.9
+
+    # 적이 많고 조화 스택이 충분하면 광역 원소 공격
+    elif enemy_count >= 3 and harmony_stacks >= 4:
+        analysis['area_elemental_attack'] = True
+        analysis['elemental_priority'] = 0.8
+
+    # 임시 원소가 있으면 해당 원소 특화 스킬 우선
+    elif temp_element:
+        analysis['use_elemental_skill'] = True
+        analysis['element_type'] = temp_element
+        analysis['elemental_priority'] = 0.7
+
+    # 조화 스택이 낮으면 축적 우선
+    elif harmony_stacks < 3:
+        analysis['build_harmony'] = True
+        analysis['harmony_priority'] = 0.6
+
+    return analysis
+
+
+def _analyze_monk_chi_balance(character, party_members: List, enemies: List) -> Dict:
+    """몽크 기공 밸런스 분석"""
+    analysis = {}
+
+    # 기공 에너지와 콤보 카운트 확인
+    chi_energy = getattr(character, 'chi_energy', 0)
+    combo_count = getattr(character, 'combo_count', 0)
+    hp_ratio = character.current_hp / character.max_hp
+
+    # HP가 낮으면 기공 회복 우선
+    if hp_ratio < 0.5:
+        analysis['chi_healing'] = True
+        analysis['heal_priority'] = 0.8
+
+    # 콤보 카운트가 높으면 피니시 기술
+    elif combo_count >= 4:
+        analysis['combo_finisher'] = True
+        analysis['combo_priority'] = 0.9
+
+    # 기공 에너지가 충분하면 강화 기술
+    elif chi_energy >= 80:
+        analysis['chi_enhanced_attack'] = True
+        analysis['chi_priority'] = 0.8
+
+    # 적이 많으면 연속 공격으로 콤보 축적
+    enemy_count = len([e for e in enemies if e.is_alive])
+    if enemy_count >= 2 and combo_count < 3:
+        analysis['build_combo'] = True
+        analysis['combo_priority'] = 0.6
+
+    # 기공 에너지가 부족하면 순환 기술
+    elif chi_energy < 30:
+        analysis['chi_circulation'] = True
+        analysis['chi_priority'] = 0.7
+
+    return analysis
+
+
+def _analyze_necromancer_soul_management(character, party_members: List, enemies: List) -> Dict:
+    """네크로맨서 영혼 관리 분석"""
+    analysis = {}
+
+    # 영혼 에너지와 언데드 상태 확인
+    soul_energy = getattr(character, 'soul_energy', 0)
+    has_undead = getattr(character, 'undead_minions', 0) > 0
+
+    enemy_count = len([e for e in enemies if e.is_alive])
+    weak_enemies = [e for e in enemies if e.is_alive and e.current_hp / e.max_hp < 0.3]
+
+    # 약한 적이 있으면 영혼 수확 우선
+    if weak_enemies and soul_energy < 80:
+        analysis['soul_harvest_target'] = True
+        analysis['harvest_priority'] = 0.9
+
+    # 영혼 에너지가 충분하면 언데드 소환
+    elif soul_energy >= 70 and not has_undead:
+        analysis['summon_undead'] = True
+        analysis['summon_priority'] = 0.8
+
+    # 적이 많고 언데드가 있으면 강화
+    elif enemy_count >= 3 and has_undead:
+        analysis['enhance_undead'] = True
+        analysis['undead_priority'] = 0.7
+
+    # 영혼 에너지가 부족하면 흡수 우선
+    elif soul_energy < 30:
+        analysis['life_drain_focus'] = True
+        analysis['drain_priority'] = 0.8
+
+    return analysis
+
+
+def _analyze_samurai_willpower_system(character, party_members: List, enemies: List) -> Dict:
+    """사무라이 의지 시스템 분석"""
+    analysis = {}
+
+    # 의지 게이지 확인
+    willpower = getattr(character, 'willpower_gauge', 0)
+
+    enemy_count = len([e for e in enemies if e.is_alive])
+    strong_enemies = [e for e in enemies if e.is_alive and e.current_hp / e.max_hp > 0.8]
+
+    # 의지 게이지가 최대치면 거합 일격
+    if willpower >= 100:
+        analysis['iai_strike'] = True
+        analysis['iai_priority'] = 1.0
+
+    # 강한 적이 있고 의지가 충분하면 무사도 정신
+    elif strong_enemies and willpower >= 80:
+        analysis['bushido_spirit'] = True
+        analysis['bushido_priority'] = 0.9
+
+    # 적이 많고 의지가 중간 정도면 연속 베기
+    elif enemy_count >= 3 and willpower >= 50:
+        analysis['continuous_slash'] = True
+        analysis['slash_priority'] = 0.8
+
+    # 의지가 부족하면 축적 우선
+    elif willpower < 40:
+        analysis['build_willpower'] = True
+        analysis['willpower_priority'] = 0.7
+
+    return analysis
+
+
+# 직업별 특수 상황 분석기 (AllyAI.choose_action에서 직업 이름으로 바로 찾음)
+_CLASS_SITUATION_ANALYZERS = {
+    "드루이드": _analyze_druid_nature_gauge,
+    "신관": _analyze_priest_atonement_system,
+    "마검사": _analyze_mystic_sword_elemental_harmony,
+    "몽크": _analyze_monk_chi_balance,
+    "네크로맨서": _analyze_necromancer_soul_management,
+    "사무라이": _analyze_samurai_willpower_system,
+}
+
+
 class AllyAI:
     """아군 AI - 플레이어를 도와주는 파티원 AI"""
     
@@ -98,6 +796,16 @@ class AllyAI:
             "damage": 0.5, "tank": 0.5, "support": 0.5, "heal": 0.5
         })
     
+    def _setup_personality_weights(self) -> Dict[str, float]:
+        """성격별 행동 가중치"""
+        return dict(_PERSONALITY_WEIGHTS[self.personality])
+    
+    def _assess_threat_level(self, character, enemies: List) -> ThreatLevel:
+        """위협 수준 평가"""
+        if not enemies:
+            return ThreatLevel.LOW
+        return _threat_level_for(sum(e.physical_attack + e.magic_attack for e in enemies if e.is_alive), character)
+    
     def choose_action(self, character, party_members: List, enemies: List, battlefield_state: Dict) -> Dict:
         """아군이 취할 최적 행동 선택"""
         if not character.is_alive:
@@ -107,24 +815,9 @@ class AllyAI:
         situation = self._analyze_party_situation(character, party_members, enemies, battlefield_state)
         
         # 직업별 특수 분석 추가
-        if character.character_class == "드루이드":
-            druid_analysis = self._analyze_druid_nature_gauge(character, enemies)
-            situation.update(druid_analysis)
-        elif character.character_class == "신관":
-            priest_analysis = self._analyze_priest_atonement_system(character, party_members)
-            situation.update(priest_analysis)
-        elif character.character_class == "마검사":
-            mystic_analysis = self._analyze_mystic_sword_elemental_harmony(character, enemies)
-            situation.update(mystic_analysis)
-        elif character.character_class == "몽크":
-            monk_analysis = self._analyze_monk_chi_balance(character, party_members, enemies)
-            situation.update(monk_analysis)
-        elif character.character_class == "네크로맨서":
-            necro_analysis = self._analyze_necromancer_soul_management(character, enemies)
-            situation.update(necro_analysis)
-        elif character.character_class == "사무라이":
-            samurai_analysis = self._analyze_samurai_willpower_system(character, enemies)
-            situation.update(samurai_analysis)
+        class_analyzer = _CLASS_SITUATION_ANALYZERS.get(character.character_class)
+        if class_analyzer is not None:
+            situation.update(class_analyzer(character, party_members, enemies))
         
         # 행동 옵션 생성
         action_options = []
@@ -156,19 +849,24 @@ class AllyAI:
         return {"type": "basic_attack", "target": enemies[0] if enemies else None, "priority": 10}
     
     def _analyze_party_situation(self, character, party_members: List, enemies: List, battlefield_state: Dict) -> Dict:
-        """파티 상황 분석"""
+        """파티 상황 분석 - 진영 공통 분석은 전장 분석 캐시에서 공유"""
+        battlefield = get_battlefield_analysis_cache().get(party_members, enemies)
         situation = {
             'self_health_ratio': character.current_hp / character.max_hp,
             'self_mp_ratio': character.current_mp / character.max_mp,
-            'party_health_avg': sum(m.current_hp / m.max_hp for m in party_members if m.is_alive) / len([m for m in party_members if m.is_alive]),
-            'critical_members': [m for m in party_members if m.is_alive and m.current_hp / m.max_hp < 0.25],
-            'injured_members': [m for m in party_members if m.is_alive and m.current_hp / m.max_hp < 0.6],
-            'enemies_count': len([e for e in enemies if e.is_alive]),
-            'strongest_enemy': max(enemies, key=lambda e: e.physical_attack + e.magic_attack) if enemies else None,
-            'threat_level': self._assess_threat_level(character, enemies),
-            'player_needs_help': any(m.current_hp / m.max_hp < 0.3 for m in party_members if hasattr(m, 'is_player') and m.is_player)
+            'party_health_avg': battlefield.party_health_avg,
+            'critical_members': battlefield.critical_members,
+            'injured_members': battlefield.injured_members,
+            'enemies_count': len(battlefield.alive_enemies),
+            'strongest_enemy': battlefield.strongest_enemy,
+            'threat_level': battlefield.threat_level(character),
+            'player_needs_help': battlefield.player_needs_help,
+            'battlefield': battlefield
         }
         
+        # 턴 순서 예측 (전투 UI와 같은 예측 결과 공유)
+        situation.update(_analyze_turn_forecast(character, party_members, enemies, battlefield_state))
+        
         return situation
     
     def _generate_heal_options(self, character, party_members: List, situation: Dict) -> List[Dict]:
@@ -183,6 +881,8 @@ class AllyAI:
             priority = 90 * self.role_weights['heal'] * self.cooperation_level
             if hasattr(member, 'is_player') and member.is_player:
                 priority *= 1.3  # 플레이어 우선 치료
+            if situation.get('opponents_acting_first'):
+                priority *= 1.2  # 다음 내 턴 전에 적이 먼저 행동
             
             heal_options.append({
                 'type': 'heal',
@@ -299,27 +999,7 @@ class SmartEnemyAI:
         
     def _get_personality_weights(self) -> Dict[str, float]:
         """성격별 행동 가중치"""
-        weights = {
-            AIPersonality.AGGRESSIVE: {
-                'attack': 0.7, 'skill': 0.2, 'defend': 0.05, 'heal': 0.05
-            },
-            AIPersonality.DEFENSIVE: {
-                'attack': 0.3, 'skill': 0.2, 'defend': 0.4, 'heal': 0.1
-            },
-            AIPersonality.TACTICAL: {
-                'attack': 0.4, 'skill': 0.35, 'defend': 0.15, 'heal': 0.1
-            },
-            AIPersonality.BERSERKER: {
-                'attack': 0.8, 'skill': 0.15, 'defend': 0.02, 'heal': 0.03
-            },
-            AIPersonality.SUPPORT: {
-                'attack': 0.2, 'skill': 0.4, 'defend': 0.2, 'heal': 0.2
-            },
-            AIPersonality.ADAPTIVE: {
-                'attack': 0.4, 'skill': 0.3, 'defend': 0.2, 'heal': 0.1
-            }
-        }
-        return weights[self.personality]
+        return dict(_PERSONALITY_WEIGHTS[self.personality])
     
     def choose_action(self, character, allies: List, enemies: List, battlefield_state: Dict) -> Dict[str, Any]:
         """행동 선택 - BRV/HP 전략 + 그림자 시스템 적용"""
@@ -329,8 +1009,11 @@ class SmartEnemyAI:
         situation = self._analyze_situation(character, allies, enemies, battlefield_state)
         
         # 🌑 그림자 시스템 분석 (암살자인 경우)
-        if getattr(character, 'character_class', '') == '암살자':
-            situation.update(self._analyze_shadow_system(character))
+        situation['shadow_analysis'] = _analyze_shadow_state(character, situation)
+        situation.update(situation['shadow_analysis'])
+        
+        # 특성 요약 (스킬마다 특성 목록을 다시 훑지 않도록)
+        situation['trait_profile'] = _trait_profile(character)
         
         # BRV/HP 전략 평가
         brv_hp_strategy = self._evaluate_brv_hp_strategy(character, enemies, situation)
@@ -364,7 +1047,11 @@ class SmartEnemyAI:
             strategy['brv_urgency'] = 'low'
         
         # 적 HP 상태 확인 (HP 공격 타이밍)
-        low_hp_enemies = [e for e in enemies if getattr(e, 'current_hp', 100) / getattr(e, 'max_hp', 100) < 0.4]
+        battlefield = situation.get('battlefield')
+        if battlefield is not None and battlefield.enemies == enemies:
+            low_hp_enemies = battlefield.low_hp_enemies
+        else:
+            low_hp_enemies = [e for e in enemies if getattr(e, 'current_hp', 100) / getattr(e, 'max_hp', 100) < 0.4]
         if low_hp_enemies and brv_ratio >= 0.3:
             strategy['hp_attack_opportunity'] = True
             strategy['priority_targets'] = low_hp_enemies
@@ -375,6 +1062,9 @@ class SmartEnemyAI:
         # 위급 상황에서는 즉시 HP 공격
         if situation.get('threat_level') == ThreatLevel.CRITICAL and brv_ratio >= 0.2:
             strategy['emergency_hp_attack'] = True
+        # 내 다음 턴 전에 상대가 여럿 행동하면 BREAK 당하기 전에 BRV 소모
+        elif len(situation.get('opponents_acting_first', [])) >= 2 and brv_ratio >= 0.5:
+            strategy['emergency_hp_attack'] = True
         else:
             strategy['emergency_hp_attack'] = False
         
@@ -387,46 +1077,40 @@ class SmartEnemyAI:
         return chosen_action
     
     def _analyze_situation(self, character, allies: List, enemies: List, battlefield_state: Dict) -> Dict:
-        """상황 분석"""
+        """상황 분석 - 진영 공통 분석은 전장 분석 캐시에서 공유"""
+        battlefield = get_battlefield_analysis_cache().get(allies, enemies)
         situation = {
             'self_health_ratio': character.current_hp / character.max_hp,
             'self_mp_ratio': character.current_mp / character.max_mp,
-            'allies_count': len([a for a in allies if a.is_alive]),
-            'enemies_count': len([e for e in enemies if e.is_alive]),
-            'strongest_enemy': max(enemies, key=lambda e: e.physical_attack + e.magic_attack) if enemies else None,
-            'weakest_enemy': min(enemies, key=lambda e: e.current_hp) if enemies else None,
-            'threat_level': self._assess_threat_level(character, enemies),
-            'allies_need_healing': any(a.current_hp / a.max_hp < 0.4 for a in allies if a.is_alive),
-            'turn_count': self.turn_count
+            'allies_count': len(battlefield.alive_allies),
+            'enemies_count': len(battlefield.alive_enemies),
+            'strongest_enemy': battlefield.strongest_enemy,
+            'weakest_enemy': battlefield.weakest_enemy,
+            'threat_level': battlefield.threat_level(character),
+            'allies_need_healing': battlefield.allies_need_healing,
+            'turn_count': self.turn_count,
+            'battlefield': battlefield
         }
         
+        # 턴 순서 예측 (전투 UI와 같은 예측 결과 공유)
+        situation.update(_analyze_turn_forecast(character, allies, enemies, battlefield_state))
+        
         return situation
     
     def _assess_threat_level(self, character, enemies: List) -> ThreatLevel:
         """위협 수준 평가"""
         if not enemies:
             return ThreatLevel.LOW
-        
-        total_enemy_power = sum(e.physical_attack + e.magic_attack for e in enemies if e.is_alive)
-        character_defense = character.physical_defense + character.magic_defense
-        
-        threat_ratio = total_enemy_power / max(1, character_defense)
-        
-        if threat_ratio > 3.0:
-            return ThreatLevel.CRITICAL
-        elif threat_ratio > 2.0:
-            return ThreatLevel.HIGH
-        elif threat_ratio > 1.0:
-            return ThreatLevel.MEDIUM
-        else:
-            return ThreatLevel.LOW
+        return _threat_level_for(sum(e.physical_attack + e.magic_attack for e in enemies if e.is_alive), character)
     
     def _generate_action_options(self, character, allies: List, enemies: List, situation: Dict) -> List[Dict]:
         """행동 옵션 생성 - BRV/HP 공격 시스템 적용"""
         options = []
         
         # 그림자 상태 분석 (암살자 전용)
-        shadow_analysis = self._analyze_shadow_state(character, situation)
+        shadow_analysis = situation.get('shadow_analysis')
+        if shadow_analysis is None:
+            shadow_analysis = _analyze_shadow_state(character, situation)
         
         # BRV/HP 공격 옵션
         for enemy in enemies:
@@ -497,32 +1181,30 @@ class SmartEnemyAI:
         skill_options = []
         
         # 그림자 상태 분석 (암살자 전용)
-        shadow_analysis = self._analyze_shadow_state(character, situation)
+        shadow_analysis = situation.get('shadow_analysis')
+        if shadow_analysis is None:
+            shadow_analysis = _analyze_shadow_state(character, situation)
         
-        try:
-            # 실제 게임의 스킬 시스템 사용
-            from game.new_skill_system import SkillDatabase
-            skill_db = SkillDatabase()
-            character_class = getattr(character, 'character_class', '전사')
-            available_skills = skill_db.get_skills(character_class)
-            
-            if available_skills:
-                for skill in available_skills:
-                    mp_cost = skill.get('mp_cost', 0)
-                    if mp_cost <= character.current_mp:
-                        skill_priority = self._calculate_skill_priority(skill, character, enemies, situation, shadow_analysis)
-                        
-                        skill_options.append({
-                            'type': 'skill',
-                            'skill': skill,
-                            'target': self._select_skill_target(skill, enemies),
-                            'priority': skill_priority,
-                            'expected_outcome': f"스킬: {skill.get('name', '알 수 없음')}",
-                            'mp_cost': mp_cost
-                        })
-        except ImportError:
+        # 실제 게임의 스킬 시스템 사용 (직업별 스킬 목록은 한 번만 조회)
+        character_class = getattr(character, 'character_class', '전사')
+        available_skills = _class_skills_from_db(character_class)
+        if available_skills is None:
             # 스킬 시스템을 찾을 수 없으면 가상 스킬 사용
-            skill_options = self._generate_virtual_skill_options(character, allies, enemies, situation)
+            return self._generate_virtual_skill_options(character, allies, enemies, situation)
+        
+        for skill in available_skills:
+            mp_cost = skill.get('mp_cost', 0)
+            if mp_cost <= character.current_mp:
+                skill_priority = self._calculate_skill_priority(skill, character, enemies, situation, shadow_analysis)
+                
+                skill_options.append({
+                    'type': 'skill',
+                    'skill': skill,
+                    'target': self._select_skill_target(skill, enemies, situation.get('battlefield')),
+                    'priority': skill_priority,
+                    'expected_outcome': f"스킬: {skill.get('name', '알 수 없음')}",
+                    'mp_cost': mp_cost
+                })
         
         return skill_options
     
@@ -530,188 +1212,28 @@ class SmartEnemyAI:
         """스킬 우선순위 계산 - 특성 시스템 연동 강화"""
         base_priority = 50
         character_class = getattr(character, 'character_class', '전사')
-        character_traits = getattr(character, 'traits', [])
         
         # 스킬 타입에 따른 우선순위
         skill_type = skill.get('type', 'unknown')
-        if skill_type in ['BRV_ATTACK', 'brv_attack']:
-            base_priority = 60 * self.personality_weights['attack']
-        elif skill_type in ['HP_ATTACK', 'hp_attack']:
-            base_priority = 80 * self.personality_weights['attack']
-        elif skill_type in ['HEAL', 'heal', 'SUPPORT', 'support']:
-            base_priority = 70 * self.personality_weights['heal']
-        elif skill_type in ['DEBUFF', 'debuff']:
-            base_priority = 65 * self.personality_weights['skill']
+        type_priority = _SKILL_TYPE_PRIORITY.get(skill_type)
+        if type_priority is not None:
+            base_priority = type_priority[0] * self.personality_weights[type_priority[1]]
         
         # MP 효율성 고려
         mp_cost = skill.get('mp_cost', 0)
         mp_efficiency = 1.0 - (mp_cost / max(character.current_mp, 1)) * 0.3
         base_priority *= mp_efficiency
         
-        # 특성 기반 우선순위 조정
-        skill_name = skill.get('name', '')
+        # 특성 기반 우선순위 조정 (choose_action에서 만든 특성 요약 사용)
+        trait_profile = situation.get('trait_profile')
+        if trait_profile is None:
+            trait_profile = _trait_profile(character)
+        base_priority *= _trait_multiplier(trait_profile, skill, skill_type)
         
-        # 직업별 특성 반영 우선순위
-        for trait in character_traits:
-            trait_name = getattr(trait, 'name', '')
-            trait_effects = getattr(trait, 'effects', {})
-            trait_type = getattr(trait, 'trait_type', 'passive')
-            
-            # 공격력 증가 특성
-            if '공격력' in trait_name and skill_type in ['BRV_ATTACK', 'HP_ATTACK', 'BRV_HP_ATTACK']:
-                base_priority *= 1.2
-            
-            # 특정 스킬 타입 특화 특성
-            if '마법' in trait_name and 'magic' in skill.get('element', '').lower():
-                base_priority *= 1.15
-            
-            # 크리티컬 특성
-            if '크리티컬' in trait_name or '치명타' in trait_name:
-                base_priority *= 1.1
-            
-            # 상태이상 특성
-            if '독' in trait_name and 'poison' in skill.get('status_effect', ''):
-                base_priority *= 1.3
-            
-            # 속성 특화 특성
-            if '화염' in trait_name and 'fire' in skill.get('element', '').lower():
-                base_priority *= 1.2
-            elif '빙결' in trait_name and 'ice' in skill.get('element', '').lower():
-                base_priority *= 1.2
-            elif '번개' in trait_name and 'lightning' in skill.get('element', '').lower():
-                base_priority *= 1.2
-        
-        # 새로운 직업별 스킬 우선순위 조정
-        if character_class == "검성":
-            # 검기 스택 관련 스킬 우선순위
-            sword_stacks = getattr(character, 'sword_aura_stacks', 0)
-            if '검기' in skill_name:
-                if sword_stacks < 2:
-                    base_priority *= 1.3  # 검기 쌓기 우선
-                elif sword_stacks == 2 and '검압' in skill_name:
-                    base_priority *= 1.8  # 최대 스택에서 소모 스킬 우선
-        
-        elif character_class == "검투사":
-            # 처치 스택이 많을수록 명예의 일격 우선
-            kill_stacks = getattr(character, 'kill_stacks', 0)
-            if '명예의 일격' in skill_name and kill_stacks > 0:
-                base_priority *= (1.0 + kill_stacks * 0.2)
-            elif '패링' in skill_name and situation.get('threat_level', 1) >= ThreatLevel.HIGH:
-                base_priority *= 1.6  # 위험 상황에서 패링 우선
-        
-        elif character_class == "광전사":
-            # HP가 낮을수록 광기 스킬 우선
-            hp_ratio = character.current_hp / character.max_hp
-            if '광기' in skill_name and hp_ratio < 0.5:
-                base_priority *= (2.0 - hp_ratio)  # HP 낮을수록 우선순위 증가
-        
-        elif character_class == "기사":
-            # 아군이 위험할 때 보호 스킬 우선
-            allies_in_danger = sum(1 for ally in [character] if ally.current_hp / ally.max_hp < 0.4)
-            if '성스러운 돌격' in skill_name and allies_in_danger > 0:
-                base_priority *= (1.0 + allies_in_danger * 0.5)
-        
-        elif character_class == "성기사":
-            # 성역 히트 카운트가 3에 가까울수록 확장 우선
-            sanctuary_hits = getattr(character, 'sanctuary_hits', 0)
-            if '성역 확장' in skill_name and sanctuary_hits >= 2:
-                base_priority *= 1.7
-        
-        elif character_class == "암흑기사":
-            # 흡혈 관련 스킬 우선 (체력이 낮을 때)
-            hp_ratio = character.current_hp / character.max_hp
-            if ('흡혈' in skill_name or '생명력 흡수' in skill_name) and hp_ratio < 0.6:
-                base_priority *= (1.5 - hp_ratio * 0.5)
-        
-        elif character_class == "용기사":
-            # 용의표식이 쌓였을 때 폭발 스킬 우선
-            dragon_marks = sum(getattr(enemy, 'dragon_mark_stacks', 0) for enemy in enemies)
-            if '용의 분노' in skill_name and dragon_marks >= 2:
-                base_priority *= 1.6
-        
-        elif character_class == "아크메이지":
-            # 원소 순환 시스템 고려
-            elemental_combo = getattr(character, 'elemental_combo', 0)
-            if elemental_combo >= 2 and any(elem in skill_name for elem in ['라이트닝', '파이어', '아이스']):
-                base_priority *= 1.4  # 원소 연쇄 기회
-        
-        # 암살자 스킬: 그림자 시스템 고려
-        elif shadow_analysis and character_class == "암살자":
-            # 그림자 생성 스킬 (기본 공격류)
-            shadow_count = getattr(character, 'shadow_count', 0)
-            if '그림자' in skill_name and shadow_count < 3:
-                base_priority *= 1.4  # 그림자 부족 시 생성 우선
-            elif '폭발' in skill_name and shadow_count >= 2:
-                base_priority *= 1.6  # 그림자 충분 시 폭발 우선
-        
-        # 🌟 새로운 직업들 AI 패턴 추가
-        elif character_class == "시간술사":
-            # 시간 되돌리기 스택 시스템
-            time_rewind_stacks = getattr(character, 'time_rewind_stacks', 0)
-            hp_ratio = character.current_hp / character.max_hp
-            
-            if '시간왜곡' in skill_name and time_rewind_stacks < 3:
-                base_priority *= 1.3  # 시간 스택 쌓기 우선
-            elif '시간되돌리기' in skill_name and (hp_ratio < 0.4 or time_rewind_stacks >= 2):
-                base_priority *= 1.8  # 위험하거나 스택 충분할 때 회복 우선
-            elif '시간정지' in skill_name and situation.get('threat_level', 1) >= ThreatLevel.HIGH:
-                base_priority *= 1.7  # 위험 상황에서 시간정지 우선
-        
-        elif character_class == "차원술사":
-            # 차원 방패와 잔상 스택 시스템
-            dimension_shield = getattr(character, 'dimension_shield_stacks', 0)
-            afterimage_stacks = getattr(character, 'afterimage_stacks', 0)
-            threat_level = situation.get('threat_level', 1)
-            
-            if '차원장막' in skill_name and (dimension_shield < 3 or threat_level >= ThreatLevel.HIGH):
-                base_priority *= 1.4  # 방어 부족 시 장막 우선
-            elif '잔상분신' in skill_name and afterimage_stacks < 5:
-                base_priority *= 1.2  # 잔상 부족 시 분신 우선
-            elif '공간도약' in skill_name and afterimage_stacks >= 3:
-                base_priority *= 1.5  # 잔상 충분할 때 도약 강화
-        
-        elif character_class == "철학자":
-            # 지혜 스택 시스템
-            wisdom_stacks = getattr(character, 'wisdom_stacks', 0)
-            enemy_analyzed = any(hasattr(enemy, 'analyzed') for enemy in enemies)
-            
-            if '진실간파' in skill_name and not enemy_analyzed:
-                base_priority *= 1.6  # 적 분석 우선
-            elif '철학적사고' in skill_name and wisdom_stacks < 5:
-                base_priority *= 1.3  # 지혜 스택 부족 시 사고 우선
-            elif '존재부정' in skill_name and wisdom_stacks >= 3:
-                base_priority *= (1.0 + wisdom_stacks * 0.15)  # 지혜에 비례 강화
-        
-        elif character_class == "연금술사":
-            # 포션 제작 스택 시스템
-            potion_stacks = getattr(character, 'potion_craft_stacks', 0)
-            team_hp_ratio = sum(ally.current_hp / ally.max_hp for ally in [character]) / max(1, len([character]))
-            
-            if '물질변환' in skill_name and potion_stacks < 3:
-                base_priority *= 1.3  # 포션 스택 부족 시 변환 우선
-            elif '회복포션' in skill_name and (team_hp_ratio < 0.6 or potion_stacks >= 2):
-                base_priority *= 1.5  # 체력 부족하거나 포션 충분할 때 회복 우선
-            elif '산성용해' in skill_name and potion_stacks >= 1:
-                base_priority *= 1.2  # 포션으로 공격 강화
-            # 그림자 생성 스킬 (기본 공격류)
-            if '그림자 강타' in skill_name:
-                if shadow_analysis.get('should_generate_shadows', False):
-                    base_priority *= 1.5  # 그림자가 필요하면 우선순위 상승
-            
-            # 그림자 소모 스킬
-            elif any(name in skill_name for name in ['그림자 분신', '그림자 칼날', '그림자 폭발', '암영 난무']):
-                if shadow_analysis.get('should_consume_shadows', False) and shadow_analysis.get('has_shadows', False):
-                    base_priority *= 1.8  # 그림자 소모가 유리하면 높은 우선순위
-                elif not shadow_analysis.get('has_shadows', False):
-                    base_priority *= 0.3  # 그림자가 없으면 우선순위 하락
-            
-            # 궁극기 (그림자 전부 소모)
-            elif '그림자 처형' in skill_name:
-                shadow_count = shadow_analysis.get('shadow_count', 0)
-                if shadow_analysis.get('optimal_shadow_use', False) and shadow_count >= 3:
-                    base_priority *= 2.0  # 최적 상황에서 궁극기 우선순위 최대
-                elif shadow_count == 0:
-                    base_priority *= 0.1  # 그림자가 없으면 거의 사용 안함
+        # 직업별 스킬 우선순위 조정
+        class_rule = _CLASS_SKILL_PRIORITY_RULES.get(character_class)
+        if class_rule is not None:
+            base_priority *= class_rule(skill.get('name', ''), character, enemies, situation, shadow_analysis)
         
         # 위험 상황에서는 강력한 스킬 우선
         if situation['threat_level'] >= ThreatLevel.HIGH:
@@ -720,20 +1242,24 @@ class SmartEnemyAI:
         
         return base_priority
     
-    def _select_skill_target(self, skill: Dict, enemies: List):
-        """스킬에 적절한 타겟 선택"""
+    def _select_skill_target(self, skill: Dict, enemies: List, battlefield: 'BattlefieldAnalysis' = None):
+        """스킬에 적절한 타겟 선택 (같은 적 목록의 전장 분석이 있으면 그대로 사용)"""
         target_type = skill.get('target', 'single_enemy')
+        if battlefield is not None and battlefield.enemies == enemies:
+            alive_enemies = battlefield.alive_enemies
+            strongest = battlefield.strongest_alive_enemy
+        else:
+            alive_enemies = [e for e in enemies if e.is_alive]
+            strongest = max(alive_enemies, key=lambda e: e.physical_attack + e.magic_attack) if alive_enemies else None
         
         if target_type in ['single_enemy', 'SINGLE_ENEMY', '적1명']:
             # 가장 위험한 적 선택
-            alive_enemies = [e for e in enemies if e.is_alive]
-            if alive_enemies:
-                return max(alive_enemies, key=lambda e: e.physical_attack + e.magic_attack)
+            if strongest is not None:
+                return strongest
         elif target_type in ['all_enemies', 'ALL_ENEMIES', '적전체']:
             return enemies  # 모든 적
         
         # 기본적으로 첫 번째 살아있는 적 반환
-        alive_enemies = [e for e in enemies if e.is_alive]
         return alive_enemies[0] if alive_enemies else None
     
     def _generate_virtual_skill_options(self, character, allies: List, enemies: List, situation: Dict) -> List[Dict]:
@@ -741,23 +1267,9 @@ class SmartEnemyAI:
         skill_options = []
         character_class = getattr(character, 'character_class', '전사')
         
-        # 직업별 가상 스킬 정의
-        virtual_skills = {
-            '전사': [
-                {'name': '강공격', 'type': 'BRV_ATTACK', 'power': 1.5, 'mp_cost': 20, 'target': 'single_enemy'},
-                {'name': '결정타', 'type': 'HP_ATTACK', 'power': 2.0, 'mp_cost': 40, 'target': 'single_enemy'}
-            ],
-            '궁수': [
-                {'name': '연속사격', 'type': 'BRV_ATTACK', 'power': 1.3, 'mp_cost': 15, 'target': 'single_enemy'},
-                {'name': '관통사격', 'type': 'HP_ATTACK', 'power': 1.8, 'mp_cost': 35, 'target': 'single_enemy'}
-            ],
-            '성기사': [
-                {'name': '치유술', 'type': 'HEAL', 'power': 1.5, 'mp_cost': 30, 'target': 'ally'},
-                {'name': '신성공격', 'type': 'BRV_ATTACK', 'power': 1.4, 'mp_cost': 25, 'target': 'single_enemy'}
-            ]
-        }
-        
-        class_skills = virtual_skills.get(character_class, virtual_skills['전사'])
+        # 직업별 가상 스킬 (모듈 테이블)
+        class_skills = _VIRTUAL_CLASS_SKILLS.get(character_class, _VIRTUAL_CLASS_SKILLS['전사'])
+        battlefield = situation.get('battlefield')
         
         for skill in class_skills:
             mp_cost = skill.get('mp_cost', 0)
@@ -767,7 +1279,7 @@ class SmartEnemyAI:
                 skill_options.append({
                     'type': 'skill',
                     'skill': skill,
-                    'target': self._select_skill_target(skill, enemies),
+                    'target': self._select_skill_target(skill, enemies, battlefield),
                     'priority': skill_priority,
                     'expected_outcome': f"가상스킬: {skill.get('name', '알 수 없음')}",
                     'mp_cost': mp_cost
@@ -1299,18 +1811,8 @@ class SmartEnemyAI:
         return skill_options
     
     def _estimate_damage(self, attacker, target) -> float:
-        """예상 데미지 계산"""
-        base_damage = attacker.physical_attack
-        defense = target.physical_defense
-        
-        # 간단한 데미지 공식
-        estimated_damage = max(1, base_damage - defense * 0.5)
-        
-        # 크리티컬 확률 고려
-        crit_chance = 0.1
-        avg_damage = estimated_damage * (1 + crit_chance * 0.5)
-        
-        return avg_damage
+        """예상 데미지 계산 (공격력/방어력 쌍별로 메모이즈)"""
+        return _estimated_damage(attacker.physical_attack, target.physical_defense)
     
     def _select_best_action(self, action_options: List[Dict], situation: Dict) -> Dict:
         """최적 행동 선택 - BRV/HP 전략 적용"""
@@ -1547,260 +2049,5 @@ def create_party_ai() -> PartyAI:
     return PartyAI()
 
 
-    def _analyze_shadow_state(self, character, situation: Dict) -> Dict:
-        """그림자 상태 분석 (암살자 클래스 전용)"""
-        from game.shadow_system import ShadowSystem
-        
-        # 암살자가 아닌 경우 빈 딕셔너리 반환
-        if character.character_class != "암살자":
-            return {}
-        
-        shadow_system = ShadowSystem.get_instance()
-        shadow_count = shadow_system.get_shadow_count(character.name)
-        
-        analysis = {
-            'has_shadows': shadow_count > 0,
-            'shadow_count': shadow_count,
-            'can_empower': shadow_count >= 1,
-            'optimal_shadow_use': False,
-            'shadow_priority': 0.0,
-            'should_generate_shadows': False,
-            'should_consume_shadows': False
-        }
-        
-        # 상황에 따른 그림자 사용 전략
-        health_ratio = situation.get('self_health_ratio', 1.0)
-        threat_level = situation.get('threat_level', 'LOW')
-        enemy_count = situation.get('enemies_count', 0)
-        
-        # 위급 상황에서는 그림자 소모 공격 우선
-        if health_ratio < 0.3 or threat_level == 'CRITICAL':
-            if shadow_count >= 3:
-                analysis['optimal_shadow_use'] = True
-                analysis['should_consume_shadows'] = True
-                analysis['shadow_priority'] = 0.9
-            elif shadow_count >= 1:
-                analysis['should_consume_shadows'] = True
-                analysis['shadow_priority'] = 0.7
-        
-        # 적이 많을 때는 그림자 축적 우선
-        elif enemy_count >= 3 and shadow_count < 5:
-            analysis['should_generate_shadows'] = True
-            analysis['shadow_priority'] = 0.6
-        
-        # 적이 적고 그림자가 많을 때는 소모 공격
-        elif enemy_count <= 2 and shadow_count >= 3:
-            analysis['should_consume_shadows'] = True
-            analysis['shadow_priority'] = 0.8
-        
-        # 그림자가 없을 때는 생성 우선
-        elif shadow_count == 0:
-            analysis['should_generate_shadows'] = True
-            analysis['shadow_priority'] = 0.9
-        
-        return analysis
-
-    def _analyze_druid_nature_gauge(self, character, enemies: List) -> Dict:
-        """드루이드 자연 게이지 분석"""
-        analysis = {}
-        
-        # 자연 친화도 스택과 야생 게이지 확인
-        nature_stacks = getattr(character, 'nature_stacks', 0)
-        wild_gauge = getattr(character, 'wild_gauge', 0)
-        hp_ratio = character.current_hp / character.max_hp
-        
-        # HP가 낮으면 자연 회복 우선
-        if hp_ratio < 0.4:
-            analysis['prioritize_nature_healing'] = True
-            analysis['nature_priority'] = 0.9
-        
-        # 자연 스택이 높으면 강력한 자연 스킬 사용
-        elif nature_stacks >= 7:
-            analysis['use_nature_ultimate'] = True
-            analysis['nature_priority'] = 0.8
-        
-        # 야생 게이지가 높으면 변신 스킬 우선
-        elif wild_gauge >= 80:
-            analysis['should_transform'] = True
-            analysis['wild_priority'] = 0.85
-        
-        # 적이 많을 때는 자연 스택 축적
-        enemy_count = len([e for e in enemies if e.is_alive])
-        if enemy_count >= 3 and nature_stacks < 5:
-            analysis['build_nature_stacks'] = True
-            analysis['nature_priority'] = 0.6
-        
-        return analysis
-
-    def _analyze_priest_atonement_system(self, character, party_members: List) -> Dict:
-        """신관 속죄 시스템 분석"""
-        analysis = {}
-        
-        # 속죄 스택과 신성 에너지 확인
-        atonement_stacks = getattr(character, 'atonement_stacks', 0)
-        divine_energy = getattr(character, 'divine_energy', 0)
-        
-        # 아군 HP 상태 확인
-        injured_allies = [ally for ally in party_members if ally.is_alive and ally.current_hp / ally.max_hp < 0.6]
-        critically_injured = [ally for ally in party_members if ally.is_alive and ally.current_hp / ally.max_hp < 0.3]
-        
-        # 심각한 부상자가 있으면 즉시 치유
-        if critically_injured:
-            analysis['emergency_heal'] = True
-            analysis['heal_priority'] = 1.0
-        
-        # 속죄 스택이 높고 신성 에너지가 충분하면 대규모 치유
-        elif atonement_stacks >= 6 and divine_energy >= 80:
-            analysis['mass_divine_heal'] = True
-            analysis['divine_priority'] = 0.9
-        
-        # 부상자가 많으면 속죄 스택 활용한 광역 치유
-        elif len(injured_allies) >= 2 and atonement_stacks >= 4:
-            analysis['atonement_heal'] = True
-            analysis['heal_priority'] = 0.8
-        
-        # 스택이 부족하면 축적 우선
-        elif atonement_stacks < 3:
-            analysis['build_atonement'] = True
-            analysis['stack_priority'] = 0.7
-        
-        return analysis
-
-    def _analyze_mystic_sword_elemental_harmony(self, character, enemies: List) -> Dict:
-        """마검사 원소 조화 분석"""
-        analysis = {}
-        
-        # 원소 조화 스택과 임시 원소 확인
-        harmony_stacks = getattr(character, 'elemental_harmony', 0)
-        temp_element = getattr(character, 'temp_element', None)
-        
-        enemy_count = len([e for e in enemies if e.is_alive])
-        
-        # 원소 조화 스택이 최대치면 폭발 스킬 사용
-        if harmony_stacks >= 6:
-            analysis['elemental_explosion'] = True
-            analysis['explosion_priority'] = 0.9
-        
-        # 적이 많고 조화 스택이 충분하면 광역 원소 공격
-        elif enemy_count >= 3 and harmony_stacks >= 4:
-            analysis['area_elemental_attack'] = True
-            analysis['elemental_priority'] = 0.8
-        
-        # 임시 원소가 있으면 해당 원소 특화 스킬 우선
-        elif temp_element:
-            analysis['use_elemental_skill'] = True
-            analysis['element_type'] = temp_element
-            analysis['elemental_priority'] = 0.7
-        
-        # 조화 스택이 낮으면 축적 우선
-        elif harmony_stacks < 3:
-            analysis['build_harmony'] = True
-            analysis['harmony_priority'] = 0.6
-        
-        return analysis
-
-    def _analyze_monk_chi_balance(self, character, party_members: List, enemies: List) -> Dict:
-        """몽크 기공 밸런스 분석"""
-        analysis = {}
-        
-        # 기공 에너지와 콤보 카운트 확인
-        chi_energy = getattr(character, 'chi_energy', 0)
-        combo_count = getattr(character, 'combo_count', 0)
-        hp_ratio = character.current_hp / character.max_hp
-        
-        # HP가 낮으면 기공 회복 우선
-        if hp_ratio < 0.5:
-            analysis['chi_healing'] = True
-            analysis['heal_priority'] = 0.8
-        
-        # 콤보 카운트가 높으면 피니시 기술
-        elif combo_count >= 4:
-            analysis['combo_finisher'] = True
-            analysis['combo_priority'] = 0.9
-        
-        # 기공 에너지가 충분하면 강화 기술
-        elif chi_energy >= 80:
-            analysis['chi_enhanced_attack'] = True
-            analysis['chi_priority'] = 0.8
-        
-        # 적이 많으면 연속 공격으로 콤보 축적
-        enemy_count = len([e for e in enemies if e.is_alive])
-        if enemy_count >= 2 and combo_count < 3:
-            analysis['build_combo'] = True
-            analysis['combo_priority'] = 0.6
-        
-        # 기공 에너지가 부족하면 순환 기술
-        elif chi_energy < 30:
-            analysis['chi_circulation'] = True
-            analysis['chi_priority'] = 0.7
-        
-        return analysis
-
-    def _analyze_necromancer_soul_management(self, character, enemies: List) -> Dict:
-        """네크로맨서 영혼 관리 분석"""
-        analysis = {}
-        
-        # 영혼 에너지와 언데드 상태 확인
-        soul_energy = getattr(character, 'soul_energy', 0)
-        has_undead = getattr(character, 'undead_minions', 0) > 0
-        
-        enemy_count = len([e for e in enemies if e.is_alive])
-        weak_enemies = [e for e in enemies if e.is_alive and e.current_hp / e.max_hp < 0.3]
-        
-        # 약한 적이 있으면 영혼 수확 우선
-        if weak_enemies and soul_energy < 80:
-            analysis['soul_harvest_target'] = True
-            analysis['harvest_priority'] = 0.9
-        
-        # 영혼 에너지가 충분하면 언데드 소환
-        elif soul_energy >= 70 and not has_undead:
-            analysis['summon_undead'] = True
-            analysis['summon_priority'] = 0.8
-        
-        # 적이 많고 언데드가 있으면 강화
-        elif enemy_count >= 3 and has_undead:
-            analysis['enhance_undead'] = True
-            analysis['undead_priority'] = 0.7
-        
-        # 영혼 에너지가 부족하면 흡수 우선
-        elif soul_energy < 30:
-            analysis['life_drain_focus'] = True
-            analysis['drain_priority'] = 0.8
-        
-        return analysis
-
-    def _analyze_samurai_willpower_system(self, character, enemies: List) -> Dict:
-        """사무라이 의지 시스템 분석"""
-        analysis = {}
-        
-        # 의지 게이지 확인
-        willpower = getattr(character, 'willpower_gauge', 0)
-        
-        enemy_count = len([e for e in enemies if e.is_alive])
-        strong_enemies = [e for e in enemies if e.is_alive and e.current_hp / e.max_hp > 0.8]
-        
-        # 의지 게이지가 최대치면 거합 일격
-        if willpower >= 100:
-            analysis['iai_strike'] = True
-            analysis['iai_priority'] = 1.0
-        
-        # 강한 적이 있고 의지가 충분하면 무사도 정신
-        elif strong_enemies and willpower >= 80:
-            analysis['bushido_spirit'] = True
-            analysis['bushido_priority'] = 0.9
-        
-        # 적이 많고 의지가 중간 정도면 연속 베기
-        elif enemy_count >= 3 and willpower >= 50:
-            analysis['continuous_slash'] = True
-            analysis['slash_priority'] = 0.8
-        
-        # 의지가 부족하면 축적 우선
-        elif willpower < 40:
-            analysis['build_willpower'] = True
-            analysis['willpower_priority'] = 0.7
-        
-        return analysis
-
-
 # 전역 파티 AI
 party_ai_assistant = create_party_ai()
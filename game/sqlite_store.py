@@ -0,0 +1,267 @@
+"""
+🗄️ SQLite 공용 저장소
+AI 학습/캐릭터 기억/상호작용 DB가 함께 쓰는 연결 풀 + 쓰기 일괄 처리 계층
+
+- DB 파일마다 저장소 하나 (get_sqlite_store), 스레드마다 연결 하나를 만들어 계속 재사용
+- WAL 모드 + synchronous=NORMAL: 읽기가 쓰기를 기다리지 않고, 커밋마다 fsync하지 않음
+- SQL 문은 호출하는 쪽에서 모듈 상수로 두고 연결별 문장 캐시(cached_statements)로 재사용
+- submit()한 쓰기는 백그라운드 writer 스레드가 모아서 한 트랜잭션(같은 SQL은 executemany)으로 실행
+- 읽기(query*) 전에는 대기 중인 쓰기를 먼저 반영 - 방금 쓴 내용을 바로 읽을 수 있음
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+DEFAULT_CACHED_STATEMENTS = 256   # 연결별 준비된 문장 캐시 크기
+DEFAULT_BATCH_SIZE = 1000         # writer가 한 트랜잭션에 넣는 최대 쓰기 수
+DEFAULT_BUSY_TIMEOUT = 10.0       # 다른 프로세스가 쓰는 중일 때 대기 시간(초)
+
+
+class SQLiteStore:
+    """DB 파일 하나에 대한 스레드별 연결 풀 + 쓰기 큐"""
+
+    def __init__(self, db_path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        self.in_memory = self.db_path == ':memory:'
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._shared_connection: Optional[sqlite3.Connection] = None   # :memory: 전용
+
+        self._pending = deque()             # (sql, params)
+        self._condition = threading.Condition()
+        self._submitted = 0
+        self._committed = 0
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
+        self.last_error: Optional[Exception] = None
+        self.stats = {'batches': 0, 'rows': 0, 'errors': 0}
+
+    # =====================================
+    # 연결
+    # =====================================
+
+    def _open(self) -> sqlite3.Connection:
+        if self.db_path != ':memory:':
+            directory = os.path.dirname(os.path.abspath(self.db_path))
+            os.makedirs(directory, exist_ok=True)
+        # isolation_level=None: 자동 커밋 - 트랜잭션은 transaction()/writer가 직접 관리
+        conn = sqlite3.connect(self.db_path, timeout=DEFAULT_BUSY_TIMEOUT, isolation_level=None,
+                               check_same_thread=False, cached_statements=DEFAULT_CACHED_STATEMENTS)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (처음 호출 시 생성)"""
+        if self.in_memory:
+            # 메모리 DB는 연결마다 별개라서 하나를 공유
+            if self._shared_connection is None:
+                with self._connections_lock:
+                    if self._shared_connection is None:
+                        self._shared_connection = sqlite3.connect(
+                            ':memory:', isolation_level=None, check_same_thread=False,
+                            cached_statements=DEFAULT_CACHED_STATEMENTS)
+                        self._connections.append(self._shared_connection)
+            return self._shared_connection
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._open()
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """with store.transaction() as conn: ... - 블록 전체를 한 번에 커밋 (중첩 시 바깥 트랜잭션 사용)"""
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        try:
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            # 커밋 실패 시 트랜잭션이 열린 채 남으면 이후 transaction()이 BEGIN/COMMIT을 건너뜀
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+    def executescript(self, script: str):
+        """스키마 생성 등 (대기 중인 쓰기 반영 후 실행)"""
+        self.flush()
+        self.connection().executescript(script)
+
+    # =====================================
+    # 읽기
+    # =====================================
+
+    def execute(self, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+        """즉시 실행 (자동 커밋) - 대기 중인 쓰기를 먼저 반영"""
+        if self._submitted != self._committed:
+            self.flush()
+        return self.connection().execute(sql, params)
+
+    def query(self, sql: str, params: Sequence = ()) -> List[tuple]:
+        return self.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence = ()) -> Optional[tuple]:
+        return self.execute(sql, params).fetchone()
+
+    def query_dicts(self, sql: str, params: Sequence = ()) -> List[Dict[str, Any]]:
+        cursor = self.execute(sql, params)
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    # =====================================
+    # 쓰기 큐
+    # =====================================
+
+    def submit(self, sql: str, params: Sequence = ()):
+        """쓰기 예약 - 호출 스레드는 기다리지 않음"""
+        with self._condition:
+            if self._closed:
+                raise sqlite3.ProgrammingError(f"닫힌 저장소: {self.db_path}")
+            self._pending.append((sql, params))
+            self._submitted += 1
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name=f"SQLiteWriter-{os.path.basename(self.db_path)}",
+                                                daemon=True)
+                self._writer.start()
+            self._condition.notify_all()
+
+    def submit_many(self, sql: str, rows: Iterable[Sequence]):
+        for params in rows:
+            self.submit(sql, params)
+
+    @property
+    def pending_count(self) -> int:
+        return self._submitted - self._committed
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """지금까지 submit된 쓰기가 커밋될 때까지 대기 (writer 스레드 자신은 바로 반환)"""
+        if threading.current_thread() is self._writer:
+            return True
+        with self._condition:
+            target = self._submitted
+            return self._condition.wait_for(lambda: self._committed >= target, timeout)
+
+    def _take_batch(self) -> List[tuple]:
+        batch = []
+        while self._pending and len(batch) < self.batch_size:
+            batch.append(self._pending.popleft())
+        return batch
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending and self._closed:
+                    return
+                batch = self._take_batch()
+            self._write_batch(batch)
+            with self._condition:
+                self._committed += len(batch)
+                self._condition.notify_all()
+
+    def _write_batch(self, batch: List[tuple]):
+        # 연속된 같은 SQL은 executemany로 묶음
+        groups = []
+        for sql, params in batch:
+            if groups and groups[-1][0] == sql:
+                groups[-1][1].append(params)
+            else:
+                groups.append((sql, [params]))
+        try:
+            with self.transaction() as conn:
+                for sql, rows in groups:
+                    if len(rows) == 1:
+                        conn.execute(sql, rows[0])
+                    else:
+                        conn.executemany(sql, rows)
+            self.stats['batches'] += 1
+            self.stats['rows'] += len(batch)
+        except sqlite3.Error as e:
+            # 한 건 때문에 전체가 버려지지 않도록 개별 실행으로 재시도
+            self.last_error = e
+            self.stats['errors'] += 1
+            conn = self.connection()
+            if conn.in_transaction:
+                conn.rollback()
+            for sql, rows in groups:
+                for params in rows:
+                    try:
+                        conn.execute(sql, params)
+                        self.stats['rows'] += 1
+                    except sqlite3.Error as row_error:
+                        self.last_error = row_error
+                        print(f"⚠️ DB 쓰기 실패 ({os.path.basename(self.db_path)}): {row_error}")
+
+    # =====================================
+    # 종료
+    # =====================================
+
+    def close(self, timeout: float = 5.0):
+        """대기 중인 쓰기를 반영하고 모든 연결 닫기"""
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._writer is not None:
+            self._writer.join(timeout)
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+            self._shared_connection = None
+        self._local = threading.local()
+
+
+# 전역 저장소 (DB 파일 경로 → 저장소)
+_sqlite_stores: Dict[str, SQLiteStore] = {}
+_sqlite_stores_lock = threading.Lock()
+
+
+def get_sqlite_store(db_path) -> SQLiteStore:
+    """DB 파일별 공용 저장소 가져오기"""
+    key = str(db_path) if str(db_path) == ':memory:' else os.path.abspath(str(db_path))
+    store = _sqlite_stores.get(key)
+    if store is not None and not store._closed:
+        return store
+    with _sqlite_stores_lock:
+        store = _sqlite_stores.get(key)
+        if store is None or store._closed:
+            store = _sqlite_stores[key] = SQLiteStore(db_path)
+    return store
+
+
+def flush_all_stores(timeout: Optional[float] = None):
+    """모든 저장소의 대기 중인 쓰기 반영"""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for store in list(_sqlite_stores.values()):
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        store.flush(remaining)
+
+
+@atexit.register
+def _flush_on_exit():
+    # writer는 데몬 스레드라서 종료 전에 남은 쓰기를 반영
+    flush_all_stores(timeout=5.0)
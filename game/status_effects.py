@@ -8,6 +8,8 @@ from typing import Dict, List, Any, Optional
 from enum import Enum
 import random
 
+from game.data_tables import register_data_table, get_data_table
+
 
 # 안전한 색상 상수 정의
 COLORS = {
@@ -329,9 +331,11 @@ class StatusEffectManager:
     """상태 이상 관리자"""
     
     def __init__(self):
-        self.status_templates = self._create_status_templates()
+        # 템플릿은 사용 시 .copy()하므로 공유 테이블 그대로 사용
+        self.status_templates = get_data_table("status_templates")
     
-    def _create_status_templates(self) -> Dict[str, Dict]:
+    @staticmethod
+    def _create_status_templates() -> Dict[str, Dict]:
         """상태 이상 템플릿 생성"""
         return {
             # 독성 효과
@@ -544,6 +548,8 @@ class StatusEffectManager:
             return self.status_templates[name]["description"]
         return "알 수 없는 상태 이상"
 
+register_data_table("status_templates", StatusEffectManager._create_status_templates)
+
 # 전역 상태 이상 관리자 인스턴스
 status_manager = StatusEffectManager()
 
@@ -27,6 +27,9 @@ except ImportError:
     INPUT_AVAILABLE = False
     KeyboardInput = None
 
+# 타이핑 효과 렌더러 (프레임 단위 묶음 출력)
+from game.typewriter import get_typewriter
+
 @dataclass
 class StorySegment:
     """스토리 세그먼트"""
@@ -542,11 +545,14 @@ class StorySystem:
         ]
 
     def _start_stdin_watcher(self):
-        """스토리 재생 중에만 파이프 stdin에서 빈 줄(Enter) 감시"""
-        if self._stdin_watcher_started or os.getenv('SUBPROCESS_MODE') != '1':
+        """스토리 재생 중에만 파이프 stdin에서 빈 줄(Enter) 감시
+        - Windows 파이프 전용 (select로 파이프를 확인할 수 없음)
+        - 그 외에는 타이핑 프레임마다 _poll_skip_input으로 확인하므로 스레드가 필요 없음
+        """
+        if self._stdin_watcher_started or os.getenv('SUBPROCESS_MODE') != '1' or sys.platform != 'win32':
             return
         self._stdin_watcher_started = True
-        import threading, sys
+        import threading
         def _watch():
             try:
                 while self.running_story:
@@ -1868,35 +1874,20 @@ class StorySystem:
                     if self.is_glitch_mode() and ('세피로스' in display_text or 'Sephiroth' in display_text or 'SEPHIROTH' in display_text):
                         self._play_sephiroth_long_beep()
                     
-                    for ch in display_text:
-                        # 🔊 글리치 모드에서 타이핑 중 랜덤 비프음 (컴퓨터실 느낌)
-                        if self.is_glitch_mode():
-                            import random, time
-                            # 5% 확률로 각 문자마다 비프음 (매우 자주)
-                            if random.random() < 0.05:
-                                self._play_random_glitch_sfx()
-                            # 스케줄된 중간 비프음 체크
-                            if hasattr(self, '_schedule_mid_text_beep') and time.time() >= self._schedule_mid_text_beep:
-                                self._play_random_glitch_sfx()
-                                delattr(self, '_schedule_mid_text_beep')
-                        
+                    def skip_check():
                         if self._skip_requested:
                             # 세피로스 개입 시도
                             if self._sephiroth_interrupt_skip():
                                 self._skip_requested = False
-                                continue
-                            else:
-                                print(codes['reset'])
-                                print("\n[스토리를 건너뜁니다...]")
-                                return True
-                        if msvcrt.kbhit():
-                            b = msvcrt.getch()
-                            if b in (b'\r', b'\n'):
-                                print(codes['reset'])
-                                print("\n[스토리를 건너뜁니다...]")
-                                return
-                        print(ch, end='', flush=True)
-                        time.sleep(actual_delay)  # 조정된 딜레이 사용
+                                return False
+                            return True
+                        return msvcrt.kbhit() and msvcrt.getch() in (b'\r', b'\n')
+                    
+                    # 프레임 단위로 묶어서 출력, 프레임마다 스킵 확인
+                    if get_typewriter().type_text(display_text, actual_delay, skip_check, self._glitch_typing_callback()):
+                        print(codes['reset'])
+                        print("\n[스토리를 건너뜁니다...]")
+                        return True
                     print(codes['reset'], end='')
                     if not (segment.text.startswith('══') or segment.text.strip().startswith('🌟')):
                         print()
@@ -1910,14 +1901,16 @@ class StorySystem:
                             return True
                         time.sleep(0.01)
                 else:
-                    # 파이프 / Unix 경로: _skip_requested 플래그만 감시
-                    self._type_text_with_skip(segment.text, segment.delay, segment.color)
+                    # 파이프 / Unix 경로: 타이핑/일시정지 중 프레임마다 스킵 확인
+                    skipped = self._type_text_with_skip(segment.text, segment.delay, segment.color)
                     end_time = time.time() + segment.pause
-                    while time.time() < end_time:
-                        if self._skip_requested:
-                            print("\n[스토리를 건너뜁니다...]")
-                            return
-                        time.sleep(0.01)
+                    while not skipped and time.time() < end_time:
+                        skipped = self._poll_skip_input()
+                        if not skipped:
+                            time.sleep(0.01)
+                    if skipped:
+                        # 다음 세그먼트 시작 시 스킵 처리 (세피로스 개입 포함)
+                        self._skip_requested = True
         except KeyboardInterrupt:
             print("\n[스토리를 건너뜁니다...]")
             return True
@@ -1972,8 +1965,42 @@ class StorySystem:
             except:
                 return False
     
+    def _poll_skip_input(self) -> bool:
+        """스킵 요청 확인 (타이핑 프레임/일시정지 중 호출) - watcher 플래그 또는 Enter 입력
+        - Windows 파이프: select를 쓸 수 없으므로 watcher 플래그만
+        - Windows 콘솔은 msvcrt, Unix(파이프 포함)는 select로 논블로킹 확인
+        """
+        if self._skip_requested:
+            return True
+        try:
+            if sys.platform == 'win32':
+                if (not sys.stdin.isatty()) and os.getenv('SUBPROCESS_MODE') == '1':
+                    return False
+                import msvcrt
+                return msvcrt.kbhit() and msvcrt.getch() in (b'\r', b'\n')
+            if select.select([sys.stdin], [], [], 0.0)[0]:
+                return sys.stdin.read(1) == '\n'
+        except Exception:
+            pass
+        return False
+    
+    def _glitch_typing_callback(self):
+        """글리치 모드 타이핑 중 비프음 (프레임마다 호출, 글자당 5% 확률을 출력된 글자 수만큼 합산)"""
+        if not self.is_glitch_mode():
+            return None
+        import random
+        
+        def on_frame(count: int):
+            if random.random() < 1 - 0.95 ** count:
+                self._play_random_glitch_sfx()
+            # 스케줄된 중간 비프음 체크
+            if hasattr(self, '_schedule_mid_text_beep') and time.time() >= self._schedule_mid_text_beep:
+                self._play_random_glitch_sfx()
+                delattr(self, '_schedule_mid_text_beep')
+        return on_frame
+    
     def _type_text_with_skip(self, text: str, delay: float, color: str = "white"):
-        """타이핑 효과 with 스킵 기능
+        """타이핑 효과 with 스킵 기능 (프레임 단위 묶음 출력)
         - Windows 파이프 모드: select() 미사용 (WinError 10038 회피)
         - Unix: select()로 Enter 감시
         """
@@ -1996,54 +2023,10 @@ class StorySystem:
         color_codes = self._get_color_codes()
         print(color_codes.get(color, ''), end='')
 
-        if windows:
-            # 콘솔(tty) 아닌 파이프에서는 watcher 플래그(_skip_requested)만 사용
-            for ch in display_text:
-                # 🔊 글리치 모드에서 타이핑 중 랜덤 비프음 (Windows 파이프)
-                if self.is_glitch_mode():
-                    import random
-                    if random.random() < 0.05:  # 5% 확률
-                        self._play_random_glitch_sfx()
-                
-                if self._skip_requested:
-                    print(color_codes['reset'])
-                    return True
-                print(ch, end='', flush=True)
-                time.sleep(actual_delay)  # 조정된 딜레이 사용
-        else:
-            # Unix 계열: non-blocking select 사용
-            try:
-                import select
-                for ch in display_text:
-                    # 🔊 글리치 모드에서 타이핑 중 랜덤 비프음 (Unix)
-                    if self.is_glitch_mode():
-                        import random
-                        if random.random() < 0.05:  # 5% 확률
-                            self._play_random_glitch_sfx()
-                    if self._skip_requested:
-                        print(color_codes['reset'])
-                        return True
-                    if select.select([sys.stdin], [], [], 0.0)[0]:
-                        key = sys.stdin.read(1)
-                        if key == '\n':
-                            print(color_codes['reset'])
-                            return True
-                    print(ch, end='', flush=True)
-                    time.sleep(actual_delay)  # 조정된 딜레이 사용
-            except Exception:
-                # 실패 시 단순 출력
-                for ch in display_text:
-                    # 🔊 글리치 모드에서 타이핑 중 랜덤 비프음 (Unix 폴백)
-                    if self.is_glitch_mode():
-                        import random
-                        if random.random() < 0.05:  # 5% 확률
-                            self._play_random_glitch_sfx()
-                    
-                    if self._skip_requested:
-                        print(color_codes['reset'])
-                        return True
-                    print(ch, end='', flush=True)
-                    time.sleep(actual_delay)  # 조정된 딜레이 사용
+        # 프레임마다 스킵 확인 (Windows 파이프는 watcher 플래그만, 그 외에는 Enter 입력도)
+        if get_typewriter().type_text(display_text, actual_delay, self._poll_skip_input, self._glitch_typing_callback()):
+            print(color_codes['reset'])
+            return True
 
         # 색상 리셋 후 세그먼트마다 항상 한 줄만 개행 (플랫폼별로 정확히 1회)
         print(color_codes['reset'], end='')
@@ -2073,9 +2056,7 @@ class StorySystem:
         color_codes = self._get_color_codes()
         
         print(color_codes.get(color, ""), end="")
-        for char in text:
-            print(char, end="", flush=True)
-            time.sleep(delay)
+        get_typewriter().type_text(text, delay)
         print(color_codes["reset"], end="")
         print()  # 줄바꿈
 
@@ -263,18 +263,15 @@ class TraitCombatIntegrator:
         reduced_cost = base_mp_cost
         
         # 전투 본능 특성: 자세 변경 스킬 MP 소모 없음
-        if skill_data and hasattr(character, 'active_traits'):
-            for trait in character.active_traits:
-                trait_name = trait.name if hasattr(trait, 'name') else trait.get('name', '')
-                if trait_name == "전투 본능":
-                    # 자세 변경 관련 스킬인지 확인
-                    skill_name = skill_data.get('name', '')
-                    special_effects = skill_data.get('special_effects', [])
-                    if ('stance_adaptation' in special_effects or 
-                        '전술 분석' in skill_name or 
-                        '자세' in skill_name):
-                        print(f"⚔️ {character.name}의 전투 본능! 자세 변경 스킬 MP 소모 없음!")
-                        return 0
+        if skill_data and hasattr(character, 'has_active_trait') and character.has_active_trait("전투 본능"):
+            # 자세 변경 관련 스킬인지 확인
+            skill_name = skill_data.get('name', '')
+            special_effects = skill_data.get('special_effects', [])
+            if ('stance_adaptation' in special_effects or 
+                '전술 분석' in skill_name or 
+                '자세' in skill_name):
+                print(f"⚔️ {character.name}의 전투 본능! 자세 변경 스킬 MP 소모 없음!")
+                return 0
         
         # 1. 지혜 (temp_skill_cost_reduction)
         cost_reduction = getattr(character, 'temp_skill_cost_reduction', 0)
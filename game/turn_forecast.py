@@ -0,0 +1,254 @@
+"""
+턴 순서 예측 시스템
+현재 ATB, 속도, 캐스팅, 행동불가 상태로 다음 K번의 행동 순서를 예측
+플레이어 UI, SmartEnemyAI, AllyAI가 같은 예측 결과를 공유
+"""
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+# 행동 불가 상태 - 예측 대상에서 제외
+DISABLE_STATUS_NAMES = {'STUN', 'STOP', 'FREEZE', 'PETRIFY', 'SLEEP', 'PARALYZE', 'TIME_STOP'}
+
+BASE_ATB_INCREASE = 30   # 틱당 기본 ATB 증가량
+
+
+def atb_gain_per_tick(speed: float, avg_speed: float, base_atb_increase: int = BASE_ATB_INCREASE,
+                      speed_modifier: Optional[float] = None) -> int:
+    """한 틱의 ATB 증가량 - BraveCombatSystem._update_atb_instant와 예측기가 함께 사용
+
+    평균 속도 대비 비율(0.5~2.0 제한)로 기본 증가량을 조절하고,
+    플레이어 턴 중이면 난이도 속도 배수(speed_modifier)를 한 번 더 곱한다.
+    """
+    if avg_speed > 0:
+        speed_ratio = max(0.5, min(2.0, speed / avg_speed))
+    else:
+        speed_ratio = 1.0
+    atb_increase = int(base_atb_increase * speed_ratio)
+    if speed_modifier is not None:
+        atb_increase = int(atb_increase * speed_modifier)
+    return atb_increase
+
+
+@dataclass
+class ForecastEntry:
+    """예측된 행동 1회"""
+    combatant: Any
+    ticks_until: int              # 지금부터 몇 번의 ATB 틱 후에 행동하는지
+    is_cast_completion: bool = False  # 캐스팅 완료로 인한 행동인지
+
+
+@dataclass
+class _CombatantProfile:
+    """전투원별 ATB 증가 프로필 (속도/상태가 바뀔 때만 다시 계산)"""
+    fingerprint: tuple
+    atb_per_tick: int
+    can_act: bool
+
+
+class TurnOrderForecaster:
+    """ATB 기반 턴 순서 예측기
+
+    BraveCombatSystem._update_atb_instant와 같은 증가 규칙(atb_gain_per_tick)을 사용한다.
+    전투원 상태가 한 틱만큼 자연 증가한 경우에는 이전 예측을 한 틱 당겨서 재사용하고,
+    속도/상태/캐스팅이 바뀐 경우에만 다시 계산한다.
+    """
+
+    def __init__(self, atb_ready_threshold: int = 1000, atb_max: int = 2000,
+                 base_atb_increase: int = BASE_ATB_INCREASE, action_cost: int = 1000):
+        self.atb_ready_threshold = atb_ready_threshold
+        self.atb_max = atb_max
+        self.base_atb_increase = base_atb_increase
+        self.action_cost = action_cost
+
+        self._profiles: Dict[int, _CombatantProfile] = {}
+        self._cached_state: Optional[tuple] = None
+        self._cached_forecast: List[ForecastEntry] = []
+        self._cached_count = 0
+        self.stats = {'full_rebuilds': 0, 'shifted': 0, 'hits': 0}
+
+    # =====================================
+    # 공개 API
+    # =====================================
+
+    def get_forecast(self, combatants: List[Any], count: int = 5,
+                     atb_ready_threshold: Optional[int] = None, atb_max: Optional[int] = None,
+                     speed_modifier: Optional[float] = None) -> List[ForecastEntry]:
+        """다음 count번의 행동 예측
+
+        atb_ready_threshold/atb_max를 생략하면 생성 시 값 사용 (공유 예측기를 바꾸지 않고 호출마다 지정),
+        speed_modifier는 플레이어 턴 중 난이도 속도 배수 (_update_atb_instant와 동일하게 적용)
+        """
+        settings = (
+            self.atb_ready_threshold if atb_ready_threshold is None else atb_ready_threshold,
+            self.atb_max if atb_max is None else atb_max,
+            speed_modifier,
+        )
+        alive = [c for c in combatants
+                 if not isinstance(c, dict) and getattr(c, 'is_alive', False) and hasattr(c, 'atb_gauge')]
+        # 호출자마다 목록 순서가 달라도 같은 예측을 공유하도록 이름순으로 정규화
+        # (메모리 주소 대신 이름 → 입력 순서라서 실행할 때마다 동점 처리가 같음)
+        alive = sorted({id(c): c for c in alive}.values(), key=lambda c: str(getattr(c, 'name', '')))
+        if not alive:
+            return []
+
+        self._refresh_profiles(alive, speed_modifier)
+        state = (settings, self._state_key(alive))
+
+        if self._cached_state is not None and count <= self._cached_count:
+            if state == self._cached_state:
+                self.stats['hits'] += 1
+                return self._cached_forecast[:count]
+            if self._is_single_tick_advance(self._cached_state, state, settings[1]):
+                self.stats['shifted'] += 1
+                self._cached_forecast = [
+                    ForecastEntry(entry.combatant, entry.ticks_until - 1, entry.is_cast_completion)
+                    for entry in self._cached_forecast
+                ]
+                self._cached_state = state
+                return self._cached_forecast[:count]
+
+        self.stats['full_rebuilds'] += 1
+        self._cached_forecast = self._simulate(alive, count, settings[0], settings[1])
+        self._cached_state = state
+        self._cached_count = count
+        return self._cached_forecast[:count]
+
+    def get_next_actor(self, combatants: List[Any]):
+        """다음에 행동할 전투원"""
+        forecast = self.get_forecast(combatants, 1)
+        return forecast[0].combatant if forecast else None
+
+    def ticks_until_turn(self, combatant, combatants: List[Any], count: int = 8) -> Optional[int]:
+        """특정 전투원의 다음 행동까지 남은 틱 수 (예측 범위 밖이면 None)"""
+        for entry in self.get_forecast(combatants, count):
+            if entry.combatant is combatant:
+                return entry.ticks_until
+        return None
+
+    def actors_before(self, combatant, combatants: List[Any], count: int = 8) -> List[Any]:
+        """특정 전투원의 다음 행동 전에 행동할 전투원 목록"""
+        actors = []
+        for entry in self.get_forecast(combatants, count):
+            if entry.combatant is combatant:
+                return actors
+            actors.append(entry.combatant)
+        return actors
+
+    # =====================================
+    # 내부 계산
+    # =====================================
+
+    def _status_names(self, combatant) -> tuple:
+        """행동불가 관련 상태 이름 (ATB 증가량에는 영향 없음 - _update_atb_instant와 동일)"""
+        effects = []
+        status_manager = getattr(combatant, 'status_manager', None)
+        if status_manager is not None:
+            effects = getattr(status_manager, 'status_effects', None) or []
+        relevant = []
+        for effect in effects:
+            status_type = getattr(effect, 'status_type', None)
+            name = getattr(status_type, 'name', str(status_type)).upper()
+            if name in DISABLE_STATUS_NAMES:
+                relevant.append(name)
+        return tuple(relevant)
+
+    def _profile_fingerprint(self, combatant, avg_speed: float, speed_modifier: Optional[float]) -> tuple:
+        return (
+            getattr(combatant, 'speed', 50),
+            avg_speed,
+            speed_modifier,
+            self._status_names(combatant),
+            bool(getattr(combatant, 'is_stunned', False)),
+            bool(getattr(combatant, 'is_casting', False)),
+            getattr(combatant, 'casting_cast_time', 250),
+        )
+
+    def _refresh_profiles(self, alive: List[Any], speed_modifier: Optional[float]):
+        """속도/상태가 바뀐 전투원만 ATB 증가량 재계산"""
+        avg_speed = sum(getattr(c, 'speed', 50) for c in alive) / len(alive)
+        for combatant in alive:
+            fingerprint = self._profile_fingerprint(combatant, avg_speed, speed_modifier)
+            profile = self._profiles.get(id(combatant))
+            if profile is not None and profile.fingerprint == fingerprint:
+                continue
+            self._profiles[id(combatant)] = self._build_profile(fingerprint)
+            self._cached_state = None
+
+        # 이전 전투의 프로필 정리
+        if len(self._profiles) > len(alive) * 4 + 32:
+            alive_ids = {id(c) for c in alive}
+            self._profiles = {cid: p for cid, p in self._profiles.items() if cid in alive_ids}
+
+    def _build_profile(self, fingerprint: tuple) -> _CombatantProfile:
+        speed, avg_speed, speed_modifier, disabling_statuses, is_stunned, _, _ = fingerprint
+        atb_per_tick = atb_gain_per_tick(speed, avg_speed, self.base_atb_increase, speed_modifier)
+        can_act = not is_stunned and not disabling_statuses
+        return _CombatantProfile(fingerprint, atb_per_tick, can_act and atb_per_tick > 0)
+
+    def _state_key(self, alive: List[Any]) -> tuple:
+        return tuple((id(c), getattr(c, 'atb_gauge', 0), self._profiles[id(c)].fingerprint) for c in alive)
+
+    def _is_single_tick_advance(self, old_state: tuple, new_state: tuple, atb_max: int) -> bool:
+        """모든 전투원이 정확히 한 틱만큼 ATB가 증가했고 아직 아무도 행동하지 않았는지"""
+        old_settings, old_state = old_state
+        new_settings, new_state = new_state
+        if old_settings != new_settings or len(old_state) != len(new_state):
+            return False
+        if not self._cached_forecast or self._cached_forecast[0].ticks_until <= 0:
+            return False
+        for (old_id, old_atb, old_fp), (new_id, new_atb, new_fp) in zip(old_state, new_state):
+            if old_id != new_id or old_fp != new_fp:
+                return False
+            profile = self._profiles.get(new_id)
+            if profile is None or new_atb != min(atb_max, old_atb + profile.atb_per_tick):
+                return False
+        return True
+
+    def _ticks_to_reach(self, atb: float, target: float, per_tick: int) -> int:
+        if atb >= target:
+            return 0
+        return int(math.ceil((target - atb) / per_tick))
+
+    def _simulate(self, alive: List[Any], count: int, ready_threshold: int, atb_max: int) -> List[ForecastEntry]:
+        """힙 기반으로 다음 count번의 행동 시뮬레이션"""
+        heap = []
+        for order, combatant in enumerate(alive):
+            profile = self._profiles[id(combatant)]
+            if not profile.can_act:
+                continue
+            atb = getattr(combatant, 'atb_gauge', 0)
+            is_casting = bool(getattr(combatant, 'is_casting', False))
+            target = getattr(combatant, 'casting_cast_time', 250) if is_casting else ready_threshold
+            ticks = self._ticks_to_reach(atb, target, profile.atb_per_tick)
+            ready_atb = min(atb_max, atb + ticks * profile.atb_per_tick)
+            # 정렬: 먼저 준비되는 순 → ATB 높은 순 → 속도 빠른 순 → 입력 순서 (랜덤 대신 결정적 순서)
+            heapq.heappush(heap, (ticks, -ready_atb, -getattr(combatant, 'speed', 50), order, is_casting, target))
+
+        forecast = []
+        while heap and len(forecast) < count:
+            ticks, neg_atb, neg_speed, order, is_casting, cost = heapq.heappop(heap)
+            combatant = alive[order]
+            forecast.append(ForecastEntry(combatant, ticks, is_casting))
+
+            profile = self._profiles[id(combatant)]
+            remaining_atb = max(0, -neg_atb - (cost if is_casting else self.action_cost))
+            next_ticks = ticks + max(1, self._ticks_to_reach(remaining_atb, ready_threshold, profile.atb_per_tick))
+            next_atb = min(atb_max, remaining_atb + (next_ticks - ticks) * profile.atb_per_tick)
+            heapq.heappush(heap, (next_ticks, -next_atb, neg_speed, order, False, ready_threshold))
+
+        return forecast
+
+
+# 전역 예측기 (전투 시스템/AI가 공유)
+_turn_forecaster = None
+
+def get_turn_forecaster() -> TurnOrderForecaster:
+    """공유 턴 순서 예측기 인스턴스 가져오기"""
+    global _turn_forecaster
+    if _turn_forecaster is None:
+        _turn_forecaster = TurnOrderForecaster()
+    return _turn_forecaster
@@ -0,0 +1,149 @@
+"""
+⌨️ 타이핑 효과 렌더러
+스토리/컷신 텍스트를 프레임 단위로 묶어서 출력하는 계층
+
+- 글자마다 print + sleep 하지 않고, 단조 시계(time.monotonic) 기준으로 '지금까지 나왔어야 할 글자'를 한 번에 write
+- 터미널/웹 브리지가 느려서 늦어진 만큼 다음 프레임에 더 많이 출력 → 체감 속도 일정
+- ANSI 이스케이프 시퀀스와 결합 문자(이모지 ZWJ, 변형 선택자 등)는 다음/앞 글자와 한 덩어리로 출력
+- 스킵 확인은 프레임마다 한 번 (skip_check 콜백) - 입력 감시 스레드 없이 바로 중단
+"""
+
+import re
+import sys
+import time
+import unicodedata
+from typing import Callable, List, Optional
+
+DEFAULT_FRAME_SECONDS = 1 / 30   # 한 프레임 (이보다 자주 깨어나지 않음)
+MAX_IDLE_SECONDS = 0.1           # 글자 사이 최대 대기 (스킵 확인 간격)
+
+_ANSI_PATTERN = re.compile(r'\x1b\[[0-9;?]*[ -/]*[@-~]')
+_ZERO_WIDTH_JOINER = '\u200d'
+
+
+def _attaches_to_previous(ch: str) -> bool:
+    """앞 글자에 붙어서 출력되어야 하는 문자 (결합 부호, 변형 선택자, 이모지 수식자)"""
+    if unicodedata.combining(ch):
+        return True
+    code = ord(ch)
+    return 0xFE00 <= code <= 0xFE0F or 0x1F3FB <= code <= 0x1F3FF or 0xE0020 <= code <= 0xE007F
+
+
+def split_typing_units(text: str) -> List[str]:
+    """텍스트를 타이핑 단위로 분리 - 단위 하나 = 화면에 보이는 글자 하나
+
+    ANSI 시퀀스는 시간을 차지하지 않도록 다음 글자 앞에 붙이고 (마지막이면 마지막 단위 뒤에),
+    결합 문자/ZWJ로 이어진 이모지는 앞 글자와 합침
+    """
+    units: List[str] = []
+    pending_escape = ''
+    join_next = False
+    position = 0
+    length = len(text)
+    while position < length:
+        ch = text[position]
+        if ch == '\x1b':
+            match = _ANSI_PATTERN.match(text, position)
+            if match:
+                pending_escape += match.group()
+                position = match.end()
+                continue
+        position += 1
+        if units and (join_next or ch == _ZERO_WIDTH_JOINER or _attaches_to_previous(ch)) and not pending_escape:
+            units[-1] += ch
+            join_next = ch == _ZERO_WIDTH_JOINER
+            continue
+        units.append(pending_escape + ch)
+        pending_escape = ''
+        join_next = False
+    if pending_escape:
+        if units:
+            units[-1] += pending_escape
+        else:
+            units.append(pending_escape)
+    return units
+
+
+class TypewriterRenderer:
+    """프레임 단위 타이핑 출력기"""
+
+    def __init__(self, stream=None, frame_seconds: float = DEFAULT_FRAME_SECONDS,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.stream = stream
+        self.frame_seconds = frame_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = {'frames': 0, 'units': 0}
+
+    def _output(self):
+        # sys.stdout은 실행 중 교체될 수 있으므로 출력할 때마다 확인
+        return self.stream if self.stream is not None else sys.stdout
+
+    def write(self, text: str):
+        """즉시 출력"""
+        if not text:
+            return
+        stream = self._output()
+        stream.write(text)
+        stream.flush()
+
+    def type_text(self, text: str, delay: float,
+                  skip_check: Optional[Callable[[], bool]] = None,
+                  on_frame: Optional[Callable[[int], None]] = None) -> bool:
+        """글자당 delay초 속도로 타이핑 (마지막 글자 뒤에도 delay만큼 대기 - 기존 글자별 sleep과 같은 총 시간)
+
+        skip_check()가 True를 돌려주면 즉시 중단하고 True 반환 (남은 글자는 출력하지 않음)
+        on_frame(n)은 이번 프레임에 n글자를 출력한 뒤 호출 (효과음 등)
+        """
+        units = split_typing_units(text)
+        total = len(units)
+        if total == 0:
+            return False
+        if delay <= 0:
+            if skip_check is not None and skip_check():
+                return True
+            self.write(''.join(units))
+            self.stats['frames'] += 1
+            self.stats['units'] += total
+            if on_frame is not None:
+                on_frame(total)
+            return False
+
+        clock = self.clock
+        start = clock()
+        end = start + total * delay
+        written = 0
+        while True:
+            if skip_check is not None and skip_check():
+                return True
+            now = clock()
+            if written < total:
+                # k번째 글자(0부터)는 start + k*delay에 나와야 함 - 늦었으면 밀린 글자를 한 번에
+                due = min(total, int((now - start) / delay) + 1)
+                if due > written:
+                    self.write(''.join(units[written:due]))
+                    self.stats['frames'] += 1
+                    self.stats['units'] += due - written
+                    if on_frame is not None:
+                        on_frame(due - written)
+                    written = due
+            if written >= total:
+                if now >= end:
+                    return False
+                wait = end - now
+            else:
+                # 다음 글자까지 자되, 한 프레임보다 짧게는 자지 않음 (글자가 빠르면 프레임마다 여러 글자)
+                wait = max(self.frame_seconds, start + written * delay - clock())
+            # 느린 타이핑에서도 스킵은 바로 반응하도록 한 번에 너무 오래 자지 않음
+            self.sleep(min(wait, MAX_IDLE_SECONDS))
+
+
+_typewriter: Optional[TypewriterRenderer] = None
+
+
+def get_typewriter() -> TypewriterRenderer:
+    """공용 타이핑 렌더러 (표준 출력)"""
+    global _typewriter
+    if _typewriter is None:
+        _typewriter = TypewriterRenderer()
+    return _typewriter
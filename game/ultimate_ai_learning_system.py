@@ -16,6 +16,10 @@ from enum import Enum
 import os
 from pathlib import Path
 
+from game.json_store import schedule_json_save
+from game.battle_training_runner import (BattleTrainingRunner, battle_engine_available, battle_success_rate,
+                                         make_training_task, run_headless_battle)
+
 class AILearningType(Enum):
     """AI 학습 방식"""
     EXPERIENCE = "경험학습"      # 실제 플레이로 학습
@@ -108,8 +112,12 @@ class UltimateAILearningSystem:
         print(f"   학습방식: {[lt.value for lt in learning_types]}")
         return ai_data
     
-    def start_night_learning(self, duration_hours: int = 8):
-        """야간 자동 학습 시작 - 컴퓨터 켜두고 자면 AI가 학습!"""
+    def start_night_learning(self, duration_hours: int = 8, workers: int = None, permanent_db=None):
+        """야간 자동 학습 시작 - 컴퓨터 켜두고 자면 AI가 학습!
+        
+        실제 헤드리스 전투를 프로세스 풀(workers개)에서 돌리고 결과를 배치로 반영
+        permanent_db: 결과를 함께 쌓을 PermanentLearningDatabase (None이면 기본 DB)
+        """
         print("🌙 === 야간 자동 학습 시작! ===")
         print(f"   ⏰ 학습 시간: {duration_hours}시간")
         print("   💤 이제 주무세요! AI가 알아서 학습합니다!")
@@ -121,6 +129,13 @@ class UltimateAILearningSystem:
             start_time = time.time()
             end_time = start_time + (duration_hours * 3600)
             
+            if battle_engine_available():
+                session_count = self._run_night_training_battles(end_time, workers, permanent_db)
+                self._complete_night_learning(session_count, duration_hours)
+                return
+            
+            # 전투 엔진을 불러올 수 없는 환경 - 기존 추정 세션
+            print("⚠️ 전투 엔진을 불러올 수 없어 추정 세션으로 학습합니다")
             session_count = 0
             while time.time() < end_time and self.night_learning_mode:
                 session_count += 1
@@ -148,6 +163,73 @@ class UltimateAILearningSystem:
         
         return learning_thread
     
+    def _run_night_training_battles(self, end_time: float, workers: int = None, permanent_db=None) -> int:
+        """종료 시각까지 훈련 전투를 병렬 실행 - 배치마다 학습 반영/진화/저장, 총 전투 수 반환"""
+        if permanent_db is None:
+            try:
+                from game.permanent_ai_learning_system import PermanentLearningDatabase
+                permanent_db = PermanentLearningDatabase()
+            except Exception as e:
+                print(f"⚠️ 영구 학습 DB 사용 불가: {e}")
+        
+        runner = BattleTrainingRunner(workers=workers, verbose=False)
+        progress = {"battles": 0}
+        
+        def on_batch(results):
+            before = progress["battles"]
+            progress["battles"] += len(results)
+            self.apply_battle_results(results)
+            if permanent_db is not None:
+                permanent_db.record_training_battles(results)
+            
+            # 진화 체크 (100전투마다)
+            if progress["battles"] // 100 > before // 100:
+                self._evolve_ai_generation()
+            
+            self._save_learning_progress()
+            remaining_hours = max(0.0, end_time - time.time()) / 3600
+            print(f"🌙 야간학습 진행중... 남은시간: {remaining_hours:.1f}시간 "
+                  f"(전투: {progress['battles']:,}, 시간당 {runner.stats.battles_per_hour:,.0f}전)")
+        
+        stats = runner.run(self._night_training_tasks(), on_batch=on_batch,
+                           should_stop=lambda: time.time() >= end_time or not self.night_learning_mode)
+        self.last_training_stats = stats
+        print(stats.summary())
+        if permanent_db is not None:
+            permanent_db.flush()
+        return stats.battles
+    
+    def _night_training_tasks(self):
+        """학습 AI들을 돌아가며 훈련 전투 생성 (지능 레벨이 오를수록 적 HP 증가)"""
+        rng = random.Random()
+        battle_id = 0
+        while self.ai_models:
+            for ai_name, ai_data in list(self.ai_models.items()):
+                battle_id += 1
+                yield make_training_task(battle_id, ai_name, ai_data["job_class"], rng,
+                                         difficulty=self._training_difficulty(ai_data))
+    
+    def _training_difficulty(self, ai_data: Dict) -> float:
+        return 1.0 + 0.25 * list(AIIntelligenceLevel).index(ai_data["intelligence_level"])
+    
+    def apply_battle_results(self, results: List[Dict[str, Any]]):
+        """헤드리스 전투 결과 배치를 AI 기억/성능에 반영"""
+        for result in results:
+            ai_data = self.ai_models.get(result["ai_name"])
+            if ai_data is None or result.get("error"):
+                continue
+            
+            self._record_combat_patterns(ai_data, result)
+            success_rate = battle_success_rate(result)
+            self._apply_learning(ai_data, success_rate, learning_hours=result["elapsed"] / 3600)
+            self._update_performance_stats(ai_data, success_rate)
+    
+    def _record_combat_patterns(self, ai_data: Dict, result: Dict[str, Any]):
+        """전투에서 실제로 한 행동 횟수를 전투 패턴으로 누적"""
+        patterns = ai_data["memory"].combat_patterns
+        for action, count in result["actions"].items():
+            patterns[action] = patterns.get(action, 0) + count
+    
     def _run_automated_learning_session(self, session_id: int):
         """자동 학습 세션 실행"""
         # 랜덤하게 AI 선택
@@ -167,7 +249,15 @@ class UltimateAILearningSystem:
         self._update_performance_stats(ai_data, success_rate)
     
     def _simulate_game_play(self, ai_data: Dict) -> float:
-        """게임 플레이 시뮬레이션"""
+        """게임 플레이 - 실제 헤드리스 전투 한 판 (전투 엔진이 없으면 지능 레벨 기반 추정)"""
+        if battle_engine_available():
+            task = make_training_task(0, ai_data["name"], ai_data["job_class"],
+                                      difficulty=self._training_difficulty(ai_data))
+            result = run_headless_battle(task)
+            if not result["error"]:
+                self._record_combat_patterns(ai_data, result)
+                return battle_success_rate(result)
+        
         # AI 지능 레벨에 따른 기본 성공률
         intelligence_multiplier = {
             AIIntelligenceLevel.BASIC: 0.3,
@@ -194,7 +284,7 @@ class UltimateAILearningSystem:
         
         return max(final_success_rate, 0.0)
     
-    def _apply_learning(self, ai_data: Dict, success_rate: float):
+    def _apply_learning(self, ai_data: Dict, success_rate: float, learning_hours: float = 0.1):
         """학습 적용"""
         memory = ai_data["memory"]
         
@@ -215,7 +305,7 @@ class UltimateAILearningSystem:
             memory.failed_actions.append(failure_pattern)
         
         # 학습 시간 누적
-        ai_data["total_learning_hours"] += 0.1  # 10초 = 0.1시간 상당의 학습
+        ai_data["total_learning_hours"] += learning_hours  # 기본: 10초 = 0.1시간 상당의 학습
     
     def _update_performance_stats(self, ai_data: Dict, success_rate: float):
         """성능 통계 업데이트"""
@@ -363,23 +453,24 @@ class UltimateAILearningSystem:
         return party
     
     def _save_ai_data(self, ai_name: str):
-        """AI 데이터 저장"""
+        """AI 데이터 저장 예약"""
         ai_file = self.data_dir / f"ai_{ai_name}.json"
-        with open(ai_file, 'w', encoding='utf-8') as f:
-            json.dump(self.ai_models[ai_name], f, ensure_ascii=False, indent=2, default=str)
+        schedule_json_save(ai_file, lambda: self.ai_models[ai_name], default=str)
     
     def _save_learning_progress(self):
-        """학습 진행상황 저장"""
+        """학습 진행상황 저장 예약 (학습 루프에서 자주 호출되므로 모아서 기록)"""
         progress_file = self.data_dir / "learning_progress.json"
-        progress_data = {
+        schedule_json_save(progress_file, self._learning_progress_data)
+    
+    def _learning_progress_data(self) -> Dict[str, Any]:
+        """학습 진행상황 데이터"""
+        ai_models = list(self.ai_models.values())
+        return {
             "last_update": datetime.now().isoformat(),
-            "ai_count": len(self.ai_models),
-            "total_learning_hours": sum(ai["total_learning_hours"] for ai in self.ai_models.values()),
-            "average_intelligence": sum(list(AIIntelligenceLevel).index(ai["intelligence_level"]) for ai in self.ai_models.values()) / len(self.ai_models) if self.ai_models else 0
+            "ai_count": len(ai_models),
+            "total_learning_hours": sum(ai["total_learning_hours"] for ai in ai_models),
+            "average_intelligence": sum(list(AIIntelligenceLevel).index(ai["intelligence_level"]) for ai in ai_models) / len(ai_models) if ai_models else 0
         }
-        
-        with open(progress_file, 'w', encoding='utf-8') as f:
-            json.dump(progress_data, f, ensure_ascii=False, indent=2)
 
 class AIPerformanceMonitor:
     """AI 성능 모니터링 시스템"""
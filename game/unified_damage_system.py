@@ -81,6 +81,14 @@ def get_color(color_name):
 # Enum import 추가
 from enum import Enum
 
+# 배치 데미지 계산용 NumPy (선택사항)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 # UI 애니메이션 대기 함수 import
 try:
     from game.ui_animations import SequentialGaugeAnimator
@@ -162,6 +170,68 @@ class DamageResult:
         if self.calculation_steps is None:
             self.calculation_steps = []
 
+@dataclass
+class BatchDamageResult:
+    """배치 데미지 계산 결과 (대상별 값 배열)
+    
+    단일 공격자 → N 대상이면 1차원, N 공격자 × M 대상 시뮬레이션이면 2차원 배열.
+    NumPy가 없으면 같은 모양의 파이썬 리스트를 사용한다.
+    """
+    base_damage: Any = None
+    critical_damage: Any = None
+    is_critical: Any = None
+    elemental_bonus: Any = None
+    trait_bonus: Any = None
+    final_damage: Any = None
+    wound_damage: Any = None
+    damage_type: DamageType = DamageType.PHYSICAL
+    calculation_steps: list = None  # explain=True일 때만 대상별 설명 문자열 목록
+    
+    def __post_init__(self):
+        if self.calculation_steps is None:
+            self.calculation_steps = []
+    
+    def __len__(self):
+        return len(self.final_damage) if self.final_damage is not None else 0
+    
+    def total_damage(self) -> int:
+        """전체 최종 데미지 합계"""
+        if self.final_damage is None:
+            return 0
+        if NUMPY_AVAILABLE and isinstance(self.final_damage, np.ndarray):
+            return int(self.final_damage.sum())
+        return sum(sum(row) if isinstance(row, list) else row for row in self.final_damage)
+    
+    def to_damage_results(self) -> list:
+        """1차원 배치 결과를 기존 DamageResult 목록으로 변환 (기존 처리 코드 호환용)"""
+        def as_list(values):
+            return values.tolist() if hasattr(values, 'tolist') else list(values)
+        
+        results = []
+        finals = as_list(self.final_damage)
+        bases = as_list(self.base_damage)
+        crits = as_list(self.critical_damage) if self.critical_damage is not None else bases
+        crit_flags = as_list(self.is_critical) if self.is_critical is not None else [False] * len(finals)
+        elementals = as_list(self.elemental_bonus)
+        traits = as_list(self.trait_bonus)
+        wounds = as_list(self.wound_damage) if self.wound_damage is not None else [0] * len(finals)
+        
+        for i in range(len(finals)):
+            result = DamageResult(
+                base_damage=int(bases[i]),
+                critical_damage=int(crits[i]),
+                elemental_bonus=float(elementals[i]),
+                trait_bonus=float(traits[i]),
+                final_damage=int(finals[i]),
+                is_critical=bool(crit_flags[i]),
+                damage_type=self.damage_type,
+                wound_damage=int(wounds[i]),
+            )
+            if i < len(self.calculation_steps):
+                result.calculation_steps = list(self.calculation_steps[i])
+            results.append(result)
+        return results
+
 class UnifiedDamageSystem:
     """통합 데미지 계산 시스템"""
     
@@ -291,25 +361,8 @@ class UnifiedDamageSystem:
         if self.debug_mode:
             self._print_damage_calculation("BRV 데미지", result)
             
-            # 1초 대기 (아무 키나 눌러서 스킵 가능) - 윈도우 호환 버전
-            import time
-            import threading
-            import msvcrt
-            
-            def wait_for_key():
-                """키 입력을 대기하는 함수"""
-                msvcrt.getch()
-            
-            # 키 입력을 기다리는 스레드 시작
-            key_thread = threading.Thread(target=wait_for_key)
-            key_thread.daemon = True
-            key_thread.start()
-            
-            # 1초 대기하거나 키 입력까지 대기
-            for i in range(10):  # 1초 = 10 × 0.1초
-                if not key_thread.is_alive():
-                    break
-                time.sleep(0.1)
+            # 1초 대기 (아무 키나 눌러서 스킵 가능)
+            self._wait_for_skip_key()
             
         return result
     
@@ -399,28 +452,268 @@ class UnifiedDamageSystem:
         if self.debug_mode:
             self._print_damage_calculation("HP 데미지", result)
             
-            # 1초 대기 (아무 키나 눌러서 스킵 가능) - 윈도우 호환 버전
-            import time
-            import threading
-            import msvcrt
-            
-            def wait_for_enter():
-                """키 입력을 대기하는 함수"""
-                msvcrt.getch()
-            
-            # 키 입력을 기다리는 스레드 시작
-            key_thread = threading.Thread(target=wait_for_enter)
-            key_thread.daemon = True
-            key_thread.start()
-            
-            # 1초 대기하거나 키 입력까지 대기
-            for i in range(10):  # 1초 = 10 × 0.1초
-                if not key_thread.is_alive():
-                    break
-                time.sleep(0.1)
+            # 1초 대기 (아무 키나 눌러서 스킵 가능)
+            self._wait_for_skip_key()
             
         return result, result.wound_damage
     
+    # =====================================
+    # 🌊 배치 데미지 계산 (광역기/시뮬레이션)
+    # =====================================
+    
+    @staticmethod
+    def _make_rng(seed: Optional[int] = None, rng=None):
+        """배치 계산용 난수 생성기 (NumPy Generator 또는 random.Random)
+
+        seed가 없으면 전역 random에서 뽑아 씀 - random.seed()로 고정한 전투는 배치 경로도 재현됨
+        """
+        if rng is not None:
+            return rng
+        if seed is None:
+            seed = random.getrandbits(64)
+        if NUMPY_AVAILABLE:
+            return np.random.default_rng(seed)
+        return random.Random(seed)
+    
+    @staticmethod
+    def _random_array(rng, shape):
+        """[0, 1) 난수 배열 생성 (Generator/Random 모두 지원)"""
+        if NUMPY_AVAILABLE and hasattr(rng, 'random') and not isinstance(rng, random.Random):
+            return rng.random(shape)
+        if isinstance(shape, tuple):
+            rows, cols = shape
+            values = [[rng.random() for _ in range(cols)] for _ in range(rows)]
+        else:
+            values = [rng.random() for _ in range(shape)]
+        return np.array(values) if NUMPY_AVAILABLE else values
+    
+    def _get_critical_rate(self, attacker) -> float:
+        """크리티컬 확률 계산"""
+        luck = getattr(attacker, 'luck', 0)
+        return self.BASE_CRITICAL_RATE + (luck * self.LUCK_CRITICAL_BONUS)
+    
+    def _get_brv_raw_attack(self, attack: float, defense: float) -> float:
+        """BRV 공격의 방어력 적용 전 기본 공격치"""
+        if self.BRV_DEFENSE_REDUCTION == 1.0:
+            return attack / max(1, defense)
+        return max(1, attack - defense * self.BRV_DEFENSE_REDUCTION)
+    
+    def calculate_brv_damage_batch(self,
+                                   attacker,
+                                   targets: list,
+                                   skill: Dict[str, Any],
+                                   base_power: Optional[float] = None,
+                                   seed: Optional[int] = None,
+                                   rng=None,
+                                   explain: bool = False) -> BatchDamageResult:
+        """
+        한 공격자 → N 대상 BRV 데미지 일괄 계산
+        
+        calculate_brv_damage와 같은 공식을 사용하지만 대상별 값을 배열로 처리하고,
+        설명 문자열은 explain=True일 때만 만들며 디버그 대기도 하지 않는다.
+        
+        Args:
+            attacker: 공격자
+            targets: 대상 목록
+            skill: 스킬 정보
+            base_power: 기본 위력 (스킬에서 가져올 수 없을 때)
+            seed: 크리티컬 판정 시드 (rng가 없을 때 사용)
+            rng: 외부 난수 생성기 (np.random.Generator 또는 random.Random)
+            explain: 대상별 계산 과정 문자열 생성 여부
+            
+        Returns:
+            BatchDamageResult: 대상 순서대로 정렬된 결과 배열
+        """
+        rng = self._make_rng(seed, rng)
+        count = len(targets)
+        
+        attack = self._get_attack_stat(attacker, skill)
+        skill_multiplier = base_power or skill.get('brv_power', 1.0)
+        level_bonus = 1.0 + (getattr(attacker, 'level', 1) * self.BRV_LEVEL_BONUS_PER_LEVEL)
+        critical_rate = self._get_critical_rate(attacker)
+        critical_multiplier = self._get_critical_multiplier(attacker)
+        attacker_bonus = self._get_attacker_trait_bonus(attacker)
+        
+        defenses = [self._get_defense_stat(target, skill) for target in targets]
+        elementals = [self._calculate_elemental_bonus(skill, attacker, target) for target in targets]
+        traits = [attacker_bonus * self._get_target_trait_factor(target) for target in targets]
+        rolls = self._random_array(rng, count)
+        
+        if NUMPY_AVAILABLE:
+            defense_array = np.asarray(defenses, dtype=float)
+            if self.BRV_DEFENSE_REDUCTION == 1.0:
+                raw_attack = attack / np.maximum(1.0, defense_array)
+            else:
+                raw_attack = np.maximum(1.0, attack - defense_array * self.BRV_DEFENSE_REDUCTION)
+            base = np.trunc(raw_attack * skill_multiplier * level_bonus * self.BRV_BASE_MULTIPLIER).astype(np.int64)
+            is_critical = np.asarray(rolls) < critical_rate
+            critical = np.where(is_critical, np.trunc(base * critical_multiplier).astype(np.int64), base)
+            elemental_array = np.asarray(elementals, dtype=float)
+            trait_array = np.asarray(traits, dtype=float)
+            elemental_damage = np.trunc(critical * elemental_array)
+            final = np.maximum(1, np.trunc(elemental_damage * trait_array)).astype(np.int64)
+            result = BatchDamageResult(base, critical, is_critical, elemental_array, trait_array, final)
+        else:
+            base, critical, is_critical, final = [], [], [], []
+            for i in range(count):
+                raw_attack = self._get_brv_raw_attack(attack, defenses[i])
+                base_damage = int(raw_attack * skill_multiplier * level_bonus * self.BRV_BASE_MULTIPLIER)
+                crit = rolls[i] < critical_rate
+                critical_damage = int(base_damage * critical_multiplier) if crit else base_damage
+                elemental_damage = int(critical_damage * elementals[i])
+                base.append(base_damage)
+                critical.append(critical_damage)
+                is_critical.append(crit)
+                final.append(max(1, int(elemental_damage * traits[i])))
+            result = BatchDamageResult(base, critical, is_critical, elementals, traits, final)
+        
+        if explain:
+            result.calculation_steps = self._explain_brv_batch(result, attack, defenses, skill_multiplier, level_bonus, critical_multiplier)
+        if self.debug_mode:
+            self._print_damage_calculation(f"BRV 데미지 ×{count}", DamageResult())
+        return result
+    
+    def calculate_hp_damage_batch(self,
+                                  attacker,
+                                  targets: list,
+                                  skill: Dict[str, Any],
+                                  brv_points: Optional[int] = None,
+                                  hp_power: Optional[float] = None,
+                                  explain: bool = False) -> BatchDamageResult:
+        """
+        한 공격자 → N 대상 HP 데미지 일괄 계산 (광역 HP 공격용)
+        
+        모든 대상이 같은 BRV로 맞는 광역 HP 공격 규칙에 맞춰 BRV는 한 번만 읽는다.
+        
+        Returns:
+            BatchDamageResult: 대상 순서대로 정렬된 결과 배열 (wound_damage 포함)
+        """
+        if brv_points is None:
+            brv_points = getattr(attacker, 'brave_points', 0)
+        if hp_power is None:
+            hp_power = skill.get('hp_power', 1.0)
+        
+        defense_attr = 'magic_defense' if skill.get('damage_type', 'physical') == 'magical' else 'physical_defense'
+        defenses = [getattr(target, defense_attr, 50) for target in targets]
+        attacker_bonus = self._get_attacker_trait_bonus(attacker)
+        elementals = [self._calculate_elemental_bonus(skill, attacker, target) for target in targets]
+        traits = [attacker_bonus * self._get_target_trait_factor(target) for target in targets]
+        scaled_power = brv_points * hp_power * self.HP_DAMAGE_MULTIPLIER * self.HP_SKILL_POWER_SCALING
+        
+        if NUMPY_AVAILABLE:
+            defense_multiplier = np.maximum(0.2, 1.0 - (np.asarray(defenses, dtype=float) * self.HP_DEFENSE_REDUCTION / 100))
+            base = np.trunc(scaled_power * defense_multiplier).astype(np.int64)
+            elemental_array = np.asarray(elementals, dtype=float)
+            trait_array = np.asarray(traits, dtype=float)
+            elemental_damage = np.trunc(base * elemental_array)
+            final = np.maximum(1, np.trunc(elemental_damage * trait_array)).astype(np.int64)
+            wounds = np.trunc(final * self.WOUND_DAMAGE_RATIO).astype(np.int64)
+            result = BatchDamageResult(base, base, np.zeros(len(targets), dtype=bool), elemental_array, trait_array, final, wounds)
+        else:
+            base, final, wounds = [], [], []
+            for i in range(len(targets)):
+                defense_multiplier = max(0.2, 1.0 - (defenses[i] * self.HP_DEFENSE_REDUCTION / 100))
+                base_damage = int(scaled_power * defense_multiplier)
+                final_damage = max(1, int(int(base_damage * elementals[i]) * traits[i]))
+                base.append(base_damage)
+                final.append(final_damage)
+                wounds.append(int(final_damage * self.WOUND_DAMAGE_RATIO))
+            result = BatchDamageResult(base, base, [False] * len(targets), elementals, traits, final, wounds)
+        
+        if explain:
+            result.calculation_steps = [
+                [f"기본 HP 데미지: {brv_points} × {hp_power} × {self.HP_DAMAGE_MULTIPLIER} × {self.HP_SKILL_POWER_SCALING} (방어력 {defenses[i]}) = {int(result.base_damage[i])}",
+                 f"최종: {int(result.final_damage[i])} (속성 {float(result.elemental_bonus[i]):.2f}, 특성 {float(result.trait_bonus[i]):.2f})"]
+                for i in range(len(targets))
+            ]
+        if self.debug_mode:
+            self._print_damage_calculation(f"HP 데미지 ×{len(targets)}", DamageResult())
+        return result
+    
+    def simulate_brv_damage_matrix(self,
+                                   attackers: list,
+                                   targets: list,
+                                   skill: Dict[str, Any],
+                                   base_power: Optional[float] = None,
+                                   seed: Optional[int] = None,
+                                   rng=None) -> BatchDamageResult:
+        """
+        N 공격자 × M 대상 BRV 데미지 행렬 (밸런스 시뮬레이션용)
+        
+        디버그 출력 없이 [공격자][대상] 모양의 결과를 돌려준다.
+        """
+        rng = self._make_rng(seed, rng)
+        rows, cols = len(attackers), len(targets)
+        
+        attacks = [self._get_attack_stat(attacker, skill) for attacker in attackers]
+        levels = [1.0 + (getattr(attacker, 'level', 1) * self.BRV_LEVEL_BONUS_PER_LEVEL) for attacker in attackers]
+        critical_rates = [self._get_critical_rate(attacker) for attacker in attackers]
+        critical_multipliers = [self._get_critical_multiplier(attacker) for attacker in attackers]
+        attacker_bonuses = [self._get_attacker_trait_bonus(attacker) for attacker in attackers]
+        defenses = [self._get_defense_stat(target, skill) for target in targets]
+        target_factors = [self._get_target_trait_factor(target) for target in targets]
+        # 속성 상성은 스킬/대상에만 의존
+        elementals = [self._calculate_elemental_bonus(skill, None, target) for target in targets]
+        skill_multiplier = base_power or skill.get('brv_power', 1.0)
+        rolls = self._random_array(rng, (rows, cols))
+        
+        if NUMPY_AVAILABLE:
+            attack_col = np.asarray(attacks, dtype=float)[:, None]
+            defense_row = np.asarray(defenses, dtype=float)[None, :]
+            if self.BRV_DEFENSE_REDUCTION == 1.0:
+                raw_attack = attack_col / np.maximum(1.0, defense_row)
+            else:
+                raw_attack = np.maximum(1.0, attack_col - defense_row * self.BRV_DEFENSE_REDUCTION)
+            level_col = np.asarray(levels, dtype=float)[:, None]
+            base = np.trunc(raw_attack * skill_multiplier * level_col * self.BRV_BASE_MULTIPLIER).astype(np.int64)
+            is_critical = np.asarray(rolls) < np.asarray(critical_rates)[:, None]
+            crit_values = np.trunc(base * np.asarray(critical_multipliers)[:, None]).astype(np.int64)
+            critical = np.where(is_critical, crit_values, base)
+            elemental_matrix = np.broadcast_to(np.asarray(elementals, dtype=float)[None, :], (rows, cols))
+            trait_matrix = np.asarray(attacker_bonuses, dtype=float)[:, None] * np.asarray(target_factors, dtype=float)[None, :]
+            final = np.maximum(1, np.trunc(np.trunc(critical * elemental_matrix) * trait_matrix)).astype(np.int64)
+            return BatchDamageResult(base, critical, is_critical, elemental_matrix, trait_matrix, final)
+        
+        base, critical, is_critical, elemental_matrix, trait_matrix, final = [], [], [], [], [], []
+        for i in range(rows):
+            base_row, crit_row, flag_row, trait_row, final_row = [], [], [], [], []
+            for j in range(cols):
+                raw_attack = self._get_brv_raw_attack(attacks[i], defenses[j])
+                base_damage = int(raw_attack * skill_multiplier * levels[i] * self.BRV_BASE_MULTIPLIER)
+                crit = rolls[i][j] < critical_rates[i]
+                critical_damage = int(base_damage * critical_multipliers[i]) if crit else base_damage
+                trait = attacker_bonuses[i] * target_factors[j]
+                base_row.append(base_damage)
+                crit_row.append(critical_damage)
+                flag_row.append(crit)
+                trait_row.append(trait)
+                final_row.append(max(1, int(int(critical_damage * elementals[j]) * trait)))
+            base.append(base_row)
+            critical.append(crit_row)
+            is_critical.append(flag_row)
+            elemental_matrix.append(list(elementals))
+            trait_matrix.append(trait_row)
+            final.append(final_row)
+        return BatchDamageResult(base, critical, is_critical, elemental_matrix, trait_matrix, final)
+    
+    def _explain_brv_batch(self, result: BatchDamageResult, attack, defenses, skill_multiplier, level_bonus, critical_multiplier) -> list:
+        """배치 BRV 결과의 대상별 계산 과정 문자열 생성"""
+        explanations = []
+        for i, defense in enumerate(defenses):
+            base_damage = int(result.base_damage[i])
+            critical_damage = int(result.critical_damage[i])
+            steps = [f"기본 데미지: ({attack} ÷ {max(1, defense):.1f}) × {skill_multiplier} × {level_bonus:.2f} × {self.BRV_BASE_MULTIPLIER} = {base_damage}"]
+            if bool(result.is_critical[i]):
+                steps.append(f"크리티컬 히트! {base_damage} × {critical_multiplier:.2f} = {critical_damage}")
+            elemental_bonus = float(result.elemental_bonus[i])
+            if elemental_bonus != 1.0:
+                steps.append(f"속성 보정: {critical_damage} × {elemental_bonus:.2f} = {int(critical_damage * elemental_bonus)}")
+            trait_bonus = float(result.trait_bonus[i])
+            if trait_bonus != 1.0:
+                steps.append(f"특성 보정: × {trait_bonus:.2f} = {int(result.final_damage[i])}")
+            explanations.append(steps)
+        return explanations
+    
     # =====================================
     # 🔮 마법 데미지 계산
     # =====================================
@@ -581,6 +874,10 @@ class UnifiedDamageSystem:
     
     def _calculate_trait_bonus(self, skill: Dict[str, Any], attacker, target, damage_type: DamageType) -> float:
         """특성 보너스 계산"""
+        return self._get_attacker_trait_bonus(attacker) * self._get_target_trait_factor(target)
+    
+    def _get_attacker_trait_bonus(self, attacker) -> float:
+        """공격자 특성의 데미지 보너스 배율"""
         bonus = 1.0
         
         # 공격자의 특성 확인
@@ -610,6 +907,12 @@ class UnifiedDamageSystem:
                     # 특성 처리 중 오류가 발생해도 계속 진행
                     continue
         
+        return bonus
+    
+    def _get_target_trait_factor(self, target) -> float:
+        """대상 방어 특성의 데미지 감소 배율"""
+        factor = 1.0
+        
         # 대상의 방어 특성 확인
         if hasattr(target, 'active_traits'):
             for trait in target.active_traits:
@@ -617,27 +920,60 @@ class UnifiedDamageSystem:
                     # trait가 딕셔너리인 경우
                     if isinstance(trait, dict):
                         if trait.get('type') == 'damage_reduction':
-                            bonus *= (1.0 - trait.get('reduction', 0.0))
+                            factor *= (1.0 - trait.get('reduction', 0.0))
                         elif trait.get('effect_type') == 'damage_reduction':
                             effect_value = trait.get('effect_value', {})
                             if isinstance(effect_value, dict):
-                                bonus *= (1.0 - effect_value.get('reduction', 0.0))
+                                factor *= (1.0 - effect_value.get('reduction', 0.0))
                             elif isinstance(effect_value, (int, float)):
-                                bonus *= (1.0 - effect_value)
+                                factor *= (1.0 - effect_value)
                     # trait가 객체인 경우 (CharacterTrait)
                     elif hasattr(trait, 'effect_value'):
                         trait_type = getattr(trait, 'trait_type', getattr(trait, 'effect_type', ''))
                         if trait_type == 'damage_reduction':
                             effect_value = getattr(trait, 'effect_value', 0.0)
                             if isinstance(effect_value, dict):
-                                bonus *= (1.0 - effect_value.get('reduction', 0.0))
+                                factor *= (1.0 - effect_value.get('reduction', 0.0))
                             elif isinstance(effect_value, (int, float)):
-                                bonus *= (1.0 - effect_value)
+                                factor *= (1.0 - effect_value)
                 except Exception as e:
                     # 특성 처리 중 오류가 발생해도 계속 진행
                     continue
         
-        return bonus
+        return factor
+    
+    def _wait_for_skip_key(self):
+        """디버그 출력 후 1초 대기 (아무 키나 눌러서 스킵 가능) - 윈도우 콘솔에서만 대기"""
+        import sys
+        import time
+        import threading
+        
+        try:
+            import msvcrt
+        except ImportError:
+            return
+        
+        # 파이프/리다이렉트 입력이면 키를 받을 수 없으므로 대기하지 않음
+        try:
+            if not sys.stdin or not sys.stdin.isatty():
+                return
+        except (AttributeError, ValueError):
+            return
+        
+        def wait_for_key():
+            """키 입력을 대기하는 함수"""
+            msvcrt.getch()
+        
+        # 키 입력을 기다리는 스레드 시작
+        key_thread = threading.Thread(target=wait_for_key)
+        key_thread.daemon = True
+        key_thread.start()
+        
+        # 1초 대기하거나 키 입력까지 대기
+        for i in range(10):  # 1초 = 10 × 0.1초
+            if not key_thread.is_alive():
+                break
+            time.sleep(0.1)
     
     def _print_damage_calculation(self, calculation_type: str, result: DamageResult):
         """데미지 계산 과정 출력 - 간소화된 버전"""
@@ -694,6 +1030,16 @@ def calculate_healing(caster, target, skill: Dict[str, Any], base_power: Optiona
     """회복 계산 편의 함수"""
     return get_damage_system().calculate_healing(caster, target, skill, base_power)
 
+def calculate_brv_damage_batch(attacker, targets: list, skill: Dict[str, Any], base_power: Optional[float] = None,
+                               seed: Optional[int] = None, explain: bool = False) -> BatchDamageResult:
+    """광역 BRV 데미지 일괄 계산 편의 함수"""
+    return get_damage_system().calculate_brv_damage_batch(attacker, targets, skill, base_power, seed=seed, explain=explain)
+
+def calculate_hp_damage_batch(attacker, targets: list, skill: Dict[str, Any], brv_points: Optional[int] = None,
+                              hp_power: Optional[float] = None, explain: bool = False) -> BatchDamageResult:
+    """광역 HP 데미지 일괄 계산 편의 함수"""
+    return get_damage_system().calculate_hp_damage_batch(attacker, targets, skill, brv_points, hp_power, explain=explain)
+
 # =====================================
 # 🔧 설정 및 디버그 함수
 # =====================================
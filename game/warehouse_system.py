@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from game.json_store import schedule_json_save, flush_json_saves
 
 class WarehouseTab(Enum):
     """창고 탭 종류"""
@@ -316,32 +317,28 @@ class WarehouseSystem:
         input("엔터를 눌러 돌아가기...")
     
     def save_warehouse(self):
-        """창고 저장"""
-        try:
-            self.save_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # 데이터 직렬화
-            warehouse_data = {}
-            for tab, slots in self.warehouse_slots.items():
-                warehouse_data[tab.value] = []
-                for slot in slots:
-                    if slot.item_id:  # 빈 슬롯은 저장하지 않음
-                        warehouse_data[tab.value].append({
-                            'item_id': slot.item_id,
-                            'item_name': slot.item_name,
-                            'quantity': slot.quantity,
-                            'weight': slot.weight
-                        })
-            
-            with open(self.save_path, 'w', encoding='utf-8') as f:
-                json.dump(warehouse_data, f, ensure_ascii=False, indent=2)
-            
-        except Exception as e:
-            print(f"❌ 창고 저장 실패: {e}")
+        """창고 저장 예약 (직렬화는 실제 저장 시점에)"""
+        schedule_json_save(self.save_path, self._serialize_warehouse)
+    
+    def _serialize_warehouse(self) -> Dict:
+        """창고 데이터 직렬화"""
+        warehouse_data = {}
+        for tab, slots in self.warehouse_slots.items():
+            warehouse_data[tab.value] = []
+            for slot in slots:
+                if slot.item_id:  # 빈 슬롯은 저장하지 않음
+                    warehouse_data[tab.value].append({
+                        'item_id': slot.item_id,
+                        'item_name': slot.item_name,
+                        'quantity': slot.quantity,
+                        'weight': slot.weight
+                    })
+        return warehouse_data
     
     def load_warehouse(self):
         """창고 로드"""
         try:
+            flush_json_saves(self.save_path)
             if not self.save_path.exists():
                 return
             
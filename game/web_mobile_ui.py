@@ -23,6 +23,13 @@ except ImportError:
     FLASK_AVAILABLE = False
     print("⚠️ Flask가 설치되지 않았습니다: pip install flask flask-socketio")
 
+try:
+    from game.web_terminal import TerminalStreamer, strip_ansi
+    from game.io_bridge import GameSessionManager, install_io_router
+except ImportError:  # game 폴더에서 직접 실행한 경우
+    from web_terminal import TerminalStreamer, strip_ansi
+    from io_bridge import GameSessionManager, install_io_router
+
 # 레트로-모던 HTML 템플릿 (8-bit 감성 + 현대 기술)
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -210,6 +217,12 @@ HTML_TEMPLATE = """
             letter-spacing: 0.3px; /* 자간 줄임 */
         }
         
+        /* 가상 터미널 한 줄 (서버가 바뀐 줄만 교체) */
+        .term-line {
+            white-space: pre-wrap;
+            min-height: 1.1em;
+        }
+        
         /* 한글 텍스트 전용 스타일 */
         .korean-text {
             font-family: 'Galmuri 11', 'VT323', '맑은 고딕', monospace !important;
@@ -1069,7 +1082,8 @@ HTML_TEMPLATE = """
 
     <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.0.1/socket.io.js"></script>
     <script>
-        const socket = io();
+        // 색상 끄기: localStorage.setItem('dos_colors', '0')
+        const socket = io({auth: {colors: localStorage.getItem('dos_colors') === '0' ? 0 : 1}});
         const gameDisplay = document.getElementById('gameDisplay');
         const connectionStatus = document.getElementById('connectionStatus');
         let isConnected = false;
@@ -1121,6 +1135,55 @@ READY... `);
             updateGameText(data.text);
         });
         
+        // 가상 터미널 화면 - 서버가 바뀐 줄만 보냄 (seq가 어긋나면 전체 화면 재요청)
+        let terminalMode = false;
+        let screenSeq = 0;
+        let resyncPending = false;
+        
+        function renderTerminalLine(line) {
+            const row = document.createElement('div');
+            row.className = 'term-line';
+            if (typeof line === 'string') {
+                row.textContent = line.length ? line : ' ';
+            } else {
+                for (const [text, color, bold] of line) {
+                    const span = document.createElement('span');
+                    span.textContent = text;
+                    if (color) span.style.color = color;
+                    if (bold) span.style.fontWeight = 'bold';
+                    row.appendChild(span);
+                }
+            }
+            return row;
+        }
+        
+        socket.on('screen_diff', function(diff) {
+            if (!diff.full && (!terminalMode || diff.seq !== screenSeq + 1)) {
+                if (!resyncPending) {
+                    resyncPending = true;
+                    socket.emit('screen_resync');
+                }
+                return;
+            }
+            if (!terminalMode) {
+                gameDisplay.textContent = '';
+                terminalMode = true;
+            }
+            resyncPending = false;
+            screenSeq = diff.seq;
+            
+            while (gameDisplay.children.length > diff.rows) {
+                gameDisplay.removeChild(gameDisplay.lastChild);
+            }
+            while (gameDisplay.children.length < diff.rows) {
+                gameDisplay.appendChild(renderTerminalLine(''));
+            }
+            for (const [index, line] of diff.lines) {
+                gameDisplay.replaceChild(renderTerminalLine(line), gameDisplay.children[index]);
+            }
+            gameDisplay.scrollTop = gameDisplay.scrollHeight;
+        });
+        
         // 연결 해제
         socket.on('disconnect', function() {
             console.log('❌ 서버 연결 해제');
@@ -1210,7 +1273,8 @@ ERROR...`);
             // ANSI 컬러 코드 제거 (모바일 브라우저용)
             const cleanText = stripAnsiCodes(text);
             
-            // 화면 내용 완전 교체 (중첩 방지)
+            // 화면 내용 완전 교체 (중첩 방지) - 다음 서버 화면은 전체로 다시 받음
+            terminalMode = false;
             gameDisplay.textContent = cleanText;
             gameDisplay.scrollTop = gameDisplay.scrollHeight;
         }
@@ -1666,6 +1730,9 @@ class WebMobileUI:
         self.socketio = None
         self.game_adapter = None
         self.clients = set()
+        self.terminal = None  # 가상 터미널 (클라이언트별 화면 차분 전송)
+        self.sessions = GameSessionManager(max_sessions=8)  # 클라이언트별 실제 게임 세션
+        self.client_colors = {}
         self.file_watcher_thread = None
         self.last_modified = None
         
@@ -1701,6 +1768,10 @@ class WebMobileUI:
         self.app.config['SECRET_KEY'] = 'dawn_of_stellar_korean_mobile'
         self.socketio = SocketIO(self.app, cors_allowed_origins="*")
         
+        # 화면 갱신은 가상 터미널에 모았다가 최대 15fps로 바뀐 줄만 전송
+        self.terminal = TerminalStreamer(self._emit_to_client)
+        self.socketio.start_background_task(self.terminal.run, self.socketio.sleep)
+        
         @self.app.route('/')
         def index():
             # 강력한 캐시 방지
@@ -1846,9 +1917,12 @@ self.addEventListener('fetch', function(event) {
         def handle_connect(auth):
             print(f"✅ 클라이언트 연결: {request.sid}")
             self.clients.add(request.sid)
-            emit('game_text', {
-                'text': '🌟 던 오브 스텔라 웹 모바일 🌟\\n\\n한글이 완벽히 지원됩니다!\\n\\n레트로 게임 모드를 시작합니다...'
-            })
+            # 색상 전송 여부 (클라이언트에서 auth={'colors': 0}로 끌 수 있음)
+            colors = not (isinstance(auth, dict) and auth.get('colors') in (0, '0', False))
+            self.client_colors[request.sid] = colors
+            self.terminal.add_client(request.sid, colors=colors)
+            if not self.terminal.screen.rows:
+                self.terminal.update('🌟 던 오브 스텔라 웹 모바일 🌟\n\n한글이 완벽히 지원됩니다!\n\n레트로 게임 모드를 시작합니다...')
             
             # 게임 어댑터 초기화
             self.init_game_adapter()
@@ -1857,12 +1931,30 @@ self.addEventListener('fetch', function(event) {
         def handle_disconnect():
             print(f"❌ 클라이언트 연결 해제: {request.sid}")
             self.clients.discard(request.sid)
+            self.client_colors.pop(request.sid, None)
+            self.terminal.remove_client(request.sid)
+            self.sessions.stop_session(request.sid)
+        
+        @self.socketio.on('screen_resync')
+        def handle_screen_resync(data=None):
+            """클라이언트 화면이 어긋났을 때 (순서 누락/로컬 메시지로 덮어씀) 전체 화면 재전송"""
+            session = self.sessions.get(request.sid)
+            if session is not None and session.is_running:
+                session.streamer.request_resync(request.sid)
+            else:
+                self.terminal.request_resync(request.sid)
         
         @self.socketio.on('user_input')
         def handle_user_input(data):
             command = data.get('command', data.get('action', ''))  # action도 확인
             print(f"🎮 사용자 입력: {command}")
             
+            # 이 클라이언트의 게임 세션이 실행 중이면 입력 큐로 바로 전달
+            session = self.sessions.get(request.sid)
+            if session is not None and session.is_running:
+                session.send_input(command)
+                return
+            
             # 게임 메뉴 처리
             if command in ['1', 'enter']:
                 self.handle_new_game()
@@ -1899,7 +1991,8 @@ self.addEventListener('fetch', function(event) {
             
             # 실제 게임 시작 명령 처리 (웹에서 실행)
             if command == 'start_real_game':
-                self.start_web_real_game()
+                if not self.start_game_session(request.sid):
+                    self.start_web_real_game()
                 return
             
             if self.game_adapter:
@@ -1910,6 +2003,28 @@ self.addEventListener('fetch', function(event) {
         
         return True
     
+    def start_game_session(self, sid) -> bool:
+        """이 클라이언트 전용 헤드리스 게임 세션 시작 (입력 큐 + 가상 터미널)"""
+        def run_headless_game():
+            parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            if parent_dir not in sys.path:
+                sys.path.insert(0, parent_dir)
+            import main
+            # main.main()은 시그널 핸들러를 설치하므로 (메인 스레드 전용) 게임 루프만 실행
+            main.DawnOfStellarGame().main_loop()
+
+        session = self.sessions.start_session(
+            sid, run_headless_game, self._emit_to_client,
+            colors=self.client_colors.get(sid, True),
+            start_task=self.socketio.start_background_task, sleep=self.socketio.sleep)
+        if session is None:
+            self.broadcast_game_text("⚠️ 동시 게임 세션 수가 가득 찼습니다. 잠시 후 다시 시도하세요.")
+            return False
+        # 공용 화면 대신 세션 화면만 받도록
+        self.terminal.remove_client(sid)
+        print(f"🎮 게임 세션 시작: {sid}")
+        return True
+
     def start_actual_game(self):
         """실제 게임 시작 및 연결"""
         try:
@@ -2557,33 +2672,18 @@ E: 출구 (계단)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━""")
     
     def strip_ansi_codes(self, text):
-        """ANSI 컬러 코드와 제어 문자 제거 (서버용)"""
+        """ANSI 컬러 코드와 제어 문자 제거 (서버용, 미리 컴파일된 정규식 한 번)"""
         if not isinstance(text, str):
             return text
-        
-        import re
-        
-        # ANSI 이스케이프 시퀀스 제거
-        # 컬러 코드: \x1b[0-9;]*[A-Za-z]
-        # 커서 제어: \x1b[H, \x1b[2J 등
-        ansi_escape = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
-        text = ansi_escape.sub('', text)
-        
-        # 추가 ANSI 제어 문자들 제거
-        text = re.sub(r'\x1b\([AB]', '', text)  # 문자셋 제어
-        text = re.sub(r'\x1b\[[\d;]*[HfABCDG]', '', text)  # 커서 제어
-        text = re.sub(r'\x1b\[2J', '', text)  # 화면 지우기
-        text = re.sub(r'\x1b\[H', '', text)  # 커서 홈
-        text = re.sub(r'\x1b\[[\d;]*m', '', text)  # 컬러/스타일 제어
-        
-        return text
+        return strip_ansi(text)
     
     def broadcast_game_text(self, text):
-        """모든 클라이언트에게 게임 텍스트 전송 (ANSI 코드 제거)"""
-        if self.socketio and self.clients:
-            # 모바일 브라우저용으로 ANSI 코드 제거
-            clean_text = self.strip_ansi_codes(text)
-            self.socketio.emit('game_text', {'text': clean_text})
+        """게임 화면 갱신 - 가상 터미널이 ANSI를 해석하고 다음 프레임에 바뀐 줄만 클라이언트별로 전송"""
+        if self.terminal is not None and isinstance(text, str):
+            self.terminal.update(text)
+    
+    def _emit_to_client(self, event, payload, sid):
+        self.socketio.emit(event, payload, to=sid)
     
     def show_simple_menu(self):
         """간단한 메뉴 표시 (어댑터 없을 때)"""
@@ -3049,6 +3149,9 @@ GAMEPAD: A/B/X/Y BUTTONS
         except:
             print("브라우저 자동 열기 실패")
         
+        # 세션 스레드의 print()/input()을 각 세션 터미널로 보내는 라우터 (이 서버 프로세스에서만 설치)
+        install_io_router()
+        
         # 서버 실행
         try:
             self.socketio.run(
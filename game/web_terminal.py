@@ -0,0 +1,364 @@
+"""
+🖥️ 웹/모바일용 가상 터미널
+게임 화면 텍스트의 ANSI 코드를 한 번만 해석해 줄 단위 화면 상태로 유지하고,
+클라이언트별로 마지막에 보낸 화면과 비교해 바뀐 줄만 전송 (최대 프레임 속도로 병합)
+
+전송 형식 ('screen_diff' 이벤트):
+    {'seq': 12, 'full': False, 'rows': 24, 'lines': [[줄번호, 줄], ...]}
+    줄 = "문자열" (스타일 없음) 또는 [[텍스트, 색상(#rrggbb 또는 ''), 굵게(0/1)], ...]
+"""
+
+import re
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 모든 ANSI 이스케이프 시퀀스를 한 번에 찾는 정규식 (CSI / 문자셋 선택 / OSC)
+ANSI_ESCAPE_RE = re.compile(r'\x1b(?:\[([0-9;?]*)([A-Za-z@`])|[()][AB012]|\][^\x07\x1b]*(?:\x07|\x1b\\))')
+
+DEFAULT_MAX_FPS = 15
+# 바뀐 줄이 이 비율을 넘으면 전체 화면을 보냄 (줄 번호 오버헤드 절약)
+FULL_FRAME_RATIO = 0.6
+
+# xterm 기본 16색
+_BASIC_COLORS = (
+    '#000000', '#cd3131', '#0dbc79', '#e5e510', '#2472c8', '#bc3fbc', '#11a8cd', '#e5e5e5',
+    '#666666', '#f14c4c', '#23d18b', '#f5f543', '#3b8eea', '#d670d6', '#29b8db', '#ffffff',
+)
+
+
+def strip_ansi(text: str) -> str:
+    """ANSI 이스케이프 시퀀스 제거 (단일 패스)"""
+    return ANSI_ESCAPE_RE.sub('', text)
+
+
+def _xterm_256_color(index: int) -> str:
+    if index < 16:
+        return _BASIC_COLORS[index]
+    if index < 232:
+        index -= 16
+        levels = (0, 95, 135, 175, 215, 255)
+        return '#%02x%02x%02x' % (levels[index // 36], levels[(index // 6) % 6], levels[index % 6])
+    gray = 8 + (index - 232) * 10
+    return '#%02x%02x%02x' % (gray, gray, gray)
+
+
+# =====================================
+# 🧮 가상 화면
+# =====================================
+
+class VirtualScreen:
+    """ANSI 텍스트를 셀 단위 화면으로 해석
+
+    지원: 줄바꿈/캐리지 리턴, 화면 지우기(2J/3J), 커서 이동(H/f/A/B/C/D/G),
+    줄 지우기(K), SGR 전경색(16/256/트루컬러)과 굵게. 배경색과 글자 폭(한글 2칸)은 무시.
+    max_rows를 주면 화면 지우기 없이 계속 출력해도 오래된 줄부터 버림 (스크롤백 제한).
+    """
+
+    def __init__(self, max_rows: Optional[int] = None):
+        self.max_rows = max_rows
+        self.rows: List[List[Tuple[str, Tuple]]] = []   # 줄별 (문자, 스타일) 셀
+        self.row = 0
+        self.col = 0
+        self.style: Tuple = ('', 0)                     # (색상, 굵게)
+
+    def reset(self):
+        self.rows = []
+        self.row = 0
+        self.col = 0
+        self.style = ('', 0)
+
+    def set_text(self, text: str):
+        """화면 전체를 새 텍스트로 교체"""
+        self.reset()
+        self.feed(text)
+
+    def feed(self, text: str):
+        """현재 커서 위치부터 텍스트 출력"""
+        position = 0
+        for match in ANSI_ESCAPE_RE.finditer(text):
+            if match.start() > position:
+                self._write(text[position:match.start()])
+            if match.group(2):
+                self._control(match.group(1) or '', match.group(2))
+            position = match.end()
+        if position < len(text):
+            self._write(text[position:])
+
+    # -------------------------------------
+
+    def _line(self) -> list:
+        """커서가 있는 줄 (없으면 만들고, 스크롤백 한도를 넘으면 위쪽 줄 제거)"""
+        while len(self.rows) <= self.row:
+            self.rows.append([])
+        if self.max_rows and len(self.rows) > self.max_rows:
+            overflow = len(self.rows) - self.max_rows
+            del self.rows[:overflow]
+            self.row = max(0, self.row - overflow)
+        return self.rows[self.row]
+
+    def _write(self, chunk: str):
+        line = self._line()
+        style = self.style
+        for char in chunk:
+            if char == '\n':
+                self.row += 1
+                self.col = 0
+                line = self._line()
+            elif char == '\r':
+                self.col = 0
+            elif char == '\t':
+                spaces = 8 - (self.col % 8)
+                self._write(' ' * spaces)
+                line = self._line()
+            elif char < ' ':
+                continue
+            else:
+                if self.col < len(line):
+                    line[self.col] = (char, style)
+                else:
+                    if self.col > len(line):
+                        line.extend([(' ', ('', 0))] * (self.col - len(line)))
+                    line.append((char, style))
+                self.col += 1
+
+    def _control(self, params: str, command: str):
+        values = [int(p) if p.isdigit() else 0 for p in params.replace('?', '').split(';')] if params else []
+        first = values[0] if values else 0
+
+        if command == 'm':
+            self._select_graphic_rendition(values or [0])
+        elif command == 'J':
+            if first in (2, 3):
+                self.rows = []
+            elif first == 0:   # 커서부터 화면 끝까지
+                del self.rows[self.row + 1:]
+                self._erase_line(0)
+        elif command in ('H', 'f'):
+            self.row = max(0, (values[0] if values and values[0] else 1) - 1)
+            self.col = max(0, (values[1] if len(values) > 1 and values[1] else 1) - 1)
+        elif command == 'K':
+            self._erase_line(first)
+        elif command == 'A':
+            self.row = max(0, self.row - (first or 1))
+        elif command == 'B':
+            self.row += first or 1
+        elif command == 'C':
+            self.col += first or 1
+        elif command == 'D':
+            self.col = max(0, self.col - (first or 1))
+        elif command == 'G':
+            self.col = max(0, (first or 1) - 1)
+
+    def _erase_line(self, mode: int):
+        line = self._line()
+        if mode == 0:
+            del line[self.col:]
+        elif mode == 1:
+            for index in range(min(self.col + 1, len(line))):
+                line[index] = (' ', ('', 0))
+        elif mode == 2:
+            line.clear()
+
+    def _select_graphic_rendition(self, values: List[int]):
+        color, bold = self.style
+        index = 0
+        while index < len(values):
+            value = values[index]
+            if value == 0:
+                color, bold = '', 0
+            elif value == 1:
+                bold = 1
+            elif value == 22:
+                bold = 0
+            elif 30 <= value <= 37:
+                color = _BASIC_COLORS[value - 30]
+            elif 90 <= value <= 97:
+                color = _BASIC_COLORS[value - 90 + 8]
+            elif value == 39:
+                color = ''
+            elif value in (38, 48) and index + 1 < len(values):
+                # 확장 색상 - 배경(48)은 읽고 버림
+                if values[index + 1] == 5 and index + 2 < len(values):
+                    if value == 38:
+                        color = _xterm_256_color(values[index + 2] % 256)
+                    index += 2
+                elif values[index + 1] == 2 and index + 4 < len(values):
+                    if value == 38:
+                        color = '#%02x%02x%02x' % tuple(v % 256 for v in values[index + 2:index + 5])
+                    index += 4
+            index += 1
+        self.style = (color, bold)
+
+    # -------------------------------------
+
+    def render_lines(self, colors: bool = True) -> List:
+        """줄 목록 - 스타일 없는 줄은 문자열, 있으면 [텍스트, 색상, 굵게] 세그먼트 리스트"""
+        rendered = []
+        for line in self.rows:
+            text = ''.join(char for char, _ in line).rstrip()
+            if not colors or all(style == ('', 0) for _, style in line):
+                rendered.append(text)
+                continue
+            segments = []
+            current_style = None
+            buffer = []
+            for char, style in line[:len(text)]:
+                if style != current_style:
+                    if buffer:
+                        segments.append((''.join(buffer), current_style[0], current_style[1]))
+                    buffer = []
+                    current_style = style
+                buffer.append(char)
+            if buffer:
+                segments.append((''.join(buffer), current_style[0], current_style[1]))
+            rendered.append(tuple(segments))
+        while rendered and rendered[-1] == '':
+            rendered.pop()
+        return rendered
+
+
+# =====================================
+# 📡 클라이언트별 차분 전송
+# =====================================
+
+class _ClientScreen:
+    """클라이언트에 마지막으로 보낸 화면"""
+    __slots__ = ('colors', 'lines', 'seq', 'needs_full')
+
+    def __init__(self, colors: bool):
+        self.colors = colors
+        self.lines: List = []
+        self.seq = 0
+        self.needs_full = True
+
+
+def _encode_line(line):
+    return line if isinstance(line, str) else [list(segment) for segment in line]
+
+
+class TerminalStreamer:
+    """가상 화면 + 클라이언트별 줄 차분 + 프레임 병합
+
+    emit(event, payload, sid)로 전송. update()는 화면만 바꾸고 실제 전송은
+    flush()에서 최대 max_fps로 이루어지므로, 한 프레임 안의 여러 갱신은 마지막 화면 하나로 합쳐짐.
+    """
+
+    def __init__(self, emit: Callable[[str, dict, str], None], max_fps: int = DEFAULT_MAX_FPS,
+                 max_rows: Optional[int] = None):
+        self.emit = emit
+        self.max_fps = max_fps
+        self.screen = VirtualScreen(max_rows)
+        self.clients: Dict[str, _ClientScreen] = {}
+        self._dirty = False
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+        self._running = False
+        self.stats = {'frames': 0, 'coalesced': 0, 'full_frames': 0, 'diff_frames': 0, 'lines_sent': 0}
+
+    # -------------------------------------
+    # 화면 / 클라이언트
+    # -------------------------------------
+
+    def update(self, text: str):
+        """화면 전체 교체 (전송은 다음 프레임에)"""
+        with self._lock:
+            if self._dirty:
+                self.stats['coalesced'] += 1
+            self.screen.set_text(text)
+            self._dirty = True
+
+    def feed(self, text: str):
+        """현재 화면에 이어서 출력 (print 스트림용, 전송은 다음 프레임에)"""
+        with self._lock:
+            if self._dirty:
+                self.stats['coalesced'] += 1
+            self.screen.feed(text)
+            self._dirty = True
+
+    def add_client(self, sid: str, colors: bool = True):
+        with self._lock:
+            self.clients[sid] = _ClientScreen(colors)
+            self._dirty = True
+
+    def remove_client(self, sid: str):
+        with self._lock:
+            self.clients.pop(sid, None)
+
+    def request_resync(self, sid: str):
+        """클라이언트 화면이 어긋났을 때 다음 프레임에 전체 화면 전송"""
+        with self._lock:
+            client = self.clients.get(sid)
+            if client is not None:
+                client.needs_full = True
+                self._dirty = True
+
+    # -------------------------------------
+    # 전송
+    # -------------------------------------
+
+    def flush(self, force: bool = False) -> int:
+        """바뀐 내용을 클라이언트별로 전송 - 전송한 클라이언트 수 반환"""
+        now = time.monotonic()
+        with self._lock:
+            if not self._dirty:
+                return 0
+            if not force and now - self._last_flush < 1.0 / self.max_fps:
+                return 0
+            self._dirty = False
+            self._last_flush = now
+
+            rendered = {}
+            outgoing = []
+            for sid, client in self.clients.items():
+                lines = rendered.get(client.colors)
+                if lines is None:
+                    lines = rendered[client.colors] = self.screen.render_lines(client.colors)
+                payload = self._diff(client, lines)
+                if payload is not None:
+                    outgoing.append((sid, payload))
+            self.stats['frames'] += 1
+
+        for sid, payload in outgoing:
+            self.emit('screen_diff', payload, sid)
+        return len(outgoing)
+
+    def _diff(self, client: _ClientScreen, lines: List) -> Optional[dict]:
+        previous = client.lines
+        changed = [index for index, line in enumerate(lines)
+                   if index >= len(previous) or previous[index] != line]
+        if not client.needs_full and not changed and len(previous) == len(lines):
+            return None
+
+        client.seq += 1
+        full = client.needs_full or len(changed) > len(lines) * FULL_FRAME_RATIO
+        if full:
+            changed = range(len(lines))
+            self.stats['full_frames'] += 1
+        else:
+            self.stats['diff_frames'] += 1
+        self.stats['lines_sent'] += len(changed)
+
+        client.lines = lines
+        client.needs_full = False
+        return {
+            'seq': client.seq,
+            'full': full,
+            'rows': len(lines),
+            'lines': [[index, _encode_line(lines[index])] for index in changed],
+        }
+
+    def run(self, sleep: Callable[[float], None] = time.sleep):
+        """프레임 페이싱 루프 (socketio.start_background_task로 실행)"""
+        self._running = True
+        interval = 1.0 / self.max_fps
+        while self._running:
+            sleep(interval)
+            if self._dirty:
+                try:
+                    self.flush()
+                except Exception as e:
+                    print(f"⚠️ 화면 전송 오류: {e}")
+
+    def stop(self):
+        self._running = False
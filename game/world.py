@@ -2,11 +2,41 @@
 게임 월드 및 차원 공간 시스템
 """
 
+import copy
 import random
-from typing import List, Tuple, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict, Set
 from enum import Enum
 from game.items import ItemDatabase, Item, DropRateManager
 from game.color_text import *
+from game.hot_path_profiler import profiled
+
+
+# =====================================
+# ⏩ 다음 층 미리 생성
+# =====================================
+
+# 층 생성이 통째로 교체하는 필드들 (미리 생성한 층을 그대로 옮겨 담음)
+_FLOOR_STATE_FIELDS = (
+    'tiles', 'rooms', 'player_pos', 'enemies_positions', 'items_positions',
+    'floor_items', 'floor_enemies', 'special_tiles', 'locked_doors', 'secret_doors',
+    'traps', 'treasure_chests', 'interactive_objects', 'stairs_pos', '_path_cut_tiles',
+    'current_level_seed',
+)
+
+_floor_executor = None
+_floor_executor_lock = threading.Lock()
+
+
+def _get_floor_executor() -> ThreadPoolExecutor:
+    """층 미리 생성 워커 (스레드 1개, 처음 쓸 때 생성)"""
+    global _floor_executor
+    if _floor_executor is None:
+        with _floor_executor_lock:
+            if _floor_executor is None:
+                _floor_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="FloorPregen")
+    return _floor_executor
 
 
 class TileType(Enum):
@@ -203,6 +233,16 @@ class GameWorld:
         self.treasure_chests: List[Tuple[int, int]] = []      # 보물상자들
         self.interactive_objects: List[Tuple[int, int]] = []  # 상호작용 객체들 (레버, 제단 등)
         
+        # 층 연결성 분석 캐시 (함정/잠긴 문 길막 판정용)
+        self.stairs_pos = None                 # 내려가는 계단 위치 (한 번 찾으면 캐시)
+        self._path_cut_tiles = None            # 막히면 플레이어→계단 경로가 끊기는 타일들
+        
+        # 시야/맵 변경 추적 (맵 스캐너 등이 결과를 재사용하는 기준)
+        self.visible_cells: Set[Tuple[int, int]] = set()  # 현재 시야 안의 좌표
+        self._visible_grid = None              # visible_cells를 계산한 타일 격자 (바뀌면 전체 초기화)
+        self.visibility_version = 0            # 시야 갱신마다 증가
+        self.map_version = 0                   # 적/아이템 배치가 바뀔 때마다 증가
+        
         # 이동거리 추적 시스템
         self.total_movement_distance = 0  # 총 이동거리 (게임 전체)
         self.current_run_movement = 0     # 현재 런에서의 이동거리
@@ -219,6 +259,15 @@ class GameWorld:
         # 🎲 게임 세션 시드 (게임 시작 시 한 번만 생성, 일관된 랜덤 보장)
         self.game_session_seed = None
         
+        # 🎲 월드 생성 전용 난수 스트림 - 전역 random을 다시 시드하지 않으므로
+        #    전투 등 다른 코드와 동시에 층을 생성해도 서로의 난수열에 영향 없음
+        self.rng = random.Random()
+        
+        # ⏩ 탐험 중 다음 층을 워커에서 미리 생성 (층 이동 즉시 완료)
+        self.pregenerate_next_floor = True
+        self._pregenerated_floor = None   # (생성 조건 키, Future)
+        self._quiet_generation = False    # 미리 생성 중인 복사본은 콘솔 출력 생략
+        
         # 성과 기반 보상 시스템
         self.performance_metrics = {
             'floors_cleared': 0,           # 클리어한 층수
@@ -253,6 +302,31 @@ class GameWorld:
                 row.append(Tile(TileType.WALL, x, y))
             self.tiles.append(row)
             
+    def get_level_seed(self, level: int) -> int:
+        """level층의 시드 (상인 재고 등 층별 결정적 생성용)"""
+        return self._level_seed_for(level)
+    
+    def _level_seed_for(self, level: int) -> int:
+        """세션 시드 + 층수로 층별 시드 계산 (세션 시드가 없으면 먼저 생성)"""
+        import hashlib
+        
+        # 🎲 게임 세션 시드가 없으면 생성 (게임 시작 시 한 번만)
+        if self.game_session_seed is None:
+            # 파티 구성만으로 시드 생성 (시간 제외로 일관성 보장)
+            party_hash = ""
+            if hasattr(self, 'party_manager') and self.party_manager and self.party_manager.members:
+                party_names = [member.name for member in self.party_manager.members]
+                party_hash = "".join(party_names)
+            
+            # 파티 구성 + 고정 문자열로 세션 시드 생성 (time.time() 제거)
+            session_string = f"DawnOfStellar_{party_hash}_Session2025"
+            self.game_session_seed = int(hashlib.md5(session_string.encode()).hexdigest()[:8], 16)
+            print(f"🎲 게임 세션 시드 생성: {self.game_session_seed}")
+        
+        # 세션 시드 + 층수만으로 층별 시드 생성 (random.randint 제거)
+        seed_string = f"{self.game_session_seed}_{level}"
+        return int(hashlib.md5(seed_string.encode()).hexdigest()[:8], 16)
+    
     def generate_level(self, saved_seed=None):
         """레벨 생성 (차원 공간 생성) - 고정 씨드 사용"""
         # 층수 기반 고정 씨드 설정 (같은 층은 항상 같은 결과)
@@ -260,33 +334,39 @@ class GameWorld:
             level_seed = saved_seed
             print(f"레벨 {self.current_level} 차원 공간 복원 (저장된 씨드: {level_seed})")
         else:
-            # 더 다양한 시드 생성 (시간 기반 + 파티 기반)
-            import time
-            import hashlib
-            
-            # 파티 구성을 시드에 반영
-            # 🎲 게임 세션 시드가 없으면 생성 (게임 시작 시 한 번만)
-            if self.game_session_seed is None:
-                # 파티 구성만으로 시드 생성 (시간 제외로 일관성 보장)
-                party_hash = ""
-                if hasattr(self, 'party_manager') and self.party_manager and self.party_manager.members:
-                    party_names = [member.name for member in self.party_manager.members]
-                    party_hash = "".join(party_names)
-                
-                # 파티 구성 + 고정 문자열로 세션 시드 생성 (time.time() 제거)
-                session_string = f"DawnOfStellar_{party_hash}_Session2025"
-                self.game_session_seed = int(hashlib.md5(session_string.encode()).hexdigest()[:8], 16)
-                print(f"🎲 게임 세션 시드 생성: {self.game_session_seed}")
-            
-            # 세션 시드 + 층수만으로 층별 시드 생성 (random.randint 제거)
-            seed_string = f"{self.game_session_seed}_{self.current_level}"
-            level_seed = int(hashlib.md5(seed_string.encode()).hexdigest()[:8], 16)
+            level_seed = self._level_seed_for(self.current_level)
             print(f"레벨 {self.current_level} 차원 공간 생성 (일관된 씨드: {level_seed})")
         
+        # 탐험 중 미리 만들어 둔 층이 있으면 그대로 사용
+        floor_state = self._take_pregenerated_floor(level_seed)
+        if floor_state is not None:
+            for field, value in floor_state.items():
+                setattr(self, field, value)
+        else:
+            print(f"레벨 {self.current_level} 차원 공간을 생성 중...")
+            self._generate_floor(level_seed)
+        
+        # 성과 추적을 위한 통계 계산
+        self._calculate_floor_stats()
+        
+        # 시야 업데이트
+        self.update_visibility()
+        
+        print("차원 공간 생성 완료!")
+        
+        # 플레이어가 이 층을 탐험하는 동안 다음 층 준비
+        self.prefetch_level(self.current_level + 1)
+    
+    def _generate_floor(self, level_seed: int):
+        """층 배치 (방/복도, 적, 아이템, 특수 요소, 계단) - 같은 씨드면 항상 같은 결과
+        
+        모든 난수는 self.rng에서 뽑음 - 빈 맵에서 시작하므로 이전 층의 타일이 섞이지 않음
+        """
         # 현재 층의 씨드 저장
         self.current_level_seed = level_seed
-        random.seed(level_seed)
+        self.rng.seed(level_seed)
         
+        self.initialize_world()
         self.rooms = []
         self.enemies_positions = []
         self.items_positions = []
@@ -300,11 +380,11 @@ class GameWorld:
         self.traps = []
         self.treasure_chests = []
         self.interactive_objects = []
-        
-        print(f"레벨 {self.current_level} 차원 공간을 생성 중...")
+        self.stairs_pos = None
+        self._path_cut_tiles = None
         
         # 방 생성 시도
-        max_rooms = random.randint(6, 12)  # 방 개수 증가
+        max_rooms = self.rng.randint(6, 12)  # 방 개수 증가
         for _ in range(max_rooms):
             self.try_place_room()
             
@@ -325,23 +405,70 @@ class GameWorld:
         
         # 계단 배치 (다음 층으로 가는 계단)
         self.place_stairs()
+    
+    def _log_generation(self, message: str):
+        """층 생성 메시지 (워커에서 미리 생성 중이면 생략)"""
+        if not self._quiet_generation:
+            print(message)
+    
+    def _pregeneration_key(self, level: int, level_seed: int) -> tuple:
+        """미리 생성한 층을 그대로 써도 되는지 판단하는 생성 조건"""
+        from config import game_config
+        return (level, level_seed, self.width, self.height, self.current_floor,
+                game_config.get_difficulty_setting('enemy_spawn_rate'))
+    
+    def prefetch_level(self, level: int):
+        """level층을 워커 스레드에서 미리 생성 - 다음 generate_level이 결과를 그대로 사용"""
+        if not self.pregenerate_next_floor or self._quiet_generation:
+            return
+        try:
+            level_seed = self._level_seed_for(level)
+            key = self._pregeneration_key(level, level_seed)
+            if self._pregenerated_floor is not None and self._pregenerated_floor[0] == key:
+                return
+            
+            # 층 필드만 새로 만드는 복사본에서 생성 (현재 층 상태는 건드리지 않음)
+            builder = copy.copy(self)
+            builder.rng = random.Random()
+            builder.current_level = level
+            builder._quiet_generation = True
+            builder._pregenerated_floor = None
+            future = _get_floor_executor().submit(builder._build_floor_state, level_seed)
+            self._pregenerated_floor = (key, future)
+        except Exception as e:
+            print(f"⚠️ 다음 층 미리 생성 실패: {e}")
+            self._pregenerated_floor = None
+    
+    def _build_floor_state(self, level_seed: int) -> Dict:
+        """(워커) 층을 생성하고 교체할 필드만 돌려줌"""
+        self._generate_floor(level_seed)
+        return {field: getattr(self, field) for field in _FLOOR_STATE_FIELDS}
+    
+    def _take_pregenerated_floor(self, level_seed: int):
+        """현재 층/씨드 조건에 맞게 미리 생성된 층 (없거나 조건이 바뀌었으면 None)"""
+        pregenerated, self._pregenerated_floor = self._pregenerated_floor, None
+        if pregenerated is None:
+            return None
         
-        # 성과 추적을 위한 통계 계산
-        self._calculate_floor_stats()
-        
-        # 시야 업데이트
-        self.update_visibility()
-        
-        print("차원 공간 생성 완료!")
+        key, future = pregenerated
+        try:
+            if key != self._pregeneration_key(self.current_level, level_seed):
+                future.cancel()
+                return None
+            # 아직 생성 중이면 마저 기다림 (처음부터 다시 만드는 것보다 빠름)
+            return future.result()
+        except Exception as e:
+            print(f"⚠️ 미리 생성된 층 사용 실패: {e}")
+            return None
         
     def try_place_room(self):
         """방 배치 시도"""
         for _ in range(100):  # 최대 100번 시도
             # 랜덤 크기와 위치
-            width = random.randint(4, 12)
-            height = random.randint(4, 8)
-            x = random.randint(1, self.width - width - 1)
-            y = random.randint(1, self.height - height - 1)
+            width = self.rng.randint(4, 12)
+            height = self.rng.randint(4, 8)
+            x = self.rng.randint(1, self.width - width - 1)
+            y = self.rng.randint(1, self.height - height - 1)
             
             new_room = Room(x, y, width, height)
             
@@ -405,14 +532,14 @@ class GameWorld:
         
         safe_radius = 7  # 플레이어 스폰 지점 반지름 7블록 내 적 생성 금지
         
-        print(f"🎯 맵 크기 {self.width}x{self.height}에 적 {num_enemies}마리 배치 시도")
+        self._log_generation(f"🎯 맵 크기 {self.width}x{self.height}에 적 {num_enemies}마리 배치 시도")
         
         for _ in range(num_enemies):
             # 빈 바닥 타일에 적 배치
             attempts = 0
             while attempts < 50:
-                x = random.randint(1, self.width - 2)
-                y = random.randint(1, self.height - 2)
+                x = self.rng.randint(1, self.width - 2)
+                y = self.rng.randint(1, self.height - 2)
                 
                 # 플레이어 스폰 지점과의 거리 계산
                 distance_from_player = ((x - self.player_pos[0]) ** 2 + (y - self.player_pos[1]) ** 2) ** 0.5
@@ -462,7 +589,7 @@ class GameWorld:
             
             # 안전 반지름 때문에 적을 배치하지 못한 경우 알림
             if attempts >= 50:
-                print(f"⚠️ 적 배치 실패: 플레이어 안전 반지름({safe_radius}블록) 제약으로 인해 적절한 위치를 찾지 못했습니다.")
+                self._log_generation(f"⚠️ 적 배치 실패: 플레이어 안전 반지름({safe_radius}블록) 제약으로 인해 적절한 위치를 찾지 못했습니다.")
         
         # 적 배치 완료 후 총계 로깅 (완전체 시스템)
         final_enemy_count = len(self.enemies_positions)
@@ -476,11 +603,11 @@ class GameWorld:
         logger.log_world_event("적배치완료", f"목표: {num_enemies}마리, 실제: {final_enemy_count}마리", 
                               {"목표적수": num_enemies, "실제적수": final_enemy_count, "적위치목록": self.enemies_positions})
         
-        print(f"✅ 적 배치 완료: {final_enemy_count}/{num_enemies}마리")
+        self._log_generation(f"✅ 적 배치 완료: {final_enemy_count}/{num_enemies}마리")
         
         # 적이 배치되지 않은 경우 경고
         if final_enemy_count == 0:
-            print("⚠️ 경고: 적이 하나도 배치되지 않았습니다!")
+            self._log_generation("⚠️ 경고: 적이 하나도 배치되지 않았습니다!")
             logger.log_warning("적배치", "적이 하나도 배치되지 않음", 
                               {"이유": "플레이어 안전 반지름이 너무 클 수 있음", "안전반지름": safe_radius})
                 
@@ -490,20 +617,20 @@ class GameWorld:
         for room_idx, room in enumerate(self.rooms):
             # 방별 고정 시드 설정 (hash 대신 안정적인 계산)
             room_seed = (self.current_level_seed + room_idx * 100 + room.x + room.y) % (2**32)
-            random.seed(room_seed)
+            self.rng.seed(room_seed)
             
-            num_items = random.randint(1, 3)
+            num_items = self.rng.randint(1, 3)
             
             for item_idx in range(num_items):
                 # 아이템별 고정 시드 설정
                 item_seed = (room_seed + item_idx * 10) % (2**32)
-                random.seed(item_seed)
+                self.rng.seed(item_seed)
                 
                 attempts = 0
                 while attempts < 20:
                     # 방 내부의 랜덤 위치
-                    x = random.randint(room.x + 1, room.x + room.width - 2)
-                    y = random.randint(room.y + 1, room.y + room.height - 2)
+                    x = self.rng.randint(room.x + 1, room.x + room.width - 2)
+                    y = self.rng.randint(room.y + 1, room.y + room.height - 2)
                     
                     if (self.tiles[y][x].type == TileType.FLOOR and 
                         (x, y) != self.player_pos and
@@ -512,7 +639,7 @@ class GameWorld:
                         
                         # 현재 레벨에 맞는 랜덤 아이템 생성 (스테이지 기반)
                         from game.items import ItemDatabase
-                        item = ItemDatabase.get_random_item_by_stage(self.current_level)
+                        item = ItemDatabase.get_random_item_by_stage(self.current_level, self.rng)
                         if item:  # 아이템이 드롭되었을 때만 배치
                             self.items_positions.append((x, y))
                             self.floor_items[(x, y)] = item
@@ -524,18 +651,18 @@ class GameWorld:
         # 복도에 보너스 아이템 배치 (낮은 확률)
         safe_radius = 7  # 플레이어 스폰 지점 반지름 7블록 내 아이템 생성 금지
         bonus_seed = (self.current_level_seed + 5000) % (2**32)
-        random.seed(bonus_seed)
+        self.rng.seed(bonus_seed)
         
-        bonus_items = random.randint(1, 3)
+        bonus_items = self.rng.randint(1, 3)
         for bonus_idx in range(bonus_items):
             bonus_item_seed = (bonus_seed + bonus_idx * 50) % (2**32)
-            random.seed(bonus_item_seed)
+            self.rng.seed(bonus_item_seed)
             
-            if random.random() < 0.3:  # 30% 확률
+            if self.rng.random() < 0.3:  # 30% 확률
                 attempts = 0
                 while attempts < 30:
-                    x = random.randint(1, self.width - 2)
-                    y = random.randint(1, self.height - 2)
+                    x = self.rng.randint(1, self.width - 2)
+                    y = self.rng.randint(1, self.height - 2)
                     
                     # 플레이어 스폰 지점과의 거리 계산
                     distance_from_player = ((x - self.player_pos[0]) ** 2 + (y - self.player_pos[1]) ** 2) ** 0.5
@@ -548,10 +675,10 @@ class GameWorld:
                         
                         from game.items import ItemDatabase
                         # 보물상자는 더 좋은 아이템 (스테이지+2 수준)
-                        item = ItemDatabase.get_random_item_by_stage(self.current_level + 2)
+                        item = ItemDatabase.get_random_item_by_stage(self.current_level + 2, self.rng)
                         if not item:  # 혹시라도 아이템이 없으면 기본 아이템
                             all_items = ItemDatabase.get_all_items()
-                            item = random.choice(all_items) if all_items else None
+                            item = self.rng.choice(all_items) if all_items else None
                         
                         if item:
                             self.items_positions.append((x, y))
@@ -561,22 +688,27 @@ class GameWorld:
                         
                     attempts += 1
                 
-    def place_stairs(self):
-        """계단 배치 (다음 층으로 가는 계단)"""
+    def _planned_stairs_position(self):
+        """계단이 놓일 위치 (마지막 방의 모서리) - 계단 배치 전에도 길막 판정에 사용"""
         if len(self.rooms) < 2:
-            return
-            
-        # 마지막 방에 계단 배치
-        last_room = self.rooms[-1]
-        stair_x = last_room.center_x
-        stair_y = last_room.center_y
+            return None
         
-        # 계단 위치 조정 (중앙이 아닌 모서리로)
+        # 마지막 방에 계단 배치 (중앙이 아닌 모서리로)
+        last_room = self.rooms[-1]
         stair_x = last_room.x + last_room.width - 2
         stair_y = last_room.y + last_room.height - 2
         
         if self.is_valid_pos(stair_x, stair_y):
+            return (stair_x, stair_y)
+        return None
+    
+    def place_stairs(self):
+        """계단 배치 (다음 층으로 가는 계단)"""
+        stairs_pos = self._planned_stairs_position()
+        if stairs_pos:
+            stair_x, stair_y = stairs_pos
             self.tiles[stair_y][stair_x].type = TileType.STAIRS_DOWN
+            self.stairs_pos = stairs_pos
             # print(f"다음 층으로 가는 계단이 ({stair_x}, {stair_y})에 배치되었습니다.")  # 숨김
     
     def place_special_features(self):
@@ -586,14 +718,14 @@ class GameWorld:
         # 각 방에 특수 요소 배치 확률 (더 많이)
         for room_idx, room in enumerate(self.rooms[1:], 1):  # 첫 번째 방은 시작점이므로 제외
             feature_seed = (self.current_level_seed + 6000 + room_idx * 200) % (2**32)
-            random.seed(feature_seed)
+            self.rng.seed(feature_seed)
             
             # 70% 확률로 특수 요소 배치 (기존 30%에서 증가)
-            if random.random() < 0.7:
+            if self.rng.random() < 0.7:
                 self._place_room_feature(room, room_idx)
                 
             # 30% 확률로 추가 특수 요소 배치
-            if random.random() < 0.3:
+            if self.rng.random() < 0.3:
                 self._place_room_feature(room, room_idx)
         
         # 복도에 함정과 비밀 문 배치
@@ -638,12 +770,12 @@ class GameWorld:
         ]
         
         # 20% 확률로 부정적 요소, 80% 확률로 긍정적 요소
-        if random.random() < 0.2:
+        if self.rng.random() < 0.2:
             features = negative_features
         else:
             features = good_features
         
-        feature_type, feature_id, feature_name = random.choice(features)
+        feature_type, feature_id, feature_name = self.rng.choice(features)
         
         # 배치 가능한 위치 찾기
         safe_radius = 7  # 플레이어 스폰 지점 반지름 7블록 내 기믹 생성 금지
@@ -666,8 +798,8 @@ class GameWorld:
                         
                         # 특수 속성 설정
                         if feature_type == TileType.CHEST:
-                            self.tiles[y][x].is_locked = random.choice([True, False])
-                            self.tiles[y][x].treasure_quality = random.choice(["common", "rare", "epic"])
+                            self.tiles[y][x].is_locked = self.rng.choice([True, False])
+                            self.tiles[y][x].treasure_quality = self.rng.choice(["common", "rare", "epic"])
                             self.treasure_chests.append((x, y))
                         elif feature_type == TileType.LEVER:
                             self.tiles[y][x].required_skill = "기계조작"
@@ -703,20 +835,18 @@ class GameWorld:
         """복도에 함정과 비밀 문 배치"""
         corridor_positions = []
         
+        # 방 내부 타일 (가장자리 제외) - 타일마다 모든 방을 검사하지 않도록 미리 모음
+        room_interior = set()
+        for room in self.rooms:
+            for y in range(room.y + 1, room.y + room.height - 1):
+                for x in range(room.x + 1, room.x + room.width - 1):
+                    room_interior.add((x, y))
+        
         # 복도 타일들 찾기 (방이 아닌 바닥 타일들)
         for y in range(self.height):
             for x in range(self.width):
-                if self.tiles[y][x].type == TileType.FLOOR:
-                    # 방 안에 있지 않은 바닥 타일인지 확인
-                    in_room = False
-                    for room in self.rooms:
-                        if (room.x < x < room.x + room.width - 1 and 
-                            room.y < y < room.y + room.height - 1):
-                            in_room = True
-                            break
-                    
-                    if not in_room:
-                        corridor_positions.append((x, y))
+                if self.tiles[y][x].type == TileType.FLOOR and (x, y) not in room_interior:
+                    corridor_positions.append((x, y))
         
         # 함정 배치 (복도의 5%로 줄임 + 길막 방지 개선)
         safe_radius = 7  # 플레이어 스폰 지점 반지름 7블록 내 함정 생성 금지
@@ -738,7 +868,7 @@ class GameWorld:
                         valid_trap_positions.append((x, y))
                 
                 if valid_trap_positions:
-                    trap_positions = random.sample(valid_trap_positions, min(num_traps, len(valid_trap_positions)))
+                    trap_positions = self.rng.sample(valid_trap_positions, min(num_traps, len(valid_trap_positions)))
                     
                     for x, y in trap_positions:
                         self.tiles[y][x].type = TileType.TRAP
@@ -782,7 +912,7 @@ class GameWorld:
                     safe_wall_positions.append((x, y))
             
             if safe_wall_positions:
-                secret_positions = random.sample(safe_wall_positions, min(num_secret_doors, len(safe_wall_positions)))
+                secret_positions = self.rng.sample(safe_wall_positions, min(num_secret_doors, len(safe_wall_positions)))
                 
                 for x, y in secret_positions:
                     self.tiles[y][x].type = TileType.SECRET_DOOR
@@ -806,11 +936,14 @@ class GameWorld:
             # 스폰 지점과의 거리 계산
             distance_from_player = ((x - self.player_pos[0]) ** 2 + (y - self.player_pos[1]) ** 2) ** 0.5
             
-            if distance_from_player >= safe_radius and random.random() < 0.3:
+            # 플레이어→계단 경로의 유일한 통로인 문은 잠그지 않음 (난수 소비 순서는 그대로)
+            if (distance_from_player >= safe_radius and self.rng.random() < 0.3
+                    and not self._would_block_stairs_path(x, y)):
                 self.tiles[y][x].type = TileType.LOCKED_DOOR
                 self.tiles[y][x].is_locked = True
                 self.tiles[y][x].required_skill = "자물쇠해제"
                 self.locked_doors.append((x, y))
+                self._invalidate_floor_connectivity()
                 # print(f"   🔒 잠긴 문이 ({x}, {y})에 배치됨")  # 숨김
                 
     def can_move(self, dx: int, dy: int) -> bool:
@@ -1042,6 +1175,7 @@ class GameWorld:
                     self.items_positions.remove((new_x, new_y))
                     del self.floor_items[(new_x, new_y)]
                     self.tiles[new_y][new_x].has_item = False
+                    self.map_version += 1
                     
                     # 아이템 수집 추적
                     self.track_item_collection()
@@ -1151,6 +1285,7 @@ class GameWorld:
         for pos in enemy_positions:
             if pos in self.enemies_positions:
                 self.enemies_positions.remove(pos)
+                self.map_version += 1
                 x, y = pos
                 if self.is_valid_pos(x, y):
                     self.tiles[y][x].type = TileType.FLOOR
@@ -1170,8 +1305,9 @@ class GameWorld:
         """유효한 위치인지 확인"""
         return 0 <= x < self.width and 0 <= y < self.height
         
+    @profiled("field.update_visibility")
     def update_visibility(self):
-        """시야 업데이트 (파티 장비 기반 시야 시스템)"""
+        """시야 업데이트 (파티 장비 기반 시야 시스템) - 보이는 좌표는 visible_cells에 보관"""
         player_x, player_y = self.player_pos
         
         # 파티 매니저가 있으면 장비 효과를 고려한 시야 범위 사용
@@ -1180,23 +1316,45 @@ class GameWorld:
         else:
             sight_range = 3  # 기본 시야 범위
         
-        # 모든 타일을 보이지 않게 설정
-        for row in self.tiles:
-            for tile in row:
-                tile.visible = False
-                
-        # 플레이어 주변 시야 범위 내 타일들을 보이게 설정
+        if self._visible_grid is self.tiles:
+            # 직전 시야의 타일만 끄면 됨
+            for x, y in self.visible_cells:
+                self.tiles[y][x].visible = False
+        else:
+            # 새 격자(층 생성/불러오기) - 모든 타일을 보이지 않게 설정
+            for row in self.tiles:
+                for tile in row:
+                    tile.visible = False
+            self._visible_grid = self.tiles
+        
+        # 플레이어 주변 시야 범위 내 타일들을 보이게 설정 (원형 시야: dx² + dy² <= r²)
+        visible_cells = set()
+        range_sq = sight_range * sight_range
         for dy in range(-sight_range, sight_range + 1):
+            y = player_y + dy
+            if not 0 <= y < self.height:
+                continue
+            row = self.tiles[y]
             for dx in range(-sight_range, sight_range + 1):
-                x, y = player_x + dx, player_y + dy
-                
-                if self.is_valid_pos(x, y):
-                    # 거리 계산
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    
-                    if distance <= sight_range:
-                        self.tiles[y][x].visible = True
-                        self.tiles[y][x].explored = True
+                x = player_x + dx
+                if 0 <= x < self.width and dx * dx + dy * dy <= range_sq:
+                    tile = row[x]
+                    tile.visible = True
+                    tile.explored = True
+                    visible_cells.add((x, y))
+        
+        self.visible_cells = visible_cells
+        self.visibility_version += 1
+    
+    def invalidate_visibility(self):
+        """타일 visible 값을 외부에서 직접 바꾼 뒤 호출 - 다음 시야 갱신 때 전체 초기화"""
+        self._visible_grid = None
+        self.map_version += 1
+    
+    def get_scan_version(self) -> tuple:
+        """맵 스캔 결과 재사용 판단용 버전 (시야/배치 변경, 외부에서 목록을 직접 고친 경우 길이로 감지)"""
+        return (self.map_version, self.visibility_version,
+                len(self.enemies_positions), len(self.items_positions))
                         
     def get_map_display(self, display_width: int = 30, display_height: int = 14) -> List[str]:
         """화면에 표시할 맵 반환 (크기 증가, 시야 시스템 적용)"""
@@ -1452,6 +1610,7 @@ class GameWorld:
         """적 제거"""
         if pos in self.enemies_positions:
             self.enemies_positions.remove(pos)
+            self.map_version += 1
             # 적 정보도 함께 제거
             if pos in self.floor_enemies:
                 del self.floor_enemies[pos]
@@ -1463,15 +1622,16 @@ class GameWorld:
         x, y = pos
         if self.is_valid_pos(x, y) and self.tiles[y][x].is_walkable():
             self.enemies_positions.append(pos)
+            self.map_version += 1
             self.tiles[y][x].has_enemy = True
             
             # 🔥 통합 적 시스템으로 적 데이터 생성
             if enemy_data is None and self.integrated_enemy_manager:
                 try:
-                    enemy_data = self.integrated_enemy_manager.generate_integrated_enemy(self.current_floor)
-                    print(f"✅ 통합 적 생성: {enemy_data.get('display_name', '적')} (타입: {enemy_data.get('enemy_type', 'unknown')})")
+                    enemy_data = self.integrated_enemy_manager.generate_integrated_enemy(self.current_floor, rng=self.rng)
+                    self._log_generation(f"✅ 통합 적 생성: {enemy_data.get('display_name', '적')} (타입: {enemy_data.get('enemy_type', 'unknown')})")
                 except Exception as e:
-                    print(f"⚠️ 통합 적 생성 실패: {e}")
+                    self._log_generation(f"⚠️ 통합 적 생성 실패: {e}")
                     enemy_data = self._create_fallback_enemy()
             elif enemy_data is None:
                 enemy_data = self._create_fallback_enemy()
@@ -1484,7 +1644,7 @@ class GameWorld:
     def _create_fallback_enemy(self) -> Dict:
         """통합 시스템 실패 시 기본 적 생성"""
         simple_enemies = ["늑대", "거미", "스켈레톤", "곰", "좀비"]
-        name = random.choice(simple_enemies)
+        name = self.rng.choice(simple_enemies)
         
         # 기본 스탯 (층수 기반 스케일링)
         base_stats = {
@@ -1553,10 +1713,10 @@ class GameWorld:
         self.current_floor_steps = 0
         print(f"🚶 새 층 시작! 걸음수 리셋: {self.current_floor_steps}")
         
-        self.initialize_world()
         self.generate_level()
         print(f"레벨 {self.current_level}로 이동했습니다!")
         
+    @profiled("field.move_enemies")
     def move_enemies(self):
         """적들의 AI 이동 처리"""
         # 로깅 시스템 사용
@@ -1719,6 +1879,7 @@ class GameWorld:
         # print(f"🔍 [DEBUG] 이전 위치: {list(self.enemies_positions)}")
         
         self.enemies_positions = new_positions
+        self.map_version += 1
         # 즉시 화면 갱신으로 적 위치 동기화
         if moved_count > 0:
             self.update_display()
@@ -2766,6 +2927,11 @@ class GameWorld:
                 row.append(tile)
             self.tiles.append(row)
         
+        # 연결성 캐시는 복원된 타일 기준으로 다시 계산, 미리 생성한 층은 버림
+        self.stairs_pos = None
+        self._path_cut_tiles = None
+        self._pregenerated_floor = None
+        
         # 방 복원
         self.rooms = []
         for room_data in data['rooms']:
@@ -2910,6 +3076,102 @@ class GameWorld:
         
         return special_elements.get(element_type, None)
 
+    # =====================================
+    # 🧭 층 연결성 분석 (길막 판정)
+    # =====================================
+    
+    def _find_stairs_position(self):
+        """내려가는 계단 위치 (캐시 - 없으면 한 번만 맵을 훑고, 배치 전이면 예정 위치)"""
+        if self.stairs_pos is None:
+            for y in range(self.height):
+                for x in range(self.width):
+                    if self.tiles[y][x].type == TileType.STAIRS_DOWN:
+                        self.stairs_pos = (x, y)
+                        return self.stairs_pos
+            return self._planned_stairs_position()
+        return self.stairs_pos
+    
+    def _invalidate_floor_connectivity(self):
+        """이동 가능 여부가 바뀌는 배치 후 호출 - 다음 판정 때 다시 분석"""
+        self._path_cut_tiles = None
+    
+    def _analyze_floor_connectivity(self):
+        """이동 가능한 타일 그래프의 단절점(articulation point)으로 길막 타일 계산
+        
+        플레이어 위치를 루트로 DFS(Tarjan)를 한 번 돌리고, 계단에서 DFS 트리를 거슬러
+        올라가며 low[자식] >= disc[부모]인 조상을 모음 - 그 타일이 막히면 계단으로 갈 수 없음.
+        계단에 도달할 수 없으면 어떤 타일도 길을 "더" 막지 않으므로 빈 집합.
+        결과: None(분석 불가 - 안전하다고 가정) 또는 길막 타일 집합 (플레이어/계단 위치 포함)
+        """
+        stairs_pos = self._find_stairs_position()
+        start = self.player_pos
+        if not stairs_pos or not self.is_valid_pos(*start):
+            return None
+        
+        tiles = self.tiles
+        width, height = self.width, self.height
+        directions = ((0, 1), (0, -1), (1, 0), (-1, 0))
+        
+        def neighbors(pos):
+            x, y = pos
+            for dx, dy in directions:
+                nx, ny = x + dx, y + dy
+                # 함정도 이동 가능한 타일이므로 경로로 인정 (피해를 받고 지나갈 수 있음)
+                if 0 <= nx < width and 0 <= ny < height and (
+                        (nx, ny) == stairs_pos or tiles[ny][nx].is_walkable()):
+                    yield (nx, ny)
+        
+        # 반복형 Tarjan DFS (큰 맵에서도 재귀 한도 걱정 없음)
+        disc = {start: 0}
+        low = {start: 0}
+        parent = {start: None}
+        stack = [(start, neighbors(start))]
+        counter = 1
+        while stack:
+            node, children = stack[-1]
+            advanced = False
+            for child in children:
+                if child not in disc:
+                    disc[child] = low[child] = counter
+                    counter += 1
+                    parent[child] = node
+                    stack.append((child, neighbors(child)))
+                    advanced = True
+                    break
+                if child != parent[node] and disc[child] < low[node]:
+                    low[node] = disc[child]
+            if not advanced:
+                stack.pop()
+                up = parent[node]
+                if up is not None and low[node] < low[up]:
+                    low[up] = low[node]
+        
+        if stairs_pos not in disc:
+            return set()
+        
+        cut_tiles = {start, stairs_pos}
+        child = stairs_pos
+        node = parent[stairs_pos]
+        while node is not None and node != start:
+            if low[child] >= disc[node]:
+                cut_tiles.add(node)
+            child, node = node, parent[node]
+        return cut_tiles
+    
+    def _get_path_cut_tiles(self):
+        if self._path_cut_tiles is None:
+            self._path_cut_tiles = self._analyze_floor_connectivity()
+        return self._path_cut_tiles
+    
+    def _would_block_stairs_path(self, x: int, y: int) -> bool:
+        """(x, y)가 이동 불가로 바뀌면 플레이어→계단 경로가 끊기는지 (분석 후 O(1))"""
+        try:
+            cut_tiles = self._get_path_cut_tiles()
+        except Exception as e:
+            print(f"경로 분석 오류: {e}")
+            return False  # 오류 시 안전하다고 가정
+        return bool(cut_tiles) and (x, y) in cut_tiles
+    
     def _can_place_trap_safely(self, trap_x: int, trap_y: int) -> bool:
         """함정을 안전하게 배치할 수 있는지 확인 (길막 방지)"""
         try:
@@ -2917,73 +3179,23 @@ class GameWorld:
             if not self.tiles[trap_y][trap_x].is_walkable():
                 return False
             
-            # 2. 임시로 함정을 배치해보고 길이 막히는지 테스트
-            original_type = self.tiles[trap_y][trap_x].type
-            original_walkable = self.tiles[trap_y][trap_x].is_walkable
-            
-            # 임시로 함정 설정
-            self.tiles[trap_y][trap_x].type = TileType.TRAP
-            self.tiles[trap_y][trap_x].is_trapped = True
-            
-            # 3. 플레이어에서 계단까지의 경로가 여전히 존재하는지 확인
-            can_reach_stairs = self._can_reach_stairs_from_player()
-            
-            # 4. 원래 상태로 복구
-            self.tiles[trap_y][trap_x].type = original_type
-            self.tiles[trap_y][trap_x].is_trapped = False
-            
-            return can_reach_stairs
+            # 2. 함정 타일이 이동 불가라면 단절점인지로 길막 판정
+            #    (현재 함정은 밟고 지나갈 수 있으므로 길을 막지 않음)
+            trap_tile = Tile(TileType.TRAP, trap_x, trap_y)
+            if trap_tile.is_walkable():
+                return True
+            return not self._would_block_stairs_path(trap_x, trap_y)
             
         except Exception as e:
             print(f"함정 배치 안전성 검사 오류: {e}")
             return False
     
     def _can_reach_stairs_from_player(self) -> bool:
-        """플레이어 위치에서 계단까지 도달 가능한지 BFS로 확인"""
+        """플레이어 위치에서 계단까지 도달 가능한지 확인 (연결성 분석 결과 재사용)"""
         try:
-            # 계단 위치 찾기
-            stairs_pos = None
-            for y in range(self.height):
-                for x in range(self.width):
-                    if self.tiles[y][x].type == TileType.STAIRS_DOWN:
-                        stairs_pos = (x, y)
-                        break
-                if stairs_pos:
-                    break
-            
-            if not stairs_pos:
-                return True  # 계단이 없으면 일단 안전하다고 가정
-            
-            # BFS로 경로 탐색
-            from collections import deque
-            
-            queue = deque([self.player_pos])
-            visited = {self.player_pos}
-            directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-            
-            while queue:
-                x, y = queue.popleft()
-                
-                # 계단에 도달했으면 성공
-                if (x, y) == stairs_pos:
-                    return True
-                
-                # 인접한 칸들 탐색
-                for dx, dy in directions:
-                    nx, ny = x + dx, y + dy
-                    
-                    # 경계 체크
-                    if 0 <= nx < self.width and 0 <= ny < self.height:
-                        # 방문하지 않은 이동 가능한 칸
-                        if (nx, ny) not in visited and self.tiles[ny][nx].is_walkable():
-                            # 함정은 이동 가능하지만 스킬이 필요하므로 경로로 인정
-                            # (함정탐지 스킬 없어도 피해 받고 지나갈 수 있음)
-                            visited.add((nx, ny))
-                            queue.append((nx, ny))
-            
-            # 계단에 도달할 수 없음
-            return False
-            
+            cut_tiles = self._get_path_cut_tiles()
+            # None: 계단이 없거나 분석 불가 → 안전하다고 가정, 빈 집합: 도달 불가
+            return cut_tiles is None or bool(cut_tiles)
         except Exception as e:
             print(f"경로 탐색 오류: {e}")
             return True  # 오류 시 안전하다고 가정
@@ -17,6 +17,14 @@ from typing import List, Tuple
 import time
 import random
 
+# ⏳ 지연 로딩 / 시작 시간 측정 (표준 라이브러리만 사용하므로 가장 먼저 로드)
+from game.lazy_loader import (get_startup_profiler, lazy_import, lazy_function,
+                              ServiceLocator, LazyService)
+_startup_profiler = get_startup_profiler()
+if '--startup-report' in sys.argv or os.environ.get('DOS_STARTUP_REPORT') == '1':
+    _startup_profiler.install_import_hook()
+    atexit.register(lambda: print(_startup_profiler.report()))
+
 def safe_korean_input(prompt: str = "", encoding: str = "utf-8") -> str:
     """한국어 입력을 안전하게 처리하는 함수
     
@@ -95,6 +103,9 @@ except ImportError as e:
     print(f"⚠️ 자동 저장 시스템을 불러올 수 없습니다: {e}")
     AUTO_SAVE_AVAILABLE = False
 
+# 핫패스 프로파일러 (비활성화 시 비용 거의 없음)
+from game.hot_path_profiler import hot_path, get_hot_path_profiler, handle_profiler_key
+
 # 안전 종료 시스템 import
 try:
     from safe_exit_handler import SafeExitHandler
@@ -104,18 +115,14 @@ except ImportError as e:
     print(f"⚠️ 안전 종료 시스템을 불러올 수 없습니다: {e}")
     SAFE_EXIT_AVAILABLE = False
 
-# Windows용 curses 대안
-try:
-    import curses
-except ImportError:
-    # Windows에서 curses가 없을 경우 더미 모듈
-    class DummyCurses:
-        def initscr(self): pass
-        def endwin(self): pass
-        def cbreak(self): pass
-        def noecho(self): pass
-        def curs_set(self, visibility): pass
-    curses = DummyCurses()
+# Windows용 curses 대안 (첫 사용 시 로드)
+class DummyCurses:
+    def initscr(self): pass
+    def endwin(self): pass
+    def cbreak(self): pass
+    def noecho(self): pass
+    def curs_set(self, visibility): pass
+curses = lazy_import('curses', fallback=DummyCurses)
 
 # 게임 상태 정의
 class GameState(Enum):
@@ -182,12 +189,9 @@ except ImportError:
     def get_unified_audio_system():
         return None
     
-try:
-    from game.enemy_system import get_enemy_manager, EnemyManager
-except ImportError:
-    print("모듈 임포트 오류: get_enemy_manager 함수를 찾을 수 없습니다.")
-    def get_enemy_manager():
-        return None
+# 적 시스템은 첫 사용 시 로드
+get_enemy_manager = lazy_function('game.enemy_system', 'get_enemy_manager',
+                                  error_message="모듈 임포트 오류: get_enemy_manager 함수를 찾을 수 없습니다.")
 
 # 동적 적 스케일링 시스템
 try:
@@ -259,19 +263,11 @@ except ImportError:
     def show_tutorial_selection_menu():
         return None
     
-try:
-    from game.auto_party_builder import get_auto_party_builder, AutoPartyBuilder
-except ImportError:
-    print("모듈 임포트 오류: auto_party_builder 모듈을 찾을 수 없습니다.")
-    def get_auto_party_builder():
-        return None
-    
-try:
-    from game.field_skill_system import get_field_skill_system, FieldSkillSystem
-except ImportError:
-    print("모듈 임포트 오류: field_skill_system 모듈을 찾을 수 없습니다.")
-    def get_field_skill_system():
-        return None
+# 자동 파티 빌더 / 필드 스킬 시스템은 첫 사용 시 로드
+get_auto_party_builder = lazy_function('game.auto_party_builder', 'get_auto_party_builder',
+                                       error_message="모듈 임포트 오류: auto_party_builder 모듈을 찾을 수 없습니다.")
+get_field_skill_system = lazy_function('game.field_skill_system', 'get_field_skill_system',
+                                       error_message="모듈 임포트 오류: field_skill_system 모듈을 찾을 수 없습니다.")
     
 try:
     from game.passive_selection import show_passive_selection_ui
@@ -358,7 +354,24 @@ except Exception:
 class DawnOfStellarGame:
     """Dawn Of Stellar 메인 게임 클래스 - 완전 통합 시스템"""
     
+    # ⏳ 타이틀 메뉴에 필요 없는 서브시스템 - 첫 접근 시 또는 메뉴 표시 후 백그라운드에서 생성
+    merchant_manager = LazyService()
+    permanent_progression = LazyService()
+    character_db = LazyService()
+    skill_manager = LazyService()
+    enemy_manager = LazyService()
+    element_system = LazyService()
+    item_database = LazyService()
+    tutorial_manager = LazyService()
+    enhanced_encounter_manager = LazyService()
+    trait_processor = LazyService()
+    balance_system = LazyService()
+    
     def __init__(self):
+        # 지연 생성 서브시스템 등록소
+        self.services = ServiceLocator()
+        self._register_deferred_services()
+        
         # 화면 클리어 디바운싱 변수
         self._last_clear_time = 0
         
@@ -445,8 +458,6 @@ class DawnOfStellarGame:
         else:
             self.auto_save_manager = None
         
-        self.merchant_manager = MerchantManager()
-        self.permanent_progression = PermanentProgressionSystem()
         self.world = GameWorld(party_manager=self.party_manager)
         
         # 오디오 시스템을 월드에 연결
@@ -506,36 +517,9 @@ class DawnOfStellarGame:
             print(f"⚠️ 필드 스킬 매니저 초기화 실패: {e}")
             self.field_skill_manager = None
         
-        # 🔥 강화된 시스템들
-        try:
-            from game.enhanced_encounter_system import get_enhanced_encounter_manager
-            from game.trait_integration_system import get_trait_processor
-            from game.relative_balance_system import get_balance_system
-            
-            self.enhanced_encounter_manager = get_enhanced_encounter_manager()
-            self.trait_processor = get_trait_processor()
-            self.balance_system = get_balance_system()
-            # print("🔥 강화된 조우, 특성, 밸런스 시스템 활성화!")  # 숨김
-        except ImportError as e:
-            # print(f"⚠️ 강화 시스템 일부 로드 실패: {e}")  # 숨김
-            self.enhanced_encounter_manager = None
-            self.trait_processor = None
-            self.balance_system = None
-        
-        # 🚀 신규 통합 시스템들 - 안전한 초기화
-        try:
-            self.skill_manager = get_skill_manager() if callable(get_skill_manager) else None
-        except Exception as e:
-            print(f"⚠️ 스킬 매니저 초기화 실패: {e}")
-            self.skill_manager = None
+        # 🔥 강화된 조우/특성/밸런스, 스킬/적 매니저는 _register_deferred_services에서 지연 생성
         
         # 각종 매니저들 안전한 초기화
-        try:
-            self.enemy_manager = get_enemy_manager() if callable(get_enemy_manager) else None
-        except Exception as e:
-            print(f"⚠️ 적 매니저 초기화 실패: {e}")
-            self.enemy_manager = None
-            
         try:
             self.save_manager = get_save_manager() if callable(get_save_manager) else None
         except Exception as e:
@@ -554,12 +538,7 @@ class DawnOfStellarGame:
             print(f"⚠️ UI 매니저 초기화 실패: {e}")
             self.ui_manager = None
             
-        try:
-            self.tutorial_manager = get_tutorial_manager() if callable(get_tutorial_manager) else None
-        except Exception as e:
-            print(f"⚠️ 튜토리얼 매니저 초기화 실패: {e}")
-            self.tutorial_manager = None
-        
+
         # 🎯 동적 적 스케일링 시스템 초기화
         try:
             self.dynamic_scaler = get_dynamic_scaler() if callable(get_dynamic_scaler) else None
@@ -578,20 +557,7 @@ class DawnOfStellarGame:
         except ImportError:
             self.adaptive_balance = None
         
-        # 🔥 원소 및 상태 시스템 - 안전한 초기화
-        try:
-            self.element_system = get_element_system() if callable(get_element_system) else None
-        except Exception as e:
-            print(f"⚠️ 원소 시스템 초기화 실패: {e}")
-            self.element_system = None
-            
-        try:
-            self.item_database = get_item_database() if callable(get_item_database) else None
-        except Exception as e:
-            print(f"⚠️ 아이템 데이터베이스 초기화 실패: {e}")
-            self.item_database = None
         self.running = True
-        self.character_db = CharacterDatabase()
         
         # 클래식 게임모드 기본값 설정 (기본적으로 비활성화)
         self.ai_game_mode_enabled = False
@@ -631,6 +597,47 @@ class DawnOfStellarGame:
         
         self.encounter_rate_increase = 0.002  # 걸음당 0.2% 증가로 감소 (0.01 → 0.002)
     
+    def _register_deferred_services(self):
+        """타이틀 메뉴 이후에 필요한 서브시스템 팩토리 등록 (실패 시 None)"""
+        def optional(label, factory):
+            def create():
+                try:
+                    return factory()
+                except Exception as e:
+                    # 백그라운드 워밍업 스레드에서도 불리므로 화면(타이틀 메뉴) 대신 로그 파일에 기록
+                    log_error("지연초기화", f"{label} 초기화 실패", e)
+                    return None
+            return create
+        
+        services = self.services
+        services.register('merchant_manager', MerchantManager)
+        services.register('permanent_progression', PermanentProgressionSystem)
+        services.register('character_db', CharacterDatabase)
+        services.register('skill_manager', optional("스킬 매니저", get_skill_manager))
+        services.register('enemy_manager', optional("적 매니저", get_enemy_manager))
+        services.register('element_system', optional("원소 시스템", get_element_system))
+        services.register('item_database', optional("아이템 데이터베이스", get_item_database))
+        services.register('tutorial_manager', optional("튜토리얼 매니저", get_tutorial_manager))
+        # 강화 시스템은 로드 실패 시 조용히 None
+        services.register('enhanced_encounter_manager',
+                          lazy_function('game.enhanced_encounter_system', 'get_enhanced_encounter_manager'))
+        services.register('trait_processor', lazy_function('game.trait_integration_system', 'get_trait_processor'))
+        services.register('balance_system', lazy_function('game.relative_balance_system', 'get_balance_system'))
+    
+    def start_background_warm_up(self):
+        """타이틀 메뉴 표시 후 지연 서브시스템을 백그라운드에서 미리 생성"""
+        if not getattr(self, '_title_shown', False):
+            self._title_shown = True
+            _startup_profiler.mark("타이틀 메뉴 표시")
+        self.services.warm_up_in_background(delay=0.3)
+        
+        # FFVII 효과음 디코딩도 함께 워밍업
+        sound_system = getattr(getattr(self, 'game_manager', None), 'sound_system', None)
+        sfx_sounds = getattr(sound_system, 'sfx_sounds', None)
+        if hasattr(sfx_sounds, 'warm'):
+            import threading
+            threading.Thread(target=sfx_sounds.warm, name="SFXWarmUp", daemon=True).start()
+    
     def __del__(self):
         """소멸자 - 오디오 시스템 보존 (정리하지 않음)"""
         try:
@@ -980,6 +987,8 @@ class DawnOfStellarGame:
                         tile.visible = tile_info.get('visible', False)
                         restored_count += 1
             
+            if hasattr(world, 'invalidate_visibility'):
+                world.invalidate_visibility()  # 직접 바꾼 visible 값은 다음 시야 갱신 때 전체 초기화
             print(f"🗺️ 탐험된 타일 복원: {restored_count}개")
         except Exception as e:
             print(f"⚠️ 탐험 타일 복원 오류: {e}")
@@ -1270,6 +1279,7 @@ class DawnOfStellarGame:
         self.second_chance_uses = 0
         
         self.world.generate_level()
+        self.prepare_floor_merchants()
         
         # 골드 시스템 동기화 (시작 골드 50G 지급)
         initial_gold = 50
@@ -3600,10 +3610,25 @@ class DawnOfStellarGame:
             print(f"패시브 선택 시스템을 불러올 수 없습니다: {e}")
             self.party_passive_effects = []
     
+    def get_passive_engine(self):
+        """선택한 파티 패시브를 트리거별로 컴파일한 엔진 (패시브 목록/상태가 바뀌면 다시 컴파일)"""
+        from game.passive_engine import PassiveEngine
+        if not hasattr(self, 'passive_states'):
+            self.passive_states = {}
+        passives = getattr(self, 'party_passive_effects', None)
+        engine = getattr(self, '_passive_engine', None)
+        if engine is None or not engine.matches(passives, self.passive_states):
+            engine = self._passive_engine = PassiveEngine(passives, self.passive_states)
+        return engine
+    
     def apply_passive_effects_to_party(self):
         """선택된 패시브 효과를 파티에 적용"""
         if not hasattr(self, 'party_passive_effects'):
             return
+        
+        # 선택/불러오기 직후 한 번 컴파일
+        self._passive_engine = None
+        self.get_passive_engine()
             
         for passive in self.party_passive_effects:
             effect_type = passive['effect_type']
@@ -3660,388 +3685,45 @@ class DawnOfStellarGame:
                 print(f"🌿 자연의 축복: 독/화상 면역 효과 적용")
     
     def process_passive_effects_field_turn(self):
-        """필드에서 걸음 수에 따른 패시브 효과 처리"""
-        if not hasattr(self, 'party_passive_effects') or not hasattr(self, 'step_count'):
-            return
-            
-        # 20걸음마다 발동하는 효과들
-        if self.step_count % 20 == 0 and self.step_count > 0:
-            for passive in self.party_passive_effects:
-                effect_type = passive['effect_type']
-                effect_value = passive['effect_value']
-                
-                # HP 회복 효과들
-                hp_regen = effect_value.get("hp_regen_per_turn", 0)
-                mp_regen = effect_value.get("mp_regen_per_turn", 0)
-                wound_heal = effect_value.get("wound_heal_per_turn", 0)
-                
-                if hp_regen > 0 or mp_regen > 0 or wound_heal > 0:
-                    for member in self.party_manager.members:
-                        if member.current_hp > 0:  # 살아있는 멤버만
-                            # HP 회복
-                            if hp_regen > 0:
-                                heal_amount = int(member.max_hp * hp_regen)
-                                member.heal(heal_amount)
-                                
-                            # MP 회복
-                            if mp_regen > 0:
-                                mp_amount = int(member.max_mp * mp_regen)
-                                member.current_mp = min(member.max_mp, member.current_mp + mp_amount)
-                                
-                            # 상처 치료
-                            if wound_heal > 0 and hasattr(member, 'wounds'):
-                                wound_heal_amount = int(member.max_hp * wound_heal)
-                                member.wounds = max(0, member.wounds - wound_heal_amount)
-                    
-                    passive_name = passive['name']
-                    print(f"💚 {passive_name}: 파티 전체가 치유되었습니다!")
-        
-        # 100걸음마다 발동하는 효과들
-        if self.step_count % 100 == 0 and self.step_count > 0:
-            for passive in self.party_passive_effects:
-                effect_type = passive['effect_type']
-                effect_value = passive['effect_value']
-                
-                if effect_type == "step_power":
-                    # 걸음마다 힘 - 공격력 증가 스택
-                    damage_bonus = effect_value.get("damage_per_100steps", 0.15)
-                    max_stacks = effect_value.get("max_stacks", 5)
-                    
-                    current_stacks = self.passive_states[effect_type].get('stacks', 0)
-                    if current_stacks < max_stacks:
-                        self.passive_states[effect_type]['stacks'] = current_stacks + 1
-                        print(f"⚡ 걸음마다 힘: 다음 공격 데미지 +{damage_bonus*100:.0f}% (스택: {current_stacks + 1}/{max_stacks})")
+        """필드 턴(20걸음)마다 패시브 효과 처리"""
+        from game.passive_engine import FIELD_TURN
+        self.get_passive_engine().fire(FIELD_TURN, self)
     
     def process_passive_effects_combat_start(self):
         """전투 시작 시 패시브 효과 처리"""
-        if not hasattr(self, 'party_passive_effects'):
-            return
-            
-        for passive in self.party_passive_effects:
-            effect_type = passive['effect_type']
-            effect_value = passive['effect_value']
-            
-            # 전투 시작 시 회복 효과
-            if effect_type == "combat_healing_art":
-                battle_start_heal = effect_value.get("battle_start_heal", 0)
-                if battle_start_heal > 0:
-                    for member in self.party_manager.members:
-                        if member.current_hp > 0:
-                            heal_amount = int(member.max_hp * battle_start_heal)
-                            member.heal(heal_amount)
-                    print(f"⚔️ 전투 치유술: 전투 시작 시 파티 전체 HP 회복!")
-            
-            # 첫 턴 속도 증가
-            elif effect_type == "dawn_focus":
-                first_turn_speed = effect_value.get("first_turn_speed", 1.0)
-                for member in self.party_manager.members:
-                    if hasattr(member, 'speed'):
-                        member.speed *= (1 + first_turn_speed)
-                print(f"🌅 새벽의 집중: 첫 턴 행동속도 +{first_turn_speed*100:.0f}%!")
-            
-            # 전투별 사용 횟수 초기화
-            if 'uses_per_battle' in effect_value:
-                self.passive_states[effect_type]['uses_per_battle'] = 0
+        from game.passive_engine import COMBAT_START
+        self.get_passive_engine().fire(COMBAT_START, self)
     
     def process_passive_effects_combat_end(self):
         """전투 종료 시 패시브 효과 처리"""
-        if not hasattr(self, 'party_passive_effects'):
-            return
-            
-        for passive in self.party_passive_effects:
-            effect_type = passive['effect_type']
-            effect_value = passive['effect_value']
-            
-            # 불멸의 재생력 - 전투 후 HP/MP 자동 회복
-            if effect_type == "immortal_regeneration":
-                threshold = effect_value.get("post_battle_threshold", 0.30)
-                restore_to = effect_value.get("restore_to", 0.30)
-                
-                for member in self.party_manager.members:
-                    if member.current_hp > 0:  # 살아있는 멤버만
-                        # HP 체크 및 회복
-                        hp_ratio = member.current_hp / member.max_hp
-                        if hp_ratio <= threshold:
-                            restore_hp = int(member.max_hp * restore_to)
-                            member.current_hp = restore_hp
-                            print(f"💫 불멸의 재생력: {member.name}의 HP가 {restore_to*100:.0f}%로 회복!")
-                        
-                        # MP 체크 및 회복
-                        mp_ratio = member.current_mp / member.max_mp
-                        if mp_ratio <= threshold:
-                            restore_mp = int(member.max_mp * restore_to)
-                            member.current_mp = restore_mp
-                            print(f"💫 불멸의 재생력: {member.name}의 MP가 {restore_to*100:.0f}%로 회복!")
-            
-            # 속도 효과 리셋 (새벽의 집중)
-            elif effect_type == "dawn_focus":
-                first_turn_speed = effect_value.get("first_turn_speed", 1.0)
-                for member in self.party_manager.members:
-                    if hasattr(member, 'speed'):
-                        member.speed /= (1 + first_turn_speed)
+        from game.passive_engine import COMBAT_END
+        self.get_passive_engine().fire(COMBAT_END, self)
                         
     def check_passive_damage_taken(self, member, damage_amount):
-        """피해를 받을 때 패시브 효과 체크"""
-        if not hasattr(self, 'party_passive_effects'):
+        """피해를 받을 때 패시브 효과 체크 - 수정된 피해량 반환"""
+        from game.passive_engine import ON_DAMAGE
+        engine = self.get_passive_engine()
+        if not engine.subscribes(ON_DAMAGE):
             return damage_amount
-            
-        modified_damage = damage_amount
-        
-        for passive in self.party_passive_effects:
-            effect_type = passive['effect_type']
-            effect_value = passive['effect_value']
-            
-            # 생존 본능 - 응급 회복 + 피해 감소
-            if effect_type == "survival_instinct":
-                hp_threshold = effect_value.get("hp_threshold", 0.15)
-                current_hp_ratio = member.current_hp / member.max_hp
-                
-                # HP가 임계점 이하이고, 아직 이번 층에서 사용하지 않았을 때
-                if (current_hp_ratio <= hp_threshold and 
-                    self.passive_states[effect_type].get('uses_per_floor', 0) == 0):
-                    
-                    # 응급 회복
-                    emergency_heal = effect_value.get("emergency_heal", 0.15)
-                    heal_amount = int(member.max_hp * emergency_heal)
-                    member.heal(heal_amount)
-                    
-                    # 피해 감소 버프 적용 (다음 몇 턴간)
-                    damage_reduction = effect_value.get("damage_reduction", 0.20)
-                    duration = effect_value.get("duration", 1)
-                    
-                    modified_damage = int(modified_damage * (1 - damage_reduction))
-                    
-                    # 사용 횟수 증가
-                    self.passive_states[effect_type]['uses_per_floor'] = 1
-                    
-                    print(f"🛡️ 생존 본능 발동! {member.name}이 응급 회복하고 피해 감소!")
-        
-        return modified_damage
-    
-    def process_field_turn(self):
-        """20걸음마다 호출되는 필드 턴 처리 - 패시브 효과 적용"""
-        # 새로운 패시브 효과 시스템 사용
-        self.process_passive_effects_field_turn()
-        
-        # 기존 패시브 효과들 (하위 호환성을 위해 유지)
-        if not hasattr(self, 'party_passive_effects'):
-            return
-            
-        # 패시브 상태 초기화
-        if not hasattr(self, 'passive_states'):
-            self.passive_states = {}
-        
-        for passive in self.party_passive_effects:
-            effect_type = passive['effect_type']
-            effect_value = passive['effect_value']
-            
-            # 생명의 씨앗: 20걸음당 HP 2% 회복, 상처 1% 치료
-            if effect_type == "life_seed":
-                hp_regen = effect_value.get("hp_regen_per_turn", 0.02)
-                wound_heal = effect_value.get("wound_heal_per_turn", 0.01)
-                for member in self.party_manager.members:
-                    if member.is_alive:
-                        # HP 회복
-                        heal_amount = int(member.max_hp * hp_regen)
-                        if heal_amount > 0:
-                            member.heal(heal_amount)
-                        # 상처 치료 (구현되어 있다면)
-                        if hasattr(member, 'wounds') and member.wounds > 0:
-                            wound_heal_amount = int(member.max_hp * wound_heal)
-                            member.wounds = max(0, member.wounds - wound_heal_amount)
-                
-            # 생명력 순환: HP 4% 회복
-            elif effect_type == "life_circulation":
-                hp_regen = effect_value.get("hp_regen_per_turn", 0.04)
-                for member in self.party_manager.members:
-                    if member.is_alive:
-                        heal_amount = int(member.max_hp * hp_regen)
-                        if heal_amount > 0:
-                            member.heal(heal_amount)
-            
-            # 자연의 축복: HP 6% 회복, MP 4% 회복
-            elif effect_type == "nature_blessing":
-                hp_regen = effect_value.get("hp_regen_per_turn", 0.06)
-                mp_regen = effect_value.get("mp_regen_per_turn", 0.04)
-                for member in self.party_manager.members:
-                    if member.is_alive:
-                        # HP 회복
-                        heal_amount = int(member.max_hp * hp_regen)
-                        if heal_amount > 0:
-                            member.heal(heal_amount)
-                        # MP 회복
-                        mp_amount = int(member.max_mp * mp_regen)
-                        if mp_amount > 0:
-                            member.mp = min(member.max_mp, member.mp + mp_amount)
-            
-            # 영혼의 치유사: HP 8% 회복, 상처 4% 치료
-            elif effect_type == "soul_healer":
-                hp_regen = effect_value.get("hp_regen_per_turn", 0.08)
-                wound_heal = effect_value.get("wound_heal_per_turn", 0.04)
-                for member in self.party_manager.members:
-                    if member.is_alive:
-                        heal_amount = int(member.max_hp * hp_regen)
-                        if heal_amount > 0:
-                            member.heal(heal_amount)
-                        if hasattr(member, 'wounds') and member.wounds > 0:
-                            wound_heal_amount = int(member.max_hp * wound_heal)
-                            member.wounds = max(0, member.wounds - wound_heal_amount)
-            
-            # 전투 치유술: HP 8% 회복, 상처 3% 치료
-            elif effect_type == "combat_healing_art":
-                hp_regen = effect_value.get("hp_regen_per_turn", 0.08)
-                wound_heal = effect_value.get("wound_heal_per_turn", 0.03)
-                for member in self.party_manager.members:
-                    if member.is_alive:
-                        heal_amount = int(member.max_hp * hp_regen)
-                        if heal_amount > 0:
-                            member.heal(heal_amount)
-                        if hasattr(member, 'wounds') and member.wounds > 0:
-                            wound_heal_amount = int(member.max_hp * wound_heal)
-                            member.wounds = max(0, member.wounds - wound_heal_amount)
-            
-            # 불멸의 재생력: HP 30% 이하일 때만 HP 15% 회복
-            elif effect_type == "immortal_regeneration":
-                hp_threshold = effect_value.get("hp_threshold", 0.30)
-                hp_regen = effect_value.get("hp_regen_per_turn", 0.15)
-                wound_heal = effect_value.get("wound_heal_per_turn", 0.08)
-                uses_per_floor = effect_value.get("uses_per_floor", 3)
-                
-                # 사용 횟수 체크
-                if effect_type not in self.passive_states:
-                    self.passive_states[effect_type] = {"uses_this_floor": 0}
-                
-                if self.passive_states[effect_type]["uses_this_floor"] < uses_per_floor:
-                    for member in self.party_manager.members:
-                        if member.is_alive and member.current_hp <= (member.max_hp * hp_threshold):
-                            heal_amount = int(member.max_hp * hp_regen)
-                            if heal_amount > 0:
-                                member.heal(heal_amount)
-                                self.passive_states[effect_type]["uses_this_floor"] += 1
-                                self.add_game_message(f"💚 {member.name}의 불멸의 재생력 발동!")
-                                if hasattr(member, 'wounds') and member.wounds > 0:
-                                    wound_heal_amount = int(member.max_hp * wound_heal)
-                                    member.wounds = max(0, member.wounds - wound_heal_amount)
-                                break  # 한 번에 한 명만
-            
-            # 걸음마다 힘: 100걸음마다 공격력 증가
-            elif effect_type == "step_power":
-                if not hasattr(self, 'step_count'):
-                    self.step_count = 0
-                if self.step_count % 100 == 0 and self.step_count > 0:
-                    damage_boost = effect_value.get("damage_per_100steps", 0.15)
-                    max_stacks = effect_value.get("max_stacks", 5)
-                    
-                    if effect_type not in self.passive_states:
-                        self.passive_states[effect_type] = {"stacks": 0}
-                    
-                    if self.passive_states[effect_type]["stacks"] < max_stacks:
-                        self.passive_states[effect_type]["stacks"] += 1
-                        self.add_game_message(f"💪 걸음마다 힘 발동! 다음 공격 데미지 +{int(damage_boost*100)}% (스택: {self.passive_states[effect_type]['stacks']})")
+        return engine.fire(ON_DAMAGE, self, member=member, damage=damage_amount)['damage']
     
     def apply_post_battle_passive_effects(self):
         """전투 후 패시브 효과 적용"""
-        if not hasattr(self, 'party_passive_effects'):
-            return
-            
-        for passive in self.party_passive_effects:
-            effect_type = passive['effect_type']
-            effect_value = passive['effect_value']
-            
-            # 불멸의 재생력: 전투 후 HP/MP가 30% 이하면 30%로 회복
-            if effect_type == "immortal_regeneration":
-                threshold = effect_value.get("post_battle_threshold", 0.30)
-                restore_to = effect_value.get("restore_to", 0.30)
-                
-                for member in self.party_manager.members:
-                    if member.is_alive:
-                        # HP 체크 및 회복
-                        if member.current_hp < (member.max_hp * threshold):
-                            new_hp = int(member.max_hp * restore_to)
-                            member.current_hp = new_hp
-                            self.add_game_message(f"💚 {member.name}의 불멸의 재생력으로 HP가 {int(restore_to*100)}%로 회복되었습니다!")
-                        
-                        # MP 체크 및 회복
-                        if member.current_mp < (member.max_mp * threshold):
-                            new_mp = int(member.max_mp * restore_to)
-                            member.current_mp = new_mp
-                            self.add_game_message(f"💙 {member.name}의 불멸의 재생력으로 MP가 {int(restore_to*100)}%로 회복되었습니다!")
-            
-            # 혈액 재생: 적 처치 시 HP 6% 회복, 상처 3% 치료
-            elif effect_type == "blood_regen":
-                hp_restore = effect_value.get("hp_restore", 0.06)
-                wound_heal = effect_value.get("wound_heal", 0.03)
-                
-                for member in self.party_manager.members:
-                    if member.is_alive:
-                        heal_amount = int(member.max_hp * hp_restore)
-                        if heal_amount > 0:
-                            member.heal(heal_amount)
-                            self.add_game_message(f"🩸 {member.name}의 혈액 재생으로 HP {heal_amount} 회복!")
-                        
-                        if hasattr(member, 'wounds') and member.wounds > 0:
-                            wound_heal_amount = int(member.max_hp * wound_heal)
-                            member.wounds = max(0, member.wounds - wound_heal_amount)
-    
-    def get_passive_bonus(self, effect_type: str, bonus_type: str = None):
-        """특정 패시브 효과의 보너스 값 반환"""
-        if not hasattr(self, 'party_passive_effects'):
-            return 0
-            
-        for passive in self.party_passive_effects:
-            if passive['effect_type'] == effect_type:
-                effect_value = passive['effect_value']
-                if bonus_type:
-                    return effect_value.get(bonus_type, 0)
-                return effect_value
-        return 0
-    
-    def apply_battle_start_passive_effects(self):
-        """전투 시작 시 패시브 효과 적용"""
-        if not hasattr(self, 'party_passive_effects'):
-            return
-            
-        for passive in self.party_passive_effects:
-            effect_type = passive['effect_type']
-            effect_value = passive['effect_value']
-            
-            # 전투 치유술: 전투 시작 시 HP 10% 회복
-            if effect_type == "combat_healing_art":
-                battle_start_heal = effect_value.get("battle_start_heal", 0.10)
-                for member in self.party_manager.members:
-                    if member.is_alive:
-                        heal_amount = int(member.max_hp * battle_start_heal)
-                        if heal_amount > 0:
-                            member.heal(heal_amount)
-                            self.add_game_message(f"⚔️ {member.name}의 전투 치유술 발동! HP {heal_amount} 회복!")
+        from game.passive_engine import POST_BATTLE
+        self.get_passive_engine().fire(POST_BATTLE, self)
     
     def reset_floor_passive_states(self):
         """새 층 시작 시 층별 패시브 상태 리셋"""
-        if hasattr(self, 'passive_states'):
-            for effect_type in self.passive_states:
-                if 'uses_this_floor' in self.passive_states[effect_type]:
-                    self.passive_states[effect_type]['uses_this_floor'] = 0
+        from game.passive_engine import FLOOR_START
+        self.get_passive_engine().fire(FLOOR_START, self)
     
     def get_passive_bonus(self, effect_type: str, bonus_type: str = None):
-        """패시브 효과에서 특정 보너스 값 가져오기"""
-        if not hasattr(self, 'party_passive_effects'):
-            return 0
-            
-        total_bonus = 0
-        for passive in self.party_passive_effects:
-            if passive['effect_type'] == effect_type:
-                effect_value = passive['effect_value']
-                if bonus_type and isinstance(effect_value, dict):
-                    total_bonus += effect_value.get(bonus_type, 0)
-                elif not bonus_type:
-                    total_bonus += effect_value if isinstance(effect_value, (int, float)) else 0
-        return total_bonus
+        """패시브 효과에서 특정 보너스 값 가져오기 (같은 효과는 합산)"""
+        return self.get_passive_engine().bonus(effect_type, bonus_type)
     
     def has_passive_effect(self, effect_type: str):
         """특정 패시브 효과가 있는지 확인"""
-        if not hasattr(self, 'party_passive_effects'):
-            return False
-        return any(passive['effect_type'] == effect_type for passive in self.party_passive_effects)
+        return self.get_passive_engine().has(effect_type)
     
     def apply_exp_bonus(self, base_exp: int) -> int:
         """경험치 보너스 적용"""
@@ -6759,6 +6441,7 @@ class DawnOfStellarGame:
         if hasattr(self, 'world') and self.world:
             self.world.current_floor = 1
             self.world.generate_level()  # generate_floor → generate_level로 수정
+            self.prepare_floor_merchants()
             
         print(f"{bright_green('✅ 모든 준비가 완료되었습니다!')}") 
         print(f"{bright_yellow('🚀 던전 탐험을 시작합니다!')}") 
@@ -6922,6 +6605,7 @@ class DawnOfStellarGame:
         
         # 세계 생성 (BGM은 main_game_loop에서 설정)
         self.world.generate_level()
+        self.prepare_floor_merchants()
         
         # print("✅ 게임 초기화 완료!")  # 메시지 제거
         
@@ -7322,6 +7006,10 @@ class DawnOfStellarGame:
                         print(f"📍 위치: {getattr(self.world, 'player_pos', '?')}")
                         print("화면 표시에 문제가 있습니다. 게임은 계속 진행됩니다.")
                     
+                    # 🔥 프로파일러 오버레이 (` 키로 켠 경우만)
+                    if get_hot_path_profiler().enabled:
+                        print(get_hot_path_profiler().render_overlay(compact=True))
+                    
                     need_screen_refresh = False  # 화면 갱신 완료
                 
                 # 클래식 모드에서는 채팅 시스템 비활성화
@@ -7334,7 +7022,8 @@ class DawnOfStellarGame:
                 pass
                 
                 # 플레이어 입력 받기
-                action = self.get_player_input()
+                with hot_path("field.input"):
+                    action = self.get_player_input()
                 
                 # 빈 입력이나 무효한 입력은 처리하지 않음 (화면 복사 방지)
                 if not action or action == '' or len(action.strip()) == 0:
@@ -7354,7 +7043,8 @@ class DawnOfStellarGame:
                     continue  # 너무 빨리 눌린 키는 무시
                 
                 # 액션 처리
-                action_result = self.process_action(action)
+                with hot_path("field.turn"):
+                    action_result = self.process_action(action)
                 
                 # 🔥 중요: process_action에서 적 이동이나 전투가 있었으면 화면 갱신
                 if action_result is True:
@@ -9849,6 +9539,13 @@ class DawnOfStellarGame:
                     print(f"❌ 핫 리로드 오류: {e}")
                 return False
             
+            # 🔥 핫패스 프로파일러 토글 (디버그 키)
+            elif action == '`':
+                print(handle_profiler_key())
+                if hasattr(self, 'keyboard') and hasattr(self.keyboard, 'wait_for_key'):
+                    self.keyboard.wait_for_key("아무 키나 눌러 계속...")
+                return True
+            
             # 기타 키들은 False 반환 (화면 갱신 불필요)
             else:
                 return False
@@ -10003,13 +9700,22 @@ class DawnOfStellarGame:
             print(f"채집 시스템 오류: {e}")
             self.keyboard.wait_for_key("아무 키나 눌러 계속...")
     
+    def prepare_floor_merchants(self):
+        """현재/다음 층 상인 재고를 층 시드로 워커에서 미리 생성 (층 이동 시 호출)"""
+        try:
+            current_floor = getattr(self, 'current_floor', 1)
+            world = getattr(self, 'world', None)
+            seed_for = world.get_level_seed if world is not None and hasattr(world, 'get_level_seed') else None
+            self.merchant_manager.prepare_floor(current_floor, seed_for)
+        except Exception as e:
+            print(f"⚠️ 상인 재고 준비 실패: {e}")
+    
     def _handle_merchant_system(self):
         """상인 시스템 처리"""
         try:
-            from game.merchant import Merchant
-            # 현재 층수 정보 가져오기 (기본값 1)
+            # 현재 층수 정보 가져오기 (기본값 1) - 층별 필드 상인은 미리 생성된 재고 사용
             current_floor = getattr(self, 'current_floor', 1)
-            merchant = Merchant("필드 상인", "일반", current_floor)
+            merchant = self.merchant_manager.get_field_merchant(current_floor)
             merchant.interact(self.party_manager)
         except ImportError:
             print("상인 시스템을 찾을 수 없습니다.")
@@ -13156,6 +12862,7 @@ class DawnOfStellarGame:
         # 실제 층 이동 진행
         self.world.current_level = new_floor
         self.current_floor = new_floor
+        self.prepare_floor_merchants()
         
         print(f"\n🏢 {old_floor}층에서 {new_floor}층으로 이동합니다...")
         
@@ -13620,6 +13327,7 @@ class DawnOfStellarGame:
 """
                     menu.extra_content = ascii_art
                     
+                    self.start_background_warm_up()  # 메뉴 표시 후 지연 서브시스템 워밍업
                     choice = menu.run()
 
                     if choice == 0:  # 게임 시작
@@ -14525,6 +14233,7 @@ class DawnOfStellarGame:
 """
                 menu.extra_content = ascii_art
                 
+                self.start_background_warm_up()  # 메뉴 표시 후 지연 서브시스템 워밍업
                 result = menu.run()
                 
                 # 선택 결과 처리
@@ -20335,6 +20044,19 @@ except Exception:
     # 바인딩 실패 시 조용히 무시 (폴백 경로가 존재함)
     pass
 
+def _flush_pending_saves():
+    """os._exit 전에 대기 중인 JSON/SQLite 저장을 내보냄 (os._exit는 atexit 플러시를 건너뜀)"""
+    try:
+        from game.sqlite_store import flush_all_stores
+        flush_all_stores(timeout=5.0)
+    except Exception as e:
+        log_error("종료", "SQLite 저장소 플러시 실패", e)
+    try:
+        from game.json_store import flush_json_saves
+        flush_json_saves()
+    except Exception as e:
+        log_error("종료", "JSON 저장 플러시 실패", e)
+
 def main():
     """메인 함수 - 상태 보존 핫 리로드 지원"""
     
@@ -20364,6 +20086,7 @@ def main():
     # 종료 처리 함수 정의
     def cleanup_and_exit(signum=None, frame=None):
         """안전한 종료 처리"""
+        _flush_pending_saves()
         try:
             # 안전 종료 핸들러 사용 (우선순위)
             if safe_exit_handler:
@@ -20475,7 +20198,9 @@ def main():
             print(f"⚠️ 모바일 서버 초기화 중 오류: {e}")
 
         # 게임 인스턴스 생성
-        game = DawnOfStellarGame()
+        _startup_profiler.mark("모듈 로드 완료")
+        with _startup_profiler.phase("DawnOfStellarGame 초기화"):
+            game = DawnOfStellarGame()
         
         # 안전 종료 시스템에 게임 인스턴스 등록
         if safe_exit_handler and hasattr(game, 'safe_cleanup'):
@@ -20563,6 +20288,7 @@ def main():
                 except:
                     pass
             
+            _flush_pending_saves()
             os._exit(0)
         else:
             # 콘솔 모드에서는 자동 종료
@@ -20577,6 +20303,7 @@ def main():
             try:
                 sys.exit(0)
             except:
+                _flush_pending_saves()
                 os._exit(0)
 
     def check_position_interactions(self):
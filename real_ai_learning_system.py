@@ -14,6 +14,8 @@ from typing import Dict, List, Any
 from dataclasses import dataclass
 from datetime import datetime
 
+from game.battle_training_runner import battle_engine_available, make_training_task, run_training_battles
+
 @dataclass
 class GameplayResult:
     """실제 게임 플레이 결과"""
@@ -33,12 +35,31 @@ class RealAIGameplayLearning:
         self.ai_players = {}
         self.learning_sessions = []
         
-    async def run_real_ai_gameplay_session(self, ai_name: str, num_battles: int = 100):
+    async def run_real_ai_gameplay_session(self, ai_name: str, num_battles: int = 100,
+                                           job_class: str = "전사", workers: int = None):
         """AI가 실제로 게임을 플레이하며 학습"""
         print(f"🎮 {ai_name}이(가) 실제 게임을 {num_battles}번 플레이 시작!")
         
         results = []
         
+        if battle_engine_available():
+            # 실제 헤드리스 전투를 프로세스 풀에서 한꺼번에 실행 (이벤트 루프는 막지 않음)
+            rng = random.Random()
+            tasks = [make_training_task(i, ai_name, job_class, rng) for i in range(num_battles)]
+            loop = asyncio.get_running_loop()
+            battle_results = await loop.run_in_executor(None, run_training_battles, tasks, workers)
+            
+            for raw in battle_results:
+                if raw["error"]:
+                    continue
+                result = self._to_gameplay_result(ai_name, raw)
+                results.append(result)
+                self._analyze_and_learn_from_result(ai_name, result)
+            
+            session_summary = self._analyze_session_results(ai_name, results)
+            print(f"✅ {ai_name} 학습 완료! 승률: {session_summary['win_rate']:.1f}%")
+            return session_summary
+        
         for battle in range(num_battles):
             print(f"  ⚔️ 전투 {battle+1}/{num_battles} 진행 중...")
             
@@ -96,6 +117,20 @@ class RealAIGameplayLearning:
             print(f"❌ 게임 세션 실행 실패: {e}")
             return None
     
+    def _to_gameplay_result(self, ai_name: str, raw: Dict[str, Any]) -> GameplayResult:
+        """헤드리스 전투 결과 → GameplayResult (생존 시간은 진행 턴 수)"""
+        actions = raw["actions"]
+        return GameplayResult(
+            ai_name=ai_name,
+            actions_taken=[action for action, count in actions.items() for _ in range(count)],
+            damage_dealt=raw["damage_dealt"],
+            damage_received=raw["damage_received"],
+            victory=raw["victory"],
+            survival_time=float(raw["turns"]),
+            errors_made=actions.get("none", 0),
+            optimal_plays=actions.get("hp_attack", 0)
+        )
+    
     def _simulate_ai_gameplay(self, ai_name: str) -> List[str]:
         """AI 게임플레이 시뮬레이션"""
         